@@ -18,91 +18,186 @@ from google.cloud.osconfig import gapic_version as package_version
 __version__ = package_version.__version__
 
 
-from google.cloud.osconfig_v1.services.os_config_service.async_client import (
-    OsConfigServiceAsyncClient,
-)
-from google.cloud.osconfig_v1.services.os_config_service.client import (
-    OsConfigServiceClient,
-)
-from google.cloud.osconfig_v1.services.os_config_zonal_service.async_client import (
-    OsConfigZonalServiceAsyncClient,
-)
-from google.cloud.osconfig_v1.services.os_config_zonal_service.client import (
-    OsConfigZonalServiceClient,
-)
-from google.cloud.osconfig_v1.types.inventory import (
-    GetInventoryRequest,
-    Inventory,
-    InventoryView,
-    ListInventoriesRequest,
-    ListInventoriesResponse,
-)
-from google.cloud.osconfig_v1.types.os_policy import OSPolicy
-from google.cloud.osconfig_v1.types.os_policy_assignment_reports import (
-    GetOSPolicyAssignmentReportRequest,
-    ListOSPolicyAssignmentReportsRequest,
-    ListOSPolicyAssignmentReportsResponse,
-    OSPolicyAssignmentReport,
-)
-from google.cloud.osconfig_v1.types.os_policy_assignments import (
-    CreateOSPolicyAssignmentRequest,
-    DeleteOSPolicyAssignmentRequest,
-    GetOSPolicyAssignmentRequest,
-    ListOSPolicyAssignmentRevisionsRequest,
-    ListOSPolicyAssignmentRevisionsResponse,
-    ListOSPolicyAssignmentsRequest,
-    ListOSPolicyAssignmentsResponse,
-    OSPolicyAssignment,
-    OSPolicyAssignmentOperationMetadata,
-    UpdateOSPolicyAssignmentRequest,
-)
-from google.cloud.osconfig_v1.types.osconfig_common import FixedOrPercent
-from google.cloud.osconfig_v1.types.patch_deployments import (
-    CreatePatchDeploymentRequest,
-    DeletePatchDeploymentRequest,
-    GetPatchDeploymentRequest,
-    ListPatchDeploymentsRequest,
-    ListPatchDeploymentsResponse,
-    MonthlySchedule,
-    OneTimeSchedule,
-    PatchDeployment,
-    PausePatchDeploymentRequest,
-    RecurringSchedule,
-    ResumePatchDeploymentRequest,
-    UpdatePatchDeploymentRequest,
-    WeekDayOfMonth,
-    WeeklySchedule,
-)
-from google.cloud.osconfig_v1.types.patch_jobs import (
-    AptSettings,
-    CancelPatchJobRequest,
-    ExecStep,
-    ExecStepConfig,
-    ExecutePatchJobRequest,
-    GcsObject,
-    GetPatchJobRequest,
-    GooSettings,
-    Instance,
-    ListPatchJobInstanceDetailsRequest,
-    ListPatchJobInstanceDetailsResponse,
-    ListPatchJobsRequest,
-    ListPatchJobsResponse,
-    PatchConfig,
-    PatchInstanceFilter,
-    PatchJob,
-    PatchJobInstanceDetails,
-    PatchRollout,
-    WindowsUpdateSettings,
-    YumSettings,
-    ZypperSettings,
-)
-from google.cloud.osconfig_v1.types.vulnerability import (
-    CVSSv3,
-    GetVulnerabilityReportRequest,
-    ListVulnerabilityReportsRequest,
-    ListVulnerabilityReportsResponse,
-    VulnerabilityReport,
-)
+from typing import TYPE_CHECKING
+
+from google.cloud.osconfig_v1 import _lazy
+
+_LAZY_SUBMODULES = {
+    "google.cloud.osconfig_v1.services.os_config_service.async_client": (
+        "OsConfigServiceAsyncClient",
+    ),
+    "google.cloud.osconfig_v1.services.os_config_service.client": (
+        "OsConfigServiceClient",
+    ),
+    "google.cloud.osconfig_v1.services.os_config_zonal_service.async_client": (
+        "OsConfigZonalServiceAsyncClient",
+    ),
+    "google.cloud.osconfig_v1.services.os_config_zonal_service.client": (
+        "OsConfigZonalServiceClient",
+    ),
+    "google.cloud.osconfig_v1.types.inventory": (
+        "GetInventoryRequest",
+        "Inventory",
+        "InventoryView",
+        "ListInventoriesRequest",
+        "ListInventoriesResponse",
+    ),
+    "google.cloud.osconfig_v1.types.os_policy": ("OSPolicy",),
+    "google.cloud.osconfig_v1.types.os_policy_assignment_reports": (
+        "GetOSPolicyAssignmentReportRequest",
+        "ListOSPolicyAssignmentReportsRequest",
+        "ListOSPolicyAssignmentReportsResponse",
+        "OSPolicyAssignmentReport",
+    ),
+    "google.cloud.osconfig_v1.types.os_policy_assignments": (
+        "CreateOSPolicyAssignmentRequest",
+        "DeleteOSPolicyAssignmentRequest",
+        "GetOSPolicyAssignmentRequest",
+        "ListOSPolicyAssignmentRevisionsRequest",
+        "ListOSPolicyAssignmentRevisionsResponse",
+        "ListOSPolicyAssignmentsRequest",
+        "ListOSPolicyAssignmentsResponse",
+        "OSPolicyAssignment",
+        "OSPolicyAssignmentOperationMetadata",
+        "UpdateOSPolicyAssignmentRequest",
+    ),
+    "google.cloud.osconfig_v1.types.osconfig_common": ("FixedOrPercent",),
+    "google.cloud.osconfig_v1.types.patch_deployments": (
+        "CreatePatchDeploymentRequest",
+        "DeletePatchDeploymentRequest",
+        "GetPatchDeploymentRequest",
+        "ListPatchDeploymentsRequest",
+        "ListPatchDeploymentsResponse",
+        "MonthlySchedule",
+        "OneTimeSchedule",
+        "PatchDeployment",
+        "PausePatchDeploymentRequest",
+        "RecurringSchedule",
+        "ResumePatchDeploymentRequest",
+        "UpdatePatchDeploymentRequest",
+        "WeekDayOfMonth",
+        "WeeklySchedule",
+    ),
+    "google.cloud.osconfig_v1.types.patch_jobs": (
+        "AptSettings",
+        "CancelPatchJobRequest",
+        "ExecStep",
+        "ExecStepConfig",
+        "ExecutePatchJobRequest",
+        "GcsObject",
+        "GetPatchJobRequest",
+        "GooSettings",
+        "Instance",
+        "ListPatchJobInstanceDetailsRequest",
+        "ListPatchJobInstanceDetailsResponse",
+        "ListPatchJobsRequest",
+        "ListPatchJobsResponse",
+        "PatchConfig",
+        "PatchInstanceFilter",
+        "PatchJob",
+        "PatchJobInstanceDetails",
+        "PatchRollout",
+        "WindowsUpdateSettings",
+        "YumSettings",
+        "ZypperSettings",
+    ),
+    "google.cloud.osconfig_v1.types.vulnerability": (
+        "CVSSv3",
+        "GetVulnerabilityReportRequest",
+        "ListVulnerabilityReportsRequest",
+        "ListVulnerabilityReportsResponse",
+        "VulnerabilityReport",
+    ),
+}
+
+if TYPE_CHECKING:  # pragma: NO COVER
+    from google.cloud.osconfig_v1.services.os_config_service.async_client import (
+        OsConfigServiceAsyncClient,
+    )
+    from google.cloud.osconfig_v1.services.os_config_service.client import (
+        OsConfigServiceClient,
+    )
+    from google.cloud.osconfig_v1.services.os_config_zonal_service.async_client import (
+        OsConfigZonalServiceAsyncClient,
+    )
+    from google.cloud.osconfig_v1.services.os_config_zonal_service.client import (
+        OsConfigZonalServiceClient,
+    )
+    from google.cloud.osconfig_v1.types.inventory import (
+        GetInventoryRequest,
+        Inventory,
+        InventoryView,
+        ListInventoriesRequest,
+        ListInventoriesResponse,
+    )
+    from google.cloud.osconfig_v1.types.os_policy import OSPolicy
+    from google.cloud.osconfig_v1.types.os_policy_assignment_reports import (
+        GetOSPolicyAssignmentReportRequest,
+        ListOSPolicyAssignmentReportsRequest,
+        ListOSPolicyAssignmentReportsResponse,
+        OSPolicyAssignmentReport,
+    )
+    from google.cloud.osconfig_v1.types.os_policy_assignments import (
+        CreateOSPolicyAssignmentRequest,
+        DeleteOSPolicyAssignmentRequest,
+        GetOSPolicyAssignmentRequest,
+        ListOSPolicyAssignmentRevisionsRequest,
+        ListOSPolicyAssignmentRevisionsResponse,
+        ListOSPolicyAssignmentsRequest,
+        ListOSPolicyAssignmentsResponse,
+        OSPolicyAssignment,
+        OSPolicyAssignmentOperationMetadata,
+        UpdateOSPolicyAssignmentRequest,
+    )
+    from google.cloud.osconfig_v1.types.osconfig_common import FixedOrPercent
+    from google.cloud.osconfig_v1.types.patch_deployments import (
+        CreatePatchDeploymentRequest,
+        DeletePatchDeploymentRequest,
+        GetPatchDeploymentRequest,
+        ListPatchDeploymentsRequest,
+        ListPatchDeploymentsResponse,
+        MonthlySchedule,
+        OneTimeSchedule,
+        PatchDeployment,
+        PausePatchDeploymentRequest,
+        RecurringSchedule,
+        ResumePatchDeploymentRequest,
+        UpdatePatchDeploymentRequest,
+        WeekDayOfMonth,
+        WeeklySchedule,
+    )
+    from google.cloud.osconfig_v1.types.patch_jobs import (
+        AptSettings,
+        CancelPatchJobRequest,
+        ExecStep,
+        ExecStepConfig,
+        ExecutePatchJobRequest,
+        GcsObject,
+        GetPatchJobRequest,
+        GooSettings,
+        Instance,
+        ListPatchJobInstanceDetailsRequest,
+        ListPatchJobInstanceDetailsResponse,
+        ListPatchJobsRequest,
+        ListPatchJobsResponse,
+        PatchConfig,
+        PatchInstanceFilter,
+        PatchJob,
+        PatchJobInstanceDetails,
+        PatchRollout,
+        WindowsUpdateSettings,
+        YumSettings,
+        ZypperSettings,
+    )
+    from google.cloud.osconfig_v1.types.vulnerability import (
+        CVSSv3,
+        GetVulnerabilityReportRequest,
+        ListVulnerabilityReportsRequest,
+        ListVulnerabilityReportsResponse,
+        VulnerabilityReport,
+    )
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
 
 __all__ = (
     "OsConfigServiceClient",
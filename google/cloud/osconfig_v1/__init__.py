@@ -18,87 +18,178 @@ from google.cloud.osconfig_v1 import gapic_version as package_version
 __version__ = package_version.__version__
 
 
-from .services.os_config_service import (
-    OsConfigServiceAsyncClient,
-    OsConfigServiceClient,
-)
-from .services.os_config_zonal_service import (
-    OsConfigZonalServiceAsyncClient,
-    OsConfigZonalServiceClient,
-)
-from .types.inventory import (
-    GetInventoryRequest,
-    Inventory,
-    InventoryView,
-    ListInventoriesRequest,
-    ListInventoriesResponse,
-)
-from .types.os_policy import OSPolicy
-from .types.os_policy_assignment_reports import (
-    GetOSPolicyAssignmentReportRequest,
-    ListOSPolicyAssignmentReportsRequest,
-    ListOSPolicyAssignmentReportsResponse,
-    OSPolicyAssignmentReport,
-)
-from .types.os_policy_assignments import (
-    CreateOSPolicyAssignmentRequest,
-    DeleteOSPolicyAssignmentRequest,
-    GetOSPolicyAssignmentRequest,
-    ListOSPolicyAssignmentRevisionsRequest,
-    ListOSPolicyAssignmentRevisionsResponse,
-    ListOSPolicyAssignmentsRequest,
-    ListOSPolicyAssignmentsResponse,
-    OSPolicyAssignment,
-    OSPolicyAssignmentOperationMetadata,
-    UpdateOSPolicyAssignmentRequest,
-)
-from .types.osconfig_common import FixedOrPercent
-from .types.patch_deployments import (
-    CreatePatchDeploymentRequest,
-    DeletePatchDeploymentRequest,
-    GetPatchDeploymentRequest,
-    ListPatchDeploymentsRequest,
-    ListPatchDeploymentsResponse,
-    MonthlySchedule,
-    OneTimeSchedule,
-    PatchDeployment,
-    PausePatchDeploymentRequest,
-    RecurringSchedule,
-    ResumePatchDeploymentRequest,
-    UpdatePatchDeploymentRequest,
-    WeekDayOfMonth,
-    WeeklySchedule,
-)
-from .types.patch_jobs import (
-    AptSettings,
-    CancelPatchJobRequest,
-    ExecStep,
-    ExecStepConfig,
-    ExecutePatchJobRequest,
-    GcsObject,
-    GetPatchJobRequest,
-    GooSettings,
-    Instance,
-    ListPatchJobInstanceDetailsRequest,
-    ListPatchJobInstanceDetailsResponse,
-    ListPatchJobsRequest,
-    ListPatchJobsResponse,
-    PatchConfig,
-    PatchInstanceFilter,
-    PatchJob,
-    PatchJobInstanceDetails,
-    PatchRollout,
-    WindowsUpdateSettings,
-    YumSettings,
-    ZypperSettings,
-)
-from .types.vulnerability import (
-    CVSSv3,
-    GetVulnerabilityReportRequest,
-    ListVulnerabilityReportsRequest,
-    ListVulnerabilityReportsResponse,
-    VulnerabilityReport,
-)
+from typing import TYPE_CHECKING
+
+from google.cloud.osconfig_v1 import _lazy
+
+_LAZY_SUBMODULES = {
+    ".services.os_config_service": (
+        "OsConfigServiceAsyncClient",
+        "OsConfigServiceClient",
+    ),
+    ".services.os_config_zonal_service": (
+        "OsConfigZonalServiceAsyncClient",
+        "OsConfigZonalServiceClient",
+    ),
+    ".types.inventory": (
+        "GetInventoryRequest",
+        "Inventory",
+        "InventoryView",
+        "ListInventoriesRequest",
+        "ListInventoriesResponse",
+    ),
+    ".types.os_policy": ("OSPolicy",),
+    ".types.os_policy_assignment_reports": (
+        "GetOSPolicyAssignmentReportRequest",
+        "ListOSPolicyAssignmentReportsRequest",
+        "ListOSPolicyAssignmentReportsResponse",
+        "OSPolicyAssignmentReport",
+    ),
+    ".types.os_policy_assignments": (
+        "CreateOSPolicyAssignmentRequest",
+        "DeleteOSPolicyAssignmentRequest",
+        "GetOSPolicyAssignmentRequest",
+        "ListOSPolicyAssignmentRevisionsRequest",
+        "ListOSPolicyAssignmentRevisionsResponse",
+        "ListOSPolicyAssignmentsRequest",
+        "ListOSPolicyAssignmentsResponse",
+        "OSPolicyAssignment",
+        "OSPolicyAssignmentOperationMetadata",
+        "UpdateOSPolicyAssignmentRequest",
+    ),
+    ".types.osconfig_common": ("FixedOrPercent",),
+    ".types.patch_deployments": (
+        "CreatePatchDeploymentRequest",
+        "DeletePatchDeploymentRequest",
+        "GetPatchDeploymentRequest",
+        "ListPatchDeploymentsRequest",
+        "ListPatchDeploymentsResponse",
+        "MonthlySchedule",
+        "OneTimeSchedule",
+        "PatchDeployment",
+        "PausePatchDeploymentRequest",
+        "RecurringSchedule",
+        "ResumePatchDeploymentRequest",
+        "UpdatePatchDeploymentRequest",
+        "WeekDayOfMonth",
+        "WeeklySchedule",
+    ),
+    ".types.patch_jobs": (
+        "AptSettings",
+        "CancelPatchJobRequest",
+        "ExecStep",
+        "ExecStepConfig",
+        "ExecutePatchJobRequest",
+        "GcsObject",
+        "GetPatchJobRequest",
+        "GooSettings",
+        "Instance",
+        "ListPatchJobInstanceDetailsRequest",
+        "ListPatchJobInstanceDetailsResponse",
+        "ListPatchJobsRequest",
+        "ListPatchJobsResponse",
+        "PatchConfig",
+        "PatchInstanceFilter",
+        "PatchJob",
+        "PatchJobInstanceDetails",
+        "PatchRollout",
+        "WindowsUpdateSettings",
+        "YumSettings",
+        "ZypperSettings",
+    ),
+    ".types.vulnerability": (
+        "CVSSv3",
+        "GetVulnerabilityReportRequest",
+        "ListVulnerabilityReportsRequest",
+        "ListVulnerabilityReportsResponse",
+        "VulnerabilityReport",
+    ),
+}
+
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .services.os_config_service import (
+        OsConfigServiceAsyncClient,
+        OsConfigServiceClient,
+    )
+    from .services.os_config_zonal_service import (
+        OsConfigZonalServiceAsyncClient,
+        OsConfigZonalServiceClient,
+    )
+    from .types.inventory import (
+        GetInventoryRequest,
+        Inventory,
+        InventoryView,
+        ListInventoriesRequest,
+        ListInventoriesResponse,
+    )
+    from .types.os_policy import OSPolicy
+    from .types.os_policy_assignment_reports import (
+        GetOSPolicyAssignmentReportRequest,
+        ListOSPolicyAssignmentReportsRequest,
+        ListOSPolicyAssignmentReportsResponse,
+        OSPolicyAssignmentReport,
+    )
+    from .types.os_policy_assignments import (
+        CreateOSPolicyAssignmentRequest,
+        DeleteOSPolicyAssignmentRequest,
+        GetOSPolicyAssignmentRequest,
+        ListOSPolicyAssignmentRevisionsRequest,
+        ListOSPolicyAssignmentRevisionsResponse,
+        ListOSPolicyAssignmentsRequest,
+        ListOSPolicyAssignmentsResponse,
+        OSPolicyAssignment,
+        OSPolicyAssignmentOperationMetadata,
+        UpdateOSPolicyAssignmentRequest,
+    )
+    from .types.osconfig_common import FixedOrPercent
+    from .types.patch_deployments import (
+        CreatePatchDeploymentRequest,
+        DeletePatchDeploymentRequest,
+        GetPatchDeploymentRequest,
+        ListPatchDeploymentsRequest,
+        ListPatchDeploymentsResponse,
+        MonthlySchedule,
+        OneTimeSchedule,
+        PatchDeployment,
+        PausePatchDeploymentRequest,
+        RecurringSchedule,
+        ResumePatchDeploymentRequest,
+        UpdatePatchDeploymentRequest,
+        WeekDayOfMonth,
+        WeeklySchedule,
+    )
+    from .types.patch_jobs import (
+        AptSettings,
+        CancelPatchJobRequest,
+        ExecStep,
+        ExecStepConfig,
+        ExecutePatchJobRequest,
+        GcsObject,
+        GetPatchJobRequest,
+        GooSettings,
+        Instance,
+        ListPatchJobInstanceDetailsRequest,
+        ListPatchJobInstanceDetailsResponse,
+        ListPatchJobsRequest,
+        ListPatchJobsResponse,
+        PatchConfig,
+        PatchInstanceFilter,
+        PatchJob,
+        PatchJobInstanceDetails,
+        PatchRollout,
+        WindowsUpdateSettings,
+        YumSettings,
+        ZypperSettings,
+    )
+    from .types.vulnerability import (
+        CVSSv3,
+        GetVulnerabilityReportRequest,
+        ListVulnerabilityReportsRequest,
+        ListVulnerabilityReportsResponse,
+        VulnerabilityReport,
+    )
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
 
 __all__ = (
     "OsConfigServiceAsyncClient",
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Lazy attribute resolution for package ``__init__`` modules (PEP 562).
+
+Importing a client pulls in gRPC, ``requests`` and every transport, so the
+package ``__init__`` modules only import the submodule defining a name the
+first time that name is accessed:
+
+.. code-block:: python
+
+    _LAZY_SUBMODULES = {".types.inventory": ("Inventory", "InventoryView")}
+
+    if TYPE_CHECKING:  # pragma: NO COVER
+        from .types.inventory import Inventory, InventoryView
+
+    __getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
+
+Type checkers do not run ``__getattr__``, so each package also imports its
+exports eagerly under ``TYPE_CHECKING``; the names must match
+``_LAZY_SUBMODULES``.
+"""
+
+import collections.abc
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+
+def attach(
+    package_name: str, submodules: Dict[str, Iterable[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns the module ``__getattr__`` and ``__dir__`` of a package.
+
+    Args:
+        package_name (str): The ``__name__`` of the package.
+        submodules (Dict[str, Iterable[str]]): The names exported by each
+            submodule, keyed by the submodule name, absolute or relative to
+            the package.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The functions
+        to assign to the package's ``__getattr__`` and ``__dir__``.
+    """
+    exports = {
+        name: submodule for submodule, names in submodules.items() for name in names
+    }
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(package_name, name)
+            )
+        value = getattr(importlib.import_module(submodule, package_name), name)
+        # Cache the value so later lookups do not go through __getattr__.
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
+
+
+class LazyRegistry(collections.abc.Mapping):
+    """An ordered, read-only mapping whose values are imported on access.
+
+    Used for the transport registries, so that constructing a client only
+    imports the transport it selects.
+
+    Args:
+        package_name (str): The package the submodules are relative to.
+        entries (Dict[str, Tuple[str, str]]): The (submodule, attribute)
+            providing the value of each key, in registry order.
+    """
+
+    def __init__(self, package_name: str, entries: Dict[str, Tuple[str, str]]):
+        self._package_name = package_name
+        self._entries = dict(entries)
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        submodule, name = self._entries[key]
+        value = getattr(importlib.import_module(submodule, self._package_name), name)
+        self._values[key] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, list(self._entries))
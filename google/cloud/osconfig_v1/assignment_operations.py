@@ -0,0 +1,634 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Waits for many OS policy assignment operations on a shared schedule.
+
+The operations returned by the ``create_os_policy_assignment``,
+``update_os_policy_assignment`` and ``delete_os_policy_assignment``
+methods of the zonal clients each poll on their own when waited on.
+A waiter polls all of them instead, from one loop:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import assignment_operations
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    with assignment_operations.OperationWaiter() as waiter:
+        for assignment in assignments:
+            waiter.add(client.create_os_policy_assignment(...))
+        for event in waiter.events():
+            if event.rollout_state_changed:
+                print(event.name, event.rollout_state)
+        # or: for operation in waiter.as_completed(): operation.result()
+
+The delay before polling an operation again grows with jittered
+exponential backoff while its rollout state does not change, and is reset
+when it does. The polls due within ``batch_window`` seconds of each other
+are sent together, so that the waiter wakes up once per batch rather than
+once per operation. An operation whose poll fails with an error that
+retrying cannot fix, such as ``NotFound`` or ``PermissionDenied``, is no
+longer polled. :class:`AsyncOperationWaiter` does the same for the
+operations of :class:`~.OsConfigZonalServiceAsyncClient`.
+"""
+
+import asyncio
+import concurrent.futures
+import random
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import operation, operation_async  # type: ignore
+
+from google.cloud.osconfig_v1.types import os_policy_assignments
+
+RolloutState = os_policy_assignments.OSPolicyAssignmentOperationMetadata.RolloutState
+
+# The API errors after which an operation is polled again; the other API
+# errors stop polling it. Errors raised outside of the API call are polled
+# again too.
+_TRANSIENT_ERRORS = (
+    core_exceptions.Aborted,
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.InternalServerError,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.TooManyRequests,
+)
+
+
+class OperationEvent(NamedTuple):
+    """A change observed on a pending operation.
+
+    Attributes:
+        operation (Union[google.api_core.operation.Operation, google.api_core.operation_async.AsyncOperation]):
+            The operation.
+        metadata (Optional[google.cloud.osconfig_v1.types.OSPolicyAssignmentOperationMetadata]):
+            The latest metadata of the operation, if any.
+        previous_rollout_state (Optional[google.cloud.osconfig_v1.types.OSPolicyAssignmentOperationMetadata.RolloutState]):
+            The rollout state at the previous event, or when the operation
+            was added.
+        done (bool): Whether the operation is no longer polled. Its result
+            is then available without blocking, unless ``error`` is set:
+            the poll failed with a permanent error.
+        error (Optional[Exception]): The error raised by the poll, in which
+            case ``metadata`` is the last known one.
+    """
+
+    operation: Any
+    metadata: Optional[os_policy_assignments.OSPolicyAssignmentOperationMetadata]
+    previous_rollout_state: Optional[RolloutState]
+    done: bool
+    error: Optional[Exception] = None
+
+    @property
+    def name(self) -> str:
+        """str: The name of the operation."""
+        return self.operation.operation.name
+
+    @property
+    def rollout_state(self) -> Optional[RolloutState]:
+        """Optional[RolloutState]: The latest rollout state, if known."""
+        return self.metadata.rollout_state if self.metadata is not None else None
+
+    @property
+    def rollout_state_changed(self) -> bool:
+        """bool: Whether the rollout state differs from the previous event."""
+        return self.rollout_state != self.previous_rollout_state
+
+
+def _metadata(
+    op,
+) -> Optional[os_policy_assignments.OSPolicyAssignmentOperationMetadata]:
+    try:
+        return op.metadata
+    except Exception:  # pragma: NO COVER
+        # Metadata of another type than the operation declares.
+        return None
+
+
+def _is_permanent(exc: Exception) -> bool:
+    return isinstance(exc, core_exceptions.GoogleAPICallError) and not isinstance(
+        exc, _TRANSIENT_ERRORS
+    )
+
+
+class _Pending:
+    def __init__(self, op, interval: float, due: float):
+        self.operation = op
+        self.interval = interval
+        self.due = due
+        self.metadata = _metadata(op)
+
+    @property
+    def rollout_state(self) -> Optional[RolloutState]:
+        return self.metadata.rollout_state if self.metadata is not None else None
+
+
+class _Schedule:
+    """The polling schedule shared by the sync and async waiters."""
+
+    def __init__(
+        self,
+        *,
+        initial_interval: float,
+        max_interval: float,
+        backoff: float,
+        jitter: float,
+        batch_window: float,
+        clock: Callable[[], float],
+        rng: Optional[random.Random],
+    ):
+        if not 0 < initial_interval <= max_interval:
+            raise ValueError(
+                "Intervals must satisfy 0 < initial_interval <= max_interval."
+            )
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1.")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1).")
+        if batch_window < 0:
+            raise ValueError("batch_window must be non-negative.")
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._jitter = jitter
+        self._batch_window = batch_window
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._pending: Dict[str, _Pending] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def pending(self) -> List[Any]:
+        with self._lock:
+            return [pending.operation for pending in self._pending.values()]
+
+    def _delay(self, interval: float) -> float:
+        return interval * (1 + self._rng.uniform(-self._jitter, self._jitter))
+
+    def add(self, op) -> None:
+        with self._lock:
+            if op.operation.name not in self._pending:
+                self._pending[op.operation.name] = _Pending(
+                    op,
+                    self._initial_interval,
+                    self._clock() + self._delay(self._initial_interval),
+                )
+
+    def discard(self, op) -> None:
+        with self._lock:
+            self._pending.pop(op.operation.name, None)
+
+    def next_poll_in(self) -> Optional[float]:
+        with self._lock:
+            if not self._pending:
+                return None
+            due = min(pending.due for pending in self._pending.values())
+        return max(due - self._clock(), 0.0)
+
+    def due(self) -> List[_Pending]:
+        # Polls due soon are sent with the ones due now.
+        horizon = self._clock() + self._batch_window
+        with self._lock:
+            return [p for p in self._pending.values() if p.due <= horizon]
+
+    def update(
+        self, pending: _Pending, done: bool, error: Optional[Exception]
+    ) -> Optional[OperationEvent]:
+        """Reschedules a polled operation and returns its event, if any."""
+        if error is not None and _is_permanent(error):
+            done = True
+        previous = pending.rollout_state
+        if error is None:
+            pending.metadata = _metadata(pending.operation)
+        changed = error is None and pending.rollout_state != previous
+        if changed:
+            pending.interval = self._initial_interval
+        else:
+            pending.interval = min(pending.interval * self._backoff, self._max_interval)
+        pending.due = self._clock() + self._delay(pending.interval)
+        if done:
+            self.discard(pending.operation)
+        if changed or done or error is not None:
+            return OperationEvent(
+                pending.operation, pending.metadata, previous, done, error
+            )
+        return None
+
+
+class OperationWaiter:
+    """Polls many operations of :class:`~.OsConfigZonalServiceClient`.
+
+    Args:
+        operations (Iterable[google.api_core.operation.Operation]): The
+            operations to wait for; more can be added with :meth:`add`.
+        executor (Optional[concurrent.futures.Executor]): The executor the
+            polls run on. Defaults to a thread pool of ``max_workers``
+            threads owned, and shut down, by the waiter.
+        max_workers (int): The size of the default thread pool.
+        initial_interval (float): The delay, in seconds, before polling an
+            operation after it was added or its rollout state changed.
+        max_interval (float): The longest delay between two polls of an
+            operation.
+        backoff (float): The factor the delay is multiplied by each time an
+            operation is polled without its rollout state changing.
+        jitter (float): The maximum relative random change of each delay,
+            which spreads the polls of operations started together.
+        batch_window (float): Polls due within this many seconds of each
+            other are sent together.
+        retry (google.api_core.retry.Retry): Designation of what errors, if
+            any, should be retried by each poll. Defaults to the retry of the
+            operations.
+        clock (Callable[[], float]): The monotonic clock used to schedule
+            the polls.
+        rng (Optional[random.Random]): The source of the jitter.
+    """
+
+    def __init__(
+        self,
+        operations: Iterable[operation.Operation] = (),
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: int = 8,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        jitter: float = 0.2,
+        batch_window: float = 0.5,
+        retry=None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        self._schedule = _Schedule(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            jitter=jitter,
+            batch_window=batch_window,
+            clock=clock,
+            rng=rng,
+        )
+        self._owns_executor = executor is None
+        self._executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="OperationWaiter"
+        )
+        self._retry = retry
+        self._clock = clock
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._closed = False
+        for op in operations:
+            self.add(op)
+
+    def __enter__(self) -> "OperationWaiter":
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._schedule)
+
+    @property
+    def pending(self) -> List[operation.Operation]:
+        """List[google.api_core.operation.Operation]: The operations not done yet."""
+        return self._schedule.pending
+
+    def add(self, op: operation.Operation) -> None:
+        """Starts polling an operation.
+
+        Args:
+            op (google.api_core.operation.Operation): The operation.
+        """
+        self._schedule.add(op)
+        self._wakeup.set()
+
+    def discard(self, op: operation.Operation) -> None:
+        """Stops polling an operation."""
+        self._schedule.discard(op)
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """Stops the iterators and shuts down the executor if it is owned.
+
+        Polls already submitted complete; later calls to :meth:`poll_once`
+        return no events.
+        """
+        with self._lock:
+            self._closed = True
+        self._wakeup.set()
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def next_poll_in(self) -> Optional[float]:
+        """Returns the seconds until the next poll is due, if any operation is pending."""
+        return self._schedule.next_poll_in()
+
+    def _done(self, op: operation.Operation) -> bool:
+        if self._retry is None:
+            return op.done()
+        return op.done(retry=self._retry)
+
+    def poll_once(self) -> List[OperationEvent]:
+        """Polls every operation that is due, concurrently.
+
+        Returns:
+            List[OperationEvent]: The events of the operations whose rollout
+            state changed, that completed, or whose poll failed. Empty once
+            the waiter is closed.
+        """
+        # Submitted under the lock, so that close() cannot shut the executor
+        # down in between.
+        with self._lock:
+            if self._closed:
+                return []
+            futures = [
+                (pending, self._executor.submit(self._done, pending.operation))
+                for pending in self._schedule.due()
+            ]
+        events = []
+        for pending, future in futures:
+            try:
+                done, error = future.result(), None
+            except Exception as exc:
+                done, error = False, exc
+            event = self._schedule.update(pending, done, error)
+            if event is not None:
+                events.append(event)
+        return events
+
+    def events(self, timeout: Optional[float] = None) -> Iterator[OperationEvent]:
+        """Yields the changes of the pending operations as they are observed.
+
+        Polls are scheduled until every operation completed or was
+        discarded, or until :meth:`close` is called. Operations can be
+        added while iterating.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to
+                wait for all operations.
+
+        Yields:
+            OperationEvent: The changes of the pending operations.
+
+        Raises:
+            concurrent.futures.TimeoutError: If operations are still pending
+                after ``timeout`` seconds.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while not self._closed:
+            self._wakeup.clear()
+            delay = self.next_poll_in()
+            if delay is None:
+                return
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise concurrent.futures.TimeoutError(
+                        "{} operations are still pending.".format(len(self))
+                    )
+                delay = min(delay, remaining)
+            if delay > 0:
+                self._wakeup.wait(delay)
+                continue
+            for event in self.poll_once():
+                yield event
+
+    def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[operation.Operation]:
+        """Yields the operations as they complete.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to
+                wait for all operations.
+
+        Yields:
+            google.api_core.operation.Operation: The completed operations;
+            their result or exception is available without blocking. An
+            operation whose poll failed permanently is yielded too; its
+            ``result()`` raises the error.
+
+        Raises:
+            concurrent.futures.TimeoutError: If operations are still pending
+                after ``timeout`` seconds.
+        """
+        for event in self.events(timeout):
+            if event.done:
+                yield event.operation
+
+
+class AsyncOperationWaiter:
+    """Polls many operations of :class:`~.OsConfigZonalServiceAsyncClient`.
+
+    Args:
+        operations (Iterable[google.api_core.operation_async.AsyncOperation]):
+            The operations to wait for; more can be added with :meth:`add`.
+        max_concurrency (int): The maximum number of polls sent at once.
+        initial_interval (float): The delay, in seconds, before polling an
+            operation after it was added or its rollout state changed.
+        max_interval (float): The longest delay between two polls of an
+            operation.
+        backoff (float): The factor the delay is multiplied by each time an
+            operation is polled without its rollout state changing.
+        jitter (float): The maximum relative random change of each delay,
+            which spreads the polls of operations started together.
+        batch_window (float): Polls due within this many seconds of each
+            other are sent together.
+        retry (google.api_core.retry_async.AsyncRetry): Designation of what
+            errors, if any, should be retried by each poll. Defaults to the
+            retry of the operations.
+        clock (Callable[[], float]): The monotonic clock used to schedule
+            the polls.
+        rng (Optional[random.Random]): The source of the jitter.
+    """
+
+    def __init__(
+        self,
+        operations: Iterable[operation_async.AsyncOperation] = (),
+        *,
+        max_concurrency: int = 8,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        jitter: float = 0.2,
+        batch_window: float = 0.5,
+        retry=None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._schedule = _Schedule(
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            jitter=jitter,
+            batch_window=batch_window,
+            clock=clock,
+            rng=rng,
+        )
+        self._max_concurrency = max_concurrency
+        self._retry = retry
+        self._clock = clock
+        # Created in the event loop the waiter is iterated in.
+        self._wakeup: Optional[asyncio.Event] = None
+        for op in operations:
+            self.add(op)
+
+    def __len__(self) -> int:
+        return len(self._schedule)
+
+    @property
+    def pending(self) -> List[operation_async.AsyncOperation]:
+        """List[google.api_core.operation_async.AsyncOperation]: The operations not done yet."""
+        return self._schedule.pending
+
+    def add(self, op: operation_async.AsyncOperation) -> None:
+        """Starts polling an operation.
+
+        Args:
+            op (google.api_core.operation_async.AsyncOperation): The operation.
+        """
+        self._schedule.add(op)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def discard(self, op: operation_async.AsyncOperation) -> None:
+        """Stops polling an operation."""
+        self._schedule.discard(op)
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def next_poll_in(self) -> Optional[float]:
+        """Returns the seconds until the next poll is due, if any operation is pending."""
+        return self._schedule.next_poll_in()
+
+    async def poll_once(self) -> List[OperationEvent]:
+        """Polls every operation that is due, concurrently.
+
+        Returns:
+            List[OperationEvent]: The events of the operations whose rollout
+            state changed, that completed, or whose poll failed.
+        """
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def poll(pending):
+            async with semaphore:
+                if self._retry is None:
+                    return await pending.operation.done()
+                return await pending.operation.done(retry=self._retry)
+
+        due = self._schedule.due()
+        results = await asyncio.gather(
+            *(poll(pending) for pending in due), return_exceptions=True
+        )
+        events = []
+        for pending, result in zip(due, results):
+            if isinstance(result, Exception):
+                event = self._schedule.update(pending, False, result)
+            else:
+                event = self._schedule.update(pending, result, None)
+            if event is not None:
+                events.append(event)
+        return events
+
+    async def events(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[OperationEvent]:
+        """Yields the changes of the pending operations as they are observed.
+
+        Polls are scheduled until every operation completed or was
+        discarded. Operations can be added while iterating.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to
+                wait for all operations.
+
+        Yields:
+            OperationEvent: The changes of the pending operations.
+
+        Raises:
+            asyncio.TimeoutError: If operations are still pending after
+                ``timeout`` seconds.
+        """
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            self._wakeup.clear()
+            delay = self.next_poll_in()
+            if delay is None:
+                return
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(
+                        "{} operations are still pending.".format(len(self))
+                    )
+                delay = min(delay, remaining)
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            for event in await self.poll_once():
+                yield event
+
+    async def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[operation_async.AsyncOperation]:
+        """Yields the operations as they complete.
+
+        Args:
+            timeout (Optional[float]): The maximum number of seconds to
+                wait for all operations.
+
+        Yields:
+            google.api_core.operation_async.AsyncOperation: The completed
+            operations, and the ones whose poll failed permanently.
+
+        Raises:
+            asyncio.TimeoutError: If operations are still pending after
+                ``timeout`` seconds.
+        """
+        async for event in self.events(timeout):
+            if event.done:
+                yield event.operation
+
+
+__all__ = (
+    "AsyncOperationWaiter",
+    "OperationEvent",
+    "OperationWaiter",
+    "RolloutState",
+)
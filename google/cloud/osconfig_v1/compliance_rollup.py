@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Compliance rollups of OS policy assignment reports.
+
+A :class:`ComplianceRollup` consumes reports in a single pass and keeps
+only counters, so that it can summarize the reports of a whole fleet:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import compliance_rollup
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    rollup = compliance_rollup.ComplianceRollup()
+    rollup.update(
+        client.list_os_policy_assignment_reports(
+            parent="projects/p/locations/-/instances/-/osPolicyAssignments/-"
+        )
+    )
+    for (zone,), counts in rollup.rollup(["zone"], level="instance").items():
+        print(zone, counts.compliance)
+
+Each report is counted at three levels:
+
+* ``instance``: the compliance of the instance with the assignment. It is
+  non-compliant if any of its OS policies is, otherwise unknown if any is
+  unknown or the report has none, otherwise compliant.
+* ``policy``: the compliance of each OS policy of the report.
+* ``resource``: the compliance of each resource of these OS policies.
+
+The counters are indexed by (zone, assignment, OS policy ID, resource ID,
+compliance state), with the strings interned and the index packed into a
+single integer; their number grows with the distinct combinations, not
+with the reports.
+"""
+
+import collections
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from google.cloud.osconfig_v1.types import os_policy_assignment_reports
+
+ComplianceState = (
+    os_policy_assignment_reports.OSPolicyAssignmentReport.OSPolicyCompliance.ComplianceState
+)
+
+#: The dimensions :meth:`ComplianceRollup.rollup` can group by.
+DIMENSIONS = ("zone", "assignment", "os_policy_id", "resource_id")
+
+#: The levels :meth:`ComplianceRollup.rollup` can count at.
+LEVELS = ("instance", "policy", "resource")
+
+# Bits of the packed counter index, from the most significant dimension.
+_DIMENSION_BITS = 24
+_STATE_BITS = 2
+_DIMENSION_MASK = (1 << _DIMENSION_BITS) - 1
+_STATE_MASK = (1 << _STATE_BITS) - 1
+
+_COMPLIANT = int(ComplianceState.COMPLIANT)
+_NON_COMPLIANT = int(ComplianceState.NON_COMPLIANT)
+_UNKNOWN = int(ComplianceState.UNKNOWN)
+# The position in :class:`ComplianceCounts` of each state. States added to
+# the API after this module are counted as unknown.
+_COUNTS_FIELD = {_COMPLIANT: 0, _NON_COMPLIANT: 1, _UNKNOWN: 2}
+
+
+class ComplianceCounts(NamedTuple):
+    """The number of compliant, non-compliant and unknown items of a group.
+
+    Attributes:
+        compliant (int): The compliant items.
+        non_compliant (int): The non-compliant items.
+        unknown (int): The items in an unknown compliance state.
+    """
+
+    compliant: int = 0
+    non_compliant: int = 0
+    unknown: int = 0
+
+    @property
+    def total(self) -> int:
+        """int: The number of items."""
+        return self.compliant + self.non_compliant + self.unknown
+
+    @property
+    def compliance(self) -> Optional[float]:
+        """Optional[float]: The percentage of compliant items, ``None`` if
+        there are none."""
+        total = self.total
+        return 100.0 * self.compliant / total if total else None
+
+
+class _Interner:
+    """Maps strings to small integers; 0 stands for "not applicable"."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.values: List[Optional[str]] = [None]
+
+    def get(self, value: str) -> Optional[int]:
+        return self._ids.get(value)
+
+    def __call__(self, value: str) -> int:
+        id_ = self._ids.get(value)
+        if id_ is None:
+            id_ = len(self.values)
+            if id_ > _DIMENSION_MASK:
+                raise ValueError("Too many distinct values to count.")
+            self._ids[value] = id_
+            self.values.append(value)
+        return id_
+
+
+def _split_assignment(name: str) -> Tuple[str, str]:
+    """Returns the (zone, assignment) of an assignment revision name."""
+    assignment = name.split("@", 1)[0]
+    segments = assignment.split("/")
+    zone = segments[3] if len(segments) > 3 and segments[2] == "locations" else ""
+    return zone, assignment
+
+
+class ComplianceRollup:
+    """Counts the compliance of OS policy assignment reports.
+
+    Reports are not retained: add each report once, for example by adding
+    the reports of a single listing.
+    """
+
+    def __init__(self):
+        self._strings = {dimension: _Interner() for dimension in DIMENSIONS}
+        self._counts: Dict[int, int] = collections.Counter()
+        self._reports = 0
+
+    def __len__(self) -> int:
+        """Returns the number of reports added."""
+        return self._reports
+
+    @property
+    def counters(self) -> int:
+        """int: The number of counters kept."""
+        return len(self._counts)
+
+    def add(self, report: Any) -> None:
+        """Counts a report.
+
+        Args:
+            report (google.cloud.osconfig_v1.types.OSPolicyAssignmentReport):
+                The report.
+        """
+        pb = os_policy_assignment_reports.OSPolicyAssignmentReport.pb(report)
+        zone, assignment = _split_assignment(pb.os_policy_assignment)
+        if not zone:
+            zone = _split_assignment(pb.name)[0]
+        strings = self._strings
+        # The packed index of the assignment, with no OS policy or resource.
+        assignment_key = (
+            strings["zone"](zone) << _DIMENSION_BITS | strings["assignment"](assignment)
+        ) << (2 * _DIMENSION_BITS + _STATE_BITS)
+        intern_policy = strings["os_policy_id"]
+        intern_resource = strings["resource_id"]
+        counts = self._counts
+
+        instance_state = _COMPLIANT if len(pb.os_policy_compliances) else _UNKNOWN
+        for policy in pb.os_policy_compliances:
+            state = policy.compliance_state
+            if state not in _COUNTS_FIELD:
+                state = _UNKNOWN
+            if state == _NON_COMPLIANT:
+                instance_state = _NON_COMPLIANT
+            elif state == _UNKNOWN and instance_state == _COMPLIANT:
+                instance_state = _UNKNOWN
+            policy_key = assignment_key | intern_policy(policy.os_policy_id) << (
+                _DIMENSION_BITS + _STATE_BITS
+            )
+            counts[policy_key | state] += 1
+            for resource in policy.os_policy_resource_compliances:
+                resource_id = intern_resource(resource.os_policy_resource_id)
+                resource_state = resource.compliance_state
+                if resource_state not in _COUNTS_FIELD:
+                    resource_state = _UNKNOWN
+                counts[policy_key | resource_id << _STATE_BITS | resource_state] += 1
+        counts[assignment_key | instance_state] += 1
+        self._reports += 1
+
+    def update(self, reports: Iterable[Any]) -> None:
+        """Counts reports, for example those of a
+        ``ListOSPolicyAssignmentReportsPager``.
+
+        Args:
+            reports (Iterable[google.cloud.osconfig_v1.types.OSPolicyAssignmentReport]):
+                The reports.
+        """
+        for report in reports:
+            self.add(report)
+
+    def _unpack(self, key: int) -> Tuple[int, int, int, int, int]:
+        state = key & _STATE_MASK
+        key >>= _STATE_BITS
+        resource = key & _DIMENSION_MASK
+        key >>= _DIMENSION_BITS
+        policy = key & _DIMENSION_MASK
+        key >>= _DIMENSION_BITS
+        return key >> _DIMENSION_BITS, key & _DIMENSION_MASK, policy, resource, state
+
+    def rollup(
+        self,
+        by: Sequence[str] = (),
+        *,
+        level: str = "policy",
+        **where: str,
+    ) -> Dict[Tuple[Optional[str], ...], ComplianceCounts]:
+        """Returns the compliance counts of groups.
+
+        Args:
+            by (Sequence[str]): The dimensions to group by, among
+                :data:`DIMENSIONS`. No dimensions count everything as one
+                group.
+            level (str): What to count, among :data:`LEVELS`.
+            where (str): Values that dimensions must have, e.g.
+                ``zone="us-central1-a"``.
+
+        Returns:
+            Dict[Tuple[Optional[str], ...], ComplianceCounts]: The counts,
+            keyed by the values of ``by``. Dimensions below ``level`` group
+            as ``None``.
+
+        Raises:
+            ValueError: If a dimension or the level is unknown.
+        """
+        if level not in LEVELS:
+            raise ValueError("Unknown level: {!r}".format(level))
+        for dimension in tuple(by) + tuple(where):
+            if dimension not in DIMENSIONS:
+                raise ValueError("Unknown dimension: {!r}".format(dimension))
+        positions = [DIMENSIONS.index(dimension) for dimension in by]
+        # The IDs required by ``where``; a value never seen matches nothing.
+        required = {}
+        for dimension, value in where.items():
+            id_ = self._strings[dimension].get(value)
+            if id_ is None:
+                return {}
+            required[DIMENSIONS.index(dimension)] = id_
+
+        totals: Dict[Tuple[int, ...], List[int]] = {}
+        for key, count in self._counts.items():
+            unpacked = self._unpack(key)
+            policy, resource = unpacked[2], unpacked[3]
+            if level == "instance" and policy:
+                continue
+            if level == "policy" and (not policy or resource):
+                continue
+            if level == "resource" and not resource:
+                continue
+            if any(unpacked[i] != id_ for i, id_ in required.items()):
+                continue
+            group = tuple(unpacked[i] for i in positions)
+            counts = totals.get(group)
+            if counts is None:
+                counts = totals[group] = [0, 0, 0]
+            # States added to the API after this module count as unknown.
+            counts[_COUNTS_FIELD.get(unpacked[4], 2)] += count
+
+        values = [self._strings[DIMENSIONS[i]].values for i in positions]
+        return {
+            tuple(v[id_] for v, id_ in zip(values, group)): ComplianceCounts(*counts)
+            for group, counts in totals.items()
+        }
+
+
+__all__ = (
+    "ComplianceCounts",
+    "ComplianceRollup",
+    "ComplianceState",
+    "DIMENSIONS",
+    "LEVELS",
+)
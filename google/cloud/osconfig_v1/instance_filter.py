@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Local evaluation of ``OSPolicyAssignment.InstanceFilter``.
+
+Predicts the VMs an OS policy assignment targets from their inventories
+and labels, without calling the service:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import instance_filter
+
+    instances = instance_filter.InstanceSet.from_inventories(
+        client.list_inventories(parent=parent),
+        labels={name: vm.labels for name, vm in compute_instances.items()},
+    )
+    targeted = instances.select(assignment.instance_filter)
+
+An :class:`InstanceSet` indexes the instances by label and by OS. Each
+posting is a bitmap, held in a Python integer, of the instances having a
+label or an OS version, so that a filter is evaluated with a few bitwise
+operations rather than by visiting every instance. Filters are compiled
+once by :func:`compile_filter`; a compiled filter caches nothing about an
+instance set and can be evaluated against several.
+
+The selection follows the API rules: a VM is targeted if it matches any
+inclusion label set, matches any inventory, and matches no exclusion label
+set, the criteria that are not set being ignored. A label set matches the
+VMs having all of its labels. An ``os_version`` ending with ``*`` matches
+the versions starting with the rest of it, and an empty one matches every
+version. A filter with ``all`` set targets every VM, and one without any
+criteria targets none.
+"""
+
+import bisect
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from google.cloud.osconfig_v1 import inventory_columns
+from google.cloud.osconfig_v1.types import os_policy_assignments
+
+InstanceFilter = os_policy_assignments.OSPolicyAssignment.InstanceFilter
+
+
+class Instance(NamedTuple):
+    """The attributes of a VM an instance filter depends on.
+
+    Attributes:
+        name (str): The instance resource name.
+        labels (Mapping[str, str]): The labels of the instance.
+        os_short_name (str): The ``Inventory.OsInfo.short_name``.
+        os_version (str): The ``Inventory.OsInfo.version``.
+    """
+
+    name: str
+    labels: Mapping[str, str]
+    os_short_name: str
+    os_version: str
+
+    @classmethod
+    def from_inventory(
+        cls, inventory: Any, labels: Optional[Mapping[str, str]] = None
+    ) -> "Instance":
+        """Returns the instance an inventory was reported by.
+
+        Args:
+            inventory (google.cloud.osconfig_v1.types.Inventory): The
+                inventory of the instance.
+            labels (Optional[Mapping[str, str]]): The labels of the
+                instance, which inventories do not include.
+        """
+        os_info = inventory.os_info
+        return cls(
+            inventory_columns.instance_name(inventory.name),
+            dict(labels or {}),
+            os_info.short_name,
+            os_info.version,
+        )
+
+
+def _validate(instance_filter: InstanceFilter) -> None:
+    if instance_filter.all_ and (
+        instance_filter.inclusion_labels
+        or instance_filter.exclusion_labels
+        or instance_filter.inventories
+    ):
+        raise ValueError("No other criteria is permitted when `all` is set.")
+    for inventory in instance_filter.inventories:
+        if not inventory.os_short_name:
+            raise ValueError("InstanceFilter.Inventory.os_short_name is required.")
+
+
+def _version_matches(pattern: str, version: str) -> bool:
+    if pattern.endswith("*"):
+        return version.startswith(pattern[:-1])
+    return not pattern or version == pattern
+
+
+def matches(instance_filter: InstanceFilter, instance: Instance) -> bool:
+    """Returns whether a filter targets a single instance.
+
+    Args:
+        instance_filter (google.cloud.osconfig_v1.types.OSPolicyAssignment.InstanceFilter):
+            The filter.
+        instance (Instance): The instance.
+
+    Raises:
+        ValueError: If the filter is invalid.
+    """
+    _validate(instance_filter)
+    if instance_filter.all_:
+        return True
+
+    def label_set_matches(label_set) -> bool:
+        return all(
+            instance.labels.get(key) == value for key, value in label_set.labels.items()
+        )
+
+    criteria = False
+    if instance_filter.inclusion_labels:
+        criteria = True
+        if not any(map(label_set_matches, instance_filter.inclusion_labels)):
+            return False
+    if instance_filter.inventories:
+        criteria = True
+        if not any(
+            inventory.os_short_name == instance.os_short_name
+            and _version_matches(inventory.os_version, instance.os_version)
+            for inventory in instance_filter.inventories
+        ):
+            return False
+    if instance_filter.exclusion_labels:
+        criteria = True
+        if any(map(label_set_matches, instance_filter.exclusion_labels)):
+            return False
+    return criteria
+
+
+class CompiledFilter(NamedTuple):
+    """An instance filter compiled for :meth:`InstanceSet.evaluate`.
+
+    Attributes:
+        all_ (bool): Whether every instance is targeted.
+        inclusion_labels (Tuple[Tuple[Tuple[str, str], ...], ...]): The
+            (key, value) pairs of each inclusion label set.
+        exclusion_labels (Tuple[Tuple[Tuple[str, str], ...], ...]): The
+            (key, value) pairs of each exclusion label set.
+        inventories (Tuple[Tuple[str, str, bool], ...]): The OS short name,
+            version and whether the version is a prefix, of each inventory.
+    """
+
+    all_: bool
+    inclusion_labels: Tuple[Tuple[Tuple[str, str], ...], ...]
+    exclusion_labels: Tuple[Tuple[Tuple[str, str], ...], ...]
+    inventories: Tuple[Tuple[str, str, bool], ...]
+
+
+def compile_filter(instance_filter: InstanceFilter) -> CompiledFilter:
+    """Compiles an instance filter.
+
+    Args:
+        instance_filter (google.cloud.osconfig_v1.types.OSPolicyAssignment.InstanceFilter):
+            The filter.
+
+    Returns:
+        CompiledFilter: The compiled filter.
+
+    Raises:
+        ValueError: If the filter is invalid.
+    """
+    _validate(instance_filter)
+    pb = InstanceFilter.pb(instance_filter)
+
+    def label_sets(sets) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+        # Sorted, so that equal label sets compile to equal tuples.
+        return tuple(tuple(sorted(label_set.labels.items())) for label_set in sets)
+
+    inventories = []
+    for inventory in pb.inventories:
+        version = inventory.os_version
+        prefix = version.endswith("*")
+        inventories.append(
+            (inventory.os_short_name, version[:-1] if prefix else version, prefix)
+        )
+    return CompiledFilter(
+        pb.all_,
+        label_sets(pb.inclusion_labels),
+        label_sets(pb.exclusion_labels),
+        tuple(inventories),
+    )
+
+
+def _bits(mask: int) -> Iterator[int]:
+    # Scanning the binary string is linear in the size of the set, whereas
+    # clearing one bit at a time copies the whole integer for every bit.
+    digits = format(mask, "b")[::-1]
+    i = digits.find("1")
+    while i != -1:
+        yield i
+        i = digits.find("1", i + 1)
+
+
+class InstanceSet:
+    """A set of instances indexed by label and OS.
+
+    Args:
+        instances (Iterable[Instance]): The instances.
+    """
+
+    def __init__(self, instances: Iterable[Instance] = ()):
+        self._instances: List[Optional[Instance]] = []
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._all = 0
+        # Bitmaps of the instances with a (key, value) label.
+        self._labels: Dict[Tuple[str, str], int] = {}
+        # Bitmaps of the instances with each version of an OS, and the
+        # sorted versions of the OS for prefix lookups.
+        self._versions: Dict[str, Dict[str, int]] = {}
+        self._sorted_versions: Dict[str, List[str]] = {}
+        self.update(instances)
+
+    @classmethod
+    def from_inventories(
+        cls,
+        inventories: Iterable[Any],
+        labels: Optional[Mapping[str, Mapping[str, str]]] = None,
+    ) -> "InstanceSet":
+        """Returns the instances that reported inventories.
+
+        Args:
+            inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+                The inventories, e.g. a ``list_inventories`` pager.
+            labels (Optional[Mapping[str, Mapping[str, str]]]): The labels
+                of each instance, keyed by instance resource name.
+        """
+        labels = labels or {}
+        instances = []
+        for inventory in inventories:
+            instance = Instance.from_inventory(inventory)
+            instances.append(instance._replace(labels=labels.get(instance.name, {})))
+        return cls(instances)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._slots
+
+    def __iter__(self) -> Iterator[Instance]:
+        return (instance for instance in self._instances if instance is not None)
+
+    def update(self, instances: Iterable[Instance]) -> None:
+        """Adds instances, replacing the ones with the same name."""
+        for instance in instances:
+            self.remove(instance.name)
+            slot = self._free.pop() if self._free else len(self._instances)
+            if slot == len(self._instances):
+                self._instances.append(instance)
+            else:
+                self._instances[slot] = instance
+            self._slots[instance.name] = slot
+            bit = 1 << slot
+            self._all |= bit
+            for pair in instance.labels.items():
+                self._labels[pair] = self._labels.get(pair, 0) | bit
+            versions = self._versions.setdefault(instance.os_short_name, {})
+            if instance.os_version not in versions:
+                versions[instance.os_version] = 0
+                bisect.insort(
+                    self._sorted_versions.setdefault(instance.os_short_name, []),
+                    instance.os_version,
+                )
+            versions[instance.os_version] |= bit
+
+    def remove(self, name: str) -> bool:
+        """Removes an instance.
+
+        Returns:
+            bool: Whether the instance was in the set.
+        """
+        slot = self._slots.pop(name, None)
+        if slot is None:
+            return False
+        instance = self._instances[slot]
+        self._instances[slot] = None
+        self._free.append(slot)
+        bit = 1 << slot
+        self._all &= ~bit
+        for pair in instance.labels.items():
+            self._labels[pair] &= ~bit
+            if not self._labels[pair]:
+                del self._labels[pair]
+        versions = self._versions[instance.os_short_name]
+        versions[instance.os_version] &= ~bit
+        if not versions[instance.os_version]:
+            del versions[instance.os_version]
+            sorted_versions = self._sorted_versions[instance.os_short_name]
+            del sorted_versions[
+                bisect.bisect_left(sorted_versions, instance.os_version)
+            ]
+        return True
+
+    def _label_set(self, pairs: Tuple[Tuple[str, str], ...]) -> int:
+        mask = self._all
+        for pair in pairs:
+            mask &= self._labels.get(pair, 0)
+            if not mask:
+                break
+        return mask
+
+    def _inventory(self, os_short_name: str, version: str, prefix: bool) -> int:
+        versions = self._versions.get(os_short_name)
+        if not versions:
+            return 0
+        if not prefix:
+            return versions.get(version, 0) if version else self._os_mask(versions)
+        sorted_versions = self._sorted_versions[os_short_name]
+        mask = 0
+        for i in range(
+            bisect.bisect_left(sorted_versions, version), len(sorted_versions)
+        ):
+            if not sorted_versions[i].startswith(version):
+                break
+            mask |= versions[sorted_versions[i]]
+        return mask
+
+    @staticmethod
+    def _os_mask(versions: Dict[str, int]) -> int:
+        mask = 0
+        for bits in versions.values():
+            mask |= bits
+        return mask
+
+    def evaluate(self, compiled: CompiledFilter) -> int:
+        """Returns the bitmap of the instances targeted by a compiled filter.
+
+        Bit ``i`` is set for the instance in slot ``i``; see :meth:`names`.
+        """
+        if compiled.all_:
+            return self._all
+        if not (
+            compiled.inclusion_labels
+            or compiled.inventories
+            or compiled.exclusion_labels
+        ):
+            return 0
+        mask = self._all
+        if compiled.inclusion_labels:
+            included = 0
+            for pairs in compiled.inclusion_labels:
+                included |= self._label_set(pairs)
+            mask &= included
+        if mask and compiled.inventories:
+            matched = 0
+            for inventory in compiled.inventories:
+                matched |= self._inventory(*inventory)
+            mask &= matched
+        for pairs in compiled.exclusion_labels:
+            if not mask:
+                break
+            mask &= ~self._label_set(pairs)
+        return mask
+
+    def names(self, mask: int) -> Set[str]:
+        """Returns the names of the instances in a bitmap."""
+        return {self._instances[slot].name for slot in _bits(mask)}
+
+    def select(self, instance_filter: InstanceFilter) -> Set[str]:
+        """Returns the names of the instances targeted by a filter.
+
+        Args:
+            instance_filter (Union[google.cloud.osconfig_v1.types.OSPolicyAssignment.InstanceFilter, CompiledFilter]):
+                The filter, compiled or not.
+
+        Returns:
+            Set[str]: The names of the targeted instances.
+
+        Raises:
+            ValueError: If the filter is invalid.
+        """
+        if not isinstance(instance_filter, CompiledFilter):
+            instance_filter = compile_filter(instance_filter)
+        return self.names(self.evaluate(instance_filter))
+
+    def count(self, instance_filter: InstanceFilter) -> int:
+        """Returns the number of instances targeted by a filter."""
+        if not isinstance(instance_filter, CompiledFilter):
+            instance_filter = compile_filter(instance_filter)
+        return bin(self.evaluate(instance_filter)).count("1")
+
+
+__all__ = (
+    "CompiledFilter",
+    "Instance",
+    "InstanceSet",
+    "compile_filter",
+    "matches",
+)
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Columnar export of :class:`~.types.Inventory` software packages.
+
+Each software package found in ``Inventory.items`` becomes one row with the
+columns listed in :data:`COLUMNS`. Rows are produced in chunks of a bounded
+number of rows, so that fleet-wide snapshots can be converted without
+holding every row as Python objects:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import inventory_columns
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    pager = client.list_inventories(
+        request={"parent": parent, "view": osconfig_v1.InventoryView.FULL}
+    )
+    table = inventory_columns.to_arrow(pager)
+
+:func:`to_arrow` and :func:`iter_record_batches` require ``pyarrow``;
+:func:`iter_numpy_chunks` requires ``numpy``. Both are optional
+dependencies, installed with the ``pyarrow`` and ``numpy`` extras.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from google.cloud.osconfig_v1.types import inventory
+
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+
+_NUMPY_REQUIRED = "numpy is required to export inventories as numpy arrays."
+_PYARROW_REQUIRED = "pyarrow is required to export inventories as Arrow tables."
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+#: The columns produced for each software package, in order.
+COLUMNS = (
+    "instance",
+    "item_id",
+    "origin_type",
+    "item_type",
+    "package_type",
+    "name",
+    "version",
+    "architecture",
+)
+
+# Columns holding ``Inventory.Item`` enum values; all others are strings.
+_ENUM_COLUMNS = frozenset(("origin_type", "item_type"))
+
+# Columns with few distinct values, dictionary-encoded in Arrow tables.
+_DICTIONARY_COLUMNS = frozenset(("instance", "package_type", "architecture"))
+
+
+def _versioned(package) -> Tuple[str, str, str]:
+    return package.package_name, package.version, package.architecture
+
+
+# Maps each ``SoftwarePackage.details`` oneof member to a function returning
+# its (name, version, architecture).
+_PACKAGE_FIELDS = {
+    "yum_package": _versioned,
+    "apt_package": _versioned,
+    "zypper_package": _versioned,
+    "googet_package": _versioned,
+    "cos_package": _versioned,
+    "zypper_patch": lambda patch: (patch.patch_name, "", ""),
+    "wua_package": lambda package: (
+        package.title,
+        str(package.revision_number) if package.revision_number else "",
+        "",
+    ),
+    "qfe_package": lambda package: (package.hot_fix_id, "", ""),
+    "windows_application": lambda app: (
+        app.display_name,
+        app.display_version,
+        "",
+    ),
+}
+
+
+def instance_name(inventory_name: str) -> str:
+    """Returns the instance resource name owning an inventory.
+
+    Args:
+        inventory_name (str): An inventory resource name, of the form
+            ``projects/{project}/locations/{location}/instances/{instance}/inventory``.
+
+    Returns:
+        str: The instance resource name, without the ``/inventory`` suffix.
+    """
+    if inventory_name.endswith("/inventory"):
+        return inventory_name[: -len("/inventory")]
+    return inventory_name
+
+
+def _raw(message: Any) -> Any:
+    """Returns the protobuf message underlying a proto-plus wrapper."""
+    if isinstance(message, inventory.Inventory):
+        return inventory.Inventory.pb(message)
+    return message
+
+
+def iter_rows(inventories: Iterable[Any]) -> Iterator[Tuple[Any, ...]]:
+    """Yields one tuple per software package, with the fields in :data:`COLUMNS`.
+
+    Args:
+        inventories (Iterable[Union[google.cloud.osconfig_v1.types.Inventory, google.cloud.osconfig_v1.types.inventory_pb2.Inventory]]):
+            The inventories to flatten, for example a ``ListInventoriesPager``.
+            Items without a software package are skipped.
+    """
+    for message in inventories:
+        pb = _raw(message)
+        instance = instance_name(pb.name)
+        for item_id, item in pb.items.items():
+            details = item.WhichOneof("details")
+            if details is None:
+                continue
+            package = getattr(item, details)
+            package_type = package.WhichOneof("details")
+            if package_type is None:
+                continue
+            name, version, architecture = _PACKAGE_FIELDS[package_type](
+                getattr(package, package_type)
+            )
+            yield (
+                instance,
+                item.id or item_id,
+                item.origin_type,
+                item.type_,
+                package_type,
+                name,
+                version,
+                architecture,
+            )
+
+
+def iter_column_chunks(
+    inventories: Iterable[Any], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Dict[str, List[Any]]]:
+    """Yields the software package rows as columns, ``chunk_size`` rows at a time.
+
+    Args:
+        inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+            The inventories to flatten.
+        chunk_size (int): The maximum number of rows per chunk.
+
+    Yields:
+        Dict[str, List[Any]]: A mapping from each name in :data:`COLUMNS`
+        to a list of values; all lists have the same length.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    columns: List[List[Any]] = [[] for _ in COLUMNS]
+    appends = [column.append for column in columns]
+    size = 0
+    for row in iter_rows(inventories):
+        for append, value in zip(appends, row):
+            append(value)
+        size += 1
+        if size == chunk_size:
+            yield dict(zip(COLUMNS, columns))
+            columns = [[] for _ in COLUMNS]
+            appends = [column.append for column in columns]
+            size = 0
+    if size:
+        yield dict(zip(COLUMNS, columns))
+
+
+def iter_numpy_chunks(
+    inventories: Iterable[Any], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Dict[str, "numpy.ndarray"]]:
+    """Yields the software package rows as numpy arrays, chunk by chunk.
+
+    Enum columns are ``int32`` arrays; string columns are arrays of
+    ``object`` dtype.
+
+    Args:
+        inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+            The inventories to flatten.
+        chunk_size (int): The maximum number of rows per chunk.
+
+    Raises:
+        ImportError: If ``numpy`` is not installed.
+    """
+    if numpy is None:
+        raise ImportError(_NUMPY_REQUIRED)
+    for chunk in iter_column_chunks(inventories, chunk_size=chunk_size):
+        yield {
+            name: numpy.array(
+                values, dtype=numpy.int32 if name in _ENUM_COLUMNS else object
+            )
+            for name, values in chunk.items()
+        }
+
+
+def arrow_schema() -> "pyarrow.Schema":
+    """Returns the schema of the Arrow tables produced by :func:`to_arrow`.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    if pyarrow is None:
+        raise ImportError(_PYARROW_REQUIRED)
+    fields = []
+    for name in COLUMNS:
+        if name in _ENUM_COLUMNS:
+            type_ = pyarrow.int32()
+        elif name in _DICTIONARY_COLUMNS:
+            type_ = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+        else:
+            type_ = pyarrow.string()
+        fields.append(pyarrow.field(name, type_, nullable=False))
+    return pyarrow.schema(fields)
+
+
+def iter_record_batches(
+    inventories: Iterable[Any], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator["pyarrow.RecordBatch"]:
+    """Yields the software package rows as Arrow record batches.
+
+    ``instance``, ``package_type`` and ``architecture`` are dictionary
+    encoded.
+
+    Args:
+        inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+            The inventories to flatten.
+        chunk_size (int): The maximum number of rows per batch.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    schema = arrow_schema()
+    for chunk in iter_column_chunks(inventories, chunk_size=chunk_size):
+        arrays = []
+        for field in schema:
+            values = chunk[field.name]
+            if pyarrow.types.is_dictionary(field.type):
+                array = pyarrow.array(values, type=pyarrow.string()).dictionary_encode()
+            else:
+                array = pyarrow.array(values, type=field.type)
+            arrays.append(array)
+        yield pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def to_arrow(
+    inventories: Iterable[Any], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> "pyarrow.Table":
+    """Converts the software packages of ``inventories`` into an Arrow table.
+
+    Rows are converted ``chunk_size`` at a time, so at most one chunk of
+    rows exists as Python objects at any point.
+
+    Args:
+        inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+            The inventories to flatten.
+        chunk_size (int): The maximum number of rows per record batch.
+
+    Returns:
+        pyarrow.Table: A table with the columns in :data:`COLUMNS`.
+
+    Raises:
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    schema = arrow_schema()
+    return pyarrow.Table.from_batches(
+        iter_record_batches(inventories, chunk_size=chunk_size), schema=schema
+    )
+
+
+def to_numpy(
+    inventories: Iterable[Any], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict[str, "numpy.ndarray"]:
+    """Converts the software packages of ``inventories`` into numpy arrays.
+
+    Args:
+        inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+            The inventories to flatten.
+        chunk_size (int): The number of rows converted at a time.
+
+    Returns:
+        Dict[str, numpy.ndarray]: One array per name in :data:`COLUMNS`.
+
+    Raises:
+        ImportError: If ``numpy`` is not installed.
+    """
+    if numpy is None:
+        raise ImportError(_NUMPY_REQUIRED)
+    chunks = list(iter_numpy_chunks(inventories, chunk_size=chunk_size))
+    return {
+        name: numpy.concatenate([chunk[name] for chunk in chunks])
+        if chunks
+        else numpy.array([], dtype=numpy.int32 if name in _ENUM_COLUMNS else object)
+        for name in COLUMNS
+    }
+
+
+__all__ = (
+    "COLUMNS",
+    "arrow_schema",
+    "instance_name",
+    "iter_column_chunks",
+    "iter_numpy_chunks",
+    "iter_record_batches",
+    "iter_rows",
+    "to_arrow",
+    "to_numpy",
+)
@@ -0,0 +1,577 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""An in-memory index of package versions across inventory snapshots.
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import package_index
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    index = package_index.PackageVersionIndex()
+    index.update(
+        client.list_inventories(
+            request={"parent": parent, "view": osconfig_v1.InventoryView.FULL}
+        )
+    )
+    vulnerable = index.find("openssl", lt="3.0.7")
+
+Versions are compared with the rules of the package manager that reported
+them: ``dpkg`` for apt packages, ``rpm`` for yum, zypper and COS packages,
+and dotted numeric versions for GooGet packages and Windows applications.
+Windows Update, QFE and zypper patch items carry no version and are not
+indexed.
+"""
+
+import bisect
+import functools
+import re
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from google.cloud.osconfig_v1 import inventory_columns
+from google.cloud.osconfig_v1.types import inventory
+
+DPKG = "dpkg"
+RPM = "rpm"
+WINDOWS = "windows"
+
+# The version scheme of each SoftwarePackage.details oneof member.
+_PACKAGE_SCHEMES = {
+    "apt_package": DPKG,
+    "yum_package": RPM,
+    "zypper_package": RPM,
+    "cos_package": RPM,
+    "googet_package": WINDOWS,
+    "windows_application": WINDOWS,
+}
+
+_DIGITS = frozenset("0123456789")
+
+
+def _is_alpha(char: str) -> bool:
+    return char.isascii() and char.isalpha()
+
+
+def _is_alnum(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def _dpkg_order(char: str) -> int:
+    if char in _DIGITS:
+        return 0
+    if _is_alpha(char):
+        return ord(char)
+    if char == "~":
+        return -1
+    return ord(char) + 256
+
+
+def _dpkg_verrevcmp(a: str, b: str) -> int:
+    """Compares version fragments like dpkg's ``verrevcmp``."""
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a or j < len_b:
+        while (i < len_a and a[i] not in _DIGITS) or (
+            j < len_b and b[j] not in _DIGITS
+        ):
+            order_a = _dpkg_order(a[i]) if i < len_a else 0
+            order_b = _dpkg_order(b[j]) if j < len_b else 0
+            if order_a != order_b:
+                return order_a - order_b
+            i += 1
+            j += 1
+        while i < len_a and a[i] == "0":
+            i += 1
+        while j < len_b and b[j] == "0":
+            j += 1
+        first_diff = 0
+        while i < len_a and a[i] in _DIGITS and j < len_b and b[j] in _DIGITS:
+            if not first_diff:
+                first_diff = ord(a[i]) - ord(b[j])
+            i += 1
+            j += 1
+        if i < len_a and a[i] in _DIGITS:
+            return 1
+        if j < len_b and b[j] in _DIGITS:
+            return -1
+        if first_diff:
+            return first_diff
+    return 0
+
+
+def _split_epoch(version: str) -> Tuple[int, str]:
+    epoch, sep, rest = version.partition(":")
+    if sep and epoch.isdigit():
+        return int(epoch), rest
+    return 0, version
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+def dpkg_compare(a: str, b: str) -> int:
+    """Compares two Debian package versions (``[epoch:]upstream[-revision]``).
+
+    Returns:
+        int: A negative number, zero or a positive number if ``a`` is older
+        than, the same as, or newer than ``b``.
+    """
+    epoch_a, a = _split_epoch(a)
+    epoch_b, b = _split_epoch(b)
+    if epoch_a != epoch_b:
+        return _sign(epoch_a - epoch_b)
+    upstream_a, _, revision_a = a.rpartition("-") if "-" in a else (a, "", "")
+    upstream_b, _, revision_b = b.rpartition("-") if "-" in b else (b, "", "")
+    return _sign(
+        _dpkg_verrevcmp(upstream_a, upstream_b)
+        or _dpkg_verrevcmp(revision_a, revision_b)
+    )
+
+
+def _rpmvercmp(a: str, b: str) -> int:
+    """Compares version fragments like rpm's ``rpmvercmp``."""
+    if a == b:
+        return 0
+    i = j = 0
+    len_a, len_b = len(a), len(b)
+    while i < len_a or j < len_b:
+        while i < len_a and not _is_alnum(a[i]) and a[i] not in "~^":
+            i += 1
+        while j < len_b and not _is_alnum(b[j]) and b[j] not in "~^":
+            j += 1
+
+        # "~" sorts before anything, even the end of the version.
+        tilde_a = i < len_a and a[i] == "~"
+        tilde_b = j < len_b and b[j] == "~"
+        if tilde_a or tilde_b:
+            if not tilde_a:
+                return 1
+            if not tilde_b:
+                return -1
+            i += 1
+            j += 1
+            continue
+
+        # "^" sorts after the end of the version, but before anything else.
+        if (i < len_a and a[i] == "^") or (j < len_b and b[j] == "^"):
+            if i >= len_a:
+                return -1
+            if j >= len_b:
+                return 1
+            if a[i] != "^":
+                return 1
+            if b[j] != "^":
+                return -1
+            i += 1
+            j += 1
+            continue
+
+        if i >= len_a or j >= len_b:
+            break
+
+        is_num = a[i] in _DIGITS
+        accept = (lambda c: c in _DIGITS) if is_num else _is_alpha
+        start_a, start_b = i, j
+        while i < len_a and accept(a[i]):
+            i += 1
+        while j < len_b and accept(b[j]):
+            j += 1
+        segment_a, segment_b = a[start_a:i], b[start_b:j]
+        if not segment_b:
+            # Numeric segments are newer than alphabetic ones.
+            return 1 if is_num else -1
+        if is_num:
+            segment_a = segment_a.lstrip("0")
+            segment_b = segment_b.lstrip("0")
+            if len(segment_a) != len(segment_b):
+                return 1 if len(segment_a) > len(segment_b) else -1
+        if segment_a != segment_b:
+            return 1 if segment_a > segment_b else -1
+
+    if i >= len_a and j >= len_b:
+        return 0
+    return -1 if i >= len_a else 1
+
+
+def rpm_compare(a: str, b: str) -> int:
+    """Compares two RPM versions (``[epoch:]version[-release]``).
+
+    This is also the version scheme used by zypper. The release is only
+    compared when both versions have one.
+
+    Returns:
+        int: A negative number, zero or a positive number if ``a`` is older
+        than, the same as, or newer than ``b``.
+    """
+    epoch_a, a = _split_epoch(a)
+    epoch_b, b = _split_epoch(b)
+    if epoch_a != epoch_b:
+        return _sign(epoch_a - epoch_b)
+    version_a, has_release_a, release_a = a.rpartition("-")
+    if not has_release_a:
+        version_a = a
+    version_b, has_release_b, release_b = b.rpartition("-")
+    if not has_release_b:
+        version_b = b
+    result = _rpmvercmp(version_a, version_b)
+    if result or not (has_release_a and has_release_b):
+        return result
+    return _rpmvercmp(release_a, release_b)
+
+
+_WINDOWS_SEPARATOR_RE = re.compile(r"[.@+\-_ ]+")
+
+
+def _windows_key(version: str) -> Tuple[Tuple[int, Any], ...]:
+    parts = [
+        (0, int(part)) if part.isdigit() else (1, part.lower())
+        for part in _WINDOWS_SEPARATOR_RE.split(version.strip())
+        if part
+    ]
+    # "10.0" and "10.0.0" are the same version.
+    while parts and parts[-1] == (0, 0):
+        parts.pop()
+    return tuple(parts)
+
+
+def windows_compare(a: str, b: str) -> int:
+    """Compares two dotted versions, such as ``10.0.19041.1`` or ``2.1.0@3``.
+
+    Numeric components are compared as numbers, other components as
+    case-insensitive strings which sort after numbers. Missing trailing
+    components count as ``0``.
+
+    Returns:
+        int: A negative number, zero or a positive number if ``a`` is older
+        than, the same as, or newer than ``b``.
+    """
+    key_a, key_b = _windows_key(a), _windows_key(b)
+    return (key_a > key_b) - (key_a < key_b)
+
+
+_COMPARATORS: Dict[str, Callable[[str, str], int]] = {
+    DPKG: dpkg_compare,
+    RPM: rpm_compare,
+    WINDOWS: windows_compare,
+}
+
+_SORT_KEYS = {
+    scheme: functools.cmp_to_key(compare) for scheme, compare in _COMPARATORS.items()
+}
+
+
+def compare_versions(a: str, b: str, scheme: str) -> int:
+    """Compares two versions using the rules of a package manager.
+
+    Args:
+        a (str): The first version.
+        b (str): The second version.
+        scheme (str): One of :data:`DPKG`, :data:`RPM` or :data:`WINDOWS`.
+
+    Returns:
+        int: A negative number, zero or a positive number if ``a`` is older
+        than, the same as, or newer than ``b``.
+
+    Raises:
+        ValueError: If ``scheme`` is not a known version scheme.
+    """
+    try:
+        compare = _COMPARATORS[scheme]
+    except KeyError:
+        raise ValueError("Unknown version scheme: {!r}.".format(scheme)) from None
+    return compare(a, b)
+
+
+class Posting(NamedTuple):
+    """A package version installed on an instance."""
+
+    instance: str
+    name: str
+    version: str
+    architecture: str
+    package_type: str
+    scheme: str
+
+
+class _PostingList:
+    """The postings of one package name and version scheme, by version."""
+
+    def __init__(self, scheme: str):
+        self.scheme = scheme
+        self.by_version: Dict[str, Set[Posting]] = {}
+        # Sorted versions and their sort keys, rebuilt lazily after updates.
+        self._versions: Optional[List[str]] = None
+        self._keys: List[Any] = []
+
+    def add(self, posting: Posting) -> None:
+        postings = self.by_version.get(posting.version)
+        if postings is None:
+            self.by_version[posting.version] = postings = set()
+            self._versions = None
+        postings.add(posting)
+
+    def discard(self, posting: Posting) -> None:
+        postings = self.by_version.get(posting.version)
+        if postings is None:
+            return
+        postings.discard(posting)
+        if not postings:
+            del self.by_version[posting.version]
+            self._versions = None
+
+    def _sorted(self) -> Tuple[List[str], List[Any]]:
+        if self._versions is None:
+            sort_key = _SORT_KEYS[self.scheme]
+            self._keys = sorted(sort_key(version) for version in self.by_version)
+            self._versions = [key.obj for key in self._keys]
+        return self._versions, self._keys
+
+    def range(
+        self,
+        lo: Optional[str],
+        lo_inclusive: bool,
+        hi: Optional[str],
+        hi_inclusive: bool,
+    ) -> List[str]:
+        versions, keys = self._sorted()
+        sort_key = _SORT_KEYS[self.scheme]
+        start, end = 0, len(versions)
+        if lo is not None:
+            bound = bisect.bisect_left if lo_inclusive else bisect.bisect_right
+            start = bound(keys, sort_key(lo))
+        if hi is not None:
+            bound = bisect.bisect_right if hi_inclusive else bisect.bisect_left
+            end = bound(keys, sort_key(hi))
+        return versions[start:end]
+
+
+def _timestamp(message: Any) -> Optional[Tuple[int, int]]:
+    if not message.HasField("update_time"):
+        return None
+    return message.update_time.seconds, message.update_time.nanos
+
+
+class PackageVersionIndex:
+    """Maps package names to the instances and versions they are installed at.
+
+    The index is built from ``Inventory`` messages, for example the items
+    of a ``ListInventoriesPager`` requested with the ``FULL`` view, and kept
+    current with :meth:`update`. It is not thread-safe.
+
+    Args:
+        inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+            The inventories to index initially.
+        include_available (bool): Whether to index the updates available
+            to an instance in addition to its installed packages.
+    """
+
+    def __init__(
+        self,
+        inventories: Iterable[Any] = (),
+        *,
+        include_available: bool = False,
+    ):
+        self._include_available = include_available
+        self._postings: Dict[str, Dict[str, _PostingList]] = {}
+        # Instance name to the update_time it was indexed at and its postings.
+        self._instances: Dict[str, Tuple[Optional[Tuple[int, int]], List[Posting]]] = {}
+        self.update(inventories)
+
+    def __len__(self) -> int:
+        return sum(len(postings) for _, postings in self._instances.values())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._postings
+
+    @property
+    def instances(self) -> List[str]:
+        """List[str]: The names of the indexed instances."""
+        return list(self._instances)
+
+    @property
+    def packages(self) -> List[str]:
+        """List[str]: The names of the indexed packages."""
+        return list(self._postings)
+
+    def update(self, inventories: Iterable[Any]) -> int:
+        """Indexes new and changed inventories.
+
+        An inventory replaces the postings of its instance, unless the
+        instance was already indexed from an inventory with the same or a
+        later ``update_time``. Inventories without an ``update_time`` are
+        always indexed.
+
+        Args:
+            inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+                The inventories to index.
+
+        Returns:
+            int: The number of inventories that were (re)indexed.
+        """
+        indexed = 0
+        for message in inventories:
+            if isinstance(message, inventory.Inventory):
+                message = inventory.Inventory.pb(message)
+            instance = inventory_columns.instance_name(message.name)
+            update_time = _timestamp(message)
+            current = self._instances.get(instance)
+            if (
+                current is not None
+                and update_time is not None
+                and current[0] is not None
+                and update_time <= current[0]
+            ):
+                continue
+            self.remove(instance)
+            postings = self._postings_of(message)
+            for posting in postings:
+                self._posting_list(posting.name, posting.scheme).add(posting)
+            self._instances[instance] = (update_time, postings)
+            indexed += 1
+        return indexed
+
+    def remove(self, instance: str) -> bool:
+        """Removes the postings of an instance, e.g. after it was deleted.
+
+        Args:
+            instance (str): The instance resource name.
+
+        Returns:
+            bool: Whether the instance was indexed.
+        """
+        current = self._instances.pop(instance, None)
+        if current is None:
+            return False
+        for posting in current[1]:
+            by_scheme = self._postings[posting.name]
+            posting_list = by_scheme[posting.scheme]
+            posting_list.discard(posting)
+            if not posting_list.by_version:
+                del by_scheme[posting.scheme]
+                if not by_scheme:
+                    del self._postings[posting.name]
+        return True
+
+    def _posting_list(self, name: str, scheme: str) -> _PostingList:
+        by_scheme = self._postings.setdefault(name, {})
+        posting_list = by_scheme.get(scheme)
+        if posting_list is None:
+            by_scheme[scheme] = posting_list = _PostingList(scheme)
+        return posting_list
+
+    def _postings_of(self, message: Any) -> List[Posting]:
+        postings = []
+        for row in inventory_columns.iter_rows([message]):
+            instance, _, _, item_type, package_type, name, version, arch = row
+            if item_type != inventory.Inventory.Item.Type.INSTALLED_PACKAGE and not (
+                self._include_available
+                and item_type == inventory.Inventory.Item.Type.AVAILABLE_PACKAGE
+            ):
+                continue
+            scheme = _PACKAGE_SCHEMES.get(package_type)
+            if scheme is None or not name:
+                continue
+            postings.append(
+                Posting(instance, name, version, arch, package_type, scheme)
+            )
+        return postings
+
+    def find(
+        self,
+        name: str,
+        *,
+        lt: Optional[str] = None,
+        le: Optional[str] = None,
+        gt: Optional[str] = None,
+        ge: Optional[str] = None,
+        eq: Optional[str] = None,
+        scheme: Optional[str] = None,
+    ) -> List[Posting]:
+        """Returns the postings of a package within a version range.
+
+        Bounds are compared using the version scheme of each posting, so
+        ``find("openssl", lt="3.0.7")`` compares Debian instances with dpkg
+        rules and RHEL instances with rpm rules.
+
+        Args:
+            name (str): The package name.
+            lt (str): Only return versions older than this one.
+            le (str): Only return versions older than or equal to this one.
+            gt (str): Only return versions newer than this one.
+            ge (str): Only return versions newer than or equal to this one.
+            eq (str): Only return versions equal to this one.
+            scheme (str): Only return postings using this version scheme,
+                one of :data:`DPKG`, :data:`RPM` or :data:`WINDOWS`.
+
+        Returns:
+            List[Posting]: The matching postings, oldest version first
+            within each version scheme.
+
+        Raises:
+            ValueError: If more than one lower or upper bound is given.
+        """
+        if eq is not None:
+            if any(bound is not None for bound in (lt, le, gt, ge)):
+                raise ValueError("eq cannot be combined with other bounds.")
+            ge = le = eq
+        if lt is not None and le is not None:
+            raise ValueError("Only one of lt and le can be given.")
+        if gt is not None and ge is not None:
+            raise ValueError("Only one of gt and ge can be given.")
+        if scheme is not None and scheme not in _COMPARATORS:
+            raise ValueError("Unknown version scheme: {!r}.".format(scheme))
+
+        results: List[Posting] = []
+        for posting_list in self._postings.get(name, {}).values():
+            if scheme is not None and posting_list.scheme != scheme:
+                continue
+            versions = posting_list.range(
+                ge if ge is not None else gt,
+                ge is not None,
+                le if le is not None else lt,
+                le is not None,
+            )
+            for version in versions:
+                results.extend(
+                    sorted(posting_list.by_version[version], key=lambda p: p.instance)
+                )
+        return results
+
+    def instances_with(self, name: str, **bounds: Optional[str]) -> Set[str]:
+        """Returns the instances with a package version within a range.
+
+        Args:
+            name (str): The package name.
+            bounds: The version bounds accepted by :meth:`find`.
+
+        Returns:
+            Set[str]: The matching instance resource names.
+        """
+        return {posting.instance for posting in self.find(name, **bounds)}
+
+
+__all__ = (
+    "DPKG",
+    "RPM",
+    "WINDOWS",
+    "PackageVersionIndex",
+    "Posting",
+    "compare_versions",
+    "dpkg_compare",
+    "rpm_compare",
+    "windows_compare",
+)
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tracks the progress of many patch jobs with adaptive polling.
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import patch_job_tracker
+
+    client = osconfig_v1.OsConfigServiceClient()
+    with patch_job_tracker.PatchJobTracker(client) as tracker:
+        for name in job_names:
+            tracker.track(name)
+        for event in tracker.events():
+            print(event.name, event.job.state, event.summary_deltas)
+
+Each job is polled on its own schedule: the interval grows while a job
+makes no progress, and shrinks when it does and as it nears completion.
+The polls that are due at the same time run together on a shared executor.
+Jobs are no longer polled once they reach a terminal state, or once a poll
+fails with an error that retrying cannot fix, such as ``NotFound`` or
+``PermissionDenied``.
+"""
+
+import concurrent.futures
+import threading
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+
+from google.cloud.osconfig_v1.types import patch_jobs
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object]  # type: ignore
+
+#: The states in which a patch job no longer changes.
+TERMINAL_STATES = frozenset(
+    (
+        patch_jobs.PatchJob.State.SUCCEEDED,
+        patch_jobs.PatchJob.State.COMPLETED_WITH_ERRORS,
+        patch_jobs.PatchJob.State.CANCELED,
+        patch_jobs.PatchJob.State.TIMED_OUT,
+    )
+)
+
+# The API errors after which a job is polled again; the other API errors stop
+# tracking it. Errors raised outside of the API call, such as a RetryError or
+# a connection error, are polled again too.
+_TRANSIENT_ERRORS = (
+    core_exceptions.Aborted,
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.InternalServerError,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.TooManyRequests,
+)
+
+_SUMMARY_FIELDS = tuple(
+    field.name
+    for field in patch_jobs.PatchJob.InstanceDetailsSummary.pb().DESCRIPTOR.fields
+)
+
+
+class PatchJobEvent(NamedTuple):
+    """A change observed on a tracked patch job.
+
+    Attributes:
+        name (str): The patch job resource name.
+        job (Optional[google.cloud.osconfig_v1.types.PatchJob]): The latest
+            state of the job; ``None`` if it was never fetched successfully.
+        previous (Optional[google.cloud.osconfig_v1.types.PatchJob]): The
+            state of the job at the previous event, if any.
+        summary_deltas (Dict[str, int]): The changes of the
+            ``InstanceDetailsSummary`` counters since the previous event,
+            keyed by field name. Unchanged counters are omitted.
+        done (bool): Whether the job is no longer tracked, because it
+            reached a terminal state or its poll failed with a permanent
+            error.
+        error (Optional[Exception]): The error raised by the poll, in which
+            case ``job`` is the last known state.
+    """
+
+    name: str
+    job: Optional[patch_jobs.PatchJob]
+    previous: Optional[patch_jobs.PatchJob]
+    summary_deltas: Dict[str, int]
+    done: bool
+    error: Optional[Exception] = None
+
+    @property
+    def state_changed(self) -> bool:
+        """bool: Whether the job state differs from the previous event."""
+        if self.job is None:
+            return False
+        return self.previous is None or self.previous.state != self.job.state
+
+    @property
+    def percent_complete_delta(self) -> float:
+        """float: The progress made since the previous event, in percent."""
+        if self.job is None:
+            return 0.0
+        previous = self.previous.percent_complete if self.previous else 0.0
+        return self.job.percent_complete - previous
+
+
+def _is_permanent(exc: Exception) -> bool:
+    return isinstance(exc, core_exceptions.GoogleAPICallError) and not isinstance(
+        exc, _TRANSIENT_ERRORS
+    )
+
+
+def _summary_deltas(
+    job: patch_jobs.PatchJob, previous: Optional[patch_jobs.PatchJob]
+) -> Dict[str, int]:
+    current = patch_jobs.PatchJob.pb(job).instance_details_summary
+    before = (
+        patch_jobs.PatchJob.pb(previous).instance_details_summary
+        if previous is not None
+        else None
+    )
+    deltas = {}
+    for field in _SUMMARY_FIELDS:
+        delta = getattr(current, field) - (getattr(before, field) if before else 0)
+        if delta:
+            deltas[field] = delta
+    return deltas
+
+
+class _TrackedJob:
+    def __init__(self, name: str, interval: float, due: float):
+        self.name = name
+        self.interval = interval
+        self.due = due
+        self.job: Optional[patch_jobs.PatchJob] = None
+        self.last_progress: Optional[Tuple[float, float]] = None
+
+
+class PatchJobTracker:
+    """Polls the state of many patch jobs and reports their changes.
+
+    Args:
+        client (google.cloud.osconfig_v1.OsConfigServiceClient): The client
+            used to get the patch jobs.
+        executor (Optional[concurrent.futures.Executor]): The executor the
+            polls run on. Defaults to a thread pool of ``max_workers``
+            threads owned, and shut down, by the tracker.
+        max_workers (int): The size of the default thread pool.
+        initial_interval (float): The delay, in seconds, before polling a
+            job again after it changed.
+        min_interval (float): The shortest delay between two polls of a job.
+        max_interval (float): The longest delay between two polls of a job.
+        backoff (float): The factor the delay is multiplied by each time a
+            job is polled without changing.
+        near_completion (float): The ``percent_complete`` above which a job
+            is polled every ``min_interval`` seconds.
+        clock (Callable[[], float]): The monotonic clock used to schedule
+            the polls.
+        retry (google.api_core.retry.Retry): Designation of what errors, if
+            any, should be retried by each poll.
+        timeout (float): The timeout for each poll.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be sent
+            along with each request as metadata.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        executor: Optional[concurrent.futures.Executor] = None,
+        max_workers: int = 8,
+        initial_interval: float = 5.0,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+        near_completion: float = 90.0,
+        clock: Callable[[], float] = time.monotonic,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        if not 0 <= min_interval <= initial_interval <= max_interval:
+            raise ValueError(
+                "Intervals must satisfy 0 <= min_interval <= initial_interval "
+                "<= max_interval."
+            )
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1.")
+        self._client = client
+        self._owns_executor = executor is None
+        self._executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="PatchJobTracker"
+        )
+        self._initial_interval = initial_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._near_completion = near_completion
+        self._clock = clock
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+        self._jobs: Dict[str, _TrackedJob] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+    def __enter__(self) -> "PatchJobTracker":
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    @property
+    def tracked(self) -> List[str]:
+        """List[str]: The names of the patch jobs being tracked."""
+        with self._lock:
+            return list(self._jobs)
+
+    def track(self, name: str) -> None:
+        """Starts tracking a patch job; it is polled immediately.
+
+        Args:
+            name (str): The patch job resource name, of the form
+                ``projects/*/patchJobs/*``.
+        """
+        with self._lock:
+            if name not in self._jobs:
+                self._jobs[name] = _TrackedJob(
+                    name, self._initial_interval, self._clock()
+                )
+        self._wakeup.set()
+
+    def untrack(self, name: str) -> None:
+        """Stops tracking a patch job."""
+        with self._lock:
+            self._jobs.pop(name, None)
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """Stops :meth:`events` and shuts down the executor if it is owned.
+
+        Polls already submitted complete; later calls to :meth:`poll_once`
+        return no events.
+        """
+        with self._lock:
+            self._closed = True
+        self._wakeup.set()
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    def next_poll_in(self) -> Optional[float]:
+        """Returns the seconds until the next poll is due, if any job is tracked."""
+        with self._lock:
+            if not self._jobs:
+                return None
+            due = min(tracked.due for tracked in self._jobs.values())
+        return max(due - self._clock(), 0.0)
+
+    def _get(self, name: str) -> patch_jobs.PatchJob:
+        return self._client.get_patch_job(
+            name=name,
+            retry=self._retry,
+            timeout=self._timeout,
+            metadata=self._metadata,
+        )
+
+    def _next_interval(
+        self, tracked: _TrackedJob, job: patch_jobs.PatchJob, changed: bool, now: float
+    ) -> float:
+        if not changed:
+            return min(tracked.interval * self._backoff, self._max_interval)
+        interval = self._initial_interval
+        if job.percent_complete >= self._near_completion:
+            return self._min_interval
+        # Poll at least twice within the estimated time to completion.
+        progress = (now, job.percent_complete)
+        if tracked.last_progress is not None:
+            elapsed = now - tracked.last_progress[0]
+            advanced = job.percent_complete - tracked.last_progress[1]
+            if elapsed > 0 and advanced > 0:
+                remaining = (100.0 - job.percent_complete) * elapsed / advanced
+                interval = min(interval, remaining / 2)
+        tracked.last_progress = progress
+        return max(interval, self._min_interval)
+
+    def poll_once(self) -> List[PatchJobEvent]:
+        """Polls every job that is due, concurrently, and returns its changes.
+
+        Returns:
+            List[PatchJobEvent]: The events of the jobs that changed, that
+            were fetched for the first time, or whose poll failed. Empty
+            once the tracker is closed.
+        """
+        now = self._clock()
+        # Submitted under the lock, so that close() cannot shut the executor
+        # down in between.
+        with self._lock:
+            if self._closed:
+                return []
+            futures = [
+                (tracked, self._executor.submit(self._get, tracked.name))
+                for tracked in self._jobs.values()
+                if tracked.due <= now
+            ]
+
+        events = []
+        for tracked, future in futures:
+            previous = tracked.job
+            try:
+                job = future.result()
+            except Exception as exc:
+                done = _is_permanent(exc)
+                if done:
+                    with self._lock:
+                        self._jobs.pop(tracked.name, None)
+                else:
+                    tracked.interval = min(
+                        tracked.interval * self._backoff, self._max_interval
+                    )
+                    tracked.due = self._clock() + tracked.interval
+                events.append(
+                    PatchJobEvent(tracked.name, previous, previous, {}, done, exc)
+                )
+                continue
+
+            now = self._clock()
+            deltas = _summary_deltas(job, previous)
+            changed = (
+                previous is None
+                or bool(deltas)
+                or job.state != previous.state
+                or job.percent_complete != previous.percent_complete
+            )
+            done = job.state in TERMINAL_STATES
+            tracked.interval = self._next_interval(tracked, job, changed, now)
+            tracked.due = now + tracked.interval
+            tracked.job = job
+            if done:
+                with self._lock:
+                    self._jobs.pop(tracked.name, None)
+            if changed or done:
+                events.append(PatchJobEvent(tracked.name, job, previous, deltas, done))
+        return events
+
+    def events(self) -> Iterator[PatchJobEvent]:
+        """Yields the changes of the tracked jobs as they are observed.
+
+        Polls are scheduled until every tracked job reached a terminal state
+        or was untracked, or until :meth:`close` is called. Jobs can be
+        tracked while iterating.
+
+        Yields:
+            PatchJobEvent: The changes of the tracked jobs.
+        """
+        while not self._closed:
+            self._wakeup.clear()
+            delay = self.next_poll_in()
+            if delay is None:
+                return
+            if delay > 0:
+                self._wakeup.wait(delay)
+                continue
+            for event in self.poll_once():
+                yield event
+
+
+__all__ = (
+    "PatchJobEvent",
+    "PatchJobTracker",
+    "TERMINAL_STATES",
+)
@@ -0,0 +1,499 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Expansion of patch deployment schedules into execution times.
+
+The schedules of many :class:`~.types.PatchDeployment` messages are encoded
+into numpy arrays and evaluated against a grid of local calendar days, so
+that the executions of all deployments are computed together:
+
+.. code-block:: python
+
+    import datetime
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import patch_schedules
+
+    client = osconfig_v1.OsConfigServiceClient()
+    deployments = list(client.list_patch_deployments(parent="projects/p"))
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    executions = patch_schedules.expand(
+        deployments, now, now + datetime.timedelta(days=30)
+    )
+    for a, b in executions.conflicts():
+        print(a, "overlaps", b)
+
+    next_runs = patch_schedules.next_executions(deployments, 5, after=now)
+
+Execution times follow the rules of the deployment's time zone. A
+``time_of_day`` skipped by a daylight saving transition runs at the
+wall-clock time it maps to after the transition, and a ``time_of_day``
+repeated by a transition runs at its first occurrence. Times are computed
+to the second.
+
+This module requires ``numpy``, installed with the ``numpy`` extra, and
+the ``zoneinfo`` module of Python 3.9 or later.
+"""
+
+import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from google.cloud.osconfig_v1.types import patch_deployments
+
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import zoneinfo
+except ImportError:  # pragma: NO COVER
+    zoneinfo = None
+
+
+_NUMPY_REQUIRED = "numpy is required to expand patch deployment schedules."
+_ZONEINFO_REQUIRED = "zoneinfo is required to expand patch deployment schedules."
+
+_DAY = 86400
+# Local calendar days around a window that can hold executions in it: time
+# zone offsets are within a day, and so is ``time_of_day``.
+_MARGIN_DAYS = 2
+# The days of schedule evaluated at once by :func:`next_executions`.
+_CHUNK_DAYS = 366
+_NEVER = numpy.iinfo(numpy.int64).max if numpy is not None else None
+
+_RecurringSchedule = patch_deployments.RecurringSchedule
+_Frequency = _RecurringSchedule.Frequency
+
+# Schedule kinds, one per evaluation rule.
+_NONE, _ONE_TIME, _DAILY, _WEEKLY, _MONTH_DAY, _WEEK_DAY_OF_MONTH = range(6)
+
+#: The default duration of executions whose deployment sets none.
+DEFAULT_DURATION = datetime.timedelta(hours=1)
+
+
+def _require() -> None:
+    if numpy is None:
+        raise ImportError(_NUMPY_REQUIRED)
+    if zoneinfo is None:
+        raise ImportError(_ZONEINFO_REQUIRED)
+
+
+def _epoch_seconds(value: datetime.datetime) -> int:
+    if value.tzinfo is None:
+        raise ValueError("Times must be timezone-aware: {!r}".format(value))
+    return int(value.timestamp())
+
+
+def _timestamp_seconds(pb, field: str) -> Optional[int]:
+    return getattr(pb, field).seconds if pb.HasField(field) else None
+
+
+class _Schedules:
+    """The schedules of a sequence of deployments, one array element each."""
+
+    def __init__(self, **columns: "numpy.ndarray"):
+        self.__dict__.update(columns)
+
+    def take(self, indices: "numpy.ndarray") -> "_Schedules":
+        return _Schedules(
+            **{name: column[indices] for name, column in self.__dict__.items()}
+        )
+
+    @classmethod
+    def encode(
+        cls,
+        deployments: Sequence[Any],
+        default_duration: datetime.timedelta,
+        include_paused: bool,
+    ) -> "_Schedules":
+        rows = []
+        for deployment in deployments:
+            pb = patch_deployments.PatchDeployment.pb(deployment)
+            kind = _NONE
+            time_zone = ""
+            time_of_day = day_of_week = day = ordinal = offset = 0
+            start = _timestamp_seconds(pb, "create_time")
+            end = None
+            if pb.HasField("one_time_schedule"):
+                kind = _ONE_TIME
+                start = pb.one_time_schedule.execute_time.seconds
+            elif pb.HasField("recurring_schedule"):
+                recurring = pb.recurring_schedule
+                time_zone = recurring.time_zone.id
+                time_of_day = (
+                    recurring.time_of_day.hours * 3600
+                    + recurring.time_of_day.minutes * 60
+                    + recurring.time_of_day.seconds
+                )
+                start = _timestamp_seconds(recurring, "start_time") or start
+                end = _timestamp_seconds(recurring, "end_time")
+                if recurring.frequency == _Frequency.DAILY:
+                    kind = _DAILY
+                elif recurring.frequency == _Frequency.WEEKLY:
+                    kind = _WEEKLY
+                    day_of_week = recurring.weekly.day_of_week
+                elif recurring.frequency == _Frequency.MONTHLY:
+                    monthly = recurring.monthly
+                    if monthly.HasField("week_day_of_month"):
+                        kind = _WEEK_DAY_OF_MONTH
+                        week_day = monthly.week_day_of_month
+                        day_of_week = week_day.day_of_week
+                        ordinal = week_day.week_ordinal
+                        offset = week_day.day_offset
+                    else:
+                        kind = _MONTH_DAY
+                        day = monthly.month_day
+            if (
+                not include_paused
+                and pb.state == patch_deployments.PatchDeployment.State.PAUSED
+            ):
+                kind = _NONE
+            duration = (
+                pb.duration.ToTimedelta()
+                if pb.HasField("duration")
+                else default_duration
+            )
+            rows.append(
+                (
+                    kind,
+                    time_zone or "UTC",
+                    time_of_day,
+                    day_of_week,
+                    day,
+                    ordinal,
+                    offset,
+                    start or 0,
+                    _NEVER if end is None else end,
+                    int(duration.total_seconds()),
+                )
+            )
+        columns = list(zip(*rows)) if rows else [()] * 10
+        return cls(
+            kind=numpy.array(columns[0], dtype=numpy.int8),
+            time_zone=numpy.array(columns[1], dtype=object),
+            time_of_day=numpy.array(columns[2], dtype=numpy.int64),
+            day_of_week=numpy.array(columns[3], dtype=numpy.int64),
+            day=numpy.array(columns[4], dtype=numpy.int64),
+            ordinal=numpy.array(columns[5], dtype=numpy.int64),
+            offset=numpy.array(columns[6], dtype=numpy.int64),
+            start=numpy.array(columns[7], dtype=numpy.int64),
+            end=numpy.array(columns[8], dtype=numpy.int64),
+            duration=numpy.array(columns[9], dtype=numpy.int64),
+        )
+
+
+def _day_mask(schedules: _Schedules, days: "numpy.ndarray") -> "numpy.ndarray":
+    """Returns which of the local ``days`` each recurring schedule runs on.
+
+    Args:
+        schedules (_Schedules): The schedules, P of them.
+        days (numpy.ndarray): The local calendar days, as D days since the
+            epoch.
+
+    Returns:
+        numpy.ndarray: A (P, D) boolean array.
+    """
+    kind = schedules.kind[:, None]
+    # A week day of month with an offset runs ``offset`` days after the
+    # week day: evaluate the rule on the day ``offset`` days earlier.
+    shifted = days[None, :] - schedules.offset[:, None]
+    weekday = (shifted + 3) % 7 + 1  # 1970-01-01 is a Thursday; MONDAY is 1.
+    dates = shifted.astype("datetime64[D]")
+    months = dates.astype("datetime64[M]")
+    first = months.astype("datetime64[D]")
+    day_of_month = (dates - first).astype(numpy.int64) + 1
+    days_in_month = ((months + 1).astype("datetime64[D]") - first).astype(numpy.int64)
+    last_day = day_of_month == days_in_month
+
+    day = schedules.day[:, None]
+    ordinal = schedules.ordinal[:, None]
+    on_weekday = weekday == schedules.day_of_week[:, None]
+    return (
+        (kind == _DAILY)
+        | ((kind == _WEEKLY) & on_weekday)
+        | ((kind == _MONTH_DAY) & ((day_of_month == day) | ((day == -1) & last_day)))
+        | (
+            (kind == _WEEK_DAY_OF_MONTH)
+            & on_weekday
+            & (
+                ((day_of_month - 1) // 7 + 1 == ordinal)
+                | ((ordinal == -1) & (day_of_month + 7 > days_in_month))
+            )
+        )
+    )
+
+
+_ZONES: Dict[str, Any] = {}
+
+
+def _utc_offsets(time_zone: str, local: "numpy.ndarray") -> "numpy.ndarray":
+    """Returns the UTC offsets of local times, in seconds since the epoch."""
+    zone = _ZONES.get(time_zone)
+    if zone is None:
+        zone = _ZONES[time_zone] = zoneinfo.ZoneInfo(time_zone)
+    # Few distinct local times repeat across deployments of a time zone.
+    unique, inverse = numpy.unique(local, return_inverse=True)
+    epoch = datetime.datetime(1970, 1, 1)
+    offsets = numpy.fromiter(
+        (
+            (epoch + datetime.timedelta(seconds=int(seconds)))
+            .replace(tzinfo=zone)
+            .utcoffset()
+            .total_seconds()
+            for seconds in unique
+        ),
+        dtype=numpy.int64,
+        count=len(unique),
+    )
+    return offsets[inverse.reshape(-1)]
+
+
+def _expand(
+    schedules: _Schedules, lower: int, upper: int
+) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    """Returns the executions within ``[lower, upper)``, in epoch seconds.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The index of the schedule and
+        the time of each execution, ordered by schedule then time.
+    """
+    days = numpy.arange(
+        lower // _DAY - _MARGIN_DAYS, (upper - 1) // _DAY + _MARGIN_DAYS + 1
+    )
+    index, day = numpy.nonzero(_day_mask(schedules, days))
+    times = days[day] * _DAY + schedules.time_of_day[index]
+    time_zones = schedules.time_zone[index]
+    for time_zone in numpy.unique(time_zones):
+        in_zone = time_zones == time_zone
+        times[in_zone] -= _utc_offsets(time_zone, times[in_zone])
+
+    one_time = numpy.flatnonzero(schedules.kind == _ONE_TIME)
+    index = numpy.concatenate([index, one_time])
+    times = numpy.concatenate([times, schedules.start[one_time]])
+    keep = (
+        (times >= lower)
+        & (times < upper)
+        & (times >= schedules.start[index])
+        & (times < schedules.end[index])
+    )
+    index, times = index[keep], times[keep]
+    order = numpy.lexsort((times, index))
+    return index[order], times[order]
+
+
+class Executions:
+    """The executions of a set of deployments, ordered by start time.
+
+    The executions are an interval index: they are sorted by start time,
+    along with the running maximum of their end times, so that the
+    executions overlapping a window are found by binary search.
+
+    Attributes:
+        names (List[str]): The names of the deployments.
+        deployment (numpy.ndarray): The index in ``names`` of the deployment
+            of each execution.
+        start (numpy.ndarray): The start times, as ``datetime64[s]`` in UTC.
+        end (numpy.ndarray): The end times, ``duration`` after the start.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        deployment: "numpy.ndarray",
+        start: "numpy.ndarray",
+        end: "numpy.ndarray",
+    ):
+        order = numpy.argsort(start, kind="stable")
+        self.names = names
+        self.deployment = deployment[order]
+        self.start = start[order]
+        self.end = end[order]
+        self._max_end = numpy.maximum.accumulate(self.end)
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def overlapping(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> "numpy.ndarray":
+        """Returns the executions running at some point of a window.
+
+        Args:
+            start (datetime.datetime): The start of the window.
+            end (datetime.datetime): The end of the window, excluded.
+
+        Returns:
+            numpy.ndarray: The indices of the executions.
+        """
+        lower = numpy.datetime64(_epoch_seconds(start), "s")
+        upper = numpy.datetime64(_epoch_seconds(end), "s")
+        # Executions before ``first`` all end by ``lower``; executions from
+        # ``last`` on all start at or after ``upper``.
+        first = numpy.searchsorted(self._max_end, lower, side="right")
+        last = numpy.searchsorted(self.start, upper, side="left")
+        candidates = numpy.arange(first, max(first, last))
+        return candidates[self.end[candidates] > lower]
+
+    def deployments_overlapping(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> List[str]:
+        """Returns the deployments running at some point of a window.
+
+        Args:
+            start (datetime.datetime): The start of the window.
+            end (datetime.datetime): The end of the window, excluded.
+
+        Returns:
+            List[str]: The names of the deployments, sorted.
+        """
+        indices = numpy.unique(self.deployment[self.overlapping(start, end)])
+        return sorted(self.names[i] for i in indices)
+
+    def conflicts(self) -> List[Tuple[str, str]]:
+        """Returns the pairs of deployments with overlapping executions.
+
+        Returns:
+            List[Tuple[str, str]]: The pairs of deployment names, each
+            ordered and listed once.
+        """
+        count = len(self)
+        # The executions overlapping execution i and starting after it are
+        # those up to the first one starting at or after its end.
+        after = numpy.searchsorted(self.start, self.end, side="left")
+        overlaps = numpy.maximum(after - numpy.arange(count) - 1, 0)
+        first = numpy.repeat(numpy.arange(count), overlaps)
+        # The position of each pair among those of its first execution.
+        rank = numpy.arange(len(first)) - numpy.repeat(
+            numpy.cumsum(overlaps) - overlaps, overlaps
+        )
+        second = first + rank + 1
+        a, b = self.deployment[first], self.deployment[second]
+        distinct = a != b
+        pairs = numpy.unique(
+            numpy.stack(
+                [numpy.minimum(a, b)[distinct], numpy.maximum(a, b)[distinct]],
+                axis=1,
+            ).reshape(-1, 2),
+            axis=0,
+        )
+        return sorted(tuple(sorted((self.names[i], self.names[j]))) for i, j in pairs)
+
+
+def expand(
+    deployments: Sequence[Any],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    *,
+    default_duration: datetime.timedelta = DEFAULT_DURATION,
+    include_paused: bool = False,
+) -> Executions:
+    """Returns the executions of deployments within a window.
+
+    Args:
+        deployments (Sequence[google.cloud.osconfig_v1.types.PatchDeployment]):
+            The deployments.
+        start (datetime.datetime): The start of the window, timezone-aware.
+        end (datetime.datetime): The end of the window, excluded.
+        default_duration (datetime.timedelta): The duration of the
+            executions of deployments without ``duration``.
+        include_paused (bool): Whether to expand paused deployments.
+
+    Returns:
+        Executions: The executions starting within the window.
+
+    Raises:
+        ImportError: If ``numpy`` or ``zoneinfo`` is not available.
+        ValueError: If ``start`` or ``end`` is naive.
+    """
+    _require()
+    deployments = list(deployments)
+    schedules = _Schedules.encode(deployments, default_duration, include_paused)
+    index, times = _expand(schedules, _epoch_seconds(start), _epoch_seconds(end))
+    starts = times.astype("datetime64[s]")
+    return Executions(
+        [deployment.name for deployment in deployments],
+        index,
+        starts,
+        starts + schedules.duration[index].astype("timedelta64[s]"),
+    )
+
+
+def next_executions(
+    deployments: Sequence[Any],
+    count: int,
+    after: Optional[datetime.datetime] = None,
+    *,
+    horizon: datetime.timedelta = datetime.timedelta(days=3660),
+    include_paused: bool = False,
+) -> "numpy.ndarray":
+    """Returns the next execution times of deployments.
+
+    Args:
+        deployments (Sequence[google.cloud.osconfig_v1.types.PatchDeployment]):
+            The deployments.
+        count (int): The number of executions to return per deployment.
+        after (Optional[datetime.datetime]): The time after which to look
+            for executions. Defaults to now.
+        horizon (datetime.timedelta): How far after ``after`` to look.
+        include_paused (bool): Whether to expand paused deployments.
+
+    Returns:
+        numpy.ndarray: A ``datetime64[s]`` array of shape
+        ``(len(deployments), count)``, in UTC, padded with ``NaT`` for the
+        deployments with fewer executions within the horizon.
+
+    Raises:
+        ImportError: If ``numpy`` or ``zoneinfo`` is not available.
+        ValueError: If ``count`` is negative or ``after`` is naive.
+    """
+    _require()
+    if count < 0:
+        raise ValueError("count must not be negative.")
+    if after is None:
+        after = datetime.datetime.now(datetime.timezone.utc)
+    schedules = _Schedules.encode(list(deployments), DEFAULT_DURATION, include_paused)
+    result = numpy.full((len(schedules.kind), count), numpy.datetime64("NaT", "s"))
+    found = numpy.zeros(len(schedules.kind), dtype=numpy.int64)
+
+    lower = _epoch_seconds(after) + 1
+    limit = lower + int(horizon.total_seconds())
+    active = numpy.flatnonzero(schedules.kind != _NONE) if count else []
+    while len(active) and lower < limit:
+        upper = min(lower + _CHUNK_DAYS * _DAY, limit)
+        index, times = _expand(schedules.take(active), lower, upper)
+        deployment = active[index]
+        # The rank of each execution among those of its deployment.
+        first = numpy.searchsorted(index, index, side="left")
+        rank = numpy.arange(len(index)) - first + found[deployment]
+        keep = rank < count
+        result[deployment[keep], rank[keep]] = times[keep].astype("datetime64[s]")
+        found += numpy.bincount(deployment[keep], minlength=len(found))
+        lower = upper
+        active = active[
+            (found[active] < count)
+            & (schedules.kind[active] != _ONE_TIME)
+            & (schedules.end[active] > lower)
+        ]
+    return result
+
+
+__all__ = (
+    "DEFAULT_DURATION",
+    "Executions",
+    "expand",
+    "next_executions",
+)
@@ -0,0 +1,566 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Queries over OS policy assignment reports, pushed down to the service.
+
+A :class:`ReportQuery` lists the reports matching a set of predicates
+across locations. The predicates the service can evaluate are sent with
+the requests, and the others are evaluated on the received reports:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1.report_query import ReportQuery
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    query = (
+        ReportQuery(
+            ["projects/p/locations/us-central1-a", "projects/p/locations/us-east1-b"]
+        )
+        .assignment("web-servers")
+        .compliance_state("NON_COMPLIANT", os_policy_id="nginx")
+    )
+    results = query.execute(client)
+    for report in results:
+        print(report.instance)
+    print(results.stats)
+
+Predicates are pushed down as follows:
+
+* ``instance`` and ``assignment`` are put in the request parents, e.g.
+  ``.../instances/-/osPolicyAssignments/web-servers/reports``, one parent
+  per value. As the service requires either of them to be ``-``, only the
+  one with the fewest values is. An instance given by its full name is
+  only listed in its own location; a bare instance ID in every location.
+* ``instance`` and ``last_run_id`` constraints left are compiled into the
+  request ``filter`` (AIP-160 syntax), with instances by ID; the locations
+  of instances given by full name are checked locally. The service documents no filter
+  grammar for reports: pass ``filterable=()`` to evaluate them locally.
+* ``compliance_state`` and ``updated_after`` constraints are evaluated
+  locally.
+
+The :attr:`QueryResults.stats` of a run count what was received and what
+was returned; comparing them with those of the same query built with
+``pushdown=False`` measures what the pushdown saved.
+"""
+
+import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.api_core import gapic_v1
+
+from google.cloud.osconfig_v1.types import os_policy_assignment_reports
+
+_Report = os_policy_assignment_reports.OSPolicyAssignmentReport
+ComplianceState = _Report.OSPolicyCompliance.ComplianceState
+
+#: The report fields compiled into the request filter by default.
+FILTERABLE_FIELDS = ("instance", "last_run_id")
+
+#: The default maximum number of parents listed per location.
+DEFAULT_MAX_PARENTS = 64
+
+_WILDCARD = "-"
+
+
+def _quote(value: str) -> str:
+    return '"{}"'.format(value.replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def _any_of(field: str, values: Sequence[str]) -> str:
+    clauses = " OR ".join("{} = {}".format(field, _quote(v)) for v in values)
+    return "({})".format(clauses) if len(values) > 1 else clauses
+
+
+def _parse_instance(value: str) -> Tuple[Optional[str], Optional[str], str]:
+    """Returns the (location, zone, ID) of an instance name or bare ID.
+
+    Both ``projects/{p}/locations/{zone}/instances/{id}`` and Compute Engine
+    ``projects/{p}/zones/{zone}/instances/{id}`` names are accepted; bare
+    IDs have no location or zone.
+    """
+    segments = value.split("/")
+    if (
+        len(segments) == 6
+        and segments[0] == "projects"
+        and segments[2] in ("locations", "zones")
+        and segments[4] == "instances"
+    ):
+        location = "projects/{}/locations/{}".format(segments[1], segments[3])
+        return location, segments[3], segments[5]
+    return None, None, value
+
+
+def _zone_of(location: str) -> str:
+    return location.split("/")[3]
+
+
+def _report_instance(pb) -> Tuple[Optional[str], FrozenSet[str]]:
+    """Returns the zone of a report and the IDs of its instance."""
+    segments = pb.name.split("/")
+    _, zone, instance_id = _parse_instance(pb.instance)
+    ids = {instance_id}
+    if len(segments) > 5 and segments[2] == "locations" and segments[4] == "instances":
+        zone = segments[3]
+        ids.add(segments[5])
+    return zone, frozenset(ids)
+
+
+def _instance_predicate(
+    instances: Sequence[Tuple[Optional[str], Optional[str], str]]
+) -> Callable[[Any], bool]:
+    """Matches reports of any of some (location, zone, ID) instances."""
+    wanted = tuple((zone, instance_id) for _, zone, instance_id in instances)
+
+    def predicate(pb) -> bool:
+        report_zone, ids = _report_instance(pb)
+        return any(
+            instance_id in ids and (zone is None or zone == report_zone)
+            for zone, instance_id in wanted
+        )
+
+    return predicate
+
+
+def _assignment_id(pb) -> str:
+    return pb.os_policy_assignment.rsplit("/", 1)[-1].split("@", 1)[0]
+
+
+class QueryStats(NamedTuple):
+    """What a query received from the service and returned.
+
+    Attributes:
+        parents (int): The number of parents listed.
+        reports_received (int): The reports received.
+        reports_returned (int): The reports matching the query.
+        bytes_received (int): The serialized size of the reports received.
+        bytes_returned (int): The serialized size of the reports returned.
+    """
+
+    parents: int = 0
+    reports_received: int = 0
+    reports_returned: int = 0
+    bytes_received: int = 0
+    bytes_returned: int = 0
+
+    @property
+    def bytes_discarded(self) -> int:
+        """int: The size of the reports received but filtered locally."""
+        return self.bytes_received - self.bytes_returned
+
+    def savings(self, baseline: "QueryStats") -> float:
+        """Returns the fraction of the baseline bytes not received.
+
+        Args:
+            baseline (QueryStats): The stats of the same query without
+                pushdown.
+        """
+        if not baseline.bytes_received:
+            return 0.0
+        return 1.0 - self.bytes_received / baseline.bytes_received
+
+
+class CompiledQuery(NamedTuple):
+    """A query split into its requests and its local predicate.
+
+    Attributes:
+        parents (Tuple[str, ...]): The parents to list.
+        filter (str): The request filter, empty for none.
+        matches (Callable[[Any], bool]): Evaluates the predicates not pushed
+            down on a raw ``OSPolicyAssignmentReport`` protobuf.
+        local (Tuple[str, ...]): The names of the predicates evaluated
+            locally.
+    """
+
+    parents: Tuple[str, ...]
+    filter: str
+    matches: Callable[[Any], bool]
+    local: Tuple[str, ...]
+
+
+class QueryResults:
+    """The reports of a query, with the stats of the listing so far."""
+
+    def __init__(self, compiled: CompiledQuery, items: Iterable[Any]):
+        self._compiled = compiled
+        self._items = items
+        self._received = self._returned = 0
+        self._bytes_received = self._bytes_returned = 0
+
+    @property
+    def stats(self) -> QueryStats:
+        """QueryStats: The stats of the reports iterated over so far."""
+        return QueryStats(
+            len(self._compiled.parents),
+            self._received,
+            self._returned,
+            self._bytes_received,
+            self._bytes_returned,
+        )
+
+    def _match(self, report: Any) -> bool:
+        pb = _Report.pb(report)
+        size = pb.ByteSize()
+        self._received += 1
+        self._bytes_received += size
+        if self._compiled.matches(pb):
+            self._returned += 1
+            self._bytes_returned += size
+            return True
+        return False
+
+    def __iter__(self) -> Iterator[_Report]:
+        for report in self._items:
+            if self._match(report):
+                yield report
+
+
+class AsyncQueryResults(QueryResults):
+    """The reports of a query listed with an async client."""
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        """Dict[str, Exception]: Errors raised while listing, per parent."""
+        return self._items.errors
+
+    def __iter__(self):
+        raise TypeError("Iterate over async query results with 'async for'.")
+
+    def __aiter__(self) -> AsyncIterator[_Report]:
+        async def async_generator():
+            async for _, report in self._items:
+                if self._match(report):
+                    yield report
+
+        return async_generator()
+
+
+class ReportQuery:
+    """An immutable query over OS policy assignment reports.
+
+    Each predicate method returns a new query. Predicates on different
+    fields must all hold; the values given to one predicate are
+    alternatives.
+    """
+
+    def __init__(
+        self,
+        locations: Union[str, Iterable[str]],
+        *,
+        filterable: Iterable[str] = FILTERABLE_FIELDS,
+        max_parents: int = DEFAULT_MAX_PARENTS,
+        pushdown: bool = True,
+    ):
+        """Instantiates the query.
+
+        Args:
+            locations (Union[str, Iterable[str]]): The locations to list,
+                of the form ``projects/{project}/locations/{location}``.
+            filterable (Iterable[str]): The report fields the service
+                filters on, among :data:`FILTERABLE_FIELDS`.
+            max_parents (int): The maximum number of parents per location
+                to push ``instance`` or ``assignment`` values into;
+                beyond it, they are filtered instead.
+            pushdown (bool): Whether to push predicates down at all.
+        """
+        if isinstance(locations, str):
+            locations = [locations]
+        self._locations = tuple(dict.fromkeys(locations))
+        if not self._locations:
+            raise ValueError("At least one location is required.")
+        for location in self._locations:
+            segments = location.split("/")
+            if len(segments) != 4 or segments[::2] != ["projects", "locations"]:
+                raise ValueError("Not a location name: {!r}".format(location))
+        self._filterable = frozenset(filterable)
+        unknown = self._filterable - set(FILTERABLE_FIELDS)
+        if unknown:
+            raise ValueError("Fields cannot be filtered: {}".format(sorted(unknown)))
+        self._max_parents = max_parents
+        self._pushdown = pushdown
+        self._instances: Tuple[str, ...] = ()
+        self._assignments: Tuple[str, ...] = ()
+        self._run_ids: Tuple[str, ...] = ()
+        self._states: Tuple[Tuple[FrozenSet[int], Optional[str]], ...] = ()
+        self._updated_after: Optional[datetime.datetime] = None
+
+    def _with(self, **changes: Any) -> "ReportQuery":
+        query = object.__new__(ReportQuery)
+        query.__dict__.update(self.__dict__)
+        query.__dict__.update(changes)
+        return query
+
+    @staticmethod
+    def _values(values: Sequence[str]) -> Tuple[str, ...]:
+        if not values:
+            raise ValueError("At least one value is required.")
+        return tuple(dict.fromkeys(values))
+
+    def instance(self, *instances: str) -> "ReportQuery":
+        """Restricts the reports to some instances, by name or ID."""
+        return self._with(_instances=self._values(instances))
+
+    def assignment(self, *assignments: str) -> "ReportQuery":
+        """Restricts the reports to some OS policy assignment IDs."""
+        return self._with(_assignments=self._values(assignments))
+
+    def last_run_id(self, *run_ids: str) -> "ReportQuery":
+        """Restricts the reports to some runs."""
+        return self._with(_run_ids=self._values(run_ids))
+
+    def compliance_state(
+        self,
+        *states: Union[ComplianceState, str, int],
+        os_policy_id: Optional[str] = None,
+    ) -> "ReportQuery":
+        """Requires an OS policy in one of some compliance states.
+
+        Args:
+            states (Union[ComplianceState, str, int]): The states.
+            os_policy_id (Optional[str]): The OS policy that must be in the
+                state. Defaults to any OS policy of the report.
+        """
+        parsed = frozenset(
+            int(ComplianceState[state] if isinstance(state, str) else state)
+            for state in self._values(states)
+        )
+        return self._with(_states=self._states + ((parsed, os_policy_id),))
+
+    def updated_after(self, time: datetime.datetime) -> "ReportQuery":
+        """Restricts the reports to those generated after ``time``."""
+        if time.tzinfo is None:
+            raise ValueError("time must be timezone-aware.")
+        return self._with(_updated_after=time)
+
+    def compile(self) -> CompiledQuery:
+        """Splits the query into requests and a local predicate.
+
+        Returns:
+            CompiledQuery: The parents and filter of the requests, and the
+            predicate of the reports received.
+        """
+        instances, assignments = self._instances, self._assignments
+        in_parent = None
+        if self._pushdown:
+            candidates = [
+                (len(values), dimension)
+                for dimension, values in (
+                    ("instance", instances),
+                    ("assignment", assignments),
+                )
+                if 0 < len(values) <= self._max_parents
+            ]
+            if candidates:
+                in_parent = min(candidates)[1]
+        parsed = [_parse_instance(value) for value in instances]
+        # Instances named with a location that is not queried, e.g. by
+        # project number, are listed in the locations of their zone and
+        # checked locally.
+        ambiguous = any(
+            location is not None and location not in self._locations
+            for location, _, _ in parsed
+        )
+        parent_assignments = assignments if in_parent == "assignment" else (_WILDCARD,)
+        parents = []
+        for location in self._locations:
+            if in_parent == "instance":
+                zone = _zone_of(location)
+                parent_instances = tuple(
+                    dict.fromkeys(
+                        instance_id
+                        for instance_location, instance_zone, instance_id in parsed
+                        if instance_zone is None
+                        or instance_location == location
+                        or (
+                            instance_location not in self._locations
+                            and instance_zone == zone
+                        )
+                    )
+                )
+            else:
+                parent_instances = (_WILDCARD,)
+            parents.extend(
+                "{}/instances/{}/osPolicyAssignments/{}/reports".format(
+                    location, instance, assignment
+                )
+                for instance in parent_instances
+                for assignment in parent_assignments
+            )
+
+        clauses = []
+        predicates = []
+        local = []
+        filterable = self._filterable if self._pushdown else frozenset()
+        if instances and in_parent != "instance":
+            if "instance" in filterable:
+                # Instances are filtered by ID: names are checked locally.
+                ids = tuple(dict.fromkeys(instance_id for _, _, instance_id in parsed))
+                clauses.append(_any_of("instance", ids))
+            if "instance" not in filterable or any(zone for _, zone, _ in parsed):
+                predicates.append(_instance_predicate(parsed))
+                local.append("instance")
+        elif instances and ambiguous:
+            predicates.append(_instance_predicate(parsed))
+            local.append("instance")
+        if assignments and in_parent != "assignment":
+            wanted_assignments = frozenset(assignments)
+            predicates.append(lambda pb: _assignment_id(pb) in wanted_assignments)
+            local.append("assignment")
+        if self._run_ids:
+            if "last_run_id" in filterable:
+                clauses.append(_any_of("last_run_id", self._run_ids))
+            else:
+                run_ids = frozenset(self._run_ids)
+                predicates.append(lambda pb: pb.last_run_id in run_ids)
+                local.append("last_run_id")
+        for states, os_policy_id in self._states:
+            predicates.append(_compliance_predicate(states, os_policy_id))
+            local.append("compliance_state")
+        if self._updated_after is not None:
+            after = self._updated_after.timestamp()
+            predicates.append(
+                lambda pb: pb.update_time.seconds + pb.update_time.nanos / 1e9 > after
+            )
+            local.append("updated_after")
+
+        def matches(pb) -> bool:
+            return all(predicate(pb) for predicate in predicates)
+
+        return CompiledQuery(
+            tuple(parents), " AND ".join(clauses), matches, tuple(local)
+        )
+
+    def execute(
+        self,
+        client: Any,
+        *,
+        page_size: Optional[int] = None,
+        retry: Any = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> QueryResults:
+        """Lists the matching reports, one parent after the other.
+
+        Args:
+            client (google.cloud.osconfig_v1.OsConfigZonalServiceClient):
+                The client to list with.
+            page_size (Optional[int]): The page size of the requests.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            QueryResults: The matching reports.
+        """
+        compiled = self.compile()
+        template = _request_template(compiled, page_size)
+
+        def items():
+            for parent in compiled.parents:
+                yield from client.list_os_policy_assignment_reports(
+                    request=dict(template, parent=parent),
+                    retry=retry,
+                    timeout=timeout,
+                    metadata=metadata,
+                )
+
+        return QueryResults(compiled, items())
+
+    def execute_async(
+        self,
+        client: Any,
+        *,
+        page_size: Optional[int] = None,
+        max_concurrency: int = 16,
+        retry: Any = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> AsyncQueryResults:
+        """Lists the matching reports, parents concurrently.
+
+        Args:
+            client (google.cloud.osconfig_v1.OsConfigZonalServiceAsyncClient):
+                The client to list with.
+            page_size (Optional[int]): The page size of the requests.
+            max_concurrency (int): The maximum number of parents listed at
+                the same time.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            AsyncQueryResults: The matching reports. Errors raised while
+            listing a parent are collected in its ``errors`` attribute.
+        """
+        compiled = self.compile()
+        pager = client.fan_out(
+            "list_os_policy_assignment_reports",
+            compiled.parents,
+            _request_template(compiled, page_size),
+            max_concurrency=max_concurrency,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return AsyncQueryResults(compiled, pager)
+
+
+def _request_template(compiled: CompiledQuery, page_size: Optional[int]) -> dict:
+    request = {"filter": compiled.filter}
+    if page_size:
+        request["page_size"] = page_size
+    return request
+
+
+def _compliance_predicate(
+    states: FrozenSet[int], os_policy_id: Optional[str]
+) -> Callable[[Any], bool]:
+    def predicate(pb) -> bool:
+        return any(
+            policy.compliance_state in states
+            and (os_policy_id is None or policy.os_policy_id == os_policy_id)
+            for policy in pb.os_policy_compliances
+        )
+
+    return predicate
+
+
+__all__ = (
+    "AsyncQueryResults",
+    "CompiledQuery",
+    "ComplianceState",
+    "DEFAULT_MAX_PARENTS",
+    "FILTERABLE_FIELDS",
+    "QueryResults",
+    "QueryStats",
+    "ReportQuery",
+)
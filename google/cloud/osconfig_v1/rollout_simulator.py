@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Estimates how long the rollout of an OS policy assignment takes.
+
+.. code-block:: python
+
+    from google.cloud.osconfig_v1 import instance_filter, rollout_simulator
+
+    targets = instances.select(assignment.instance_filter)
+    apply_times = rollout_simulator.apply_times_from_reports(
+        client.list_os_policy_assignment_reports(parent=parent),
+        client.list_os_policy_assignment_revisions(name=assignment.name),
+    )
+    estimate = rollout_simulator.simulate_rollout(assignment, targets, apply_times)
+    print(estimate.mean, estimate.percentile(95))
+
+The rollout proceeds independently in each zone. A VM counts towards the
+``disruption_budget`` of its zone from the moment the configuration starts
+being applied until ``min_wait_duration`` after it was applied, and a VM
+only starts once the budget allows it. Each run of the simulation draws
+the apply time of every VM from its own samples, and the rollout
+completes when the last VM of the slowest zone leaves the budget.
+
+Within a zone, the VMs are a queue served by ``budget`` slots: each VM
+takes the slot freed first. The slots are kept in a heap, so a run costs
+O(n log budget) operations for n VMs; a zone whose budget covers all its
+VMs takes as long as its slowest VM. A run over 100,000 instances takes
+about 100 ms, so the default :data:`DEFAULT_RUNS` runs take a few seconds;
+the percentiles of fewer runs are coarser.
+"""
+
+import heapq
+import math
+import random
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from google.cloud.osconfig_v1.types import os_policy_assignments
+
+#: The default number of simulated rollouts.
+DEFAULT_RUNS = 20
+
+
+def zone_of(instance: str) -> str:
+    """Returns the zone of an instance resource name.
+
+    Args:
+        instance (str): A name of the form
+            ``projects/{project}/locations/{zone}/instances/{instance}``.
+    """
+    parts = instance.split("/")
+    try:
+        return parts[parts.index("locations") + 1]
+    except (ValueError, IndexError):
+        raise ValueError("Not an instance name: {!r}".format(instance))
+
+
+def zone_budget(
+    disruption_budget: Any,
+    zone_size: int,
+) -> int:
+    """Returns the number of VMs of a zone that can be disrupted at once.
+
+    Args:
+        disruption_budget (google.cloud.osconfig_v1.types.FixedOrPercent):
+            The budget of the rollout.
+        zone_size (int): The number of targeted VMs in the zone.
+
+    Returns:
+        int: The budget, at least 1 so that the rollout progresses.
+    """
+    pb = type(disruption_budget).pb(disruption_budget)
+    if pb.WhichOneof("mode") == "percent":
+        budget = math.ceil(zone_size * pb.percent / 100)
+    else:
+        budget = pb.fixed
+    return max(budget, 1)
+
+
+def _seconds(timestamp) -> float:
+    return timestamp.seconds + timestamp.nanos / 1e9
+
+
+def _revision_key(name: str) -> Tuple[str, str]:
+    # Reports use project numbers, revisions may use project IDs.
+    return zone_of(name), name.rsplit("/", 1)[-1]
+
+
+def apply_times_from_reports(
+    reports: Iterable[Any],
+    revisions: Iterable[os_policy_assignments.OSPolicyAssignment],
+) -> Dict[str, List[float]]:
+    """Returns apply time samples of each instance from past rollouts.
+
+    The sample of an instance for a revision is the time from the creation
+    of the revision to the instance's report of it. It includes the time
+    the instance waited for the disruption budget; it is closest to the
+    apply time for revisions whose rollout was not limited by the budget.
+
+    Args:
+        reports (Iterable[google.cloud.osconfig_v1.types.OSPolicyAssignmentReport]):
+            The reports, e.g. a ``list_os_policy_assignment_reports`` pager.
+        revisions (Iterable[google.cloud.osconfig_v1.types.OSPolicyAssignment]):
+            The revisions the reports refer to, e.g. a
+            ``list_os_policy_assignment_revisions`` pager.
+
+    Returns:
+        Dict[str, List[float]]: The samples, in seconds, keyed by instance
+        name.
+    """
+    starts = {}
+    for revision in revisions:
+        pb = os_policy_assignments.OSPolicyAssignment.pb(revision)
+        name = pb.name if "@" in pb.name else "{}@{}".format(pb.name, pb.revision_id)
+        starts[_revision_key(name)] = _seconds(pb.revision_create_time)
+    samples: Dict[str, List[float]] = {}
+    for report in reports:
+        pb = type(report).pb(report)
+        if "@" not in pb.os_policy_assignment or not pb.HasField("update_time"):
+            continue
+        start = starts.get(_revision_key(pb.os_policy_assignment))
+        if start is None:
+            continue
+        elapsed = _seconds(pb.update_time) - start
+        if elapsed > 0:
+            samples.setdefault(pb.instance, []).append(elapsed)
+    return samples
+
+
+class RolloutEstimate(NamedTuple):
+    """The simulated completion times of a rollout.
+
+    Attributes:
+        completion_times (List[float]): The completion time of each run, in
+            seconds, sorted.
+        zone_budgets (Dict[str, int]): The disruption budget of each zone.
+    """
+
+    completion_times: List[float]
+    zone_budgets: Dict[str, int]
+
+    @property
+    def mean(self) -> float:
+        """float: The mean completion time, in seconds."""
+        return sum(self.completion_times) / len(self.completion_times)
+
+    def percentile(self, q: float) -> float:
+        """Returns a percentile of the completion time, in seconds.
+
+        Args:
+            q (float): The percentile, between 0 and 100.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100.")
+        times = self.completion_times
+        # Linear interpolation between the closest ranks.
+        rank = (len(times) - 1) * q / 100
+        low = math.floor(rank)
+        high = min(low + 1, len(times) - 1)
+        return times[low] + (times[high] - times[low]) * (rank - low)
+
+
+def _makespan(durations: List[float], budget: int) -> float:
+    if budget >= len(durations):
+        return max(durations)
+    slots = durations[:budget]
+    heapq.heapify(slots)
+    replace = heapq.heapreplace
+    for duration in durations[budget:]:
+        replace(slots, slots[0] + duration)
+    return max(slots)
+
+
+def simulate_rollout(
+    assignment: os_policy_assignments.OSPolicyAssignment,
+    instances: Iterable[str],
+    apply_times: Optional[Mapping[str, Sequence[float]]] = None,
+    *,
+    default_apply_times: Optional[Sequence[float]] = None,
+    runs: int = DEFAULT_RUNS,
+    seed: Optional[int] = None,
+) -> RolloutEstimate:
+    """Simulates the rollout of an assignment to a set of instances.
+
+    Args:
+        assignment (google.cloud.osconfig_v1.types.OSPolicyAssignment): The
+            assignment; only its ``rollout`` is used.
+        instances (Iterable[str]): The names of the targeted instances, e.g.
+            from :meth:`~.instance_filter.InstanceSet.select`.
+        apply_times (Optional[Mapping[str, Sequence[float]]]): Samples of
+            the apply time of each instance, in seconds, e.g. from
+            :func:`apply_times_from_reports`.
+        default_apply_times (Optional[Sequence[float]]): The samples used
+            for the instances without any. Defaults to the samples of all
+            instances.
+        runs (int): The number of simulated rollouts. Each run costs
+            about 100 ms per 100,000 instances.
+        seed (Optional[int]): The seed of the random draws, for
+            reproducible estimates.
+
+    Returns:
+        RolloutEstimate: The completion times of the runs.
+
+    Raises:
+        ValueError: If there are no instances, or no samples for some.
+    """
+    if runs < 1:
+        raise ValueError("runs must be at least 1.")
+    apply_times = apply_times or {}
+    if default_apply_times is None:
+        default_apply_times = [t for samples in apply_times.values() for t in samples]
+    default = list(default_apply_times)
+
+    rollout = assignment.rollout
+    wait = _seconds(
+        os_policy_assignments.OSPolicyAssignment.Rollout.pb(rollout).min_wait_duration
+    )
+
+    # The samples of each zone's instances, in a fixed random order: the
+    # order in which the service picks VMs is unknown. The samples include
+    # the wait, and instances without samples share the default ones.
+    rng = random.Random(seed)
+    default_samples = tuple(t + wait for t in default)
+    zones: Dict[str, List[Sequence[float]]] = {}
+    names = sorted(set(instances))
+    rng.shuffle(names)
+    for name in names:
+        samples = apply_times.get(name)
+        if samples:
+            samples = tuple(t + wait for t in samples)
+        elif default_samples:
+            samples = default_samples
+        else:
+            raise ValueError("No apply time samples for {}.".format(name))
+        zones.setdefault(zone_of(name), []).append(samples)
+    if not zones:
+        raise ValueError("No instances to roll out to.")
+    budgets = {
+        zone: zone_budget(rollout.disruption_budget, len(queue))
+        for zone, queue in zones.items()
+    }
+
+    # Indexing with random() is several times faster than Random.choice.
+    uniform = rng.random
+    completion_times = []
+    for _ in range(runs):
+        completion = 0.0
+        for zone, queue in zones.items():
+            durations = [samples[int(uniform() * len(samples))] for samples in queue]
+            completion = max(completion, _makespan(durations, budgets[zone]))
+        completion_times.append(completion)
+    completion_times.sort()
+    return RolloutEstimate(completion_times, budgets)
+
+
+__all__ = (
+    "DEFAULT_RUNS",
+    "RolloutEstimate",
+    "apply_times_from_reports",
+    "simulate_rollout",
+    "zone_budget",
+    "zone_of",
+)
@@ -0,0 +1,429 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Helpers shared by the gRPC transports of the osconfig_v1 services.
+
+A single gRPC channel multiplexes every RPC over one HTTP/2 connection,
+which the server caps at a fixed number of concurrent streams. The channel
+pools below open several sub-channels, each with its own connection, and
+send every RPC on the sub-channel with the fewest RPCs in flight. They also
+apply the per-method compression of the transports.
+"""
+
+import asyncio
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import grpc  # type: ignore
+from grpc.experimental import aio  # type: ignore
+
+#: Channel option giving each sub-channel its own connections, instead of
+#: sharing those of identical channels through gRPC's global subchannel pool.
+LOCAL_SUBCHANNEL_POOL_OPTION = ("grpc.use_local_subchannel_pool", 1)
+
+# Aggregate connectivity of a pool: the best state of any sub-channel.
+_STATE_RANK = {
+    grpc.ChannelConnectivity.READY: 0,
+    grpc.ChannelConnectivity.CONNECTING: 1,
+    grpc.ChannelConnectivity.IDLE: 2,
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE: 3,
+    grpc.ChannelConnectivity.SHUTDOWN: 4,
+}
+
+
+def channel_options(
+    *,
+    max_send_message_length: int = -1,
+    max_receive_message_length: int = -1,
+    keepalive_time_ms: Optional[int] = None,
+    keepalive_timeout_ms: Optional[int] = None,
+) -> List[Tuple[str, object]]:
+    """Returns the options of the channels created by the transports.
+
+    Args:
+        max_send_message_length (int): The largest message, in bytes, the
+            channel sends; -1 for no limit.
+        max_receive_message_length (int): The largest message, in bytes,
+            the channel accepts; -1 for no limit.
+        keepalive_time_ms (Optional[int]): If set, the channel pings the
+            server after this many milliseconds without activity while
+            RPCs are in flight.
+        keepalive_timeout_ms (Optional[int]): How long the channel waits
+            for the acknowledgement of a keepalive ping before closing the
+            connection. Defaults to gRPC's 20 seconds.
+    """
+    options: List[Tuple[str, object]] = [
+        ("grpc.max_send_message_length", max_send_message_length),
+        ("grpc.max_receive_message_length", max_receive_message_length),
+    ]
+    if keepalive_time_ms is not None:
+        options.append(("grpc.keepalive_time_ms", keepalive_time_ms))
+    if keepalive_timeout_ms is not None:
+        options.append(("grpc.keepalive_timeout_ms", keepalive_timeout_ms))
+    return options
+
+
+def pool_channel_options(
+    options: Sequence[Tuple[str, object]]
+) -> List[Tuple[str, object]]:
+    """Returns ``options`` for the sub-channels of a channel pool."""
+    return list(options) + [LOCAL_SUBCHANNEL_POOL_OPTION]
+
+
+def _method_compression(
+    method_compression: Dict[str, grpc.Compression], method: str
+) -> Optional[grpc.Compression]:
+    if method in method_compression:
+        return method_compression[method]
+    return method_compression.get(method.rsplit("/", 1)[-1])
+
+
+class _Balancer:
+    """Counts the RPCs in flight on each sub-channel and picks the least busy.
+
+    Ties are broken round-robin, so an idle pool still spreads its RPCs.
+    """
+
+    def __init__(self, size: int):
+        self._in_flight = [0] * size
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> List[int]:
+        with self._lock:
+            return list(self._in_flight)
+
+    def acquire(self) -> int:
+        with self._lock:
+            size = len(self._in_flight)
+            start = self._next
+            index = min(
+                ((start + offset) % size for offset in range(size)),
+                key=self._in_flight.__getitem__,
+            )
+            self._in_flight[index] += 1
+            self._next = (index + 1) % size
+            return index
+
+    def release(self, index: int) -> None:
+        with self._lock:
+            self._in_flight[index] -= 1
+
+    def releaser(self, index: int) -> Callable[..., None]:
+        """Returns a callback releasing ``index`` exactly once."""
+        released = []
+
+        def release(*args) -> None:
+            if not released:
+                released.append(True)
+                self.release(index)
+
+        return release
+
+
+class _PooledMultiCallable:
+    def __init__(
+        self,
+        balancer: _Balancer,
+        callables: Sequence,
+        compression: Optional[grpc.Compression] = None,
+    ):
+        self._balancer = balancer
+        self._callables = callables
+        self._compression = compression
+
+    def _call_kwargs(self, kwargs):
+        # An explicit per-call compression takes precedence.
+        if self._compression is not None and kwargs.get("compression") is None:
+            kwargs["compression"] = self._compression
+        return kwargs
+
+
+class _PooledUnaryResponse(_PooledMultiCallable):
+    """Multi-callable of RPCs that return once the response is received."""
+
+    def __call__(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index](*args, **self._call_kwargs(kwargs))
+        finally:
+            self._balancer.release(index)
+
+    def with_call(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        try:
+            return self._callables[index].with_call(*args, **self._call_kwargs(kwargs))
+        finally:
+            self._balancer.release(index)
+
+    def future(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        release = self._balancer.releaser(index)
+        try:
+            future = self._callables[index].future(*args, **self._call_kwargs(kwargs))
+        except BaseException:
+            release()
+            raise
+        future.add_done_callback(release)
+        return future
+
+
+class _PooledStreamResponse(_PooledMultiCallable):
+    """Multi-callable of RPCs that return a response iterator."""
+
+    def __call__(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        release = self._balancer.releaser(index)
+        try:
+            call = self._callables[index](*args, **self._call_kwargs(kwargs))
+        except BaseException:
+            release()
+            raise
+        # add_callback returns False if the RPC already terminated.
+        if not call.add_callback(release):
+            release()
+        return call
+
+
+class _PooledUnaryUnary(_PooledUnaryResponse, grpc.UnaryUnaryMultiCallable):
+    pass
+
+
+class _PooledUnaryStream(_PooledStreamResponse, grpc.UnaryStreamMultiCallable):
+    pass
+
+
+class _PooledStreamUnary(_PooledUnaryResponse, grpc.StreamUnaryMultiCallable):
+    pass
+
+
+class _PooledStreamStream(_PooledStreamResponse, grpc.StreamStreamMultiCallable):
+    pass
+
+
+class ChannelPool(grpc.Channel):
+    """A :class:`grpc.Channel` spreading RPCs over several sub-channels.
+
+    Each RPC is sent on the sub-channel with the fewest RPCs in flight.
+
+    Args:
+        channels (Sequence[grpc.Channel]): The sub-channels; they are owned,
+            and closed, by the pool.
+        method_compression (Optional[Dict[str, grpc.Compression]]): The
+            compression of the requests of each RPC, keyed by RPC name
+            (``"ListInventories"``) or full method path. Overrides the
+            compression of the sub-channels.
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[grpc.Channel],
+        *,
+        method_compression: Optional[Dict[str, grpc.Compression]] = None,
+    ):
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel.")
+        self._channels = list(channels)
+        self._balancer = _Balancer(len(self._channels))
+        self._method_compression = dict(method_compression or {})
+
+    @property
+    def channels(self) -> List[grpc.Channel]:
+        """List[grpc.Channel]: The sub-channels of the pool."""
+        return list(self._channels)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """List[int]: The number of RPCs in flight on each sub-channel."""
+        return self._balancer.in_flight
+
+    def _multi_callable(self, factory: str, pooled_class, method, **kwargs):
+        return pooled_class(
+            self._balancer,
+            [getattr(channel, factory)(method, **kwargs) for channel in self._channels],
+            _method_compression(self._method_compression, method),
+        )
+
+    def unary_unary(self, method, **kwargs):
+        return self._multi_callable("unary_unary", _PooledUnaryUnary, method, **kwargs)
+
+    def unary_stream(self, method, **kwargs):
+        return self._multi_callable(
+            "unary_stream", _PooledUnaryStream, method, **kwargs
+        )
+
+    def stream_unary(self, method, **kwargs):
+        return self._multi_callable(
+            "stream_unary", _PooledStreamUnary, method, **kwargs
+        )
+
+    def stream_stream(self, method, **kwargs):
+        return self._multi_callable(
+            "stream_stream", _PooledStreamStream, method, **kwargs
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        """Subscribes ``callback`` to the connectivity of every sub-channel."""
+        for channel in self._channels:
+            channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        for channel in self._channels:
+            channel.unsubscribe(callback)
+
+    def close(self):
+        for channel in self._channels:
+            channel.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+
+class _AsyncPooledMultiCallable(_PooledMultiCallable):
+    def __call__(self, *args, **kwargs):
+        index = self._balancer.acquire()
+        release = self._balancer.releaser(index)
+        try:
+            call = self._callables[index](*args, **self._call_kwargs(kwargs))
+        except BaseException:
+            release()
+            raise
+        call.add_done_callback(release)
+        if call.done():
+            release()
+        return call
+
+
+class _AsyncPooledUnaryUnary(_AsyncPooledMultiCallable, aio.UnaryUnaryMultiCallable):
+    pass
+
+
+class _AsyncPooledUnaryStream(_AsyncPooledMultiCallable, aio.UnaryStreamMultiCallable):
+    pass
+
+
+class _AsyncPooledStreamUnary(_AsyncPooledMultiCallable, aio.StreamUnaryMultiCallable):
+    pass
+
+
+class _AsyncPooledStreamStream(
+    _AsyncPooledMultiCallable, aio.StreamStreamMultiCallable
+):
+    pass
+
+
+class AsyncChannelPool(aio.Channel):
+    """An :class:`grpc.aio.Channel` spreading RPCs over several sub-channels.
+
+    Each RPC is sent on the sub-channel with the fewest RPCs in flight.
+
+    Args:
+        channels (Sequence[grpc.aio.Channel]): The sub-channels; they are
+            owned, and closed, by the pool.
+        method_compression (Optional[Dict[str, grpc.Compression]]): The
+            compression of the requests of each RPC, keyed by RPC name
+            (``"ListInventories"``) or full method path. Overrides the
+            compression of the sub-channels.
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[aio.Channel],
+        *,
+        method_compression: Optional[Dict[str, grpc.Compression]] = None,
+    ):
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel.")
+        self._channels = list(channels)
+        self._balancer = _Balancer(len(self._channels))
+        self._method_compression = dict(method_compression or {})
+
+    @property
+    def channels(self) -> List[aio.Channel]:
+        """List[grpc.aio.Channel]: The sub-channels of the pool."""
+        return list(self._channels)
+
+    @property
+    def in_flight(self) -> List[int]:
+        """List[int]: The number of RPCs in flight on each sub-channel."""
+        return self._balancer.in_flight
+
+    def _multi_callable(self, factory: str, pooled_class, method, **kwargs):
+        return pooled_class(
+            self._balancer,
+            [getattr(channel, factory)(method, **kwargs) for channel in self._channels],
+            _method_compression(self._method_compression, method),
+        )
+
+    def unary_unary(self, method, **kwargs):
+        return self._multi_callable(
+            "unary_unary", _AsyncPooledUnaryUnary, method, **kwargs
+        )
+
+    def unary_stream(self, method, **kwargs):
+        return self._multi_callable(
+            "unary_stream", _AsyncPooledUnaryStream, method, **kwargs
+        )
+
+    def stream_unary(self, method, **kwargs):
+        return self._multi_callable(
+            "stream_unary", _AsyncPooledStreamUnary, method, **kwargs
+        )
+
+    def stream_stream(self, method, **kwargs):
+        return self._multi_callable(
+            "stream_stream", _AsyncPooledStreamStream, method, **kwargs
+        )
+
+    def get_state(self, try_to_connect: bool = False) -> grpc.ChannelConnectivity:
+        """Returns the best connectivity state of the sub-channels."""
+        return min(
+            (channel.get_state(try_to_connect) for channel in self._channels),
+            key=_STATE_RANK.__getitem__,
+        )
+
+    async def wait_for_state_change(
+        self, last_observed_state: grpc.ChannelConnectivity
+    ) -> None:
+        while self.get_state() == last_observed_state:
+            waiters = [
+                asyncio.ensure_future(
+                    channel.wait_for_state_change(channel.get_state())
+                )
+                for channel in self._channels
+            ]
+            try:
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+
+    async def channel_ready(self) -> None:
+        """Waits until every sub-channel is ready."""
+        await asyncio.gather(*(channel.channel_ready() for channel in self._channels))
+
+    async def close(self, grace=None):
+        await asyncio.gather(*(channel.close(grace) for channel in self._channels))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Helpers shared by the asyncio REST transports of the osconfig_v1 services.
+
+Requests are sent through one pooled :class:`aiohttp.ClientSession`, so
+concurrent calls share keep-alive connections instead of each needing a
+thread. The credentials are the regular ``google.auth`` credentials; they
+are refreshed on the default executor, off the event loop.
+"""
+
+import asyncio
+import json
+import os
+import ssl
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1, path_template, rest_helpers
+from google.api_core import retry as retries
+from google.auth import credentials as ga_credentials  # type: ignore
+import google.auth.transport.requests  # type: ignore
+from google.longrunning import operations_pb2  # type: ignore
+from google.protobuf import json_format
+
+try:
+    import aiohttp  # type: ignore
+except ImportError as exc:  # pragma: NO COVER
+    raise ImportError(
+        "The rest_asyncio transport requires aiohttp. Install the library "
+        "with the async_rest extra: pip install google-cloud-os-config[async_rest]"
+    ) from exc
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object]  # type: ignore
+
+AIOHTTP_VERSION = aiohttp.__version__
+
+#: The default maximum number of connections open at once; see
+#: :class:`aiohttp.TCPConnector`.
+DEFAULT_POOL_MAXSIZE = 100
+
+# Status codes after which the credentials are refreshed and the request
+# sent again, as done by google.auth.transport.requests.AuthorizedSession.
+_REFRESH_STATUS_CODES = (401,)
+_MAX_REFRESH_ATTEMPTS = 2
+
+
+class AsyncRestResponse(NamedTuple):
+    """A response whose body was read in full.
+
+    Attributes:
+        status_code (int): The HTTP status code.
+        headers (Mapping[str, str]): The response headers.
+        content (bytes): The response body.
+        method (str): The HTTP method of the request.
+        url (str): The URL of the request.
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    content: bytes
+    method: str
+    url: str
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
+def from_http_response(
+    response: AsyncRestResponse,
+) -> core_exceptions.GoogleAPICallError:
+    """Returns the exception matching an error response.
+
+    The counterpart of :func:`google.api_core.exceptions.from_http_response`,
+    which only accepts :class:`requests.Response` objects.
+    """
+    try:
+        payload = response.json()
+    except ValueError:
+        payload = None
+    error = payload.get("error", {}) if isinstance(payload, dict) else {}
+    error_message = error.get("message") or (
+        response.content.decode("utf-8", "replace") or "unknown error"
+    )
+    message = "{method} {url}: {error}".format(
+        method=response.method.upper(), url=response.url, error=error_message
+    )
+    return core_exceptions.from_http_status(
+        response.status_code,
+        message,
+        errors=error.get("errors", ()),
+        response=response,
+    )
+
+
+def ssl_context_from_cert_source(
+    client_cert_source: Callable[[], Tuple[bytes, bytes]]
+) -> ssl.SSLContext:
+    """Returns an SSL context presenting the client certificate of a source.
+
+    Args:
+        client_cert_source (Callable[[], Tuple[bytes, bytes]]): Returns the
+            client certificate and private key, both in PEM format.
+    """
+    cert, key = client_cert_source()
+    context = ssl.create_default_context()
+    # load_cert_chain only reads files.
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path = os.path.join(directory, "cert.pem")
+        key_path = os.path.join(directory, "key.pem")
+        with open(cert_path, "wb") as cert_file:
+            cert_file.write(cert)
+        with open(os.open(key_path, os.O_WRONLY | os.O_CREAT, 0o600), "wb") as f:
+            f.write(key)
+        context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+class AsyncAuthorizedSession:
+    """An authorized, pooled asyncio HTTP session.
+
+    The :class:`aiohttp.ClientSession` is created on the first request, so
+    that the session can be constructed outside of the event loop it is
+    used in.
+
+    Args:
+        credentials (google.auth.credentials.Credentials): The credentials
+            applied to every request.
+        pool_maxsize (int): The maximum number of connections open at once.
+            Requests beyond it wait for a connection to be released. 0 for
+            no limit.
+        pool_maxsize_per_host (int): The maximum number of connections open
+            to a single host; 0 for no limit.
+        keepalive_timeout (float): Seconds an idle connection is kept open
+            for reuse.
+        ssl_context (Optional[ssl.SSLContext]): The SSL context used for
+            HTTPS connections, for instance to present a client certificate.
+    """
+
+    def __init__(
+        self,
+        credentials: ga_credentials.Credentials,
+        *,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_maxsize_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ):
+        self._credentials = credentials
+        self._pool_maxsize = pool_maxsize
+        self._pool_maxsize_per_host = pool_maxsize_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._ssl_context = ssl_context
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._auth_request = google.auth.transport.requests.Request()
+
+    @property
+    def credentials(self) -> ga_credentials.Credentials:
+        return self._credentials
+
+    def configure_mtls_channel(
+        self, client_cert_source: Callable[[], Tuple[bytes, bytes]]
+    ) -> None:
+        """Presents the client certificate of ``client_cert_source``."""
+        self._ssl_context = ssl_context_from_cert_source(client_cert_source)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._pool_maxsize,
+                limit_per_host=self._pool_maxsize_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ssl=self._ssl_context if self._ssl_context is not None else True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _refresh(self, rejected_token: Optional[str] = None) -> None:
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            # Another request may have refreshed the credentials meanwhile.
+            if self._credentials.valid and (
+                rejected_token is None or self._credentials.token != rejected_token
+            ):
+                return
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._credentials.refresh, self._auth_request
+            )
+
+    async def _authorize(self, method: str, url: str, headers: Dict[str, str]):
+        if not self._credentials.valid:
+            await self._refresh()
+        self._credentials.before_request(self._auth_request, method, url, headers)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Sequence[Tuple[str, str]]] = None,
+        data: Optional[Union[str, bytes]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncRestResponse:
+        """Sends a request and reads its response.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL to request.
+            params (Optional[Sequence[Tuple[str, str]]]): The query
+                parameters.
+            data (Optional[Union[str, bytes]]): The request body.
+            headers (Optional[Mapping[str, str]]): The request headers.
+            timeout (Optional[float]): The timeout of the request, including
+                reading the response, in seconds.
+
+        Returns:
+            AsyncRestResponse: The response.
+        """
+        kwargs: Dict[str, Any] = {"params": params, "data": data}
+        if timeout is not None:
+            kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        for attempt in range(_MAX_REFRESH_ATTEMPTS + 1):
+            request_headers = dict(headers or {})
+            await self._authorize(method, url, request_headers)
+            token = self._credentials.token
+            async with self._get_session().request(
+                method.upper(), url, headers=request_headers, **kwargs
+            ) as response:
+                content = await response.read()
+            if (
+                response.status not in _REFRESH_STATUS_CODES
+                or attempt == _MAX_REFRESH_ATTEMPTS
+                or isinstance(self._credentials, ga_credentials.AnonymousCredentials)
+            ):
+                break
+            await self._refresh(rejected_token=token)
+        return AsyncRestResponse(
+            response.status, response.headers, content, method, url
+        )
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncOperationsRestClient:
+    """Gets and cancels long-running operations over an asyncio REST session.
+
+    Implements the methods used by
+    :func:`google.api_core.operation_async.from_gapic`.
+
+    Args:
+        session (AsyncAuthorizedSession): The session to send requests on.
+        host (str): The scheme and host of the API endpoint.
+        http_options (Dict[str, List[Dict[str, str]]]): The HTTP rules of the
+            ``google.longrunning.Operations`` methods, keyed by full method
+            name.
+    """
+
+    def __init__(
+        self,
+        session: AsyncAuthorizedSession,
+        host: str,
+        http_options: Dict[str, List[Dict[str, str]]],
+    ):
+        self._session = session
+        self._host = host
+        self._http_options = http_options
+
+    async def _call(
+        self,
+        method_name: str,
+        request,
+        timeout: Optional[float],
+        metadata: Optional[Sequence[Tuple[str, str]]],
+    ) -> AsyncRestResponse:
+        transcoded_request = path_template.transcode(
+            self._http_options[method_name], request
+        )
+        body = None
+        if "body" in transcoded_request:
+            body = json_format.MessageToJson(
+                transcoded_request["body"], use_integers_for_enums=True
+            )
+        query_params = json_format.MessageToDict(
+            transcoded_request["query_params"], use_integers_for_enums=True
+        )
+        query_params["$alt"] = "json;enum-encoding=int"
+        headers = dict(metadata or ())
+        headers["Content-Type"] = "application/json"
+        response = await self._session.request(
+            transcoded_request["method"],
+            "{host}{uri}".format(host=self._host, uri=transcoded_request["uri"]),
+            params=rest_helpers.flatten_query_params(query_params, strict=True),
+            data=body,
+            headers=headers,
+            timeout=timeout,
+        )
+        if response.status_code >= 400:
+            raise from_http_response(response)
+        return response
+
+    async def _get_operation(
+        self,
+        name: str,
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> operations_pb2.Operation:
+        response = await self._call(
+            "google.longrunning.Operations.GetOperation",
+            operations_pb2.GetOperationRequest(name=name),
+            timeout,
+            metadata,
+        )
+        return json_format.Parse(
+            response.content, operations_pb2.Operation(), ignore_unknown_fields=True
+        )
+
+    async def get_operation(
+        self,
+        name: str,
+        *,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Optional[float] = None,
+        metadata: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> operations_pb2.Operation:
+        """Gets the latest state of a long-running operation.
+
+        Args:
+            name (str): The name of the operation resource.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of
+                what errors, if any, should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.longrunning.operations_pb2.Operation: The operation.
+        """
+        get_operation = self._get_operation
+        if retry is not None and retry is not gapic_v1.method.DEFAULT:
+            get_operation = retry(get_operation)
+        return await get_operation(name, timeout=timeout, metadata=metadata)
+
+    async def cancel_operation(
+        self,
+        name: str,
+        *,
+        timeout: Optional[float] = None,
+        metadata: Optional[Sequence[Tuple[str, str]]] = None,
+    ) -> None:
+        """Starts asynchronous cancellation of a long-running operation.
+
+        Args:
+            name (str): The name of the operation resource to be cancelled.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+        """
+        await self._call(
+            "google.longrunning.Operations.CancelOperation",
+            operations_pb2.CancelOperationRequest(name=name),
+            timeout,
+            metadata,
+        )
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Helpers shared by the REST transports of the osconfig_v1 services."""
+
+import json
+import re
+import socket
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_CONNECTIONS = requests.adapters.DEFAULT_POOLSIZE
+DEFAULT_POOL_MAXSIZE = requests.adapters.DEFAULT_POOLSIZE
+
+
+def _keepalive_socket_options(
+    tcp_keepalive: Optional[int],
+) -> Optional[List[Tuple[int, int, int]]]:
+    """Returns urllib3 socket options enabling TCP keep-alive probes.
+
+    Args:
+        tcp_keepalive (Optional[int]): Seconds a connection sits idle before
+            the first keep-alive probe is sent. ``None`` leaves the socket
+            options untouched.
+    """
+    if tcp_keepalive is None:
+        return None
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE / TCP_KEEPINTVL are not available on every platform.
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, tcp_keepalive))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, tcp_keepalive))
+    return options
+
+
+def configure_session_pool(
+    session: requests.Session,
+    *,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    max_retries: Union[int, Retry] = 0,
+    tcp_keepalive: Optional[int] = None,
+) -> None:
+    """Re-initializes the connection pools of every adapter on ``session``.
+
+    The adapters already mounted on the session are kept, so an adapter
+    installed by ``AuthorizedSession.configure_mtls_channel`` keeps its
+    client certificate.
+
+    Args:
+        session (requests.Session): The session to configure.
+        pool_connections (int): The number of per-host connection pools
+            to cache.
+        pool_maxsize (int): The maximum number of connections kept open
+            to a single host. Should be at least the number of threads
+            sharing the session, otherwise connections are discarded
+            after use.
+        pool_block (bool): Whether to wait for a free connection, rather
+            than open a new one, once ``pool_maxsize`` connections to a
+            host are in use.
+        max_retries (Union[int, urllib3.util.retry.Retry]): Retries applied
+            by the adapter to failed connections; see
+            :class:`requests.adapters.HTTPAdapter`.
+        tcp_keepalive (Optional[int]): If set, enables TCP keep-alive
+            probes after this many idle seconds so that pooled connections
+            are not silently dropped by intermediaries.
+    """
+    pool_kwargs = {}
+    socket_options = _keepalive_socket_options(tcp_keepalive)
+    if socket_options is not None:
+        pool_kwargs["socket_options"] = socket_options
+
+    for adapter in session.adapters.values():
+        if not isinstance(adapter, requests.adapters.HTTPAdapter):
+            continue  # pragma: NO COVER
+        if max_retries == requests.adapters.DEFAULT_RETRIES:
+            adapter.max_retries = Retry(0, read=False)
+        else:
+            adapter.max_retries = Retry.from_int(max_retries)
+        adapter.poolmanager.clear()
+        adapter.init_poolmanager(
+            pool_connections, pool_maxsize, block=pool_block, **pool_kwargs
+        )
+
+
+# A JSON string, a bracket, or an opening quote whose string is not complete
+# yet (only possible at the end of the buffer).
+_TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]|"', re.DOTALL)
+_STRING_RE = re.compile(rb'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_SCALAR_RE = re.compile(rb"[^,}\]\s]*")
+_WHITESPACE = b" \t\r\n"
+
+
+class JsonListSplitter:
+    """Splits a streamed JSON list response into its repeated items.
+
+    The payload is fed in arbitrary chunks. Each complete element of the
+    top-level array field named by ``field_names`` is returned as raw JSON
+    bytes as soon as it has been received, so only the element being
+    received is buffered. The other top-level fields, such as
+    ``nextPageToken``, are decoded and returned by :meth:`finish`; they may
+    appear before or after the array.
+
+    Args:
+        field_names (Iterable[str]): The JSON and proto names of the
+            repeated field to split.
+    """
+
+    def __init__(self, field_names: Iterable[str]):
+        self._field_names = frozenset(field_names)
+        self._buf = bytearray()
+        self._pos = 0
+        self._state = "start"
+        self._key: Optional[str] = None
+        self._fields: Dict[str, Any] = {}
+        # Resumable scan of the value starting at self._pos.
+        self._scan_pos: Optional[int] = None
+        self._depth = 0
+
+    def _skip_whitespace(self) -> bool:
+        buf = self._buf
+        pos = self._pos
+        end = len(buf)
+        while pos < end and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < end
+
+    def _scan_value(self, final: bool) -> Optional[int]:
+        """Returns the end of the value at ``self._pos`` if it is complete."""
+        buf = self._buf
+        start = self._pos
+        first = buf[start]
+        if first == 0x22:  # '"'
+            match = _STRING_RE.match(buf, start)
+            return match.end() if match else None
+        if first not in b"{[":
+            end = _SCALAR_RE.match(buf, start).end()
+            if end == len(buf) and not final:
+                return None
+            return end
+
+        if self._scan_pos is None:
+            self._scan_pos = start
+            self._depth = 0
+        for match in _TOKEN_RE.finditer(buf, self._scan_pos):
+            token = match.group()
+            if token == b'"':
+                # Incomplete string: resume from its opening quote.
+                self._scan_pos = match.start()
+                return None
+            if token in (b"{", b"["):
+                self._depth += 1
+            elif token in (b"}", b"]"):
+                self._depth -= 1
+                if self._depth == 0:
+                    self._scan_pos = None
+                    return match.end()
+        self._scan_pos = len(buf)
+        return None
+
+    def _expect(self, char: bytes) -> None:
+        if self._buf[self._pos : self._pos + 1] != char:
+            raise ValueError(
+                "Malformed JSON list response: expected {!r} at offset {}.".format(
+                    char.decode(), self._pos
+                )
+            )
+        self._pos += 1
+
+    def _advance(self, final: bool) -> List[bytes]:
+        items = []
+        buf = self._buf
+        while self._state != "done" and self._skip_whitespace():
+            char = buf[self._pos : self._pos + 1]
+            if self._state == "start":
+                self._expect(b"{")
+                self._state = "key"
+            elif self._state == "key":
+                if char in (b",", b"}"):
+                    self._pos += 1
+                    if char == b"}":
+                        self._state = "done"
+                    continue
+                end = self._scan_value(final)
+                if end is None:
+                    break
+                self._key = json.loads(bytes(buf[self._pos : end]))
+                self._pos = end
+                self._state = "colon"
+            elif self._state == "colon":
+                self._expect(b":")
+                self._state = "value"
+            elif self._state == "value":
+                if char == b"[" and self._key in self._field_names:
+                    self._pos += 1
+                    self._state = "items"
+                    continue
+                end = self._scan_value(final)
+                if end is None:
+                    break
+                self._fields[self._key] = json.loads(bytes(buf[self._pos : end]))
+                self._pos = end
+                self._state = "key"
+            else:  # items
+                if char in (b",", b"]"):
+                    self._pos += 1
+                    if char == b"]":
+                        self._state = "key"
+                    continue
+                end = self._scan_value(final)
+                if end is None:
+                    break
+                items.append(bytes(buf[self._pos : end]))
+                self._pos = end
+
+        # Drop what has been consumed so only the pending value is kept.
+        if self._pos:
+            if self._scan_pos is not None:
+                self._scan_pos -= self._pos
+            del buf[: self._pos]
+            self._pos = 0
+        return items
+
+    def feed(self, data: bytes) -> List[bytes]:
+        """Adds a chunk of the payload.
+
+        Args:
+            data (bytes): The next chunk of the payload.
+
+        Returns:
+            List[bytes]: The array elements completed by this chunk.
+        """
+        self._buf += data
+        return self._advance(final=False)
+
+    def finish(self) -> Dict[str, Any]:
+        """Completes the parse once the whole payload has been fed.
+
+        Returns:
+            Dict[str, Any]: The decoded top-level fields other than the
+            split array, keyed by the names used in the payload.
+
+        Raises:
+            ValueError: If the payload is truncated or malformed.
+        """
+        self._advance(final=True)
+        if self._state != "done" or self._buf.strip():
+            raise ValueError("Truncated JSON list response.")
+        return self._fields
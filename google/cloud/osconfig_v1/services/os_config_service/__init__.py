@@ -13,8 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from .async_client import OsConfigServiceAsyncClient
-from .client import OsConfigServiceClient
+from typing import TYPE_CHECKING
+
+from google.cloud.osconfig_v1 import _lazy
+
+_LAZY_SUBMODULES = {
+    ".async_client": ("OsConfigServiceAsyncClient",),
+    ".client": ("OsConfigServiceClient",),
+}
+
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .async_client import OsConfigServiceAsyncClient
+    from .client import OsConfigServiceClient
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
 
 __all__ = (
     "OsConfigServiceClient",
@@ -47,6 +47,7 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
 from google.cloud.osconfig_v1.services.os_config_service import pagers
+from google.cloud.osconfig_v1.services.response_cache import ResponseCache
 from google.cloud.osconfig_v1.types import patch_deployments, patch_jobs
 
 from .client import OsConfigServiceClient
@@ -188,6 +189,7 @@ class OsConfigServiceAsyncClient:
         transport: Union[str, OsConfigServiceTransport] = "grpc_asyncio",
         client_options: Optional[ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         """Instantiates the os config service client.
 
@@ -216,6 +218,10 @@ class OsConfigServiceAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            response_cache (Optional[google.cloud.osconfig_v1.services.response_cache.ResponseCache]):
+                A cache serving repeated ``get_*`` calls for the same
+                resource, invalidated by the ``update_*`` and ``delete_*``
+                calls of this client. Responses are not cached by default.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -226,6 +232,7 @@ class OsConfigServiceAsyncClient:
             transport=transport,
             client_options=client_options,
             client_info=client_info,
+            response_cache=response_cache,
         )
 
     async def execute_patch_job(
@@ -981,6 +988,14 @@ class OsConfigServiceAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
+        # Serve the response from the cache while it is fresh.
+        if self._client._response_cache is not None:
+            cached = self._client._response_cache.get(
+                "get_patch_deployment", request.name
+            )
+            if cached is not None:
+                return cached
+
         # Send the request.
         response = await rpc(
             request,
@@ -989,6 +1004,11 @@ class OsConfigServiceAsyncClient:
             metadata=metadata,
         )
 
+        if self._client._response_cache is not None:
+            response = self._client._response_cache.put(
+                "get_patch_deployment", request.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1201,6 +1221,10 @@ class OsConfigServiceAsyncClient:
             metadata=metadata,
         )
 
+        # Cached responses for the resource are outdated.
+        if self._client._response_cache is not None:
+            self._client._response_cache.invalidate(request.name)
+
     async def update_patch_deployment(
         self,
         request: Optional[
@@ -1318,6 +1342,12 @@ class OsConfigServiceAsyncClient:
             metadata=metadata,
         )
 
+        if self._client._response_cache is not None:
+            # The response is the updated patch deployment.
+            response = self._client._response_cache.put(
+                "get_patch_deployment", response.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1428,6 +1458,12 @@ class OsConfigServiceAsyncClient:
             metadata=metadata,
         )
 
+        if self._client._response_cache is not None:
+            # The response is the updated patch deployment.
+            response = self._client._response_cache.put(
+                "get_patch_deployment", response.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1538,6 +1574,12 @@ class OsConfigServiceAsyncClient:
             metadata=metadata,
         )
 
+        if self._client._response_cache is not None:
+            # The response is the updated patch deployment.
+            response = self._client._response_cache.put(
+                "get_patch_deployment", response.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from collections import OrderedDict
 import os
 import re
 from typing import (
@@ -51,12 +50,11 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
 from google.cloud.osconfig_v1.services.os_config_service import pagers
+from google.cloud.osconfig_v1.services.response_cache import ResponseCache
 from google.cloud.osconfig_v1.types import patch_deployments, patch_jobs
 
+from . import transports
 from .transports.base import DEFAULT_CLIENT_INFO, OsConfigServiceTransport
-from .transports.grpc import OsConfigServiceGrpcTransport
-from .transports.grpc_asyncio import OsConfigServiceGrpcAsyncIOTransport
-from .transports.rest import OsConfigServiceRestTransport
 
 
 class OsConfigServiceClientMeta(type):
@@ -67,12 +65,10 @@ class OsConfigServiceClientMeta(type):
     objects.
     """
 
+    # Transport classes are imported when first requested.
     _transport_registry = (
-        OrderedDict()
-    )  # type: Dict[str, Type[OsConfigServiceTransport]]
-    _transport_registry["grpc"] = OsConfigServiceGrpcTransport
-    _transport_registry["grpc_asyncio"] = OsConfigServiceGrpcAsyncIOTransport
-    _transport_registry["rest"] = OsConfigServiceRestTransport
+        transports._transport_registry
+    )  # type: Mapping[str, Type[OsConfigServiceTransport]]
 
     def get_transport_class(
         cls,
@@ -395,6 +391,7 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
         transport: Optional[Union[str, OsConfigServiceTransport]] = None,
         client_options: Optional[Union[client_options_lib.ClientOptions, dict]] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         """Instantiates the os config service client.
 
@@ -428,6 +425,10 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            response_cache (Optional[google.cloud.osconfig_v1.services.response_cache.ResponseCache]):
+                A cache serving repeated ``get_*`` calls for the same
+                resource, invalidated by the ``update_*`` and ``delete_*``
+                calls of this client. Responses are not cached by default.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -449,6 +450,8 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        self._response_cache = response_cache
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -1245,6 +1248,12 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
+        # Serve the response from the cache while it is fresh.
+        if self._response_cache is not None:
+            cached = self._response_cache.get("get_patch_deployment", request.name)
+            if cached is not None:
+                return cached
+
         # Send the request.
         response = rpc(
             request,
@@ -1253,6 +1262,11 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
             metadata=metadata,
         )
 
+        if self._response_cache is not None:
+            response = self._response_cache.put(
+                "get_patch_deployment", request.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1465,6 +1479,10 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
             metadata=metadata,
         )
 
+        # Cached responses for the resource are outdated.
+        if self._response_cache is not None:
+            self._response_cache.invalidate(request.name)
+
     def update_patch_deployment(
         self,
         request: Optional[
@@ -1582,6 +1600,12 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
             metadata=metadata,
         )
 
+        if self._response_cache is not None:
+            # The response is the updated patch deployment.
+            response = self._response_cache.put(
+                "get_patch_deployment", response.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1692,6 +1716,12 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
             metadata=metadata,
         )
 
+        if self._response_cache is not None:
+            # The response is the updated patch deployment.
+            response = self._response_cache.put(
+                "get_patch_deployment", response.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1802,6 +1832,12 @@ class OsConfigServiceClient(metaclass=OsConfigServiceClientMeta):
             metadata=metadata,
         )
 
+        if self._response_cache is not None:
+            # The response is the updated patch deployment.
+            response = self._response_cache.put(
+                "get_patch_deployment", response.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -14,18 +14,40 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-from typing import Dict, Type
+from typing import TYPE_CHECKING, Mapping, Type
+
+from google.cloud.osconfig_v1 import _lazy
 
 from .base import OsConfigServiceTransport
-from .grpc import OsConfigServiceGrpcTransport
-from .grpc_asyncio import OsConfigServiceGrpcAsyncIOTransport
-from .rest import OsConfigServiceRestInterceptor, OsConfigServiceRestTransport
 
-# Compile a registry of transports.
-_transport_registry = OrderedDict()  # type: Dict[str, Type[OsConfigServiceTransport]]
-_transport_registry["grpc"] = OsConfigServiceGrpcTransport
-_transport_registry["grpc_asyncio"] = OsConfigServiceGrpcAsyncIOTransport
-_transport_registry["rest"] = OsConfigServiceRestTransport
+_LAZY_SUBMODULES = {
+    ".grpc": ("OsConfigServiceGrpcTransport",),
+    ".grpc_asyncio": ("OsConfigServiceGrpcAsyncIOTransport",),
+    ".rest": (
+        "OsConfigServiceRestInterceptor",
+        "OsConfigServiceRestTransport",
+    ),
+}
+
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .grpc import OsConfigServiceGrpcTransport
+    from .grpc_asyncio import OsConfigServiceGrpcAsyncIOTransport
+    from .rest import OsConfigServiceRestInterceptor, OsConfigServiceRestTransport
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
+
+# Compile a registry of transports. Each transport module, and the
+# libraries it depends on, is only imported once the transport is requested.
+_transport_registry = _lazy.LazyRegistry(
+    __name__,
+    OrderedDict(
+        [
+            ("grpc", (".grpc", "OsConfigServiceGrpcTransport")),
+            ("grpc_asyncio", (".grpc_asyncio", "OsConfigServiceGrpcAsyncIOTransport")),
+            ("rest", (".rest", "OsConfigServiceRestTransport")),
+        ]
+    ),
+)  # type: Mapping[str, Type[OsConfigServiceTransport]]
 
 __all__ = (
     "OsConfigServiceTransport",
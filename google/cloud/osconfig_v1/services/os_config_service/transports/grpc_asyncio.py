@@ -23,6 +23,7 @@ from google.protobuf import empty_pb2  # type: ignore
 import grpc  # type: ignore
 from grpc.experimental import aio  # type: ignore
 
+from google.cloud.osconfig_v1.services import _grpc_helpers
 from google.cloud.osconfig_v1.types import patch_deployments, patch_jobs
 
 from .base import DEFAULT_CLIENT_INFO, OsConfigServiceTransport
@@ -107,6 +108,13 @@ class OsConfigServiceGrpcAsyncIOTransport(OsConfigServiceTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         api_audience: Optional[str] = None,
+        channel_pool_size: int = 1,
+        compression: Optional[grpc.Compression] = None,
+        method_compression: Optional[Dict[str, grpc.Compression]] = None,
+        keepalive_time_ms: Optional[int] = None,
+        keepalive_timeout_ms: Optional[int] = None,
+        max_send_message_length: int = -1,
+        max_receive_message_length: int = -1,
     ) -> None:
         """Instantiate the transport.
 
@@ -150,6 +158,32 @@ class OsConfigServiceGrpcAsyncIOTransport(OsConfigServiceTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            channel_pool_size (int): The number of channels to open. RPCs
+                are sent on the channel with the fewest RPCs in flight,
+                which lifts the limit on concurrent streams of a single
+                HTTP/2 connection. It is ignored if ``channel`` is provided.
+            compression (Optional[grpc.Compression]): The compression of
+                the requests sent on the channel. The channel accepts
+                gzip and deflate compressed responses regardless. It is
+                ignored if ``channel`` is provided.
+            method_compression (Optional[Dict[str, grpc.Compression]]):
+                The compression of the requests of each RPC, keyed by
+                RPC name (``"ListInventories"``). Overrides
+                ``compression``. It is ignored if ``channel`` is provided.
+            keepalive_time_ms (Optional[int]): If set, the channel pings
+                the server after this many milliseconds without activity
+                while RPCs are in flight. It is ignored if ``channel`` is
+                provided.
+            keepalive_timeout_ms (Optional[int]): How long the channel
+                waits for a keepalive ping to be acknowledged before
+                closing the connection. It is ignored if ``channel`` is
+                provided.
+            max_send_message_length (int): The largest request, in bytes,
+                the channel sends; -1 for no limit. It is ignored if
+                ``channel`` is provided.
+            max_receive_message_length (int): The largest response, in
+                bytes, the channel accepts; -1 for no limit. It is ignored
+                if ``channel`` is provided.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -157,6 +191,8 @@ class OsConfigServiceGrpcAsyncIOTransport(OsConfigServiceTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        if channel_pool_size < 1:
+            raise ValueError("channel_pool_size must be at least 1.")
         self._grpc_channel = None
         self._ssl_channel_credentials = ssl_channel_credentials
         self._stubs: Dict[str, Callable] = {}
@@ -206,21 +242,39 @@ class OsConfigServiceGrpcAsyncIOTransport(OsConfigServiceTransport):
         )
 
         if not self._grpc_channel:
-            self._grpc_channel = type(self).create_channel(
-                self._host,
-                # use the credentials which are saved
-                credentials=self._credentials,
-                # Set ``credentials_file`` to ``None`` here as
-                # the credentials that we saved earlier should be used.
-                credentials_file=None,
-                scopes=self._scopes,
-                ssl_credentials=self._ssl_channel_credentials,
-                quota_project_id=quota_project_id,
-                options=[
-                    ("grpc.max_send_message_length", -1),
-                    ("grpc.max_receive_message_length", -1),
-                ],
+            options = _grpc_helpers.channel_options(
+                max_send_message_length=max_send_message_length,
+                max_receive_message_length=max_receive_message_length,
+                keepalive_time_ms=keepalive_time_ms,
+                keepalive_timeout_ms=keepalive_timeout_ms,
             )
+            if channel_pool_size > 1:
+                options = _grpc_helpers.pool_channel_options(options)
+            channel_kwargs = {}
+            if compression is not None:
+                channel_kwargs["compression"] = compression
+            channels = [
+                type(self).create_channel(
+                    self._host,
+                    # use the credentials which are saved
+                    credentials=self._credentials,
+                    # Set ``credentials_file`` to ``None`` here as
+                    # the credentials that we saved earlier should be used.
+                    credentials_file=None,
+                    scopes=self._scopes,
+                    ssl_credentials=self._ssl_channel_credentials,
+                    quota_project_id=quota_project_id,
+                    options=options,
+                    **channel_kwargs,
+                )
+                for _ in range(channel_pool_size)
+            ]
+            if channel_pool_size == 1 and not method_compression:
+                self._grpc_channel = channels[0]
+            else:
+                self._grpc_channel = _grpc_helpers.AsyncChannelPool(
+                    channels, method_compression=method_compression
+                )
 
         # Wrap messages. This must be done after self._grpc_channel exists
         self._prep_wrapped_messages(client_info)
@@ -235,6 +289,18 @@ class OsConfigServiceGrpcAsyncIOTransport(OsConfigServiceTransport):
         # Return the channel from cache.
         return self._grpc_channel
 
+    @property
+    def channel_pool(self) -> Optional[_grpc_helpers.AsyncChannelPool]:
+        """Return the channel pool, if the transport uses one.
+
+        The transport uses a pool when ``channel_pool_size`` is above 1 or
+        ``method_compression`` is set. Its ``in_flight`` property counts
+        the RPCs in flight on each channel of the pool.
+        """
+        if isinstance(self._grpc_channel, _grpc_helpers.AsyncChannelPool):
+            return self._grpc_channel
+        return None
+
     @property
     def execute_patch_job(
         self,
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -26,9 +25,9 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-from google.protobuf import json_format
 import grpc  # type: ignore
 from requests import __version__ as requests_version
+from urllib3.util.retry import Retry
 
 try:
     OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
@@ -38,6 +37,7 @@ except AttributeError:  # pragma: NO COVER
 
 from google.protobuf import empty_pb2  # type: ignore
 
+from google.cloud.osconfig_v1.services import _rest_helpers, rest_codecs
 from google.cloud.osconfig_v1.types import patch_deployments, patch_jobs
 
 from .base import DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
@@ -446,6 +446,7 @@ class OsConfigServiceRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: OsConfigServiceRestInterceptor
+    _codec: rest_codecs.JsonCodec = rest_codecs.DEFAULT_CODEC
 
 
 class OsConfigServiceRestTransport(OsConfigServiceTransport):
@@ -478,6 +479,12 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
         url_scheme: str = "https",
         interceptor: Optional[OsConfigServiceRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        pool_connections: int = _rest_helpers.DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = _rest_helpers.DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        max_retries: Union[int, Retry] = 0,
+        tcp_keepalive: Optional[int] = None,
+        codec: Optional[rest_codecs.JsonCodec] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -510,6 +517,25 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            pool_connections (int): The number of per-host connection pools
+                cached by the HTTP session.
+            pool_maxsize (int): The maximum number of keep-alive connections
+                kept open to the API host. Set it to at least the number of
+                threads sharing this transport to avoid reconnecting.
+            pool_block (bool): Whether requests wait for a pooled connection
+                to be released once ``pool_maxsize`` connections are in use,
+                rather than opening an extra, unpooled connection.
+            max_retries (Union[int, urllib3.util.retry.Retry]): Connection
+                level retries applied by the HTTP adapter. These are in
+                addition to, and independent from, the ``retry`` argument
+                of each method.
+            tcp_keepalive (Optional[int]): If set, idle pooled connections
+                send TCP keep-alive probes after this many seconds.
+            codec (Optional[google.cloud.osconfig_v1.services.rest_codecs.JsonCodec]):
+                The codec used to serialize requests and parse responses.
+                Defaults to :class:`~.rest_codecs.JsonCodec`; pass a
+                :class:`~.rest_codecs.FastJsonCodec` to speed up parsing of
+                large responses.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -537,6 +563,15 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
         )
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        _rest_helpers.configure_session_pool(
+            self._session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+            tcp_keepalive=tcp_keepalive,
+        )
+        self._codec = codec or rest_codecs.DEFAULT_CODEC
         self._interceptor = interceptor or OsConfigServiceRestInterceptor()
         self._prep_wrapped_messages(client_info)
 
@@ -603,22 +638,12 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -643,7 +668,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_jobs.PatchJob()
             pb_resp = patch_jobs.PatchJob.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_cancel_patch_job(resp)
             return resp
 
@@ -709,22 +734,12 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -749,7 +764,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_deployments.PatchDeployment()
             pb_resp = patch_deployments.PatchDeployment.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_create_patch_deployment(resp)
             return resp
 
@@ -804,13 +819,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -895,22 +904,12 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -935,7 +934,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_jobs.PatchJob()
             pb_resp = patch_jobs.PatchJob.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_execute_patch_job(resp)
             return resp
 
@@ -1000,13 +999,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1030,7 +1023,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_deployments.PatchDeployment()
             pb_resp = patch_deployments.PatchDeployment.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_get_patch_deployment(resp)
             return resp
 
@@ -1097,13 +1090,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1127,7 +1114,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_jobs.PatchJob()
             pb_resp = patch_jobs.PatchJob.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_get_patch_job(resp)
             return resp
 
@@ -1188,13 +1175,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1218,7 +1199,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_deployments.ListPatchDeploymentsResponse()
             pb_resp = patch_deployments.ListPatchDeploymentsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_patch_deployments(resp)
             return resp
 
@@ -1280,13 +1261,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1310,7 +1285,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_jobs.ListPatchJobInstanceDetailsResponse()
             pb_resp = patch_jobs.ListPatchJobInstanceDetailsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_patch_job_instance_details(resp)
             return resp
 
@@ -1369,13 +1344,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1399,7 +1368,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_jobs.ListPatchJobsResponse()
             pb_resp = patch_jobs.ListPatchJobsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_patch_jobs(resp)
             return resp
 
@@ -1463,22 +1432,12 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1503,7 +1462,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_deployments.PatchDeployment()
             pb_resp = patch_deployments.PatchDeployment.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_pause_patch_deployment(resp)
             return resp
 
@@ -1567,22 +1526,12 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1607,7 +1556,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_deployments.PatchDeployment()
             pb_resp = patch_deployments.PatchDeployment.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_resume_patch_deployment(resp)
             return resp
 
@@ -1671,22 +1620,12 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1711,7 +1650,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
             resp = patch_deployments.PatchDeployment()
             pb_resp = patch_deployments.PatchDeployment.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_update_patch_deployment(resp)
             return resp
 
@@ -1721,7 +1660,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ) -> Callable[[patch_jobs.CancelPatchJobRequest], patch_jobs.PatchJob]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._CancelPatchJob(self._session, self._host, self._interceptor)  # type: ignore
+        return self._CancelPatchJob(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def create_patch_deployment(
@@ -1732,7 +1671,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._CreatePatchDeployment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._CreatePatchDeployment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def delete_patch_deployment(
@@ -1740,7 +1679,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ) -> Callable[[patch_deployments.DeletePatchDeploymentRequest], empty_pb2.Empty]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeletePatchDeployment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeletePatchDeployment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def execute_patch_job(
@@ -1748,7 +1687,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ) -> Callable[[patch_jobs.ExecutePatchJobRequest], patch_jobs.PatchJob]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ExecutePatchJob(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ExecutePatchJob(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def get_patch_deployment(
@@ -1758,7 +1697,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetPatchDeployment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetPatchDeployment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def get_patch_job(
@@ -1766,7 +1705,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ) -> Callable[[patch_jobs.GetPatchJobRequest], patch_jobs.PatchJob]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetPatchJob(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetPatchJob(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def list_patch_deployments(
@@ -1777,7 +1716,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListPatchDeployments(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListPatchDeployments(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def list_patch_job_instance_details(
@@ -1788,7 +1727,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListPatchJobInstanceDetails(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListPatchJobInstanceDetails(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def list_patch_jobs(
@@ -1796,7 +1735,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ) -> Callable[[patch_jobs.ListPatchJobsRequest], patch_jobs.ListPatchJobsResponse]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListPatchJobs(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListPatchJobs(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def pause_patch_deployment(
@@ -1807,7 +1746,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._PausePatchDeployment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._PausePatchDeployment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def resume_patch_deployment(
@@ -1818,7 +1757,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ResumePatchDeployment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ResumePatchDeployment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def update_patch_deployment(
@@ -1829,7 +1768,7 @@ class OsConfigServiceRestTransport(OsConfigServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._UpdatePatchDeployment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._UpdatePatchDeployment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def kind(self) -> str:
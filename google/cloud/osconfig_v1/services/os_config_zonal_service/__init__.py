@@ -13,8 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from .async_client import OsConfigZonalServiceAsyncClient
-from .client import OsConfigZonalServiceClient
+from typing import TYPE_CHECKING
+
+from google.cloud.osconfig_v1 import _lazy
+
+_LAZY_SUBMODULES = {
+    ".async_client": ("OsConfigZonalServiceAsyncClient",),
+    ".client": ("OsConfigZonalServiceClient",),
+}
+
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .async_client import OsConfigZonalServiceAsyncClient
+    from .client import OsConfigZonalServiceClient
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
 
 __all__ = (
     "OsConfigZonalServiceClient",
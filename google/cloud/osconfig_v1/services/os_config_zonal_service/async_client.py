@@ -18,6 +18,7 @@ import functools
 import re
 from typing import (
     Dict,
+    Iterable,
     Mapping,
     MutableMapping,
     MutableSequence,
@@ -49,6 +50,8 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
 from google.cloud.osconfig_v1.services.os_config_zonal_service import pagers
+from google.cloud.osconfig_v1.services.projection import FieldProjection
+from google.cloud.osconfig_v1.services.response_cache import ResponseCache
 from google.cloud.osconfig_v1.types import (
     inventory,
     os_policy,
@@ -217,6 +220,7 @@ class OsConfigZonalServiceAsyncClient:
         transport: Union[str, OsConfigZonalServiceTransport] = "grpc_asyncio",
         client_options: Optional[ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         """Instantiates the os config zonal service client.
 
@@ -245,6 +249,10 @@ class OsConfigZonalServiceAsyncClient:
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+            response_cache (Optional[google.cloud.osconfig_v1.services.response_cache.ResponseCache]):
+                A cache serving repeated ``get_*`` calls for the same
+                resource, invalidated by the ``update_*`` and ``delete_*``
+                calls of this client. Responses are not cached by default.
 
         Raises:
             google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
@@ -255,6 +263,7 @@ class OsConfigZonalServiceAsyncClient:
             transport=transport,
             client_options=client_options,
             client_info=client_info,
+            response_cache=response_cache,
         )
 
     async def create_os_policy_assignment(
@@ -582,6 +591,10 @@ class OsConfigZonalServiceAsyncClient:
             metadata=metadata,
         )
 
+        # Cached responses for the resource are outdated.
+        if self._client._response_cache is not None:
+            self._client._response_cache.invalidate(request.os_policy_assignment.name)
+
         # Wrap the response in an operation future.
         response = operation_async.from_gapic(
             response,
@@ -702,6 +715,14 @@ class OsConfigZonalServiceAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
+        # Serve the response from the cache while it is fresh.
+        if self._client._response_cache is not None:
+            cached = self._client._response_cache.get(
+                "get_os_policy_assignment", request.name
+            )
+            if cached is not None:
+                return cached
+
         # Send the request.
         response = await rpc(
             request,
@@ -710,6 +731,11 @@ class OsConfigZonalServiceAsyncClient:
             metadata=metadata,
         )
 
+        if self._client._response_cache is not None:
+            response = self._client._response_cache.put(
+                "get_os_policy_assignment", request.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1076,6 +1102,10 @@ class OsConfigZonalServiceAsyncClient:
             metadata=metadata,
         )
 
+        # Cached responses for the resource are outdated.
+        if self._client._response_cache is not None:
+            self._client._response_cache.invalidate(request.name)
+
         # Wrap the response in an operation future.
         response = operation_async.from_gapic(
             response,
@@ -1193,6 +1223,14 @@ class OsConfigZonalServiceAsyncClient:
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
+        # Serve the response from the cache while it is fresh.
+        if self._client._response_cache is not None:
+            cached = self._client._response_cache.get(
+                "get_os_policy_assignment_report", request.name
+            )
+            if cached is not None:
+                return cached
+
         # Send the request.
         response = await rpc(
             request,
@@ -1201,6 +1239,11 @@ class OsConfigZonalServiceAsyncClient:
             metadata=metadata,
         )
 
+        if self._client._response_cache is not None:
+            response = self._client._response_cache.put(
+                "get_os_policy_assignment_report", request.name, response
+            )
+
         # Done; return the response.
         return response
 
@@ -1216,6 +1259,7 @@ class OsConfigZonalServiceAsyncClient:
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        projection: Optional[FieldProjection] = None,
     ) -> pagers.ListOSPolicyAssignmentReportsAsyncPager:
         r"""List OS policy asssignment reports for all Compute
         Engine VM instances in the specified zone.
@@ -1287,6 +1331,11 @@ class OsConfigZonalServiceAsyncClient:
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            projection (Optional[google.cloud.osconfig_v1.services.projection.FieldProjection]):
+                Fields to drop from the responses while they are parsed,
+                e.g. ``projection.REPORT_COMPLIANCE`` to skip the output of
+                exec resources. The projection must be of
+                ``ListOSPolicyAssignmentReportsResponse``.
 
         Returns:
             google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListOSPolicyAssignmentReportsAsyncPager:
@@ -1298,6 +1347,18 @@ class OsConfigZonalServiceAsyncClient:
                 automatically.
 
         """
+        if projection is not None and (
+            projection.message_type
+            is not os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse
+        ):
+            raise ValueError(
+                "projection must be of ListOSPolicyAssignmentReportsResponse."
+            )
+        if projection is not None and not hasattr(
+            self._client._transport, "list_os_policy_assignment_reports_projected"
+        ):
+            raise ValueError("projection is not supported by this transport.")
+
         # Create or coerce a protobuf request object.
         # Quick check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
@@ -1319,8 +1380,16 @@ class OsConfigZonalServiceAsyncClient:
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
+        if projection is None:
+            method = self._client._transport.list_os_policy_assignment_reports
+        else:
+            method = (
+                self._client._transport.list_os_policy_assignment_reports_projected(
+                    projection
+                )
+            )
         rpc = gapic_v1.method_async.wrap_method(
-            self._client._transport.list_os_policy_assignment_reports,
+            method,
             default_timeout=None,
             client_info=DEFAULT_CLIENT_INFO,
         )
@@ -1835,6 +1904,102 @@ class OsConfigZonalServiceAsyncClient:
         # Done; return the response.
         return response
 
+    _FAN_OUT_REQUESTS = {
+        "list_os_policy_assignments": os_policy_assignments.ListOSPolicyAssignmentsRequest,
+        "list_os_policy_assignment_reports": os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest,
+        "list_inventories": inventory.ListInventoriesRequest,
+        "list_vulnerability_reports": vulnerability.ListVulnerabilityReportsRequest,
+    }
+
+    def fan_out(
+        self,
+        method: str,
+        parents: Iterable[str],
+        request: Optional[Union[Mapping, object]] = None,
+        *,
+        max_concurrency: int = 16,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> pagers.FanOutAsyncPager:
+        r"""Runs a zonal list RPC over many parents concurrently.
+
+        .. code-block:: python
+
+            from google.cloud import osconfig_v1
+
+            async def sample_fan_out():
+                client = osconfig_v1.OsConfigZonalServiceAsyncClient()
+
+                parents = [
+                    f"projects/{project}/locations/{zone}/instances/-"
+                    for project in projects
+                    for zone in zones
+                ]
+                results = client.fan_out(
+                    "list_inventories",
+                    parents,
+                    {"view": osconfig_v1.InventoryView.FULL},
+                    max_concurrency=32,
+                )
+                async for parent, inventory in results:
+                    print(parent, inventory.name)
+
+                for parent, error in results.errors.items():
+                    print(parent, error)
+
+        Args:
+            method (str): The name of the list method to call, one of
+                ``list_os_policy_assignments``,
+                ``list_os_policy_assignment_reports``, ``list_inventories``
+                or ``list_vulnerability_reports``.
+            parents (Iterable[str]): The parent resource names to list.
+                Duplicates are listed once.
+            request (Union[dict, proto.Message]): A request template for
+                ``method``. Its ``parent`` field is replaced by each of
+                ``parents``.
+            max_concurrency (int): The maximum number of parents listed
+                at the same time, across all pages.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for each request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with each request as metadata.
+
+        Returns:
+            google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.FanOutAsyncPager:
+                Iterating over this object yields ``(parent, item)``
+                tuples for all parents. Errors raised while listing a
+                parent are collected in its ``errors`` attribute instead
+                of being raised.
+
+        """
+        if method not in self._FAN_OUT_REQUESTS:
+            raise ValueError(
+                "Unsupported fan-out method {!r}; expected one of {}.".format(
+                    method, ", ".join(sorted(self._FAN_OUT_REQUESTS))
+                )
+            )
+        request_type = self._FAN_OUT_REQUESTS[method]
+        template = request_type(request)
+        call = getattr(self, method)
+
+        async def list_parent(parent: str):
+            parent_request = request_type(template)
+            parent_request.parent = parent
+            return await call(
+                request=parent_request,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+            )
+
+        return pagers.FanOutAsyncPager(
+            list_parent,
+            parents,
+            max_concurrency=max_concurrency,
+        )
+
     async def __aenter__(self):
         return self
 
@@ -13,7 +13,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from collections import OrderedDict
 import os
 import re
 from typing import (
@@ -53,6 +52,8 @@ from google.protobuf import field_mask_pb2  # type: ignore
 from google.protobuf import timestamp_pb2  # type: ignore
 
 from google.cloud.osconfig_v1.services.os_config_zonal_service import pagers
+from google.cloud.osconfig_v1.services.projection import FieldProjection
+from google.cloud.osconfig_v1.services.response_cache import ResponseCache
 from google.cloud.osconfig_v1.types import (
     inventory,
     os_policy,
@@ -61,10 +62,8 @@ from google.cloud.osconfig_v1.types import (
     vulnerability,
 )
 
+from . import transports
 from .transports.base import DEFAULT_CLIENT_INFO, OsConfigZonalServiceTransport
-from .transports.grpc import OsConfigZonalServiceGrpcTransport
-from .transports.grpc_asyncio import OsConfigZonalServiceGrpcAsyncIOTransport
-from .transports.rest import OsConfigZonalServiceRestTransport
 
 
 class OsConfigZonalServiceClientMeta(type):
@@ -75,12 +74,10 @@ class OsConfigZonalServiceClientMeta(type):
     objects.
     """
 
+    # Transport classes are imported when first requested.
     _transport_registry = (
-        OrderedDict()
-    )  # type: Dict[str, Type[OsConfigZonalServiceTransport]]
-    _transport_registry["grpc"] = OsConfigZonalServiceGrpcTransport
-    _transport_registry["grpc_asyncio"] = OsConfigZonalServiceGrpcAsyncIOTransport
-    _transport_registry["rest"] = OsConfigZonalServiceRestTransport
+        transports._transport_registry
+    )  # type: Mapping[str, Type[OsConfigZonalServiceTransport]]
 
     def get_transport_class(
         cls,
@@ -480,6 +477,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         transport: Optional[Union[str, OsConfigZonalServiceTransport]] = None,
         client_options: Optional[Union[client_options_lib.ClientOptions, dict]] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        response_cache: Optional[ResponseCache] = None,
     ) -> None:
         """Instantiates the os config zonal service client.
 
@@ -513,6 +511,10 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
                 API requests. If ``None``, then default info will be used.
                 Generally, you only need to set this if you're developing
                 your own client library.
+            response_cache (Optional[google.cloud.osconfig_v1.services.response_cache.ResponseCache]):
+                A cache serving repeated ``get_*`` calls for the same
+                resource, invalidated by the ``update_*`` and ``delete_*``
+                calls of this client. Responses are not cached by default.
 
         Raises:
             google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -534,6 +536,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        self._response_cache = response_cache
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -906,6 +910,10 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             metadata=metadata,
         )
 
+        # Cached responses for the resource are outdated.
+        if self._response_cache is not None:
+            self._response_cache.invalidate(request.os_policy_assignment.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -927,6 +935,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> os_policy_assignments.OSPolicyAssignment:
         r"""Retrieve an existing OS policy assignment.
 
@@ -978,6 +987,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, return the underlying protobuf
+                message rather than its proto-plus wrapper.
 
         Returns:
             google.cloud.osconfig_v1.types.OSPolicyAssignment:
@@ -1026,6 +1037,16 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
+        # Serve the response from the cache while it is fresh.
+        if self._response_cache is not None:
+            cached = self._response_cache.get("get_os_policy_assignment", request.name)
+            if cached is not None:
+                return (
+                    os_policy_assignments.OSPolicyAssignment.pb(cached)
+                    if raw
+                    else cached
+                )
+
         # Send the request.
         response = rpc(
             request,
@@ -1034,7 +1055,14 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             metadata=metadata,
         )
 
+        if self._response_cache is not None:
+            response = self._response_cache.put(
+                "get_os_policy_assignment", request.name, response
+            )
+
         # Done; return the response.
+        if raw:
+            return os_policy_assignments.OSPolicyAssignment.pb(response)
         return response
 
     def list_os_policy_assignments(
@@ -1047,6 +1075,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> pagers.ListOSPolicyAssignmentsPager:
         r"""List the OS policy assignments under the parent
         resource.
@@ -1094,6 +1123,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, the pager yields the underlying
+                protobuf messages rather than their proto-plus wrappers.
 
         Returns:
             google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListOSPolicyAssignmentsPager:
@@ -1154,6 +1185,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            raw=raw,
         )
 
         # Done; return the response.
@@ -1169,6 +1201,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> pagers.ListOSPolicyAssignmentRevisionsPager:
         r"""List the OS policy assignment revisions for a given
         OS policy assignment.
@@ -1216,6 +1249,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, the pager yields the underlying
+                protobuf messages rather than their proto-plus wrappers.
 
         Returns:
             google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListOSPolicyAssignmentRevisionsPager:
@@ -1278,6 +1313,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            raw=raw,
         )
 
         # Done; return the response.
@@ -1414,6 +1450,10 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             metadata=metadata,
         )
 
+        # Cached responses for the resource are outdated.
+        if self._response_cache is not None:
+            self._response_cache.invalidate(request.name)
+
         # Wrap the response in an operation future.
         response = operation.from_gapic(
             response,
@@ -1435,6 +1475,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> os_policy_assignment_reports.OSPolicyAssignmentReport:
         r"""Get the OS policy asssignment report for the
         specified Compute Engine VM instance.
@@ -1491,6 +1532,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, return the underlying protobuf
+                message rather than its proto-plus wrapper.
 
         Returns:
             google.cloud.osconfig_v1.types.OSPolicyAssignmentReport:
@@ -1535,6 +1578,18 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             gapic_v1.routing_header.to_grpc_metadata((("name", request.name),)),
         )
 
+        # Serve the response from the cache while it is fresh.
+        if self._response_cache is not None:
+            cached = self._response_cache.get(
+                "get_os_policy_assignment_report", request.name
+            )
+            if cached is not None:
+                return (
+                    os_policy_assignment_reports.OSPolicyAssignmentReport.pb(cached)
+                    if raw
+                    else cached
+                )
+
         # Send the request.
         response = rpc(
             request,
@@ -1543,7 +1598,14 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             metadata=metadata,
         )
 
+        if self._response_cache is not None:
+            response = self._response_cache.put(
+                "get_os_policy_assignment_report", request.name, response
+            )
+
         # Done; return the response.
+        if raw:
+            return os_policy_assignment_reports.OSPolicyAssignmentReport.pb(response)
         return response
 
     def list_os_policy_assignment_reports(
@@ -1558,6 +1620,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        projection: Optional[FieldProjection] = None,
+        raw: bool = False,
     ) -> pagers.ListOSPolicyAssignmentReportsPager:
         r"""List OS policy asssignment reports for all Compute
         Engine VM instances in the specified zone.
@@ -1629,6 +1693,13 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            projection (Optional[google.cloud.osconfig_v1.services.projection.FieldProjection]):
+                Fields to drop from the responses while they are parsed,
+                e.g. ``projection.REPORT_COMPLIANCE`` to skip the output of
+                exec resources. The projection must be of
+                ``ListOSPolicyAssignmentReportsResponse``.
+            raw (bool): If ``True``, the pager yields the underlying
+                protobuf messages rather than their proto-plus wrappers.
 
         Returns:
             google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListOSPolicyAssignmentReportsPager:
@@ -1640,6 +1711,18 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
                 automatically.
 
         """
+        if projection is not None and (
+            projection.message_type
+            is not os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse
+        ):
+            raise ValueError(
+                "projection must be of ListOSPolicyAssignmentReportsResponse."
+            )
+        if projection is not None and not hasattr(
+            self._transport, "list_os_policy_assignment_reports_projected"
+        ):
+            raise ValueError("projection is not supported by this transport.")
+
         # Create or coerce a protobuf request object.
         # Quick check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
@@ -1667,9 +1750,16 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[
-            self._transport.list_os_policy_assignment_reports
-        ]
+        if projection is None:
+            rpc = self._transport._wrapped_methods[
+                self._transport.list_os_policy_assignment_reports
+            ]
+        else:
+            rpc = gapic_v1.method.wrap_method(
+                self._transport.list_os_policy_assignment_reports_projected(projection),
+                default_timeout=None,
+                client_info=DEFAULT_CLIENT_INFO,
+            )
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1692,6 +1782,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            raw=raw,
         )
 
         # Done; return the response.
@@ -1705,6 +1796,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> inventory.Inventory:
         r"""Get inventory data for the specified VM instance. If the VM has
         no associated inventory, the message ``NOT_FOUND`` is returned.
@@ -1758,6 +1850,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, return the underlying protobuf
+                message rather than its proto-plus wrapper.
 
         Returns:
             google.cloud.osconfig_v1.types.Inventory:
@@ -1813,6 +1907,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         )
 
         # Done; return the response.
+        if raw:
+            return inventory.Inventory.pb(response)
         return response
 
     def list_inventories(
@@ -1823,7 +1919,11 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> pagers.ListInventoriesPager:
+        prefetch: int = 0,
+        prefetch_max_bytes: Optional[int] = pagers.DEFAULT_PREFETCH_MAX_BYTES,
+        stream: bool = False,
+        raw: bool = False,
+    ) -> Union[pagers.ListInventoriesPager, pagers.ListInventoriesStreamPager]:
         r"""List inventory data for all VM instances in the
         specified zone.
 
@@ -1876,9 +1976,22 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The maximum number of additional pages to
+                request on a background thread while the caller consumes
+                the current one. ``0`` (the default) disables prefetching.
+            prefetch_max_bytes (Optional[int]): The maximum serialized size
+                of the pages buffered ahead of the caller when
+                ``prefetch`` is enabled.
+            stream (bool): If ``True``, each response body is decoded
+                while it is being received and inventories are yielded one
+                at a time, bounding memory use by a single inventory rather
+                than a page. Requires the ``rest`` transport and cannot be
+                combined with ``prefetch``.
+            raw (bool): If ``True``, the pager yields the underlying
+                protobuf messages rather than their proto-plus wrappers.
 
         Returns:
-            google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListInventoriesPager:
+            Union[google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListInventoriesPager, google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListInventoriesStreamPager]:
                 A response message for listing
                 inventory data for all VMs in a
                 specified location.
@@ -1908,9 +2021,19 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             if parent is not None:
                 request.parent = parent
 
+        if stream and prefetch:
+            raise ValueError("stream and prefetch are mutually exclusive.")
+        if stream and not hasattr(self._transport, "list_inventories_stream"):
+            raise ValueError("stream=True requires the rest transport.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.list_inventories]
+        if stream:
+            rpc = self._transport._wrapped_methods[
+                self._transport.list_inventories_stream
+            ]
+        else:
+            rpc = self._transport._wrapped_methods[self._transport.list_inventories]
 
         # Certain fields should be provided within the metadata header;
         # add these here.
@@ -1928,11 +2051,22 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
+        if stream:
+            return pagers.ListInventoriesStreamPager(
+                method=rpc,
+                request=request,
+                response=response,
+                metadata=metadata,
+                raw=raw,
+            )
         response = pagers.ListInventoriesPager(
             method=rpc,
             request=request,
             response=response,
             metadata=metadata,
+            raw=raw,
+            prefetch=prefetch,
+            prefetch_max_bytes=prefetch_max_bytes,
         )
 
         # Done; return the response.
@@ -1948,6 +2082,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> vulnerability.VulnerabilityReport:
         r"""Gets the vulnerability report for the specified VM
         instance. Only VMs with inventory data have
@@ -2003,6 +2138,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, return the underlying protobuf
+                message rather than its proto-plus wrapper.
 
         Returns:
             google.cloud.osconfig_v1.types.VulnerabilityReport:
@@ -2054,6 +2191,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         )
 
         # Done; return the response.
+        if raw:
+            return vulnerability.VulnerabilityReport.pb(response)
         return response
 
     def list_vulnerability_reports(
@@ -2066,6 +2205,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
         timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ) -> pagers.ListVulnerabilityReportsPager:
         r"""List vulnerability reports for all VM instances in
         the specified zone.
@@ -2119,6 +2259,8 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, the pager yields the underlying
+                protobuf messages rather than their proto-plus wrappers.
 
         Returns:
             google.cloud.osconfig_v1.services.os_config_zonal_service.pagers.ListVulnerabilityReportsPager:
@@ -2178,6 +2320,7 @@ class OsConfigZonalServiceClient(metaclass=OsConfigZonalServiceClientMeta):
             request=request,
             response=response,
             metadata=metadata,
+            raw=raw,
         )
 
         # Done; return the response.
@@ -13,11 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import collections
+import threading
 from typing import (
     Any,
+    AsyncIterable,
     AsyncIterator,
     Awaitable,
     Callable,
+    Dict,
+    Iterable,
     Iterator,
     Optional,
     Sequence,
@@ -31,6 +37,107 @@ from google.cloud.osconfig_v1.types import (
     vulnerability,
 )
 
+# Upper bound on the serialized size of pages a prefetching pager keeps
+# buffered ahead of the caller.
+DEFAULT_PREFETCH_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _PagePrefetcher:
+    """Fetches pages ahead of the caller on a background thread.
+
+    Pages are held in a bounded buffer: the worker stops fetching once
+    ``max_pages`` pages, or ``max_bytes`` serialized bytes, are waiting to
+    be consumed. A single page is always admitted into an empty buffer so
+    that a page larger than ``max_bytes`` cannot stall the iteration.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        page_token: str,
+        *,
+        max_pages: int,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = lambda page: 0,
+    ):
+        self._fetch = fetch
+        self._page_token = page_token
+        self._max_pages = max_pages
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._buffer: collections.deque = collections.deque()
+        self._buffered_bytes = 0
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self._stopped = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="osconfig-page-prefetch", daemon=True
+        )
+
+    @property
+    def buffered_bytes(self) -> int:
+        """int: Serialized size of the pages currently buffered."""
+        return self._buffered_bytes
+
+    def _has_room(self) -> bool:
+        if not self._buffer:
+            return True
+        if len(self._buffer) >= self._max_pages:
+            return False
+        return self._max_bytes is None or self._buffered_bytes < self._max_bytes
+
+    def _run(self) -> None:
+        token = self._page_token
+        try:
+            while token:
+                with self._cond:
+                    while not self._stopped and not self._has_room():
+                        self._cond.wait()
+                    if self._stopped:
+                        return
+                page = self._fetch(token)
+                size = self._sizeof(page)
+                with self._cond:
+                    self._buffer.append((page, size))
+                    self._buffered_bytes += size
+                    self._cond.notify_all()
+                token = page.next_page_token
+        except BaseException as exc:
+            with self._cond:
+                self._error = exc
+        finally:
+            with self._cond:
+                self._done = True
+                self._cond.notify_all()
+
+    def stop(self) -> None:
+        """Ask the worker to exit once its in-flight request completes."""
+        with self._cond:
+            self._stopped = True
+            self._buffer.clear()
+            self._buffered_bytes = 0
+            self._cond.notify_all()
+
+    def __iter__(self) -> Iterator[Any]:
+        self._thread.start()
+        try:
+            while True:
+                with self._cond:
+                    while not self._buffer and not self._done:
+                        self._cond.wait()
+                    if self._buffer:
+                        page, size = self._buffer.popleft()
+                        self._buffered_bytes -= size
+                        self._cond.notify_all()
+                    elif self._error is not None:
+                        raise self._error
+                    else:
+                        return
+                yield page
+        finally:
+            self.stop()
+
 
 class ListOSPolicyAssignmentsPager:
     """A pager for iterating through ``list_os_policy_assignments`` requests.
@@ -56,7 +163,8 @@ class ListOSPolicyAssignmentsPager:
         request: os_policy_assignments.ListOSPolicyAssignmentsRequest,
         response: os_policy_assignments.ListOSPolicyAssignmentsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ):
         """Instantiate the pager.
 
@@ -69,11 +177,14 @@ class ListOSPolicyAssignmentsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, iterating yields the underlying protobuf
+                messages rather than their proto-plus wrappers.
         """
         self._method = method
         self._request = os_policy_assignments.ListOSPolicyAssignmentsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
@@ -88,7 +199,12 @@ class ListOSPolicyAssignmentsPager:
 
     def __iter__(self) -> Iterator[os_policy_assignments.OSPolicyAssignment]:
         for page in self.pages:
-            yield from page.os_policy_assignments
+            if self._raw:
+                yield from os_policy_assignments.ListOSPolicyAssignmentsResponse.pb(
+                    page
+                ).os_policy_assignments
+            else:
+                yield from page.os_policy_assignments
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -120,7 +236,7 @@ class ListOSPolicyAssignmentsAsyncPager:
         request: os_policy_assignments.ListOSPolicyAssignmentsRequest,
         response: os_policy_assignments.ListOSPolicyAssignmentsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
     ):
         """Instantiates the pager.
 
@@ -190,7 +306,8 @@ class ListOSPolicyAssignmentRevisionsPager:
         request: os_policy_assignments.ListOSPolicyAssignmentRevisionsRequest,
         response: os_policy_assignments.ListOSPolicyAssignmentRevisionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ):
         """Instantiate the pager.
 
@@ -203,6 +320,8 @@ class ListOSPolicyAssignmentRevisionsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, iterating yields the underlying protobuf
+                messages rather than their proto-plus wrappers.
         """
         self._method = method
         self._request = os_policy_assignments.ListOSPolicyAssignmentRevisionsRequest(
@@ -210,6 +329,7 @@ class ListOSPolicyAssignmentRevisionsPager:
         )
         self._response = response
         self._metadata = metadata
+        self._raw = raw
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
@@ -226,7 +346,12 @@ class ListOSPolicyAssignmentRevisionsPager:
 
     def __iter__(self) -> Iterator[os_policy_assignments.OSPolicyAssignment]:
         for page in self.pages:
-            yield from page.os_policy_assignments
+            if self._raw:
+                yield from os_policy_assignments.ListOSPolicyAssignmentRevisionsResponse.pb(
+                    page
+                ).os_policy_assignments
+            else:
+                yield from page.os_policy_assignments
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -259,7 +384,7 @@ class ListOSPolicyAssignmentRevisionsAsyncPager:
         request: os_policy_assignments.ListOSPolicyAssignmentRevisionsRequest,
         response: os_policy_assignments.ListOSPolicyAssignmentRevisionsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
     ):
         """Instantiates the pager.
 
@@ -331,7 +456,8 @@ class ListOSPolicyAssignmentReportsPager:
         request: os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest,
         response: os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ):
         """Instantiate the pager.
 
@@ -344,6 +470,8 @@ class ListOSPolicyAssignmentReportsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, iterating yields the underlying protobuf
+                messages rather than their proto-plus wrappers.
         """
         self._method = method
         self._request = (
@@ -351,6 +479,7 @@ class ListOSPolicyAssignmentReportsPager:
         )
         self._response = response
         self._metadata = metadata
+        self._raw = raw
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
@@ -369,7 +498,12 @@ class ListOSPolicyAssignmentReportsPager:
         self,
     ) -> Iterator[os_policy_assignment_reports.OSPolicyAssignmentReport]:
         for page in self.pages:
-            yield from page.os_policy_assignment_reports
+            if self._raw:
+                yield from os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse.pb(
+                    page
+                ).os_policy_assignment_reports
+            else:
+                yield from page.os_policy_assignment_reports
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -404,7 +538,7 @@ class ListOSPolicyAssignmentReportsAsyncPager:
         request: os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest,
         response: os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
     ):
         """Instantiates the pager.
 
@@ -470,6 +604,11 @@ class ListInventoriesPager:
     All the usual :class:`google.cloud.osconfig_v1.types.ListInventoriesResponse`
     attributes are available on the pager. If multiple requests are made, only
     the most recent response is retained, and thus used for attribute lookup.
+
+    When ``prefetch`` is greater than zero, up to that many subsequent pages
+    are requested on a background thread while the caller is still consuming
+    the current one. Buffered pages are also capped by their serialized size,
+    see ``prefetch_max_bytes``.
     """
 
     def __init__(
@@ -478,7 +617,10 @@ class ListInventoriesPager:
         request: inventory.ListInventoriesRequest,
         response: inventory.ListInventoriesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
+        prefetch: int = 0,
+        prefetch_max_bytes: Optional[int] = DEFAULT_PREFETCH_MAX_BYTES,
     ):
         """Instantiate the pager.
 
@@ -491,18 +633,49 @@ class ListInventoriesPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, iterating yields the underlying protobuf
+                messages rather than their proto-plus wrappers.
+            prefetch (int): The maximum number of pages to fetch ahead of
+                the caller on a background thread. ``0`` disables prefetching.
+            prefetch_max_bytes (Optional[int]): The maximum serialized size
+                of the pages buffered by the prefetching thread. ``None``
+                bounds the buffer by page count only.
         """
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer.")
         self._method = method
         self._request = inventory.ListInventoriesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
+        self._prefetch = prefetch
+        self._prefetch_max_bytes = prefetch_max_bytes
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
+    def _fetch_page(self, page_token: str) -> inventory.ListInventoriesResponse:
+        request = inventory.ListInventoriesRequest(self._request)
+        request.page_token = page_token
+        return self._method(request, metadata=self._metadata)
+
     @property
     def pages(self) -> Iterator[inventory.ListInventoriesResponse]:
         yield self._response
+        if self._prefetch:
+            prefetcher = _PagePrefetcher(
+                self._fetch_page,
+                self._response.next_page_token,
+                max_pages=self._prefetch,
+                max_bytes=self._prefetch_max_bytes,
+                sizeof=lambda page: inventory.ListInventoriesResponse.pb(
+                    page
+                ).ByteSize(),
+            )
+            for page in prefetcher:
+                self._response = page
+                yield self._response
+            return
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
             self._response = self._method(self._request, metadata=self._metadata)
@@ -510,7 +683,86 @@ class ListInventoriesPager:
 
     def __iter__(self) -> Iterator[inventory.Inventory]:
         for page in self.pages:
-            yield from page.inventories
+            if self._raw:
+                yield from inventory.ListInventoriesResponse.pb(page).inventories
+            else:
+                yield from page.inventories
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListInventoriesStreamPager:
+    """A pager for iterating through streamed ``list_inventories`` requests.
+
+    This class wraps an initial
+    :class:`google.cloud.osconfig_v1.services.os_config_zonal_service.transports.rest.StreamedListInventoriesResponse`
+    object, and provides an ``__iter__`` method to iterate through its
+    inventories while the response body is still being received.
+
+    If there are more pages, the ``__iter__`` method will make additional
+    ``ListInventories`` requests and continue to iterate through their
+    inventories. Only one page is being read, and one inventory decoded, at
+    a time.
+
+    The attributes of the current streamed response, such as
+    ``next_page_token``, are available on the pager once that page has been
+    read entirely.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Any],
+        request: inventory.ListInventoriesRequest,
+        response: Any,
+        *,
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.cloud.osconfig_v1.types.ListInventoriesRequest):
+                The initial request object.
+            response (google.cloud.osconfig_v1.services.os_config_zonal_service.transports.rest.StreamedListInventoriesResponse):
+                The initial streamed response object.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            raw (bool): If ``True``, iterating yields the underlying protobuf
+                messages rather than their proto-plus wrappers.
+        """
+        self._method = method
+        self._request = inventory.ListInventoriesRequest(request)
+        self._response = response
+        self._metadata = metadata
+        self._raw = raw
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    def pages(self) -> Iterator[Any]:
+        """Yields the streamed responses of each page.
+
+        Inventories of a page that are not iterated before the next page is
+        requested are discarded.
+        """
+        yield self._response
+        self._response.finish()
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = self._method(self._request, metadata=self._metadata)
+            yield self._response
+            self._response.finish()
+
+    def __iter__(self) -> Iterator[inventory.Inventory]:
+        for page in self.pages:
+            if self._raw:
+                yield from map(inventory.Inventory.pb, page)
+            else:
+                yield from page
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -540,7 +792,7 @@ class ListInventoriesAsyncPager:
         request: inventory.ListInventoriesRequest,
         response: inventory.ListInventoriesResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
     ):
         """Instantiates the pager.
 
@@ -606,7 +858,8 @@ class ListVulnerabilityReportsPager:
         request: vulnerability.ListVulnerabilityReportsRequest,
         response: vulnerability.ListVulnerabilityReportsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        raw: bool = False,
     ):
         """Instantiate the pager.
 
@@ -619,11 +872,14 @@ class ListVulnerabilityReportsPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            raw (bool): If ``True``, iterating yields the underlying protobuf
+                messages rather than their proto-plus wrappers.
         """
         self._method = method
         self._request = vulnerability.ListVulnerabilityReportsRequest(request)
         self._response = response
         self._metadata = metadata
+        self._raw = raw
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
@@ -638,7 +894,12 @@ class ListVulnerabilityReportsPager:
 
     def __iter__(self) -> Iterator[vulnerability.VulnerabilityReport]:
         for page in self.pages:
-            yield from page.vulnerability_reports
+            if self._raw:
+                yield from vulnerability.ListVulnerabilityReportsResponse.pb(
+                    page
+                ).vulnerability_reports
+            else:
+                yield from page.vulnerability_reports
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -670,7 +931,7 @@ class ListVulnerabilityReportsAsyncPager:
         request: vulnerability.ListVulnerabilityReportsRequest,
         response: vulnerability.ListVulnerabilityReportsResponse,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
     ):
         """Instantiates the pager.
 
@@ -712,3 +973,105 @@ class ListVulnerabilityReportsAsyncPager:
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class FanOutAsyncPager:
+    """A pager merging the results of one list RPC across many parents.
+
+    Each parent is listed with its own async pager; at most
+    ``max_concurrency`` of them are iterated at the same time. Results are
+    yielded as ``(parent, item)`` tuples in the order they arrive, so items
+    of different parents are interleaved.
+
+    A failure while listing one parent does not stop the others: the
+    exception is recorded in :attr:`errors` under that parent and the
+    remaining parents keep being listed.
+    """
+
+    def __init__(
+        self,
+        method: Callable[[str], Awaitable[AsyncIterable[Any]]],
+        parents: Iterable[str],
+        *,
+        max_concurrency: int = 16,
+        buffer_size: int = 1024,
+    ):
+        """Instantiates the pager.
+
+        Args:
+            method (Callable[[str], Awaitable[AsyncIterable]]): Called with
+                a parent; resolves to the async pager listing that parent.
+            parents (Iterable[str]): The parent resource names to list.
+            max_concurrency (int): The maximum number of parents listed
+                at the same time.
+            buffer_size (int): The maximum number of results buffered
+                ahead of the caller.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        self._method = method
+        self._parents = list(dict.fromkeys(parents))
+        self._max_concurrency = max_concurrency
+        self._buffer_size = buffer_size
+        self._errors: Dict[str, Exception] = {}
+        self._counts: Dict[str, int] = {}
+
+    @property
+    def parents(self) -> Sequence[str]:
+        """Sequence[str]: The parents listed by this pager."""
+        return tuple(self._parents)
+
+    @property
+    def errors(self) -> Dict[str, Exception]:
+        """Dict[str, Exception]: Errors raised while listing, per parent."""
+        return dict(self._errors)
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Dict[str, int]: The number of results yielded, per parent."""
+        return dict(self._counts)
+
+    async def _list_parent(self, parent: str, queue: asyncio.Queue) -> None:
+        try:
+            pager = await self._method(parent)
+            async for item in pager:
+                await queue.put((parent, item))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._errors[parent] = exc
+
+    async def _worker(self, pending: collections.deque, queue: asyncio.Queue) -> None:
+        while pending:
+            await self._list_parent(pending.popleft(), queue)
+        await queue.put(None)
+
+    def __aiter__(self) -> AsyncIterator[Tuple[str, Any]]:
+        async def async_generator():
+            queue: asyncio.Queue = asyncio.Queue(maxsize=self._buffer_size)
+            pending = collections.deque(self._parents)
+            workers = [
+                asyncio.ensure_future(self._worker(pending, queue))
+                for _ in range(min(self._max_concurrency, len(pending)))
+            ]
+            running = len(workers)
+            try:
+                while running:
+                    result = await queue.get()
+                    if result is None:
+                        running -= 1
+                        continue
+                    parent = result[0]
+                    self._counts[parent] = self._counts.get(parent, 0) + 1
+                    yield result
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+
+        return async_generator()
+
+    def __repr__(self) -> str:
+        return "{0}<parents={1}, errors={2}>".format(
+            self.__class__.__name__, len(self._parents), len(self._errors)
+        )
@@ -14,20 +14,58 @@
 # limitations under the License.
 #
 from collections import OrderedDict
-from typing import Dict, Type
+from typing import TYPE_CHECKING, Mapping, Type
+
+from google.cloud.osconfig_v1 import _lazy
 
 from .base import OsConfigZonalServiceTransport
-from .grpc import OsConfigZonalServiceGrpcTransport
-from .grpc_asyncio import OsConfigZonalServiceGrpcAsyncIOTransport
-from .rest import OsConfigZonalServiceRestInterceptor, OsConfigZonalServiceRestTransport
 
-# Compile a registry of transports.
-_transport_registry = (
-    OrderedDict()
-)  # type: Dict[str, Type[OsConfigZonalServiceTransport]]
-_transport_registry["grpc"] = OsConfigZonalServiceGrpcTransport
-_transport_registry["grpc_asyncio"] = OsConfigZonalServiceGrpcAsyncIOTransport
-_transport_registry["rest"] = OsConfigZonalServiceRestTransport
+_LAZY_SUBMODULES = {
+    ".grpc": ("OsConfigZonalServiceGrpcTransport",),
+    ".grpc_asyncio": ("OsConfigZonalServiceGrpcAsyncIOTransport",),
+    ".rest": (
+        "OsConfigZonalServiceRestInterceptor",
+        "OsConfigZonalServiceRestTransport",
+    ),
+    ".rest_asyncio": (
+        "AsyncOsConfigZonalServiceRestInterceptor",
+        "AsyncOsConfigZonalServiceRestTransport",
+    ),
+}
+
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .grpc import OsConfigZonalServiceGrpcTransport
+    from .grpc_asyncio import OsConfigZonalServiceGrpcAsyncIOTransport
+    from .rest import (
+        OsConfigZonalServiceRestInterceptor,
+        OsConfigZonalServiceRestTransport,
+    )
+    from .rest_asyncio import (
+        AsyncOsConfigZonalServiceRestInterceptor,
+        AsyncOsConfigZonalServiceRestTransport,
+    )
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
+
+# Compile a registry of transports. Each transport module, and the
+# libraries it depends on, is only imported once the transport is requested.
+_transport_registry = _lazy.LazyRegistry(
+    __name__,
+    OrderedDict(
+        [
+            ("grpc", (".grpc", "OsConfigZonalServiceGrpcTransport")),
+            (
+                "grpc_asyncio",
+                (".grpc_asyncio", "OsConfigZonalServiceGrpcAsyncIOTransport"),
+            ),
+            ("rest", (".rest", "OsConfigZonalServiceRestTransport")),
+            (
+                "rest_asyncio",
+                (".rest_asyncio", "AsyncOsConfigZonalServiceRestTransport"),
+            ),
+        ]
+    ),
+)  # type: Mapping[str, Type[OsConfigZonalServiceTransport]]
 
 __all__ = (
     "OsConfigZonalServiceTransport",
@@ -35,4 +73,6 @@ __all__ = (
     "OsConfigZonalServiceGrpcAsyncIOTransport",
     "OsConfigZonalServiceRestTransport",
     "OsConfigZonalServiceRestInterceptor",
+    "AsyncOsConfigZonalServiceRestTransport",
+    "AsyncOsConfigZonalServiceRestInterceptor",
 )
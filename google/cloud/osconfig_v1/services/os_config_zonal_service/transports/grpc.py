@@ -23,6 +23,8 @@ from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.longrunning import operations_pb2  # type: ignore
 import grpc  # type: ignore
 
+from google.cloud.osconfig_v1.services import _grpc_helpers
+from google.cloud.osconfig_v1.services.projection import FieldProjection
 from google.cloud.osconfig_v1.types import (
     inventory,
     os_policy_assignment_reports,
@@ -67,6 +69,13 @@ class OsConfigZonalServiceGrpcTransport(OsConfigZonalServiceTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         api_audience: Optional[str] = None,
+        channel_pool_size: int = 1,
+        compression: Optional[grpc.Compression] = None,
+        method_compression: Optional[Dict[str, grpc.Compression]] = None,
+        keepalive_time_ms: Optional[int] = None,
+        keepalive_timeout_ms: Optional[int] = None,
+        max_send_message_length: int = -1,
+        max_receive_message_length: int = -1,
     ) -> None:
         """Instantiate the transport.
 
@@ -109,6 +118,32 @@ class OsConfigZonalServiceGrpcTransport(OsConfigZonalServiceTransport):
                 your own client library.
             always_use_jwt_access (Optional[bool]): Whether self signed JWT should
                 be used for service account credentials.
+            channel_pool_size (int): The number of channels to open. RPCs
+                are sent on the channel with the fewest RPCs in flight,
+                which lifts the limit on concurrent streams of a single
+                HTTP/2 connection. It is ignored if ``channel`` is provided.
+            compression (Optional[grpc.Compression]): The compression of
+                the requests sent on the channel. The channel accepts
+                gzip and deflate compressed responses regardless. It is
+                ignored if ``channel`` is provided.
+            method_compression (Optional[Dict[str, grpc.Compression]]):
+                The compression of the requests of each RPC, keyed by
+                RPC name (``"ListInventories"``). Overrides
+                ``compression``. It is ignored if ``channel`` is provided.
+            keepalive_time_ms (Optional[int]): If set, the channel pings
+                the server after this many milliseconds without activity
+                while RPCs are in flight. It is ignored if ``channel`` is
+                provided.
+            keepalive_timeout_ms (Optional[int]): How long the channel
+                waits for a keepalive ping to be acknowledged before
+                closing the connection. It is ignored if ``channel`` is
+                provided.
+            max_send_message_length (int): The largest request, in bytes,
+                the channel sends; -1 for no limit. It is ignored if
+                ``channel`` is provided.
+            max_receive_message_length (int): The largest response, in
+                bytes, the channel accepts; -1 for no limit. It is ignored
+                if ``channel`` is provided.
 
         Raises:
           google.auth.exceptions.MutualTLSChannelError: If mutual TLS transport
@@ -116,6 +151,8 @@ class OsConfigZonalServiceGrpcTransport(OsConfigZonalServiceTransport):
           google.api_core.exceptions.DuplicateCredentialArgs: If both ``credentials``
               and ``credentials_file`` are passed.
         """
+        if channel_pool_size < 1:
+            raise ValueError("channel_pool_size must be at least 1.")
         self._grpc_channel = None
         self._ssl_channel_credentials = ssl_channel_credentials
         self._stubs: Dict[str, Callable] = {}
@@ -167,21 +204,39 @@ class OsConfigZonalServiceGrpcTransport(OsConfigZonalServiceTransport):
         )
 
         if not self._grpc_channel:
-            self._grpc_channel = type(self).create_channel(
-                self._host,
-                # use the credentials which are saved
-                credentials=self._credentials,
-                # Set ``credentials_file`` to ``None`` here as
-                # the credentials that we saved earlier should be used.
-                credentials_file=None,
-                scopes=self._scopes,
-                ssl_credentials=self._ssl_channel_credentials,
-                quota_project_id=quota_project_id,
-                options=[
-                    ("grpc.max_send_message_length", -1),
-                    ("grpc.max_receive_message_length", -1),
-                ],
+            options = _grpc_helpers.channel_options(
+                max_send_message_length=max_send_message_length,
+                max_receive_message_length=max_receive_message_length,
+                keepalive_time_ms=keepalive_time_ms,
+                keepalive_timeout_ms=keepalive_timeout_ms,
             )
+            if channel_pool_size > 1:
+                options = _grpc_helpers.pool_channel_options(options)
+            channel_kwargs = {}
+            if compression is not None:
+                channel_kwargs["compression"] = compression
+            channels = [
+                type(self).create_channel(
+                    self._host,
+                    # use the credentials which are saved
+                    credentials=self._credentials,
+                    # Set ``credentials_file`` to ``None`` here as
+                    # the credentials that we saved earlier should be used.
+                    credentials_file=None,
+                    scopes=self._scopes,
+                    ssl_credentials=self._ssl_channel_credentials,
+                    quota_project_id=quota_project_id,
+                    options=options,
+                    **channel_kwargs,
+                )
+                for _ in range(channel_pool_size)
+            ]
+            if channel_pool_size == 1 and not method_compression:
+                self._grpc_channel = channels[0]
+            else:
+                self._grpc_channel = _grpc_helpers.ChannelPool(
+                    channels, method_compression=method_compression
+                )
 
         # Wrap messages. This must be done after self._grpc_channel exists
         self._prep_wrapped_messages(client_info)
@@ -238,6 +293,18 @@ class OsConfigZonalServiceGrpcTransport(OsConfigZonalServiceTransport):
         """Return the channel designed to connect to this service."""
         return self._grpc_channel
 
+    @property
+    def channel_pool(self) -> Optional[_grpc_helpers.ChannelPool]:
+        """Return the channel pool, if the transport uses one.
+
+        The transport uses a pool when ``channel_pool_size`` is above 1 or
+        ``method_compression`` is set. Its ``in_flight`` property counts
+        the RPCs in flight on each channel of the pool.
+        """
+        if isinstance(self._grpc_channel, _grpc_helpers.ChannelPool):
+            return self._grpc_channel
+        return None
+
     @property
     def operations_client(self) -> operations_v1.OperationsClient:
         """Create the client designed to process long-running operations.
@@ -534,6 +601,36 @@ class OsConfigZonalServiceGrpcTransport(OsConfigZonalServiceTransport):
             )
         return self._stubs["list_os_policy_assignment_reports"]
 
+    def list_os_policy_assignment_reports_projected(
+        self, projection: FieldProjection
+    ) -> Callable[
+        [os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest],
+        os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse,
+    ]:
+        r"""Return a callable for the list os policy assignment
+        reports method over gRPC, with responses parsed through a
+        field projection.
+
+        Args:
+            projection (google.cloud.osconfig_v1.services.projection.FieldProjection):
+                The fields to drop from the responses.
+
+        Returns:
+            Callable[[~.ListOSPolicyAssignmentReportsRequest],
+                    ~.ListOSPolicyAssignmentReportsResponse]:
+                A function that, when called, will call the underlying RPC
+                on the server.
+        """
+        # Responses are deserialized by the stub: each projection has its own.
+        key = ("list_os_policy_assignment_reports", projection)
+        if key not in self._stubs:
+            self._stubs[key] = self.grpc_channel.unary_unary(
+                "/google.cloud.osconfig.v1.OsConfigZonalService/ListOSPolicyAssignmentReports",
+                request_serializer=os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest.serialize,
+                response_deserializer=projection.deserialize,
+            )
+        return self._stubs[key]
+
     @property
     def get_inventory(
         self,
@@ -15,7 +15,6 @@
 #
 
 import dataclasses
-import json  # type: ignore
 import re
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 import warnings
@@ -32,9 +31,9 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-from google.protobuf import json_format
 import grpc  # type: ignore
 from requests import __version__ as requests_version
+from urllib3.util.retry import Retry
 
 try:
     OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
@@ -44,6 +43,8 @@ except AttributeError:  # pragma: NO COVER
 
 from google.longrunning import operations_pb2  # type: ignore
 
+from google.cloud.osconfig_v1.services import _rest_helpers, rest_codecs
+from google.cloud.osconfig_v1.services.projection import FieldProjection
 from google.cloud.osconfig_v1.types import (
     inventory,
     os_policy_assignment_reports,
@@ -475,11 +476,78 @@ class OsConfigZonalServiceRestInterceptor:
         return response
 
 
+class StreamedListInventoriesResponse:
+    """A ``ListInventories`` response decoded while it is being received.
+
+    Iterating over this object reads the HTTP body in chunks and yields each
+    :class:`~.inventory.Inventory` as soon as it has been received, so only
+    one inventory is held in memory at a time. It can be iterated only once.
+
+    The remaining response fields, such as ``next_page_token``, are
+    available once the iteration has completed, or after :meth:`finish`.
+    """
+
+    def __init__(
+        self,
+        response: Any,
+        codec: rest_codecs.JsonCodec,
+        *,
+        chunk_size: int = 64 * 1024,
+    ):
+        self._response = response
+        self._codec = codec
+        self._chunk_size = chunk_size
+        self._splitter = _rest_helpers.JsonListSplitter(("inventories",))
+        self._items = self._iter_items()
+        self._fields: Optional[Dict[str, Any]] = None
+
+    def _iter_items(self):
+        try:
+            for chunk in self._response.iter_content(chunk_size=self._chunk_size):
+                for item in self._splitter.feed(chunk):
+                    resp = inventory.Inventory()
+                    self._codec.decode(item, inventory.Inventory.pb(resp))
+                    yield resp
+            self._fields = self._splitter.finish()
+        finally:
+            self._response.close()
+
+    def __iter__(self):
+        return self._items
+
+    def finish(self) -> None:
+        """Discards the inventories not iterated yet and completes the read."""
+        for _ in self._items:
+            pass
+
+    @property
+    def done(self) -> bool:
+        """bool: Whether the whole response body has been read."""
+        return self._fields is not None
+
+    def _field(self, json_name: str, default: Any) -> Any:
+        if self._fields is None:
+            raise RuntimeError(
+                "The streamed response has not been fully read; iterate over "
+                "it or call finish() first."
+            )
+        return self._fields.get(json_name, default)
+
+    @property
+    def next_page_token(self) -> str:
+        """str: The token of the next page, known once the body is read."""
+        return self._field("nextPageToken", "")
+
+    def __repr__(self) -> str:
+        return "{0}<done={1}>".format(self.__class__.__name__, self.done)
+
+
 @dataclasses.dataclass
 class OsConfigZonalServiceRestStub:
     _session: AuthorizedSession
     _host: str
     _interceptor: OsConfigZonalServiceRestInterceptor
+    _codec: rest_codecs.JsonCodec = rest_codecs.DEFAULT_CODEC
 
 
 class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
@@ -512,6 +580,12 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
         url_scheme: str = "https",
         interceptor: Optional[OsConfigZonalServiceRestInterceptor] = None,
         api_audience: Optional[str] = None,
+        pool_connections: int = _rest_helpers.DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = _rest_helpers.DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        max_retries: Union[int, Retry] = 0,
+        tcp_keepalive: Optional[int] = None,
+        codec: Optional[rest_codecs.JsonCodec] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -544,6 +618,25 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            pool_connections (int): The number of per-host connection pools
+                cached by the HTTP session.
+            pool_maxsize (int): The maximum number of keep-alive connections
+                kept open to the API host. Set it to at least the number of
+                threads sharing this transport to avoid reconnecting.
+            pool_block (bool): Whether requests wait for a pooled connection
+                to be released once ``pool_maxsize`` connections are in use,
+                rather than opening an extra, unpooled connection.
+            max_retries (Union[int, urllib3.util.retry.Retry]): Connection
+                level retries applied by the HTTP adapter. These are in
+                addition to, and independent from, the ``retry`` argument
+                of each method.
+            tcp_keepalive (Optional[int]): If set, idle pooled connections
+                send TCP keep-alive probes after this many seconds.
+            codec (Optional[google.cloud.osconfig_v1.services.rest_codecs.JsonCodec]):
+                The codec used to serialize requests and parse responses.
+                Defaults to :class:`~.rest_codecs.JsonCodec`; pass a
+                :class:`~.rest_codecs.FastJsonCodec` to speed up parsing of
+                large responses.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
@@ -572,8 +665,24 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
         self._operations_client: Optional[operations_v1.AbstractOperationsClient] = None
         if client_cert_source_for_mtls:
             self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        _rest_helpers.configure_session_pool(
+            self._session,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=max_retries,
+            tcp_keepalive=tcp_keepalive,
+        )
+        self._codec = codec or rest_codecs.DEFAULT_CODEC
         self._interceptor = interceptor or OsConfigZonalServiceRestInterceptor()
         self._prep_wrapped_messages(client_info)
+        self._wrapped_methods[
+            self.list_inventories_stream
+        ] = gapic_v1.method.wrap_method(
+            self.list_inventories_stream,
+            default_timeout=None,
+            client_info=client_info,
+        )
 
     @property
     def operations_client(self) -> operations_v1.AbstractOperationsClient:
@@ -678,22 +787,12 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -716,7 +815,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, resp)
             resp = self._interceptor.post_create_os_policy_assignment(resp)
             return resp
 
@@ -781,13 +880,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -809,7 +902,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, resp)
             resp = self._interceptor.post_delete_os_policy_assignment(resp)
             return resp
 
@@ -876,13 +969,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -906,7 +993,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             resp = inventory.Inventory()
             pb_resp = inventory.Inventory.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_get_inventory(resp)
             return resp
 
@@ -977,13 +1064,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1007,7 +1088,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             resp = os_policy_assignments.OSPolicyAssignment()
             pb_resp = os_policy_assignments.OSPolicyAssignment.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_get_os_policy_assignment(resp)
             return resp
 
@@ -1073,13 +1154,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1103,7 +1178,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             resp = os_policy_assignment_reports.OSPolicyAssignmentReport()
             pb_resp = os_policy_assignment_reports.OSPolicyAssignmentReport.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_get_os_policy_assignment_report(resp)
             return resp
 
@@ -1169,13 +1244,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1199,7 +1268,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             resp = vulnerability.VulnerabilityReport()
             pb_resp = vulnerability.VulnerabilityReport.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_get_vulnerability_report(resp)
             return resp
 
@@ -1262,13 +1331,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1292,10 +1355,97 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             resp = inventory.ListInventoriesResponse()
             pb_resp = inventory.ListInventoriesResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_inventories(resp)
             return resp
 
+    class _ListInventoriesStream(OsConfigZonalServiceRestStub):
+        def __hash__(self):
+            return hash("ListInventoriesStream")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES: Dict[str, Any] = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        def __call__(
+            self,
+            request: inventory.ListInventoriesRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: Optional[float] = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> StreamedListInventoriesResponse:
+            r"""Call the list inventories method over HTTP, streaming
+            the response body.
+
+            The ``pre_list_inventories`` interceptor hook is applied to
+            the request. ``post_list_inventories`` is not called, since
+            the response is never materialized as a whole.
+
+            Args:
+                request (~.inventory.ListInventoriesRequest):
+                    The request object. A request message for listing
+                inventory data for all VMs in the
+                specified location.
+                retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                ~.StreamedListInventoriesResponse:
+                    The response, decoded one inventory at a
+                time while it is being iterated.
+
+            """
+
+            http_options: List[Dict[str, str]] = [
+                {
+                    "method": "get",
+                    "uri": "/v1/{parent=projects/*/locations/*/instances/*}/inventories",
+                },
+            ]
+            request, metadata = self._interceptor.pre_list_inventories(
+                request, metadata
+            )
+            pb_request = inventory.ListInventoriesRequest.pb(request)
+            transcoded_request = path_template.transcode(http_options, pb_request)
+
+            uri = transcoded_request["uri"]
+            method = transcoded_request["method"]
+
+            # Jsonify the query params
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
+            query_params.update(self._get_unset_required_fields(query_params))
+
+            query_params["$alt"] = "json;enum-encoding=int"
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = getattr(self._session, method)(
+                "{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=rest_helpers.flatten_query_params(query_params, strict=True),
+                stream=True,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+
+            # Return the response
+            return StreamedListInventoriesResponse(response, self._codec)
+
     class _ListOSPolicyAssignmentReports(OsConfigZonalServiceRestStub):
         def __hash__(self):
             return hash("ListOSPolicyAssignmentReports")
@@ -1359,13 +1509,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1393,7 +1537,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
                 )
             )
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_os_policy_assignment_reports(resp)
             return resp
 
@@ -1460,13 +1604,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1492,7 +1630,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
                 resp
             )
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_os_policy_assignment_revisions(resp)
             return resp
 
@@ -1556,13 +1694,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1586,7 +1718,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             resp = os_policy_assignments.ListOSPolicyAssignmentsResponse()
             pb_resp = os_policy_assignments.ListOSPolicyAssignmentsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_os_policy_assignments(resp)
             return resp
 
@@ -1650,13 +1782,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1680,7 +1806,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
             resp = vulnerability.ListVulnerabilityReportsResponse()
             pb_resp = vulnerability.ListVulnerabilityReportsResponse.pb(resp)
 
-            json_format.Parse(response.content, pb_resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, pb_resp)
             resp = self._interceptor.post_list_vulnerability_reports(resp)
             return resp
 
@@ -1744,22 +1870,12 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
 
             # Jsonify the request body
 
-            body = json_format.MessageToJson(
-                transcoded_request["body"],
-                including_default_value_fields=False,
-                use_integers_for_enums=True,
-            )
+            body = self._codec.encode(transcoded_request["body"])
             uri = transcoded_request["uri"]
             method = transcoded_request["method"]
 
             # Jsonify the query params
-            query_params = json.loads(
-                json_format.MessageToJson(
-                    transcoded_request["query_params"],
-                    including_default_value_fields=False,
-                    use_integers_for_enums=True,
-                )
-            )
+            query_params = self._codec.to_dict(transcoded_request["query_params"])
             query_params.update(self._get_unset_required_fields(query_params))
 
             query_params["$alt"] = "json;enum-encoding=int"
@@ -1782,7 +1898,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
 
             # Return the response
             resp = operations_pb2.Operation()
-            json_format.Parse(response.content, resp, ignore_unknown_fields=True)
+            self._codec.decode(response.content, resp)
             resp = self._interceptor.post_update_os_policy_assignment(resp)
             return resp
 
@@ -1795,7 +1911,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._CreateOSPolicyAssignment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._CreateOSPolicyAssignment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def delete_os_policy_assignment(
@@ -1806,7 +1922,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._DeleteOSPolicyAssignment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._DeleteOSPolicyAssignment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def get_inventory(
@@ -1814,7 +1930,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ) -> Callable[[inventory.GetInventoryRequest], inventory.Inventory]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetInventory(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetInventory(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def get_os_policy_assignment(
@@ -1825,7 +1941,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetOSPolicyAssignment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetOSPolicyAssignment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def get_os_policy_assignment_report(
@@ -1836,7 +1952,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetOSPolicyAssignmentReport(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetOSPolicyAssignmentReport(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def get_vulnerability_report(
@@ -1846,7 +1962,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._GetVulnerabilityReport(self._session, self._host, self._interceptor)  # type: ignore
+        return self._GetVulnerabilityReport(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def list_inventories(
@@ -1856,7 +1972,15 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListInventories(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListInventories(self._session, self._host, self._interceptor, self._codec)  # type: ignore
+
+    @property
+    def list_inventories_stream(
+        self,
+    ) -> Callable[[inventory.ListInventoriesRequest], StreamedListInventoriesResponse]:
+        # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
+        # In C++ this would require a dynamic_cast
+        return self._ListInventoriesStream(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def list_os_policy_assignment_reports(
@@ -1867,7 +1991,16 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListOSPolicyAssignmentReports(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListOSPolicyAssignmentReports(self._session, self._host, self._interceptor, self._codec)  # type: ignore
+
+    def list_os_policy_assignment_reports_projected(
+        self, projection: FieldProjection
+    ) -> Callable[
+        [os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest],
+        os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse,
+    ]:
+        # Responses are decoded by the codec: wrap it in the projection.
+        return self._ListOSPolicyAssignmentReports(self._session, self._host, self._interceptor, projection.codec(self._codec))  # type: ignore
 
     @property
     def list_os_policy_assignment_revisions(
@@ -1878,7 +2011,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListOSPolicyAssignmentRevisions(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListOSPolicyAssignmentRevisions(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def list_os_policy_assignments(
@@ -1889,7 +2022,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListOSPolicyAssignments(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListOSPolicyAssignments(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def list_vulnerability_reports(
@@ -1900,7 +2033,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._ListVulnerabilityReports(self._session, self._host, self._interceptor)  # type: ignore
+        return self._ListVulnerabilityReports(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def update_os_policy_assignment(
@@ -1911,7 +2044,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
     ]:
         # The return type is fine, but mypy isn't sophisticated enough to determine what's going on here.
         # In C++ this would require a dynamic_cast
-        return self._UpdateOSPolicyAssignment(self._session, self._host, self._interceptor)  # type: ignore
+        return self._UpdateOSPolicyAssignment(self._session, self._host, self._interceptor, self._codec)  # type: ignore
 
     @property
     def kind(self) -> str:
@@ -1921,4 +2054,7 @@ class OsConfigZonalServiceRestTransport(OsConfigZonalServiceTransport):
         self._session.close()
 
 
-__all__ = ("OsConfigZonalServiceRestTransport",)
+__all__ = (
+    "OsConfigZonalServiceRestTransport",
+    "StreamedListInventoriesResponse",
+)
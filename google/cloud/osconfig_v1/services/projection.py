@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Field projections dropping large fields of responses as they are parsed.
+
+OS policy assignment reports carry the output of each exec resource, up to
+100KB each. Sweeps that only read compliance states pass a projection to
+``list_os_policy_assignment_reports``:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1.services import projection
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    for report in client.list_os_policy_assignment_reports(
+        parent=parent, projection=projection.REPORT_COMPLIANCE
+    ):
+        print(report.name, report.os_policy_compliances[0].compliance_state)
+
+The service has no read mask for reports, so the fields are still sent.
+They are cut out of the serialized response before it is parsed: the
+bytes of gRPC responses are scanned along the projected field paths only,
+and the excluded fields are never copied into messages. REST responses
+are pruned after JSON tokenization, before the transport's codec merges
+them into messages.
+The full report remains available from ``get_os_policy_assignment_report``.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from google.protobuf.message import Message
+
+from google.cloud.osconfig_v1.services import rest_codecs
+from google.cloud.osconfig_v1.types import os_policy_assignment_reports
+
+# A projection tree: field number (or JSON key) to the tree of a message
+# field to prune recursively, or None for a field to drop.
+_Tree = Dict[Any, Optional[dict]]
+
+_WIRE_VARINT, _WIRE_FIXED64, _WIRE_LENGTH, _WIRE_FIXED32 = 0, 1, 2, 5
+
+
+def _read_varint(buf: memoryview, pos: int) -> tuple:
+    result = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _prune(buf: memoryview, pos: int, end: int, tree: _Tree, out: List) -> None:
+    """Appends the fields of ``buf[pos:end]`` not excluded by ``tree``."""
+    kept = pos
+    while pos < end:
+        tag, value = _read_varint(buf, pos)
+        wire_type = tag & 7
+        if wire_type == _WIRE_LENGTH:
+            length, value = _read_varint(buf, value)
+            field_end = value + length
+        elif wire_type == _WIRE_VARINT:
+            field_end = _read_varint(buf, value)[1]
+        elif wire_type == _WIRE_FIXED64:
+            field_end = value + 8
+        elif wire_type == _WIRE_FIXED32:
+            field_end = value + 4
+        else:
+            raise ValueError("Unsupported wire type {}.".format(wire_type))
+        subtree = tree.get(tag >> 3, False)
+        if subtree is None:
+            out.append(buf[kept:pos])
+            kept = field_end
+        elif subtree and wire_type == _WIRE_LENGTH:
+            out.append(buf[kept:pos])
+            pruned: List = []
+            _prune(buf, value, field_end, subtree, pruned)
+            payload = b"".join(pruned)
+            out.append(_encode_varint(tag))
+            out.append(_encode_varint(len(payload)))
+            out.append(payload)
+            kept = field_end
+        pos = field_end
+    out.append(buf[kept:end])
+
+
+def _prune_json(value: Any, tree: _Tree) -> None:
+    if isinstance(value, list):
+        for item in value:
+            _prune_json(item, tree)
+        return
+    if not isinstance(value, dict):
+        return
+    for key, subtree in tree.items():
+        if key not in value:
+            continue
+        if subtree is None:
+            del value[key]
+        else:
+            _prune_json(value[key], subtree)
+
+
+class FieldProjection:
+    """Drops fields of a response message type while it is parsed.
+
+    Args:
+        message_type (Type[proto.Message]): The response message type.
+        exclude (Iterable[str]): Dotted paths of the fields to drop,
+            relative to ``message_type``, through message fields only, e.g.
+            ``"os_policy_assignment_reports.os_policy_compliances"``.
+
+    Raises:
+        ValueError: If a path does not name a field.
+    """
+
+    def __init__(self, message_type: Type[Any], exclude: Iterable[str]):
+        self._message_type = message_type
+        self._exclude = tuple(dict.fromkeys(exclude))
+        self._tree: _Tree = {}
+        self._json_tree: _Tree = {}
+        for path in self._exclude:
+            self._add(path)
+
+    def _add(self, path: str) -> None:
+        descriptor = self._message_type.pb().DESCRIPTOR
+        tree, json_tree = self._tree, self._json_tree
+        names = path.split(".")
+        for depth, name in enumerate(names):
+            field = descriptor.fields_by_name.get(name)
+            if field is None:
+                raise ValueError("{!r} has no field {!r}.".format(path, name))
+            keys = {field.name, field.json_name}
+            if depth == len(names) - 1:
+                tree[field.number] = None
+                for key in keys:
+                    json_tree[key] = None
+                return
+            if field.message_type is None:
+                raise ValueError("{!r}: {!r} is not a message.".format(path, name))
+            if field.number in tree and tree[field.number] is None:
+                return  # An enclosing field is dropped already.
+            tree = tree.setdefault(field.number, {})
+            subtree = json_tree.setdefault(field.json_name, {})
+            json_tree[field.name] = subtree
+            json_tree = subtree
+            descriptor = field.message_type
+
+    @property
+    def message_type(self) -> Type[Any]:
+        """Type[proto.Message]: The response message type."""
+        return self._message_type
+
+    @property
+    def exclude(self) -> tuple:
+        """Tuple[str, ...]: The paths of the fields dropped."""
+        return self._exclude
+
+    def prune(self, payload: bytes) -> bytes:
+        """Returns a serialized message without the excluded fields."""
+        buf = memoryview(payload)
+        out: List = []
+        _prune(buf, 0, len(buf), self._tree, out)
+        return b"".join(out)
+
+    def deserialize(self, payload: bytes) -> Any:
+        """Parses a serialized message, dropping the excluded fields.
+
+        Suitable as the ``response_deserializer`` of a gRPC stub.
+        """
+        return self._message_type.deserialize(self.prune(payload))
+
+    def prune_json(self, value: Any) -> None:
+        """Drops the excluded fields of a parsed JSON message, in place."""
+        _prune_json(value, self._json_tree)
+
+    def codec(self, codec: Any = None) -> "ProjectingCodec":
+        """Returns a REST codec applying this projection to responses.
+
+        Args:
+            codec (Optional[google.cloud.osconfig_v1.services.rest_codecs.JsonCodec]):
+                The codec encoding requests and decoding the pruned
+                responses. Defaults to :class:`~.rest_codecs.JsonCodec`.
+        """
+        return ProjectingCodec(self, codec)
+
+    def __repr__(self) -> str:
+        return "{}({}, exclude={!r})".format(
+            type(self).__name__, self._message_type.__name__, list(self._exclude)
+        )
+
+
+class ProjectingCodec:
+    """A REST codec dropping the fields of a projection from responses.
+
+    Requests are encoded, and the pruned responses decoded, by the wrapped
+    codec.
+    """
+
+    def __init__(self, projection: FieldProjection, codec: Any = None):
+        if codec is None:
+            codec = rest_codecs.JsonCodec()
+        self._projection = projection
+        self._codec = codec
+
+    def encode(self, message: Message) -> str:
+        return self._codec.encode(message)
+
+    def to_dict(self, message: Message) -> Dict[str, Any]:
+        return self._codec.to_dict(message)
+
+    def decode(self, content: bytes, message: Message) -> None:
+        value = self._codec.loads(content)
+        self._projection.prune_json(value)
+        self._codec.decode_value(value, message)
+
+
+_REPORT_RESOURCES = (
+    "os_policy_assignment_reports.os_policy_compliances."
+    "os_policy_resource_compliances."
+)
+
+#: The fields of reports that can be large: the output of exec resources
+#: and the configuration steps of each resource.
+LARGE_REPORT_FIELDS = (
+    _REPORT_RESOURCES + "exec_resource_output",
+    _REPORT_RESOURCES + "config_steps",
+)
+
+#: A projection of report listings to their compliance states.
+REPORT_COMPLIANCE = FieldProjection(
+    os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse,
+    LARGE_REPORT_FIELDS,
+)
+
+
+__all__ = (
+    "FieldProjection",
+    "LARGE_REPORT_FIELDS",
+    "ProjectingCodec",
+    "REPORT_COMPLIANCE",
+)
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A client-side cache for the responses of ``get_*`` methods.
+
+A cache is passed to a client with its ``response_cache`` argument, and can
+be shared by several clients:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1.services import response_cache
+
+    cache = response_cache.ResponseCache(ttl=30, max_bytes=16 * 1024 * 1024)
+    client = osconfig_v1.OsConfigZonalServiceClient(response_cache=cache)
+
+The following methods are served from the cache while their entry is
+fresh:
+
+* ``OsConfigZonalService.get_os_policy_assignment``
+* ``OsConfigZonalService.get_os_policy_assignment_report``
+* ``OsConfigService.get_patch_deployment``
+
+Entries expire ``ttl`` seconds after they were fetched, except for OS policy
+assignment revisions (names ending with ``@<revision_id>``), which never
+change. The least recently used entries are evicted once the serialized
+responses exceed ``max_bytes``.
+
+An expired entry is kept until it is fetched again. The fetched response
+then revalidates the entry if it has the same version, ``etag`` or
+``update_time``, as the cached one. A response with an older ``update_time``
+never replaces a newer one, so a lagging read cannot roll an entry back.
+
+The ``update_*`` and ``delete_*`` methods of a client invalidate the
+entries of the resource they change; the patch deployment methods
+returning the changed resource store it instead. The changes to OS policy
+assignments are long-running operations, during which the assignment is
+``reconciling``: such responses are not cached, so a read made before the
+operation completes cannot be served after it.
+"""
+
+import collections
+import threading
+import time
+from typing import Callable, Dict, NamedTuple, Optional, Set, Tuple, Type, TypeVar
+
+import proto  # type: ignore
+
+M = TypeVar("M", bound=proto.Message)
+
+#: The default number of seconds an entry is fresh for.
+DEFAULT_TTL = 60.0
+
+#: The default maximum size of the cached responses, in bytes.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+# The fields holding the version of a resource, by order of preference.
+_VERSION_FIELDS = ("etag", "update_time")
+
+# The field set while a change to a resource is being rolled out.
+_RECONCILING_FIELD = "reconciling"
+
+
+class CacheStats(NamedTuple):
+    """Counters of a :class:`ResponseCache`.
+
+    Attributes:
+        hits (int): Lookups served from the cache.
+        misses (int): Lookups of missing or expired entries.
+        revalidations (int): Expired entries refreshed by a fetched response
+            of the same version.
+        evictions (int): Entries evicted to stay under ``max_bytes``.
+        invalidations (int): Entries dropped by local changes.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class _Entry:
+    __slots__ = ("message_type", "data", "version", "expires")
+
+    def __init__(self, message_type, data, version, expires):
+        self.message_type = message_type
+        self.data = data
+        self.version = version
+        self.expires = expires
+
+
+def _version(message: proto.Message) -> Optional[Tuple]:
+    """Returns a comparable version of ``message``, or None if it has none."""
+    pb = type(message).pb(message)
+    fields = pb.DESCRIPTOR.fields_by_name
+    for name in _VERSION_FIELDS:
+        if name not in fields:
+            continue
+        value = getattr(pb, name)
+        if name == "update_time":
+            if pb.HasField(name):
+                return (name, value.seconds, value.nanos)
+        elif value:
+            return (name, value)
+    return None
+
+
+def _is_reconciling(message: proto.Message) -> bool:
+    """Returns whether a change to ``message`` is still being rolled out."""
+    pb = type(message).pb(message)
+    if _RECONCILING_FIELD not in pb.DESCRIPTOR.fields_by_name:
+        return False
+    return getattr(pb, _RECONCILING_FIELD)
+
+
+def _is_revision(name: str) -> bool:
+    return "@" in name.rsplit("/", 1)[-1]
+
+
+class ResponseCache:
+    """A TTL and LRU cache of responses, keyed by method and resource name.
+
+    Responses are stored serialized: each lookup returns a new message, so
+    callers may modify it, and ``max_bytes`` bounds the actual memory used
+    by the responses. The cache is thread-safe, and can be shared by
+    synchronous and asynchronous clients.
+
+    Args:
+        ttl (float): The number of seconds an entry is served for after it
+            was fetched or revalidated.
+        max_bytes (int): The maximum total size of the serialized
+            responses. A response larger than it is not cached.
+        clock (Callable[[], float]): The monotonic clock used to expire
+            entries.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = DEFAULT_TTL,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl < 0:
+            raise ValueError("ttl must be non-negative.")
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+        self._ttl = ttl
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[Tuple[str, str], _Entry]" = (
+            collections.OrderedDict()
+        )
+        # The cached methods of each resource name, for invalidate().
+        self._names: Dict[str, Set[str]] = {}
+        self._size = 0
+        self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """The total size of the cached responses, in bytes."""
+        with self._lock:
+            return self._size
+
+    @property
+    def stats(self) -> CacheStats:
+        """The counters of the cache."""
+        with self._lock:
+            return self._stats
+
+    def _count(self, **increments: int) -> None:
+        self._stats = self._stats._replace(
+            **{k: getattr(self._stats, k) + v for k, v in increments.items()}
+        )
+
+    def _remove(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry.data)
+        method, name = key
+        methods = self._names[name]
+        methods.discard(method)
+        if not methods:
+            del self._names[name]
+
+    def get(self, method: str, name: str) -> Optional[proto.Message]:
+        """Returns the cached response of a method, if it is fresh.
+
+        Args:
+            method (str): The client method, e.g. ``"get_os_policy_assignment"``.
+            name (str): The name of the requested resource.
+
+        Returns:
+            Optional[proto.Message]: A copy of the cached response, or None
+            if there is no fresh entry.
+        """
+        key = (method, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (
+                entry.expires is not None and entry.expires <= self._clock()
+            ):
+                self._count(misses=1)
+                return None
+            self._entries.move_to_end(key)
+            self._count(hits=1)
+            message_type, data = entry.message_type, entry.data
+        return message_type.deserialize(data)
+
+    def put(self, method: str, name: str, response: M) -> M:
+        """Caches the response of a method.
+
+        A response of a resource that is ``reconciling`` is not cached, and
+        drops the cached response: the resource changes until it is
+        reconciled.
+
+        Args:
+            method (str): The client method, e.g. ``"get_os_policy_assignment"``.
+            name (str): The name of the requested resource.
+            response (proto.Message): The response.
+
+        Returns:
+            proto.Message: The response to return to the caller: ``response``
+            itself, or the cached response if it is newer.
+        """
+        key = (method, name)
+        if _is_reconciling(response):
+            with self._lock:
+                if key in self._entries:
+                    self._remove(key)
+            return response
+        message_type: Type[M] = type(response)
+        version = _version(response)
+        expires = None if _is_revision(name) else self._clock() + self._ttl
+        newer = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.message_type is message_type
+                and entry.version is not None
+                and version is not None
+                and entry.version[0] == version[0]
+            ):
+                if entry.version == version:
+                    entry.expires = expires
+                    self._entries.move_to_end(key)
+                    self._count(revalidations=1)
+                    return response
+                if version[0] == "update_time" and entry.version > version:
+                    # A lagging read; keep the newer response.
+                    newer = entry.data
+        if newer is not None:
+            return message_type.deserialize(newer)
+
+        data = message_type.serialize(response)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if len(data) > self._max_bytes:
+                return response
+            self._entries[key] = _Entry(message_type, data, version, expires)
+            self._names.setdefault(name, set()).add(method)
+            self._size += len(data)
+            while self._size > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._count(evictions=1)
+        return response
+
+    def invalidate(self, name: str) -> None:
+        """Drops the entries of a resource, for every method.
+
+        Args:
+            name (str): The name of the resource.
+        """
+        with self._lock:
+            for method in list(self._names.get(name, ())):
+                self._remove((method, name))
+                self._count(invalidations=1)
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._names.clear()
+            self._size = 0
@@ -0,0 +1,447 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""JSON codecs used by the REST transports to (de)serialize messages.
+
+A codec is passed to a REST transport with its ``codec`` argument:
+
+.. code-block:: python
+
+    from google.cloud.osconfig_v1.services import rest_codecs
+    from google.cloud.osconfig_v1.services.os_config_zonal_service import transports
+
+    transport = transports.OsConfigZonalServiceRestTransport(
+        codec=rest_codecs.FastJsonCodec(),
+    )
+
+:class:`JsonCodec` reproduces the generic :mod:`google.protobuf.json_format`
+behavior. :class:`FastJsonCodec` decodes responses with a per-message-type
+compiled decoder, and uses ``orjson`` to tokenize the payload when it is
+installed. Request bodies and query parameters are encoded identically by
+both codecs.
+"""
+
+import json
+import re
+import sys
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from google.protobuf import descriptor as pb_descriptor
+from google.protobuf import json_format
+from google.protobuf.message import Message
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: NO COVER
+    orjson = None
+
+
+class JsonCodec:
+    """Encodes and decodes messages exactly like ``json_format`` does."""
+
+    def encode(self, message: Message) -> str:
+        """Serializes a request body.
+
+        Args:
+            message (google.protobuf.message.Message): The body message.
+
+        Returns:
+            str: The JSON representation of ``message``.
+        """
+        return json_format.MessageToJson(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=True,
+        )
+
+    def to_dict(self, message: Message) -> Dict[str, Any]:
+        """Converts a query parameter message into a JSON-compatible dict.
+
+        This is equivalent to ``json.loads(self.encode(message))`` without
+        the intermediate JSON text.
+
+        Args:
+            message (google.protobuf.message.Message): The query parameters.
+
+        Returns:
+            Dict[str, Any]: The query parameters, keyed by JSON field name.
+        """
+        return json_format.MessageToDict(
+            message,
+            including_default_value_fields=False,
+            use_integers_for_enums=True,
+        )
+
+    def decode(self, content: bytes, message: Message) -> None:
+        """Merges a JSON response payload into ``message``.
+
+        Unknown fields are ignored.
+
+        Args:
+            content (bytes): The response payload.
+            message (google.protobuf.message.Message): The message to merge
+                the payload into.
+        """
+        json_format.Parse(content, message, ignore_unknown_fields=True)
+
+    def loads(self, content: bytes) -> Any:
+        """Tokenizes a JSON response payload.
+
+        Together with :meth:`decode_value`, this lets callers edit the
+        payload before it is merged into a message.
+
+        Args:
+            content (bytes): The response payload.
+
+        Returns:
+            Any: The parsed JSON value.
+
+        Raises:
+            google.protobuf.json_format.ParseError: If ``content`` is not
+                valid JSON.
+        """
+        try:
+            return json.loads(content)
+        except ValueError as exc:
+            raise json_format.ParseError(
+                "Failed to load JSON: {0}.".format(str(exc))
+            ) from exc
+
+    def decode_value(self, value: Any, message: Message) -> None:
+        """Merges a JSON value returned by :meth:`loads` into ``message``.
+
+        Unknown fields are ignored.
+
+        Args:
+            value (Any): The parsed response payload.
+            message (google.protobuf.message.Message): The message to merge
+                the value into.
+        """
+        json_format.ParseDict(value, message, ignore_unknown_fields=True)
+
+
+_FieldDecoder = Callable[[Any, Message], None]
+
+_INT_CPP_TYPES = frozenset(
+    (
+        pb_descriptor.FieldDescriptor.CPPTYPE_INT32,
+        pb_descriptor.FieldDescriptor.CPPTYPE_INT64,
+        pb_descriptor.FieldDescriptor.CPPTYPE_UINT32,
+        pb_descriptor.FieldDescriptor.CPPTYPE_UINT64,
+    )
+)
+_FLOAT_CPP_TYPES = frozenset(
+    (
+        pb_descriptor.FieldDescriptor.CPPTYPE_FLOAT,
+        pb_descriptor.FieldDescriptor.CPPTYPE_DOUBLE,
+    )
+)
+_INTEGER_RE = re.compile(r"-?[0-9]+\Z")
+# The largest finite values of float and double fields; json_format rejects
+# larger values rather than rounding them to infinity.
+_FLOAT_MAX = float.fromhex("0x1.fffffep+127")
+_DOUBLE_MAX = sys.float_info.max
+
+
+def _is_well_known(message_descriptor: pb_descriptor.Descriptor) -> bool:
+    return message_descriptor.file.package == "google.protobuf"
+
+
+def _scalar_converter(field: pb_descriptor.FieldDescriptor) -> Callable[[Any], Any]:
+    """Returns a function converting the common JSON forms of a scalar.
+
+    The returned function raises ``TypeError`` for any input it does not
+    handle, in which case the caller defers to ``json_format``.
+    """
+    cpp_type = field.cpp_type
+    if cpp_type == pb_descriptor.FieldDescriptor.CPPTYPE_STRING:
+        if field.type == pb_descriptor.FieldDescriptor.TYPE_BYTES:
+
+            def convert(value):
+                raise TypeError
+
+        else:
+
+            def convert(value):
+                if value.__class__ is str:
+                    return value
+                raise TypeError
+
+    elif cpp_type in _INT_CPP_TYPES or (
+        cpp_type == pb_descriptor.FieldDescriptor.CPPTYPE_ENUM
+    ):
+        allow_str = cpp_type != pb_descriptor.FieldDescriptor.CPPTYPE_ENUM
+
+        def convert(value):
+            if value.__class__ is int:
+                return value
+            if allow_str and value.__class__ is str and _INTEGER_RE.match(value):
+                return int(value)
+            raise TypeError
+
+    elif cpp_type in _FLOAT_CPP_TYPES:
+        limit = (
+            _FLOAT_MAX
+            if cpp_type == pb_descriptor.FieldDescriptor.CPPTYPE_FLOAT
+            else _DOUBLE_MAX
+        )
+
+        def convert(value):
+            if (value.__class__ is float or value.__class__ is int) and (
+                -limit <= value <= limit
+            ):
+                return value
+            raise TypeError
+
+    else:  # CPPTYPE_BOOL
+
+        def convert(value):
+            if value.__class__ is bool:
+                return value
+            raise TypeError
+
+    return convert
+
+
+class _CompiledDecoder:
+    """Merges parsed JSON into messages using per-type field tables.
+
+    ``json_format`` re-inspects the descriptor of every field of every
+    message it parses. This decoder builds, once per message type, a table
+    from JSON key to a specialized setter, and defers to ``json_format`` for
+    anything unusual: well-known types, ``null`` values, enum names, bytes,
+    special or out of range float values and malformed input. Like
+    ``json_format``, it rejects objects setting several members of a oneof.
+    """
+
+    def __init__(self):
+        self._tables: Dict[
+            pb_descriptor.Descriptor,
+            Tuple[Dict[str, _FieldDecoder], Dict[str, str]],
+        ] = {}
+        self._lock = threading.Lock()
+
+    def decode(self, value: Any, message: Message) -> None:
+        if value.__class__ is not dict or _is_well_known(message.DESCRIPTOR):
+            json_format.ParseDict(value, message, ignore_unknown_fields=True)
+            return
+        self._merge(value, message)
+
+    def _merge(self, value: Dict[str, Any], message: Message) -> None:
+        table, oneofs = self._table(message.DESCRIPTOR)
+        seen_oneofs = None
+        for key, item in value.items():
+            decoder = table.get(key)
+            if decoder is None:
+                if key.startswith("["):
+                    # Extensions are handled by json_format.
+                    json_format.ParseDict(
+                        {key: item}, message, ignore_unknown_fields=True
+                    )
+                continue
+            if item is None:
+                json_format.ParseDict({key: item}, message, ignore_unknown_fields=True)
+                continue
+            oneof = oneofs.get(key)
+            if oneof is not None:
+                if seen_oneofs is None:
+                    seen_oneofs = set()
+                elif oneof in seen_oneofs:
+                    raise json_format.ParseError(
+                        'Message type "{0}" should not have multiple '
+                        '"{1}" oneof fields.'.format(
+                            message.DESCRIPTOR.full_name, oneof
+                        )
+                    )
+                seen_oneofs.add(oneof)
+            decoder(item, message)
+
+    def _table(
+        self, message_descriptor: pb_descriptor.Descriptor
+    ) -> Tuple[Dict[str, _FieldDecoder], Dict[str, str]]:
+        """Returns the decoders by JSON key, and the oneof of each key in
+        one."""
+        tables = self._tables.get(message_descriptor)
+        if tables is None:
+            with self._lock:
+                table = {}
+                oneofs = {}
+                for field in message_descriptor.fields:
+                    decoder = self._field_decoder(field)
+                    table[field.json_name] = decoder
+                    table[field.name] = decoder
+                    if field.containing_oneof is not None:
+                        oneofs[field.json_name] = field.containing_oneof.name
+                        oneofs[field.name] = field.containing_oneof.name
+                tables = self._tables[message_descriptor] = (table, oneofs)
+        return tables
+
+    def _field_decoder(self, field: pb_descriptor.FieldDescriptor) -> _FieldDecoder:
+        name = field.name
+        json_name = field.json_name
+
+        def fallback(value, message):
+            json_format.ParseDict(
+                {json_name: value}, message, ignore_unknown_fields=True
+            )
+
+        message_type = field.message_type
+        if message_type is not None and message_type.GetOptions().map_entry:
+            return self._map_decoder(field, fallback)
+
+        if field.label == pb_descriptor.FieldDescriptor.LABEL_REPEATED:
+            if message_type is not None:
+                if _is_well_known(message_type):
+                    return fallback
+
+                def decode_messages(value, message):
+                    if value.__class__ is not list:
+                        return fallback(value, message)
+                    container = getattr(message, name)
+                    for item in value:
+                        if item.__class__ is not dict:
+                            return fallback(value, message)
+                    for item in value:
+                        self._merge(item, container.add())
+
+                return decode_messages
+
+            convert = _scalar_converter(field)
+
+            def decode_scalars(value, message):
+                container = getattr(message, name)
+                size = len(container)
+                try:
+                    if value.__class__ is not list:
+                        raise TypeError
+                    container.extend([convert(item) for item in value])
+                except (TypeError, ValueError):
+                    del container[size:]
+                    return fallback(value, message)
+
+            return decode_scalars
+
+        if message_type is not None:
+            if _is_well_known(message_type):
+                return fallback
+
+            def decode_message(value, message):
+                if value.__class__ is not dict:
+                    return fallback(value, message)
+                sub_message = getattr(message, name)
+                sub_message.SetInParent()
+                self._merge(value, sub_message)
+
+            return decode_message
+
+        convert = _scalar_converter(field)
+
+        def decode_scalar(value, message):
+            try:
+                setattr(message, name, convert(value))
+            except (TypeError, ValueError):
+                return fallback(value, message)
+
+        return decode_scalar
+
+    def _map_decoder(
+        self, field: pb_descriptor.FieldDescriptor, fallback: _FieldDecoder
+    ) -> _FieldDecoder:
+        name = field.name
+        key_field = field.message_type.fields_by_name["key"]
+        value_field = field.message_type.fields_by_name["value"]
+        if key_field.cpp_type != pb_descriptor.FieldDescriptor.CPPTYPE_STRING:
+            return fallback
+
+        value_type = value_field.message_type
+        if value_type is not None:
+            if _is_well_known(value_type):
+                return fallback
+
+            def decode_message_map(value, message):
+                if value.__class__ is not dict:
+                    return fallback(value, message)
+                for item in value.values():
+                    if item.__class__ is not dict:
+                        return fallback(value, message)
+                container = getattr(message, name)
+                for key, item in value.items():
+                    self._merge(item, container[key])
+
+            return decode_message_map
+
+        convert = _scalar_converter(value_field)
+
+        def decode_scalar_map(value, message):
+            try:
+                if value.__class__ is not dict:
+                    raise TypeError
+                getattr(message, name).update(
+                    {key: convert(item) for key, item in value.items()}
+                )
+            except (TypeError, ValueError):
+                # Entries already set are overwritten with the same values.
+                return fallback(value, message)
+
+        return decode_scalar_map
+
+
+class FastJsonCodec(JsonCodec):
+    """A codec that trades ``json_format``'s generic parser for speed.
+
+    Responses are tokenized with ``orjson`` when it is installed, or with
+    :func:`json.loads` otherwise, and merged into the response message with
+    a decoder compiled once per message type. The resulting messages are
+    equal to the ones produced by :class:`JsonCodec`, and it rejects the
+    same oneof conflicts and out of range floats.
+
+    Unlike ``json_format.Parse``, duplicate JSON keys are not rejected: the
+    last occurrence wins.
+
+    Args:
+        loads (Optional[Callable[[bytes], Any]]): The JSON tokenizer to use.
+            Defaults to ``orjson.loads`` when available.
+    """
+
+    def __init__(self, loads: Optional[Callable[[bytes], Any]] = None):
+        if loads is None:
+            loads = orjson.loads if orjson is not None else json.loads
+        self._loads = loads
+        self._decoder = _CompiledDecoder()
+
+    def decode(self, content: bytes, message: Message) -> None:
+        self._decoder.decode(self.loads(content), message)
+
+    def loads(self, content: bytes) -> Any:
+        try:
+            return self._loads(content)
+        except ValueError as exc:
+            raise json_format.ParseError(
+                "Failed to load JSON: {0}.".format(str(exc))
+            ) from exc
+
+    def decode_value(self, value: Any, message: Message) -> None:
+        self._decoder.decode(value, message)
+
+
+DEFAULT_CODEC = JsonCodec()
+
+
+__all__ = (
+    "DEFAULT_CODEC",
+    "FastJsonCodec",
+    "JsonCodec",
+)
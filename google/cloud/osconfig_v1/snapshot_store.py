@@ -0,0 +1,610 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""A content-addressed on-disk store of inventory snapshots.
+
+Instances of a fleet mostly report the same software packages, day after
+day. A :class:`SnapshotStore` keeps each distinct
+``Inventory.SoftwarePackage`` once, keyed by the SHA-256 of its serialized
+form, and stores each snapshot as one manifest per instance: the inventory
+without its packages, and an array of package IDs.
+
+.. code-block:: python
+
+    import datetime
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import snapshot_store
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    with snapshot_store.SnapshotStore("/var/lib/fleet-inventory") as store:
+        store.write(
+            client.list_inventories(
+                request={"parent": parent, "view": osconfig_v1.InventoryView.FULL},
+                raw=True,
+            )
+        )
+
+        # The fleet as it was a week ago.
+        snapshot = store.at(
+            datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(days=7)
+        )
+        for package in snapshot.packages(snapshot.instances[0]):
+            print(package)
+
+The store is a directory with the following layout::
+
+    packages.bin        the serialized packages, concatenated
+    packages.idx        (offset, length) of each package, by package ID
+    packages.sha        the SHA-256 digest of each package, by package ID
+    snapshots/{id}/
+        index.json      the instances of the snapshot and their manifests
+        inventories.bin the inventories without packages, concatenated
+        items.bin       the package IDs of the items of each inventory
+
+Package and snapshot files are memory-mapped when read, so that a query
+only pages in the manifests and packages it touches. The store supports a
+single writer; packages are append-only and a snapshot becomes visible
+once it is complete.
+"""
+
+import array
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from google.cloud.osconfig_v1 import inventory_columns
+from google.cloud.osconfig_v1.types import inventory
+
+_Inventory = inventory.Inventory.pb()
+_SoftwarePackage = inventory.Inventory.SoftwarePackage.pb()
+
+_PACKAGES = "packages.bin"
+_PACKAGE_INDEX = "packages.idx"
+_PACKAGE_DIGESTS = "packages.sha"
+_SNAPSHOTS = "snapshots"
+_INDEX = "index.json"
+_INVENTORIES = "inventories.bin"
+_ITEMS = "items.bin"
+
+# (offset, length) of a package in packages.bin.
+_PACKAGE_ENTRY = struct.Struct("<QI")
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+# An item ID is the package ID shifted left by one, with the low bit set
+# for available (rather than installed) packages; items without a package
+# are stored as _NO_PACKAGE.
+_NO_PACKAGE = 0xFFFFFFFF
+_MAX_PACKAGES = _NO_PACKAGE >> 1
+
+_ID_TYPECODE = "I"
+assert array.array(_ID_TYPECODE).itemsize == 4
+# Item IDs are little-endian on disk; memory-mapped arrays can be used as
+# is on little-endian hosts only.
+_NATIVE_IDS = sys.byteorder == "little"
+
+_SNAPSHOT_ID_FORMAT = "%Y%m%dT%H%M%SZ"
+
+
+class WriteResult(NamedTuple):
+    """The outcome of :meth:`SnapshotStore.write`.
+
+    Attributes:
+        snapshot_id (str): The ID of the snapshot written.
+        inventories (int): The number of inventories in the snapshot.
+        items (int): The number of items of these inventories.
+        new_packages (int): The number of packages not stored before.
+    """
+
+    snapshot_id: str
+    inventories: int
+    items: int
+    new_packages: int
+
+
+def _map(path: str) -> Any:
+    """Memory-maps a file for reading; empty files map to empty bytes."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _close(buffer: Any) -> None:
+    if isinstance(buffer, mmap.mmap):
+        buffer.close()
+
+
+def _snapshot_id(snapshot_time: datetime.datetime) -> str:
+    if snapshot_time.tzinfo is None:
+        raise ValueError("snapshot_time must be timezone-aware.")
+    return snapshot_time.astimezone(datetime.timezone.utc).strftime(_SNAPSHOT_ID_FORMAT)
+
+
+def _snapshot_time(snapshot_id: str) -> datetime.datetime:
+    return datetime.datetime.strptime(snapshot_id, _SNAPSHOT_ID_FORMAT).replace(
+        tzinfo=datetime.timezone.utc
+    )
+
+
+class _PackagePack:
+    """The append-only store of distinct packages."""
+
+    def __init__(self, root: str):
+        self._paths = [
+            os.path.join(root, name)
+            for name in (_PACKAGES, _PACKAGE_INDEX, _PACKAGE_DIGESTS)
+        ]
+        for path in self._paths:
+            open(path, "ab").close()
+        # Each flush makes the data durable, then the digests, then the
+        # index, so the index defines the complete packages. Entries whose
+        # data or digest is missing after an interrupted write are dropped,
+        # and data or digests past the last complete entry are truncated.
+        count = os.path.getsize(self._paths[1]) // _PACKAGE_ENTRY.size
+        with open(self._paths[1], "rb") as f:
+            entries = f.read(count * _PACKAGE_ENTRY.size)
+        with open(self._paths[2], "rb") as f:
+            digests = f.read(count * _DIGEST_SIZE)
+        count = min(count, len(digests) // _DIGEST_SIZE)
+        data_size = os.path.getsize(self._paths[0])
+        end = 0
+        while count:
+            offset, length = _PACKAGE_ENTRY.unpack_from(
+                entries, (count - 1) * _PACKAGE_ENTRY.size
+            )
+            end = offset + length
+            if end <= data_size:
+                break
+            count -= 1
+            end = 0
+        self._ids: Dict[bytes, int] = {
+            digests[i * _DIGEST_SIZE : (i + 1) * _DIGEST_SIZE]: i for i in range(count)
+        }
+        self._end = end
+        self._files = []
+        for path, size in zip(
+            self._paths,
+            (end, count * _PACKAGE_ENTRY.size, count * _DIGEST_SIZE),
+        ):
+            # The sizes never exceed those of the files: they only shrink.
+            f = open(path, "r+b")
+            f.truncate(size)
+            f.seek(size)
+            self._files.append(f)
+        # Index entries and digests wait in memory for the next flush, so
+        # that they never reach the disk ahead of their data.
+        self._pending_index = bytearray()
+        self._pending_digests = bytearray()
+        self._data = self._index = b""
+        self._mapped = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, package: Any) -> int:
+        """Returns the ID of a package, storing it if it is new."""
+        payload = package.SerializeToString(deterministic=True)
+        digest = hashlib.sha256(payload).digest()
+        package_id = self._ids.get(digest)
+        if package_id is not None:
+            return package_id
+        package_id = len(self._ids)
+        if package_id >= _MAX_PACKAGES:
+            raise ValueError("Too many distinct packages to store.")
+        self._files[0].write(payload)
+        self._pending_digests += digest
+        self._pending_index += _PACKAGE_ENTRY.pack(self._end, len(payload))
+        self._end += len(payload)
+        self._ids[digest] = package_id
+        return package_id
+
+    def flush(self) -> None:
+        """Makes the added packages durable: data, digests, then index."""
+        data, index, digests = self._files
+        for f, pending in (
+            (data, None),
+            (digests, self._pending_digests),
+            (index, self._pending_index),
+        ):
+            if pending:
+                f.write(pending)
+                del pending[:]
+            f.flush()
+            os.fsync(f.fileno())
+
+    def get(self, package_id: int) -> Any:
+        """Parses a stored package from the memory-mapped files."""
+        if not 0 <= package_id < len(self._ids):
+            raise KeyError(package_id)
+        if package_id >= self._mapped:
+            self._remap()
+        offset, length = _PACKAGE_ENTRY.unpack_from(
+            self._index, package_id * _PACKAGE_ENTRY.size
+        )
+        package = _SoftwarePackage()
+        package.ParseFromString(self._data[offset : offset + length])
+        return package
+
+    def _remap(self) -> None:
+        self.flush()
+        self._unmap()
+        self._data = _map(self._paths[0])
+        self._index = _map(self._paths[1])
+        self._mapped = len(self._ids)
+
+    def _unmap(self) -> None:
+        _close(self._data)
+        _close(self._index)
+        self._data = self._index = b""
+        self._mapped = 0
+
+    def close(self) -> None:
+        if self._files[0].closed:
+            return
+        self.flush()
+        self._unmap()
+        for f in self._files:
+            f.close()
+
+
+class Snapshot:
+    """A memory-mapped, read-only snapshot of a :class:`SnapshotStore`.
+
+    Returned by :meth:`SnapshotStore.open` and :meth:`SnapshotStore.at`;
+    valid until it or the store is closed.
+    """
+
+    def __init__(self, store: "SnapshotStore", snapshot_id: str, path: str):
+        with open(os.path.join(path, _INDEX)) as f:
+            index = json.load(f)
+        self._store = store
+        self._id = snapshot_id
+        # Instance name: (inventory offset, inventory length, first item,
+        # item count).
+        self._manifests: Dict[str, Tuple[int, int, int, int]] = {
+            name: tuple(manifest) for name, *manifest in index["instances"]
+        }
+        self._inventories = _map(os.path.join(path, _INVENTORIES))
+        self._items = _map(os.path.join(path, _ITEMS))
+
+    @property
+    def id(self) -> str:
+        """str: The ID of the snapshot."""
+        return self._id
+
+    @property
+    def time(self) -> datetime.datetime:
+        """datetime.datetime: The time the snapshot was taken, in UTC."""
+        return _snapshot_time(self._id)
+
+    @property
+    def instances(self) -> List[str]:
+        """List[str]: The instance names of the snapshot."""
+        return list(self._manifests)
+
+    def __len__(self) -> int:
+        return len(self._manifests)
+
+    def __contains__(self, instance: str) -> bool:
+        return instance in self._manifests
+
+    def _manifest(self, instance: str) -> Tuple[int, int, int, int]:
+        manifest = self._manifests.get(instance)
+        if manifest is None:
+            raise KeyError(instance)
+        return manifest
+
+    def item_ids(self, instance: str) -> Any:
+        """Returns the item IDs of an instance.
+
+        Each ID is a package ID shifted left by one, with the low bit set
+        for an available package, or ``0xFFFFFFFF`` for an item without a
+        package. The IDs are ordered by item key.
+
+        Args:
+            instance (str): The instance name.
+
+        Returns:
+            Sequence[int]: A view of the memory-mapped IDs on little-endian
+            hosts, a copy otherwise. Views must be released before the
+            snapshot is closed.
+
+        Raises:
+            KeyError: If the instance is not part of the snapshot.
+        """
+        _, _, first, count = self._manifest(instance)
+        if not count:
+            return array.array(_ID_TYPECODE)
+        view = memoryview(self._items)[first * 4 : (first + count) * 4]
+        if _NATIVE_IDS:
+            return view.cast(_ID_TYPECODE)
+        ids = array.array(_ID_TYPECODE, view.tobytes())
+        ids.byteswap()
+        return ids
+
+    def package_ids(self, instance: str) -> List[int]:
+        """Returns the distinct package IDs of an instance, in item order.
+
+        Args:
+            instance (str): The instance name.
+
+        Raises:
+            KeyError: If the instance is not part of the snapshot.
+        """
+        ids = dict.fromkeys(
+            item_id >> 1
+            for item_id in self.item_ids(instance)
+            if item_id != _NO_PACKAGE
+        )
+        return list(ids)
+
+    def packages(self, instance: str) -> Iterator[Any]:
+        """Yields the distinct packages of an instance, without parsing its
+        inventory.
+
+        Args:
+            instance (str): The instance name.
+
+        Yields:
+            google.cloud.osconfig_v1.types.Inventory.SoftwarePackage: The
+            underlying protobuf messages.
+
+        Raises:
+            KeyError: If the instance is not part of the snapshot.
+        """
+        for package_id in self.package_ids(instance):
+            yield self._store.package(package_id)
+
+    def get(self, instance: str) -> inventory.Inventory:
+        """Rebuilds the inventory of an instance.
+
+        Args:
+            instance (str): The instance name.
+
+        Returns:
+            google.cloud.osconfig_v1.types.Inventory: The inventory as it
+            was written.
+
+        Raises:
+            KeyError: If the instance is not part of the snapshot.
+        """
+        offset, length, _, _ = self._manifest(instance)
+        message = _Inventory()
+        message.ParseFromString(self._inventories[offset : offset + length])
+        packages: Dict[int, Any] = {}
+        for key, item_id in zip(sorted(message.items), self.item_ids(instance)):
+            if item_id == _NO_PACKAGE:
+                continue
+            package_id = item_id >> 1
+            package = packages.get(package_id)
+            if package is None:
+                package = packages[package_id] = self._store.package(package_id)
+            item = message.items[key]
+            field = item.available_package if item_id & 1 else item.installed_package
+            field.CopyFrom(package)
+        return inventory.Inventory.wrap(message)
+
+    def __iter__(self) -> Iterator[inventory.Inventory]:
+        for instance in self._manifests:
+            yield self.get(instance)
+
+    def close(self) -> None:
+        _close(self._inventories)
+        _close(self._items)
+        self._inventories = self._items = b""
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return "{}({!r}, instances={})".format(
+            type(self).__name__, self._id, len(self._manifests)
+        )
+
+
+class SnapshotStore:
+    """A directory of inventory snapshots sharing deduplicated packages.
+
+    Args:
+        root (str): The directory of the store, created if needed.
+    """
+
+    def __init__(self, root: str):
+        self._root = root
+        self._snapshots_dir = os.path.join(root, _SNAPSHOTS)
+        os.makedirs(self._snapshots_dir, exist_ok=True)
+        self._packages = _PackagePack(root)
+        self._open: List[Snapshot] = []
+
+    @property
+    def root(self) -> str:
+        """str: The directory of the store."""
+        return self._root
+
+    @property
+    def package_count(self) -> int:
+        """int: The number of distinct packages stored."""
+        return len(self._packages)
+
+    def package(self, package_id: int) -> Any:
+        """Returns a stored package.
+
+        Args:
+            package_id (int): The package ID, as found in manifests.
+
+        Returns:
+            google.cloud.osconfig_v1.types.Inventory.SoftwarePackage: The
+            underlying protobuf message.
+
+        Raises:
+            KeyError: If there is no such package.
+        """
+        return self._packages.get(package_id)
+
+    def snapshots(self) -> List[str]:
+        """Returns the IDs of the snapshots, oldest first."""
+        return sorted(
+            name for name in os.listdir(self._snapshots_dir) if not name.startswith(".")
+        )
+
+    def write(
+        self,
+        inventories: Iterable[Any],
+        snapshot_time: Optional[datetime.datetime] = None,
+    ) -> WriteResult:
+        """Writes a snapshot.
+
+        Args:
+            inventories (Iterable[google.cloud.osconfig_v1.types.Inventory]):
+                The inventories of the snapshot, for example those of a
+                ``ListInventoriesPager`` with the ``FULL`` view. An instance
+                listed twice keeps its last inventory.
+            snapshot_time (Optional[datetime.datetime]): The time of the
+                snapshot, with a time zone. Defaults to now. Snapshot IDs
+                have a resolution of one second.
+
+        Returns:
+            WriteResult: The ID and size of the snapshot.
+
+        Raises:
+            ValueError: If ``snapshot_time`` is naive or a snapshot was
+                already taken at that time.
+        """
+        if snapshot_time is None:
+            snapshot_time = datetime.datetime.now(datetime.timezone.utc)
+        snapshot_id = _snapshot_id(snapshot_time)
+        path = os.path.join(self._snapshots_dir, snapshot_id)
+        if os.path.exists(path):
+            raise ValueError("Snapshot {} already exists.".format(snapshot_id))
+
+        new_packages = len(self._packages)
+        manifests: Dict[str, List[int]] = {}
+        # Snapshots are written to a hidden directory, renamed once complete.
+        tmp = tempfile.mkdtemp(prefix=".", dir=self._snapshots_dir)
+        try:
+            with open(os.path.join(tmp, _INVENTORIES), "wb") as shells, open(
+                os.path.join(tmp, _ITEMS), "wb"
+            ) as ids_file:
+                for message in inventories:
+                    if isinstance(message, inventory.Inventory):
+                        message = inventory.Inventory.pb(message)
+                    shell = _Inventory()
+                    shell.CopyFrom(message)
+                    ids = array.array(_ID_TYPECODE)
+                    for key in sorted(shell.items):
+                        item = shell.items[key]
+                        details = item.WhichOneof("details")
+                        if details is None:
+                            ids.append(_NO_PACKAGE)
+                            continue
+                        package_id = self._packages.add(getattr(item, details))
+                        ids.append(package_id << 1 | (details == "available_package"))
+                        item.ClearField(details)
+                    if not _NATIVE_IDS:
+                        ids.byteswap()
+                    payload = shell.SerializeToString(deterministic=True)
+                    manifests[inventory_columns.instance_name(message.name)] = [
+                        shells.tell(),
+                        len(payload),
+                        ids_file.tell() // 4,
+                        len(ids),
+                    ]
+                    shells.write(payload)
+                    ids_file.write(ids.tobytes())
+                items = ids_file.tell() // 4
+                for f in (shells, ids_file):
+                    f.flush()
+                    os.fsync(f.fileno())
+            with open(os.path.join(tmp, _INDEX), "w") as f:
+                json.dump(
+                    {"instances": [[name] + m for name, m in manifests.items()]}, f
+                )
+            # Packages must be durable before a snapshot refers to them.
+            self._packages.flush()
+            os.rename(tmp, path)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+        return WriteResult(
+            snapshot_id, len(manifests), items, len(self._packages) - new_packages
+        )
+
+    def open(self, snapshot_id: str) -> Snapshot:
+        """Opens a snapshot.
+
+        Args:
+            snapshot_id (str): The snapshot ID, as returned by
+                :meth:`write` or :meth:`snapshots`.
+
+        Raises:
+            KeyError: If there is no such snapshot.
+        """
+        path = os.path.join(self._snapshots_dir, snapshot_id)
+        if snapshot_id.startswith(".") or not os.path.isdir(path):
+            raise KeyError(snapshot_id)
+        snapshot = Snapshot(self, snapshot_id, path)
+        self._open.append(snapshot)
+        return snapshot
+
+    def at(self, when: datetime.datetime) -> Optional[Snapshot]:
+        """Opens the latest snapshot taken at or before a time.
+
+        Args:
+            when (datetime.datetime): The point in time, with a time zone.
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if all snapshots are
+            more recent.
+
+        Raises:
+            ValueError: If ``when`` is naive.
+        """
+        bound = _snapshot_id(when)
+        candidates = [s for s in self.snapshots() if s <= bound]
+        return self.open(candidates[-1]) if candidates else None
+
+    def close(self) -> None:
+        """Closes the store and the snapshots opened from it."""
+        for snapshot in self._open:
+            snapshot.close()
+        self._open = []
+        self._packages.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return "{}({!r})".format(type(self).__name__, self._root)
+
+
+__all__ = (
+    "Snapshot",
+    "SnapshotStore",
+    "WriteResult",
+)
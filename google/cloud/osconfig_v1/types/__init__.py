@@ -13,79 +13,162 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
-from .inventory import (
-    GetInventoryRequest,
-    Inventory,
-    InventoryView,
-    ListInventoriesRequest,
-    ListInventoriesResponse,
-)
-from .os_policy import OSPolicy
-from .os_policy_assignment_reports import (
-    GetOSPolicyAssignmentReportRequest,
-    ListOSPolicyAssignmentReportsRequest,
-    ListOSPolicyAssignmentReportsResponse,
-    OSPolicyAssignmentReport,
-)
-from .os_policy_assignments import (
-    CreateOSPolicyAssignmentRequest,
-    DeleteOSPolicyAssignmentRequest,
-    GetOSPolicyAssignmentRequest,
-    ListOSPolicyAssignmentRevisionsRequest,
-    ListOSPolicyAssignmentRevisionsResponse,
-    ListOSPolicyAssignmentsRequest,
-    ListOSPolicyAssignmentsResponse,
-    OSPolicyAssignment,
-    OSPolicyAssignmentOperationMetadata,
-    UpdateOSPolicyAssignmentRequest,
-)
-from .osconfig_common import FixedOrPercent
-from .patch_deployments import (
-    CreatePatchDeploymentRequest,
-    DeletePatchDeploymentRequest,
-    GetPatchDeploymentRequest,
-    ListPatchDeploymentsRequest,
-    ListPatchDeploymentsResponse,
-    MonthlySchedule,
-    OneTimeSchedule,
-    PatchDeployment,
-    PausePatchDeploymentRequest,
-    RecurringSchedule,
-    ResumePatchDeploymentRequest,
-    UpdatePatchDeploymentRequest,
-    WeekDayOfMonth,
-    WeeklySchedule,
-)
-from .patch_jobs import (
-    AptSettings,
-    CancelPatchJobRequest,
-    ExecStep,
-    ExecStepConfig,
-    ExecutePatchJobRequest,
-    GcsObject,
-    GetPatchJobRequest,
-    GooSettings,
-    Instance,
-    ListPatchJobInstanceDetailsRequest,
-    ListPatchJobInstanceDetailsResponse,
-    ListPatchJobsRequest,
-    ListPatchJobsResponse,
-    PatchConfig,
-    PatchInstanceFilter,
-    PatchJob,
-    PatchJobInstanceDetails,
-    PatchRollout,
-    WindowsUpdateSettings,
-    YumSettings,
-    ZypperSettings,
-)
-from .vulnerability import (
-    CVSSv3,
-    GetVulnerabilityReportRequest,
-    ListVulnerabilityReportsRequest,
-    ListVulnerabilityReportsResponse,
-    VulnerabilityReport,
-)
+from typing import TYPE_CHECKING
+
+from google.cloud.osconfig_v1 import _lazy
+
+_LAZY_SUBMODULES = {
+    ".inventory": (
+        "GetInventoryRequest",
+        "Inventory",
+        "InventoryView",
+        "ListInventoriesRequest",
+        "ListInventoriesResponse",
+    ),
+    ".os_policy": ("OSPolicy",),
+    ".os_policy_assignment_reports": (
+        "GetOSPolicyAssignmentReportRequest",
+        "ListOSPolicyAssignmentReportsRequest",
+        "ListOSPolicyAssignmentReportsResponse",
+        "OSPolicyAssignmentReport",
+    ),
+    ".os_policy_assignments": (
+        "CreateOSPolicyAssignmentRequest",
+        "DeleteOSPolicyAssignmentRequest",
+        "GetOSPolicyAssignmentRequest",
+        "ListOSPolicyAssignmentRevisionsRequest",
+        "ListOSPolicyAssignmentRevisionsResponse",
+        "ListOSPolicyAssignmentsRequest",
+        "ListOSPolicyAssignmentsResponse",
+        "OSPolicyAssignment",
+        "OSPolicyAssignmentOperationMetadata",
+        "UpdateOSPolicyAssignmentRequest",
+    ),
+    ".osconfig_common": ("FixedOrPercent",),
+    ".patch_deployments": (
+        "CreatePatchDeploymentRequest",
+        "DeletePatchDeploymentRequest",
+        "GetPatchDeploymentRequest",
+        "ListPatchDeploymentsRequest",
+        "ListPatchDeploymentsResponse",
+        "MonthlySchedule",
+        "OneTimeSchedule",
+        "PatchDeployment",
+        "PausePatchDeploymentRequest",
+        "RecurringSchedule",
+        "ResumePatchDeploymentRequest",
+        "UpdatePatchDeploymentRequest",
+        "WeekDayOfMonth",
+        "WeeklySchedule",
+    ),
+    ".patch_jobs": (
+        "AptSettings",
+        "CancelPatchJobRequest",
+        "ExecStep",
+        "ExecStepConfig",
+        "ExecutePatchJobRequest",
+        "GcsObject",
+        "GetPatchJobRequest",
+        "GooSettings",
+        "Instance",
+        "ListPatchJobInstanceDetailsRequest",
+        "ListPatchJobInstanceDetailsResponse",
+        "ListPatchJobsRequest",
+        "ListPatchJobsResponse",
+        "PatchConfig",
+        "PatchInstanceFilter",
+        "PatchJob",
+        "PatchJobInstanceDetails",
+        "PatchRollout",
+        "WindowsUpdateSettings",
+        "YumSettings",
+        "ZypperSettings",
+    ),
+    ".vulnerability": (
+        "CVSSv3",
+        "GetVulnerabilityReportRequest",
+        "ListVulnerabilityReportsRequest",
+        "ListVulnerabilityReportsResponse",
+        "VulnerabilityReport",
+    ),
+}
+
+if TYPE_CHECKING:  # pragma: NO COVER
+    from .inventory import (
+        GetInventoryRequest,
+        Inventory,
+        InventoryView,
+        ListInventoriesRequest,
+        ListInventoriesResponse,
+    )
+    from .os_policy import OSPolicy
+    from .os_policy_assignment_reports import (
+        GetOSPolicyAssignmentReportRequest,
+        ListOSPolicyAssignmentReportsRequest,
+        ListOSPolicyAssignmentReportsResponse,
+        OSPolicyAssignmentReport,
+    )
+    from .os_policy_assignments import (
+        CreateOSPolicyAssignmentRequest,
+        DeleteOSPolicyAssignmentRequest,
+        GetOSPolicyAssignmentRequest,
+        ListOSPolicyAssignmentRevisionsRequest,
+        ListOSPolicyAssignmentRevisionsResponse,
+        ListOSPolicyAssignmentsRequest,
+        ListOSPolicyAssignmentsResponse,
+        OSPolicyAssignment,
+        OSPolicyAssignmentOperationMetadata,
+        UpdateOSPolicyAssignmentRequest,
+    )
+    from .osconfig_common import FixedOrPercent
+    from .patch_deployments import (
+        CreatePatchDeploymentRequest,
+        DeletePatchDeploymentRequest,
+        GetPatchDeploymentRequest,
+        ListPatchDeploymentsRequest,
+        ListPatchDeploymentsResponse,
+        MonthlySchedule,
+        OneTimeSchedule,
+        PatchDeployment,
+        PausePatchDeploymentRequest,
+        RecurringSchedule,
+        ResumePatchDeploymentRequest,
+        UpdatePatchDeploymentRequest,
+        WeekDayOfMonth,
+        WeeklySchedule,
+    )
+    from .patch_jobs import (
+        AptSettings,
+        CancelPatchJobRequest,
+        ExecStep,
+        ExecStepConfig,
+        ExecutePatchJobRequest,
+        GcsObject,
+        GetPatchJobRequest,
+        GooSettings,
+        Instance,
+        ListPatchJobInstanceDetailsRequest,
+        ListPatchJobInstanceDetailsResponse,
+        ListPatchJobsRequest,
+        ListPatchJobsResponse,
+        PatchConfig,
+        PatchInstanceFilter,
+        PatchJob,
+        PatchJobInstanceDetails,
+        PatchRollout,
+        WindowsUpdateSettings,
+        YumSettings,
+        ZypperSettings,
+    )
+    from .vulnerability import (
+        CVSSv3,
+        GetVulnerabilityReportRequest,
+        ListVulnerabilityReportsRequest,
+        ListVulnerabilityReportsResponse,
+        VulnerabilityReport,
+    )
+
+__getattr__, __dir__ = _lazy.attach(__name__, _LAZY_SUBMODULES)
 
 __all__ = (
     "GetInventoryRequest",
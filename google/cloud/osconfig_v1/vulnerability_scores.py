@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Batch CVSSv3 scoring and severity rollups of vulnerability reports.
+
+The vulnerabilities of many :class:`~.types.VulnerabilityReport` messages
+are encoded into numpy arrays, one row per vulnerability, so that scores and
+aggregates are computed without per-vulnerability Python code:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import vulnerability_scores
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    arrays = vulnerability_scores.encode(
+        client.list_vulnerability_reports(parent=parent)
+    )
+    by_zone = vulnerability_scores.rollup(arrays, "zone")
+
+This module requires ``numpy``, installed with the ``numpy`` extra.
+"""
+
+from typing import Any, Dict, Iterable, NamedTuple, Tuple
+
+from google.cloud.osconfig_v1.types import vulnerability
+
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+
+_NUMPY_REQUIRED = "numpy is required to score vulnerability reports."
+
+_CVSSv3 = vulnerability.CVSSv3
+
+# The CVSS v3.1 metric values, indexed by enum value. Unspecified metrics
+# map to NaN so that the scores depending on them are NaN as well.
+_NAN = float("nan")
+_ATTACK_VECTOR = (_NAN, 0.85, 0.62, 0.55, 0.2)
+_ATTACK_COMPLEXITY = (_NAN, 0.77, 0.44)
+_PRIVILEGES_REQUIRED_UNCHANGED = (_NAN, 0.85, 0.62, 0.27)
+_PRIVILEGES_REQUIRED_CHANGED = (_NAN, 0.85, 0.68, 0.5)
+_USER_INTERACTION = (_NAN, 0.85, 0.62)
+_IMPACT = (_NAN, 0.56, 0.22, 0.0)
+
+#: The metric columns of :class:`VulnerabilityArrays`, in CVSSv3 field order.
+METRICS = (
+    "attack_vector",
+    "attack_complexity",
+    "privileges_required",
+    "user_interaction",
+    "scope",
+    "confidentiality_impact",
+    "integrity_impact",
+    "availability_impact",
+)
+
+#: The groupings supported by :func:`rollup`.
+ROLLUP_KEYS = ("zone", "instance", "cve", "severity")
+
+# Qualitative severity rating scale, as (lower bound, rating), highest first.
+_RATINGS = (
+    (9.0, "CRITICAL"),
+    (7.0, "HIGH"),
+    (4.0, "MEDIUM"),
+    (0.1, "LOW"),
+    (0.0, "NONE"),
+)
+_UNKNOWN = "UNKNOWN"
+
+
+def _require_numpy() -> None:
+    if numpy is None:
+        raise ImportError(_NUMPY_REQUIRED)
+
+
+def _parse_report_name(name: str) -> Tuple[str, str]:
+    """Returns the (zone, instance) a vulnerability report belongs to."""
+    instance = name
+    if instance.endswith("/vulnerabilityReport"):
+        instance = instance[: -len("/vulnerabilityReport")]
+    segments = instance.split("/")
+    zone = segments[3] if len(segments) > 3 and segments[2] == "locations" else ""
+    return zone, instance
+
+
+class VulnerabilityArrays:
+    """The vulnerabilities of a set of reports, one array element each.
+
+    Attributes:
+        instance (numpy.ndarray): The instance resource names.
+        zone (numpy.ndarray): The zones of the instances.
+        cve (numpy.ndarray): The CVE identifiers.
+        severity (numpy.ndarray): The distro severities, upper-cased.
+            Empty when the distro did not assign one.
+        cvss_v2_score (numpy.ndarray): The CVSS v2 scores, as ``float64``.
+        reported_base_score (numpy.ndarray): The CVSSv3 base scores reported
+            by the service, NaN when the vulnerability has no CVSSv3 data.
+        attack_vector, attack_complexity, privileges_required,
+        user_interaction, scope, confidentiality_impact, integrity_impact,
+        availability_impact (numpy.ndarray): The CVSSv3 metric enum values,
+            as ``int8``.
+    """
+
+    def __init__(self, **columns: "numpy.ndarray"):
+        self.__dict__.update(columns)
+
+    def __len__(self) -> int:
+        return len(self.cve)
+
+
+def encode(reports: Iterable[Any]) -> VulnerabilityArrays:
+    """Encodes the vulnerabilities of ``reports`` into arrays.
+
+    Args:
+        reports (Iterable[google.cloud.osconfig_v1.types.VulnerabilityReport]):
+            The reports to encode, for example a
+            ``ListVulnerabilityReportsPager``.
+
+    Returns:
+        VulnerabilityArrays: One element per vulnerability.
+
+    Raises:
+        ImportError: If ``numpy`` is not installed.
+    """
+    _require_numpy()
+    instances, zones, cves, severities = [], [], [], []
+    v2_scores, base_scores = [], []
+    metrics = [[] for _ in METRICS]
+    for report in reports:
+        if isinstance(report, vulnerability.VulnerabilityReport):
+            report = vulnerability.VulnerabilityReport.pb(report)
+        zone, instance = _parse_report_name(report.name)
+        for item in report.vulnerabilities:
+            details = item.details
+            cvss_v3 = details.cvss_v3
+            instances.append(instance)
+            zones.append(zone)
+            cves.append(details.cve)
+            severities.append(details.severity.upper())
+            v2_scores.append(details.cvss_v2_score)
+            if details.HasField("cvss_v3"):
+                base_scores.append(cvss_v3.base_score)
+            else:
+                base_scores.append(_NAN)
+            for values, metric in zip(metrics, METRICS):
+                values.append(getattr(cvss_v3, metric))
+
+    columns = {
+        "instance": numpy.array(instances, dtype=object),
+        "zone": numpy.array(zones, dtype=object),
+        "cve": numpy.array(cves, dtype=object),
+        "severity": numpy.array(severities, dtype=object),
+        "cvss_v2_score": numpy.array(v2_scores, dtype=numpy.float64),
+        "reported_base_score": numpy.array(base_scores, dtype=numpy.float64),
+    }
+    for values, metric in zip(metrics, METRICS):
+        columns[metric] = numpy.array(values, dtype=numpy.int8)
+    return VulnerabilityArrays(**columns)
+
+
+def _lookup(table: Tuple[float, ...], values: "numpy.ndarray") -> "numpy.ndarray":
+    """Maps enum values to metric values; out-of-range values map to NaN."""
+    table = numpy.append(numpy.array(table, dtype=numpy.float64), _NAN)
+    index = numpy.where((values >= 0) & (values < len(table) - 1), values, -1)
+    return table[index]
+
+
+def _roundup(values: "numpy.ndarray") -> "numpy.ndarray":
+    """The CVSS v3.1 ``Roundup`` function, which avoids float artifacts."""
+    scaled = numpy.round(values * 100000)
+    return numpy.where(
+        scaled % 10000 == 0, scaled / 100000, (numpy.floor(scaled / 10000) + 1) / 10
+    )
+
+
+class CVSSv3Scores(NamedTuple):
+    """CVSSv3 scores computed from the base metrics."""
+
+    base: "numpy.ndarray"
+    impact: "numpy.ndarray"
+    exploitability: "numpy.ndarray"
+
+
+def cvss3_scores(arrays: VulnerabilityArrays) -> CVSSv3Scores:
+    """Computes the CVSS v3.1 base score and sub-scores of each vulnerability.
+
+    Scores are NaN for vulnerabilities with an unspecified base metric.
+    The base score is rounded up to one decimal as the specification
+    requires; the sub-scores are rounded to one decimal, like the
+    ``impact_score`` and ``exploitability_score`` fields.
+
+    Args:
+        arrays (VulnerabilityArrays): The output of :func:`encode`.
+
+    Returns:
+        CVSSv3Scores: The scores, as ``float64`` arrays.
+    """
+    _require_numpy()
+    changed = arrays.scope == _CVSSv3.Scope.SCOPE_CHANGED
+    scope_known = (arrays.scope == _CVSSv3.Scope.SCOPE_UNCHANGED) | changed
+    privileges = numpy.where(
+        changed,
+        _lookup(_PRIVILEGES_REQUIRED_CHANGED, arrays.privileges_required),
+        _lookup(_PRIVILEGES_REQUIRED_UNCHANGED, arrays.privileges_required),
+    )
+    exploitability = (
+        8.22
+        * _lookup(_ATTACK_VECTOR, arrays.attack_vector)
+        * _lookup(_ATTACK_COMPLEXITY, arrays.attack_complexity)
+        * privileges
+        * _lookup(_USER_INTERACTION, arrays.user_interaction)
+    )
+    iss = 1 - (
+        (1 - _lookup(_IMPACT, arrays.confidentiality_impact))
+        * (1 - _lookup(_IMPACT, arrays.integrity_impact))
+        * (1 - _lookup(_IMPACT, arrays.availability_impact))
+    )
+    impact = numpy.where(
+        changed,
+        7.52 * (iss - 0.029) - 3.25 * (iss - 0.02) ** 15,
+        6.42 * iss,
+    )
+    impact = numpy.where(scope_known, impact, _NAN)
+    total = numpy.where(changed, 1.08, 1.0) * (impact + exploitability)
+    with numpy.errstate(invalid="ignore"):
+        base = numpy.where(impact <= 0, 0.0, _roundup(numpy.minimum(total, 10.0)))
+    base = numpy.where(numpy.isnan(total), _NAN, base)
+    return CVSSv3Scores(
+        base=base,
+        impact=numpy.round(impact, 1),
+        exploitability=numpy.round(exploitability, 1),
+    )
+
+
+def effective_scores(arrays: VulnerabilityArrays) -> "numpy.ndarray":
+    """Returns the CVSSv3 base score used to rank each vulnerability.
+
+    This is the score computed from the base metrics, or the reported base
+    score when some metrics are unspecified.
+
+    Args:
+        arrays (VulnerabilityArrays): The output of :func:`encode`.
+
+    Returns:
+        numpy.ndarray: The scores; NaN when neither is available.
+    """
+    computed = cvss3_scores(arrays).base
+    return numpy.where(numpy.isnan(computed), arrays.reported_base_score, computed)
+
+
+def severity_ratings(scores: "numpy.ndarray") -> "numpy.ndarray":
+    """Maps CVSSv3 scores to their qualitative severity ratings.
+
+    Args:
+        scores (numpy.ndarray): CVSSv3 scores.
+
+    Returns:
+        numpy.ndarray: ``"NONE"``, ``"LOW"``, ``"MEDIUM"``, ``"HIGH"`` or
+        ``"CRITICAL"``; ``"UNKNOWN"`` for NaN scores.
+    """
+    _require_numpy()
+    scores = numpy.asarray(scores, dtype=numpy.float64)
+    with numpy.errstate(invalid="ignore"):
+        conditions = [scores >= bound for bound, _ in _RATINGS]
+    return numpy.select(
+        conditions, [rating for _, rating in _RATINGS], default=_UNKNOWN
+    ).astype(object)
+
+
+class Rollup(NamedTuple):
+    """Aggregates of the vulnerabilities sharing a rollup key."""
+
+    count: int
+    instances: int
+    max_score: float
+    mean_score: float
+
+
+def rollup(arrays: VulnerabilityArrays, by: str) -> Dict[str, Rollup]:
+    """Aggregates vulnerabilities by zone, instance, CVE or severity.
+
+    Scores are the :func:`effective_scores`. Vulnerabilities without a
+    distro severity are grouped by the rating of their score.
+
+    Args:
+        arrays (VulnerabilityArrays): The output of :func:`encode`.
+        by (str): One of :data:`ROLLUP_KEYS`.
+
+    Returns:
+        Dict[str, Rollup]: The aggregates of each key, in key order.
+        ``max_score`` and ``mean_score`` ignore vulnerabilities without a
+        score, and are NaN if none has one.
+
+    Raises:
+        ValueError: If ``by`` is not a supported rollup key.
+    """
+    if by not in ROLLUP_KEYS:
+        raise ValueError(
+            "Cannot roll up vulnerabilities by {!r}; expected one of {}.".format(
+                by, ", ".join(ROLLUP_KEYS)
+            )
+        )
+    _require_numpy()
+    scores = effective_scores(arrays)
+    keys = getattr(arrays, by)
+    if by == "severity":
+        keys = numpy.where(keys == "", severity_ratings(scores), keys)
+
+    labels, inverse = numpy.unique(keys.astype(str), return_inverse=True)
+    inverse = inverse.ravel()
+    size = len(labels)
+    counts = numpy.bincount(inverse, minlength=size)
+
+    scored = ~numpy.isnan(scores)
+    score_counts = numpy.bincount(inverse[scored], minlength=size)
+    score_sums = numpy.bincount(inverse[scored], weights=scores[scored], minlength=size)
+    max_scores = numpy.full(size, _NAN)
+    numpy.fmax.at(max_scores, inverse, scores)
+
+    instance_labels, instance_inverse = numpy.unique(
+        arrays.instance.astype(str), return_inverse=True
+    )
+    pairs = numpy.unique(
+        inverse.astype(numpy.int64) * len(instance_labels) + instance_inverse.ravel()
+    )
+    instance_counts = numpy.bincount(
+        pairs // max(len(instance_labels), 1), minlength=size
+    )
+
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        means = score_sums / score_counts
+    return {
+        str(label): Rollup(
+            count=int(counts[i]),
+            instances=int(instance_counts[i]),
+            max_score=float(max_scores[i]),
+            mean_score=float(means[i]),
+        )
+        for i, label in enumerate(labels)
+    }
+
+
+__all__ = (
+    "CVSSv3Scores",
+    "METRICS",
+    "ROLLUP_KEYS",
+    "Rollup",
+    "VulnerabilityArrays",
+    "cvss3_scores",
+    "effective_scores",
+    "encode",
+    "rollup",
+    "severity_ratings",
+)
@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Incremental synchronization of vulnerability reports.
+
+:class:`VulnerabilityReportSync` remembers, for every parent, the reports it
+has seen and the latest ``update_time`` among them (the watermark). Each
+:meth:`~VulnerabilityReportSync.sync` only returns what changed since the
+previous one:
+
+.. code-block:: python
+
+    from google.cloud import osconfig_v1
+    from google.cloud.osconfig_v1 import vulnerability_sync
+
+    client = osconfig_v1.OsConfigZonalServiceClient()
+    syncer = vulnerability_sync.VulnerabilityReportSync(client)
+    for change in syncer.sync(parent):
+        if change.kind == vulnerability_sync.REMOVED:
+            forget(change.name)
+        else:
+            store(change.report)
+"""
+
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple, Union
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry as retries
+from google.protobuf import timestamp_pb2  # type: ignore
+
+from google.cloud.osconfig_v1.types import vulnerability
+
+try:
+    OptionalRetry = Union[retries.Retry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.Retry, object]  # type: ignore
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+_Timestamp = Tuple[int, int]
+
+
+class ReportChange(NamedTuple):
+    """A difference between two syncs of a parent.
+
+    Attributes:
+        kind (str): One of :data:`ADDED`, :data:`CHANGED` or :data:`REMOVED`.
+        name (str): The vulnerability report resource name.
+        report (Optional[google.cloud.osconfig_v1.types.VulnerabilityReport]):
+            The current report; ``None`` for removed reports.
+    """
+
+    kind: str
+    name: str
+    report: Optional[vulnerability.VulnerabilityReport]
+
+
+class _ParentState:
+    def __init__(self):
+        self.reports: Dict[str, _Timestamp] = {}
+        self.watermark: Optional[_Timestamp] = None
+        self.incremental_syncs = 0
+
+
+def _update_time(report: vulnerability.VulnerabilityReport) -> _Timestamp:
+    update_time = vulnerability.VulnerabilityReport.pb(report).update_time
+    return update_time.seconds, update_time.nanos
+
+
+class VulnerabilityReportSync:
+    """Returns the vulnerability reports added, changed or removed since the
+    previous sync of a parent.
+
+    The first sync of a parent lists every report. Later syncs ask the
+    server for the reports whose ``update_time`` is at or after the
+    watermark, by extending the request ``filter``. If the server rejects
+    that filter, it is not sent again and the sync lists every report
+    instead; reports whose ``update_time`` did not change are then skipped
+    on the client. Either way, the reports returned are the same.
+
+    Reports can only be detected as removed by a complete listing, so every
+    ``full_sync_every``-th sync of a parent lists every report even when the
+    server supports the filter.
+
+    The watermark and known reports of a parent are updated as the changes
+    are consumed; the watermark only advances once a sync has been
+    consumed entirely. Instances are not thread-safe.
+
+    Args:
+        client (google.cloud.osconfig_v1.OsConfigZonalServiceClient):
+            The client used to list vulnerability reports.
+        filter (str): A filter applied to every listing, such as a
+            constraint on the report contents.
+        full_sync_every (int): How often to list every report of a parent
+            to detect removed reports. ``1`` disables incremental listings.
+        page_size (int): The page size of the listings.
+        retry (google.api_core.retry.Retry): Designation of what errors, if
+            any, should be retried.
+        timeout (float): The timeout for each page request.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be sent
+            along with each request as metadata.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        filter: str = "",
+        full_sync_every: int = 10,
+        page_size: int = 0,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ):
+        if full_sync_every < 1:
+            raise ValueError("full_sync_every must be a positive integer.")
+        self._client = client
+        self._filter = filter
+        self._full_sync_every = full_sync_every
+        self._page_size = page_size
+        self._retry = retry
+        self._timeout = timeout
+        self._metadata = metadata
+        self._server_filter_supported = True
+        self._parents: Dict[str, _ParentState] = {}
+
+    @property
+    def server_filter_supported(self) -> bool:
+        """bool: Whether the server accepted the ``update_time`` filter."""
+        return self._server_filter_supported
+
+    def watermark(self, parent: str) -> Optional[timestamp_pb2.Timestamp]:
+        """Returns the latest ``update_time`` seen for ``parent``.
+
+        Args:
+            parent (str): The parent passed to :meth:`sync`.
+
+        Returns:
+            Optional[google.protobuf.timestamp_pb2.Timestamp]: The watermark,
+            or ``None`` if ``parent`` was never fully synced.
+        """
+        state = self._parents.get(parent)
+        if state is None or state.watermark is None:
+            return None
+        seconds, nanos = state.watermark
+        return timestamp_pb2.Timestamp(seconds=seconds, nanos=nanos)
+
+    def known_reports(self, parent: str) -> Sequence[str]:
+        """Returns the names of the reports known for ``parent``."""
+        state = self._parents.get(parent)
+        return list(state.reports) if state is not None else []
+
+    def reset(self, parent: Optional[str] = None) -> None:
+        """Forgets the state of ``parent``, or of every parent.
+
+        The next sync of a forgotten parent returns all its reports as added.
+        """
+        if parent is None:
+            self._parents.clear()
+        else:
+            self._parents.pop(parent, None)
+
+    def _list(self, parent: str, filter: str) -> Any:
+        request = vulnerability.ListVulnerabilityReportsRequest(
+            parent=parent, filter=filter, page_size=self._page_size
+        )
+        return self._client.list_vulnerability_reports(
+            request=request,
+            retry=self._retry,
+            timeout=self._timeout,
+            metadata=self._metadata,
+        )
+
+    def _incremental_filter(self, watermark: _Timestamp) -> str:
+        since = timestamp_pb2.Timestamp(seconds=watermark[0], nanos=watermark[1])
+        condition = 'update_time >= "{}"'.format(since.ToJsonString())
+        if self._filter:
+            return "({}) AND {}".format(self._filter, condition)
+        return condition
+
+    def sync(self, parent: str, *, full: bool = False) -> Iterator[ReportChange]:
+        """Lists the reports of ``parent`` that changed since the last sync.
+
+        Args:
+            parent (str): The parent resource name, of the form
+                ``projects/{project}/locations/{location}/instances/-``.
+            full (bool): Whether to list every report, regardless of the
+                watermark, to detect removed reports.
+
+        Yields:
+            ReportChange: The added and changed reports, in listing order,
+            followed by the removed reports when every report was listed.
+        """
+        state = self._parents.setdefault(parent, _ParentState())
+        incremental = (
+            not full
+            and self._server_filter_supported
+            and state.watermark is not None
+            and state.incremental_syncs + 1 < self._full_sync_every
+        )
+
+        pager = None
+        if incremental:
+            try:
+                pager = self._list(parent, self._incremental_filter(state.watermark))
+            except core_exceptions.BadRequest:
+                self._server_filter_supported = False
+                incremental = False
+        if pager is None:
+            pager = self._list(parent, self._filter)
+
+        watermark = state.watermark
+        seen = set()
+        for report in pager:
+            name = report.name
+            seen.add(name)
+            update_time = _update_time(report)
+            if watermark is None or update_time > watermark:
+                watermark = update_time
+            previous = state.reports.get(name)
+            if previous == update_time:
+                continue
+            state.reports[name] = update_time
+            yield ReportChange(ADDED if previous is None else CHANGED, name, report)
+
+        if incremental:
+            state.incremental_syncs += 1
+        else:
+            state.incremental_syncs = 0
+            for name in [name for name in state.reports if name not in seen]:
+                del state.reports[name]
+                yield ReportChange(REMOVED, name, None)
+        state.watermark = watermark
+
+
+__all__ = (
+    "ADDED",
+    "CHANGED",
+    "REMOVED",
+    "ReportChange",
+    "VulnerabilityReportSync",
+)
@@ -43,7 +43,11 @@ UNIT_TEST_STANDARD_DEPENDENCIES = [
 UNIT_TEST_EXTERNAL_DEPENDENCIES = []
 UNIT_TEST_LOCAL_DEPENDENCIES = []
 UNIT_TEST_DEPENDENCIES = []
-UNIT_TEST_EXTRAS = []
+UNIT_TEST_EXTRAS = [
+    "numpy",
+    "pyarrow",
+    "async_rest",
+]
 UNIT_TEST_EXTRAS_BY_PYTHON = {}
 
 SYSTEM_TEST_PYTHON_VERSIONS = ["3.8"]
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import concurrent.futures
+import random
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import operation, operation_async
+from google.longrunning import operations_pb2
+from google.rpc import status_pb2
+import pytest
+
+from google.cloud.osconfig_v1 import assignment_operations
+from google.cloud.osconfig_v1.assignment_operations import RolloutState
+from google.cloud.osconfig_v1.types import os_policy_assignments
+
+Metadata = os_policy_assignments.OSPolicyAssignmentOperationMetadata
+
+# Short intervals keep the tests fast; no jitter keeps them deterministic.
+FAST = dict(initial_interval=0.01, max_interval=0.02, jitter=0.0, batch_window=0.005)
+
+
+def _operation_pb(name, state, done=False, error=None):
+    op = operations_pb2.Operation(name=name, done=done)
+    op.metadata.Pack(Metadata.pb(Metadata(rollout_state=state)))
+    if error is not None:
+        op.error.CopyFrom(error)
+    elif done:
+        op.response.Pack(
+            os_policy_assignments.OSPolicyAssignment.pb(
+                os_policy_assignments.OSPolicyAssignment(name=name)
+            )
+        )
+    return op
+
+
+class _Script:
+    """Returns the scripted states of an operation, one per poll."""
+
+    def __init__(self, name, *states):
+        self.name = name
+        self.states = list(states)
+        self.polls = 0
+
+    def next(self):
+        self.polls += 1
+        state = self.states.pop(0) if len(self.states) > 1 else self.states[0]
+        if isinstance(state, Exception):
+            raise state
+        return state
+
+    def refresh(self, retry=None):
+        return self.next()
+
+    async def refresh_async(self, retry=None):
+        return self.next()
+
+
+def _scripts():
+    return [
+        _Script(
+            "op-a",
+            _operation_pb("op-a", RolloutState.IN_PROGRESS),
+            _operation_pb("op-a", RolloutState.SUCCEEDED, done=True),
+        ),
+        _Script(
+            "op-b",
+            core_exceptions.ServiceUnavailable("try again"),
+            _operation_pb("op-b", RolloutState.IN_PROGRESS),
+            _operation_pb("op-b", RolloutState.IN_PROGRESS),
+            _operation_pb("op-b", RolloutState.CANCELLING),
+            _operation_pb(
+                "op-b",
+                RolloutState.CANCELLED,
+                done=True,
+                error=status_pb2.Status(code=1, message="cancelled"),
+            ),
+        ),
+    ]
+
+
+def _sync_operation(script):
+    return operation.Operation(
+        _operation_pb(script.name, RolloutState.ROLLOUT_STATE_UNSPECIFIED),
+        script.refresh,
+        lambda: None,
+        os_policy_assignments.OSPolicyAssignment,
+        metadata_type=Metadata,
+    )
+
+
+def _check_events(events, scripts):
+    by_name = {}
+    for event in events:
+        by_name.setdefault(event.name, []).append(event)
+    a, b = by_name["op-a"], by_name["op-b"]
+    assert [(e.previous_rollout_state, e.rollout_state, e.done) for e in a] == [
+        (RolloutState.ROLLOUT_STATE_UNSPECIFIED, RolloutState.IN_PROGRESS, False),
+        (RolloutState.IN_PROGRESS, RolloutState.SUCCEEDED, True),
+    ]
+    assert isinstance(b[0].error, core_exceptions.ServiceUnavailable)
+    assert [(e.rollout_state, e.done) for e in b[1:]] == [
+        (RolloutState.IN_PROGRESS, False),
+        (RolloutState.CANCELLING, False),
+        (RolloutState.CANCELLED, True),
+    ]
+    # Each operation is polled until done, and no further.
+    assert [script.polls for script in scripts] == [2, 5]
+
+
+def test_operation_waiter_events():
+    scripts = _scripts()
+    with assignment_operations.OperationWaiter(
+        [_sync_operation(script) for script in scripts], **FAST
+    ) as waiter:
+        events = list(waiter.events(timeout=5))
+        assert len(waiter) == 0
+    _check_events(events, scripts)
+
+
+def test_operation_waiter_as_completed():
+    scripts = _scripts()
+    operations = [_sync_operation(script) for script in scripts]
+    with assignment_operations.OperationWaiter(**FAST) as waiter:
+        for op in operations:
+            waiter.add(op)
+        assert len(waiter) == 2
+        completed = list(waiter.as_completed(timeout=5))
+    assert completed == operations
+    assert completed[0].result().name == "op-a"
+    with pytest.raises(core_exceptions.GoogleAPICallError):
+        completed[1].result()
+
+
+def test_operation_waiter_timeout():
+    script = _Script("op-a", _operation_pb("op-a", RolloutState.IN_PROGRESS))
+    with assignment_operations.OperationWaiter(
+        [_sync_operation(script)], **FAST
+    ) as waiter:
+        with pytest.raises(concurrent.futures.TimeoutError):
+            list(waiter.as_completed(timeout=0.05))
+        assert waiter.pending
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        core_exceptions.NotFound("not found"),
+        core_exceptions.PermissionDenied("denied"),
+        core_exceptions.InvalidArgument("invalid"),
+    ],
+)
+def test_operation_waiter_permanent_errors(error):
+    script = _Script("op-a", _operation_pb("op-a", RolloutState.IN_PROGRESS), error)
+    with assignment_operations.OperationWaiter(
+        [_sync_operation(script)], **FAST
+    ) as waiter:
+        # Without a timeout, the iteration ends once the operation fails.
+        events = list(waiter.events())
+        assert len(waiter) == 0
+    assert [(e.rollout_state, e.done, e.error) for e in events] == [
+        (RolloutState.IN_PROGRESS, False, None),
+        (RolloutState.IN_PROGRESS, True, error),
+    ]
+    assert script.polls == 2
+
+
+def test_operation_waiter_poll_once_after_close():
+    script = _Script("op-a", _operation_pb("op-a", RolloutState.IN_PROGRESS))
+    now = [0.0]
+    waiter = assignment_operations.OperationWaiter(
+        [_sync_operation(script)], clock=lambda: now[0], **FAST
+    )
+    waiter.close()
+    now[0] = 1.0
+    assert waiter.next_poll_in() == 0.0
+    # The owned executor is shut down; nothing is submitted to it.
+    assert waiter.poll_once() == []
+    assert script.polls == 0
+    assert list(waiter.events()) == []
+
+
+def test_schedule_backoff_jitter_and_batching():
+    class Clock:
+        now = 100.0
+
+        def __call__(self):
+            return self.now
+
+    clock = Clock()
+    schedule = assignment_operations._Schedule(
+        initial_interval=1.0,
+        max_interval=4.0,
+        backoff=2.0,
+        jitter=0.25,
+        batch_window=0.5,
+        clock=clock,
+        rng=random.Random(0),
+    )
+    ops = [_sync_operation(_Script("op-{}".format(i), None)) for i in range(3)]
+    for op in ops:
+        schedule.add(op)
+    delays = [p.due - clock.now for p in schedule._pending.values()]
+    assert all(0.75 <= d <= 1.25 for d in delays)
+    assert len(set(delays)) == 3
+
+    # The polls due within the batch window are sent together.
+    clock.now = 100.0 + min(delays)
+    assert len(schedule.due()) == sum(d <= min(delays) + 0.5 for d in delays)
+
+    pending = next(iter(schedule._pending.values()))
+    intervals = []
+    for _ in range(4):
+        schedule.update(pending, False, None)
+        intervals.append(pending.interval)
+    assert intervals == [2.0, 4.0, 4.0, 4.0]
+    assert 3.0 <= pending.due - clock.now <= 5.0
+
+    with pytest.raises(ValueError):
+        assignment_operations.OperationWaiter(initial_interval=2, max_interval=1)
+    with pytest.raises(ValueError):
+        assignment_operations.OperationWaiter(jitter=1)
+
+
+async def _async_waiter():
+    scripts = _scripts()
+    operations = [
+        operation_async.AsyncOperation(
+            _operation_pb(script.name, RolloutState.ROLLOUT_STATE_UNSPECIFIED),
+            script.refresh_async,
+            lambda: None,
+            os_policy_assignments.OSPolicyAssignment,
+            metadata_type=Metadata,
+        )
+        for script in scripts
+    ]
+    waiter = assignment_operations.AsyncOperationWaiter(operations, **FAST)
+    events = [event async for event in waiter.events(timeout=5)]
+    _check_events(events, scripts)
+    assert (await operations[0].result()).name == "op-a"
+    with pytest.raises(core_exceptions.GoogleAPICallError):
+        await operations[1].result()
+
+    script = _Script("op-c", _operation_pb("op-c", RolloutState.IN_PROGRESS))
+    waiter.add(
+        operation_async.AsyncOperation(
+            _operation_pb("op-c", RolloutState.IN_PROGRESS),
+            script.refresh_async,
+            lambda: None,
+            os_policy_assignments.OSPolicyAssignment,
+            metadata_type=Metadata,
+        )
+    )
+    with pytest.raises(asyncio.TimeoutError):
+        async for _ in waiter.as_completed(timeout=0.05):
+            pass
+
+
+async def _async_permanent_error():
+    error = core_exceptions.NotFound("not found")
+    script = _Script("op-a", _operation_pb("op-a", RolloutState.IN_PROGRESS), error)
+    waiter = assignment_operations.AsyncOperationWaiter(
+        [
+            operation_async.AsyncOperation(
+                _operation_pb("op-a", RolloutState.ROLLOUT_STATE_UNSPECIFIED),
+                script.refresh_async,
+                lambda: None,
+                os_policy_assignments.OSPolicyAssignment,
+                metadata_type=Metadata,
+            )
+        ],
+        **FAST,
+    )
+    events = [event async for event in waiter.events()]
+    assert [(e.done, e.error) for e in events] == [(False, None), (True, error)]
+    assert len(waiter) == 0
+
+
+def test_async_operation_waiter():
+    # A private loop leaves the current event loop of the thread untouched.
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_async_waiter())
+        loop.run_until_complete(_async_permanent_error())
+    finally:
+        loop.close()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.cloud.osconfig_v1 import compliance_rollup
+from google.cloud.osconfig_v1.compliance_rollup import (
+    ComplianceCounts,
+    ComplianceRollup,
+)
+from google.cloud.osconfig_v1.types import os_policy_assignment_reports
+
+Report = os_policy_assignment_reports.OSPolicyAssignmentReport
+PolicyCompliance = Report.OSPolicyCompliance
+ResourceCompliance = PolicyCompliance.OSPolicyResourceCompliance
+
+C, N, U = "COMPLIANT", "NON_COMPLIANT", "UNKNOWN"
+
+
+def _report(zone, assignment, policies):
+    """Returns a report; ``policies`` maps policy IDs to (state, resources)."""
+    return Report(
+        instance="projects/p/locations/{}/instances/i".format(zone),
+        os_policy_assignment="projects/1/locations/{}/osPolicyAssignments/{}@r1".format(
+            zone, assignment
+        ),
+        os_policy_compliances=[
+            PolicyCompliance(
+                os_policy_id=policy_id,
+                compliance_state=state,
+                os_policy_resource_compliances=[
+                    ResourceCompliance(
+                        os_policy_resource_id=resource_id,
+                        compliance_state=resource_state,
+                    )
+                    for resource_id, resource_state in resources.items()
+                ],
+            )
+            for policy_id, (state, resources) in policies.items()
+        ],
+    )
+
+
+def _assignment(zone, name):
+    return "projects/1/locations/{}/osPolicyAssignments/{}".format(zone, name)
+
+
+REPORTS = [
+    _report("z1", "a", {"p1": (C, {"r1": C, "r2": C}), "p2": (C, {"r3": C})}),
+    _report("z1", "a", {"p1": (N, {"r1": C, "r2": N}), "p2": (C, {"r3": C})}),
+    _report("z1", "a", {"p1": (C, {"r1": C, "r2": C}), "p2": (U, {"r3": U})}),
+    _report("z2", "a", {"p1": (C, {"r1": C, "r2": C}), "p2": (C, {"r3": C})}),
+    _report("z2", "b", {}),
+]
+
+
+def _rollup():
+    rollup = ComplianceRollup()
+    rollup.update(REPORTS)
+    return rollup
+
+
+def test_instance_level():
+    rollup = _rollup()
+    assert len(rollup) == 5
+    assert rollup.rollup(level="instance") == {(): ComplianceCounts(2, 1, 2)}
+    assert rollup.rollup(["zone", "assignment"], level="instance") == {
+        ("z1", _assignment("z1", "a")): ComplianceCounts(1, 1, 1),
+        ("z2", _assignment("z2", "a")): ComplianceCounts(1, 0, 0),
+        # A report without policies has an unknown compliance.
+        ("z2", _assignment("z2", "b")): ComplianceCounts(0, 0, 1),
+    }
+    # Dimensions below the level group as None.
+    assert rollup.rollup(["os_policy_id"], level="instance") == {
+        (None,): ComplianceCounts(2, 1, 2)
+    }
+
+
+def test_policy_and_resource_levels():
+    rollup = _rollup()
+    assert rollup.rollup(["os_policy_id"]) == {
+        ("p1",): ComplianceCounts(3, 1, 0),
+        ("p2",): ComplianceCounts(3, 0, 1),
+    }
+    by_resource = rollup.rollup(["os_policy_id", "resource_id"], level="resource")
+    assert by_resource == {
+        ("p1", "r1"): ComplianceCounts(4, 0, 0),
+        ("p1", "r2"): ComplianceCounts(3, 1, 0),
+        ("p2", "r3"): ComplianceCounts(3, 0, 1),
+    }
+    assert by_resource["p1", "r2"].compliance == 75.0
+    assert by_resource["p1", "r2"].total == 4
+
+
+def test_where():
+    rollup = _rollup()
+    assert rollup.rollup(["resource_id"], level="resource", zone="z1") == {
+        ("r1",): ComplianceCounts(3, 0, 0),
+        ("r2",): ComplianceCounts(2, 1, 0),
+        ("r3",): ComplianceCounts(2, 0, 1),
+    }
+    assert rollup.rollup(level="resource", zone="z1", os_policy_id="p2") == {
+        (): ComplianceCounts(2, 0, 1)
+    }
+    assert rollup.rollup(zone="missing") == {}
+
+
+def test_counters_do_not_grow_with_reports():
+    rollup = _rollup()
+    counters = rollup.counters
+    rollup.update(REPORTS * 100)
+    assert rollup.counters == counters
+    assert rollup.rollup(level="instance") == {(): ComplianceCounts(202, 101, 202)}
+
+
+def test_unrecognized_states_are_unknown():
+    # States added to the API after this client are not in the enums.
+    report = Report.pb(_report("z1", "a", {"p1": (C, {"r1": C, "r2": C})}))
+    (policy,) = report.os_policy_compliances
+    policy.compliance_state = 3
+    policy.os_policy_resource_compliances[1].compliance_state = 7
+    rollup = ComplianceRollup()
+    rollup.add(Report.wrap(report))
+    assert rollup.rollup(level="instance") == {(): ComplianceCounts(0, 0, 1)}
+    assert rollup.rollup(["os_policy_id"]) == {("p1",): ComplianceCounts(0, 0, 1)}
+    assert rollup.rollup(["resource_id"], level="resource") == {
+        ("r1",): ComplianceCounts(1, 0, 0),
+        ("r2",): ComplianceCounts(0, 0, 1),
+    }
+
+
+def test_invalid_arguments():
+    rollup = _rollup()
+    with pytest.raises(ValueError):
+        rollup.rollup(["instance"])
+    with pytest.raises(ValueError):
+        rollup.rollup(level="zone")
+    with pytest.raises(ValueError):
+        rollup.rollup(project="p")
+
+
+def test_empty_counts():
+    assert ComplianceCounts().compliance is None
+    assert ComplianceRollup().rollup() == {}
+    assert compliance_rollup.ComplianceState.COMPLIANT == 1
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import concurrent.futures
+import contextlib
+import os
+import socket
+import threading
+import time
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import grpc
+import pytest
+
+from google.cloud.osconfig_v1.services import _grpc_helpers
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceClient,
+    transports,
+)
+from google.cloud.osconfig_v1.types import inventory
+
+SERVICE = "google.cloud.osconfig.v1.OsConfigZonalService"
+
+_COMPRESSIONS = (
+    grpc.Compression.NoCompression,
+    grpc.Compression.Gzip,
+    grpc.Compression.Deflate,
+)
+
+# The benchmarks are slow, and only report their results.
+_benchmark = pytest.mark.skipif(
+    not os.environ.get("OSCONFIG_BENCHMARKS"),
+    reason="Set OSCONFIG_BENCHMARKS=1 to run the benchmarks.",
+)
+
+
+def _inventory(name, packages=2000):
+    return inventory.Inventory(
+        name=name,
+        items={
+            "item-{}".format(i): inventory.Inventory.Item(
+                id="item-{}".format(i),
+                installed_package=inventory.Inventory.SoftwarePackage(
+                    apt_package=inventory.Inventory.VersionedPackage(
+                        package_name="libpackage{}".format(i % 300),
+                        architecture="amd64",
+                        version="1.2.{}-0ubuntu1".format(i % 17),
+                    )
+                ),
+            )
+            for i in range(packages)
+        },
+    )
+
+
+class _CountingProxy:
+    """A TCP proxy counting the bytes sent in each direction."""
+
+    def __init__(self, target_port):
+        self._target = ("127.0.0.1", target_port)
+        self._listener = socket.socket()
+        self._listener.bind(("127.0.0.1", 0))
+        self._listener.listen()
+        self.port = self._listener.getsockname()[1]
+        self.upstream = 0
+        self.downstream = 0
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                return
+            server = socket.create_connection(self._target)
+            threading.Thread(
+                target=self._pump, args=(client, server, "upstream"), daemon=True
+            ).start()
+            threading.Thread(
+                target=self._pump, args=(server, client, "downstream"), daemon=True
+            ).start()
+
+    def _pump(self, source, sink, direction):
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                with self._lock:
+                    setattr(self, direction, getattr(self, direction) + len(data))
+                sink.sendall(data)
+        except OSError:
+            pass
+        finally:
+            with contextlib.suppress(OSError):
+                sink.shutdown(socket.SHUT_WR)
+
+    def reset(self):
+        with self._lock:
+            self.upstream = self.downstream = 0
+
+    def close(self):
+        self._listener.close()
+
+
+@contextlib.contextmanager
+def _fake_server(compression=None):
+    """Serves GetInventory, echoing the requested name in a large inventory."""
+
+    def get_inventory(request, context):
+        return _inventory(request.name)
+
+    handler = grpc.method_handlers_generic_handler(
+        SERVICE,
+        {
+            "GetInventory": grpc.unary_unary_rpc_method_handler(
+                get_inventory,
+                request_deserializer=inventory.GetInventoryRequest.deserialize,
+                response_serializer=inventory.Inventory.serialize,
+            )
+        },
+    )
+    server = grpc.server(
+        concurrent.futures.ThreadPoolExecutor(max_workers=4), compression=compression
+    )
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    proxy = _CountingProxy(port)
+    try:
+        yield proxy
+    finally:
+        proxy.close()
+        server.stop(None)
+
+
+def _client(proxy, **kwargs):
+    """Returns a client whose transport creates local channels to ``proxy``."""
+
+    def create_channel(host, **channel_kwargs):
+        return grpc.insecure_channel(
+            "127.0.0.1:{}".format(proxy.port),
+            options=channel_kwargs["options"],
+            compression=channel_kwargs.get("compression"),
+        )
+
+    with mock.patch.object(
+        transports.OsConfigZonalServiceGrpcTransport,
+        "create_channel",
+        side_effect=create_channel,
+    ):
+        transport = transports.OsConfigZonalServiceGrpcTransport(
+            credentials=ga_credentials.AnonymousCredentials(), **kwargs
+        )
+    return OsConfigZonalServiceClient(transport=transport)
+
+
+def test_channel_options():
+    assert _grpc_helpers.channel_options() == [
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", -1),
+    ]
+    assert _grpc_helpers.channel_options(
+        max_send_message_length=10,
+        max_receive_message_length=20,
+        keepalive_time_ms=30000,
+        keepalive_timeout_ms=5000,
+    ) == [
+        ("grpc.max_send_message_length", 10),
+        ("grpc.max_receive_message_length", 20),
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.keepalive_timeout_ms", 5000),
+    ]
+
+
+def test_transport_channel_options():
+    with mock.patch.object(
+        transports.OsConfigZonalServiceGrpcAsyncIOTransport, "create_channel"
+    ) as create_channel:
+        transports.OsConfigZonalServiceGrpcAsyncIOTransport(
+            credentials=ga_credentials.AnonymousCredentials(),
+            compression=grpc.Compression.Gzip,
+            keepalive_time_ms=30000,
+            keepalive_timeout_ms=5000,
+            max_receive_message_length=1 << 20,
+        )
+    _, kwargs = create_channel.call_args
+    assert kwargs["compression"] == grpc.Compression.Gzip
+    assert kwargs["options"] == [
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", 1 << 20),
+        ("grpc.keepalive_time_ms", 30000),
+        ("grpc.keepalive_timeout_ms", 5000),
+    ]
+
+
+def test_request_compression():
+    # A long, repetitive name makes the request compressible.
+    name = "projects/p/locations/l/instances/{}/inventory".format("i" * 50000)
+    with _fake_server() as proxy:
+        sent = {}
+        for label, kwargs in [
+            ("none", {}),
+            ("channel", {"compression": grpc.Compression.Gzip}),
+            (
+                "method",
+                {
+                    "compression": grpc.Compression.NoCompression,
+                    "method_compression": {"GetInventory": grpc.Compression.Deflate},
+                },
+            ),
+        ]:
+            # The stub is called directly: the client would also send the
+            # name in the routing header, which is never compressed.
+            transport = _client(proxy, **kwargs).transport
+            request = inventory.GetInventoryRequest(name=name)
+            transport.get_inventory(request)  # connect
+            proxy.reset()
+            assert transport.get_inventory(request).name == name
+            sent[label] = proxy.upstream
+            transport.close()
+
+    assert sent["channel"] < sent["none"] / 10
+    assert sent["method"] < sent["none"] / 10
+
+
+def test_max_receive_message_length():
+    with _fake_server() as proxy:
+        client = _client(proxy, max_receive_message_length=1024)
+        with pytest.raises(core_exceptions.ResourceExhausted):
+            client.get_inventory(name="inventories/a")
+        client.transport.close()
+
+
+def _get_inventories(compression, calls):
+    """Calls GetInventory ``calls`` times with ``compression``.
+
+    The transport compresses requests; the fake server compresses responses
+    with the same algorithm, as the channel always accepts compressed
+    responses.
+
+    Returns:
+        Tuple[int, float]: The bytes on the wire, and the CPU time of the
+        process, client and server, in seconds.
+    """
+    with _fake_server(compression) as proxy:
+        client = _client(proxy, compression=compression)
+        client.get_inventory(name="inventories/warmup")
+        proxy.reset()
+        start = time.process_time()
+        for i in range(calls):
+            client.get_inventory(name="inventories/{}".format(i))
+        cpu = time.process_time() - start
+        wire = proxy.upstream + proxy.downstream
+        client.transport.close()
+    return wire, cpu
+
+
+def test_response_compression():
+    wire = {
+        compression.name: _get_inventories(compression, calls=20)[0]
+        for compression in _COMPRESSIONS
+    }
+    assert wire["Gzip"] < wire["NoCompression"] / 3
+    assert wire["Deflate"] < wire["NoCompression"] / 3
+
+
+@_benchmark
+def test_response_compression_benchmark(
+    record_testsuite_property,
+):  # pragma: NO COVER
+    """Records the bytes on the wire and CPU time of GetInventory.
+
+    The results are properties of the test suite in the JUnit XML report.
+    """
+    for compression in _COMPRESSIONS:
+        wire, cpu = _get_inventories(compression, calls=50)
+        prefix = "get_inventory_{}".format(compression.name)
+        record_testsuite_property(prefix + "_bytes", wire)
+        record_testsuite_property(prefix + "_cpu_seconds", round(cpu, 3))
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import asyncio
+import concurrent.futures
+import threading
+
+from google.auth import credentials as ga_credentials
+import grpc
+from grpc.experimental import aio
+import pytest
+
+from google.cloud.osconfig_v1.services import _grpc_helpers
+from google.cloud.osconfig_v1.services.os_config_service import transports as ocs
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceAsyncClient,
+    OsConfigZonalServiceClient,
+    transports,
+)
+from google.cloud.osconfig_v1.types import inventory
+
+SERVICE = "google.cloud.osconfig.v1.OsConfigZonalService"
+POOL_SIZE = 4
+CALLS = 8
+
+
+def _get_inventory_handler(behavior):
+    return grpc.method_handlers_generic_handler(
+        SERVICE,
+        {
+            "GetInventory": grpc.unary_unary_rpc_method_handler(
+                behavior,
+                request_deserializer=inventory.GetInventoryRequest.deserialize,
+                response_serializer=inventory.Inventory.serialize,
+            )
+        },
+    )
+
+
+def test_balancer_least_outstanding_round_robin():
+    balancer = _grpc_helpers._Balancer(3)
+    assert [balancer.acquire() for _ in range(3)] == [0, 1, 2]
+    balancer.release(1)
+    assert balancer.acquire() == 1
+    balancer.release(0)
+    balancer.release(2)
+    assert balancer.in_flight == [0, 1, 0]
+    # Ties go to the sub-channel after the last one picked.
+    assert [balancer.acquire() for _ in range(3)] == [2, 0, 1]
+
+    release = balancer.releaser(0)
+    release()
+    release()
+    assert balancer.in_flight == [0, 2, 1]
+
+
+def test_channel_pool_spreads_concurrent_rpcs():
+    arrived = threading.Semaphore(0)
+    unblock = threading.Event()
+    peers = []
+
+    def get_inventory(request, context):
+        peers.append(context.peer())
+        arrived.release()
+        unblock.wait(5)
+        return inventory.Inventory(name=request.name)
+
+    server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=CALLS))
+    server.add_generic_rpc_handlers((_get_inventory_handler(get_inventory),))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+
+    pool = _grpc_helpers.ChannelPool(
+        [
+            grpc.insecure_channel(
+                "localhost:{}".format(port),
+                options=_grpc_helpers.pool_channel_options([]),
+            )
+            for _ in range(POOL_SIZE)
+        ]
+    )
+    client = OsConfigZonalServiceClient(
+        transport=transports.OsConfigZonalServiceGrpcTransport(channel=pool)
+    )
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=CALLS) as executor:
+            futures = [
+                executor.submit(client.get_inventory, name="inventories/{}".format(i))
+                for i in range(CALLS)
+            ]
+            for _ in range(CALLS):
+                assert arrived.acquire(timeout=5)
+            assert pool.in_flight == [CALLS // POOL_SIZE] * POOL_SIZE
+            unblock.set()
+            names = sorted(future.result().name for future in futures)
+    finally:
+        unblock.set()
+        client.transport.close()
+        server.stop(None)
+
+    assert names == sorted("inventories/{}".format(i) for i in range(CALLS))
+    assert pool.in_flight == [0] * POOL_SIZE
+    # Every sub-channel has its own connection.
+    assert len(set(peers)) == POOL_SIZE
+
+
+def test_channel_pool_releases_streams_and_futures():
+    def respond(request, context):
+        for _ in range(3):
+            yield request
+
+    handler = grpc.method_handlers_generic_handler(
+        "test.Echo",
+        {
+            "Stream": grpc.unary_stream_rpc_method_handler(respond),
+            "Unary": grpc.unary_unary_rpc_method_handler(lambda r, c: r),
+        },
+    )
+    server = grpc.server(concurrent.futures.ThreadPoolExecutor(max_workers=2))
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("localhost:0")
+    server.start()
+    channels = [grpc.insecure_channel("localhost:{}".format(port)) for _ in range(2)]
+    try:
+        with _grpc_helpers.ChannelPool(channels) as pool:
+            stream = pool.unary_stream("/test.Echo/Stream")
+            assert isinstance(stream, grpc.UnaryStreamMultiCallable)
+            assert list(stream(b"x")) == [b"x"] * 3
+            assert pool.unary_unary("/test.Echo/Unary").future(b"y").result() == b"y"
+            response, call = pool.unary_unary("/test.Echo/Unary").with_call(b"z")
+            assert response == b"z"
+            assert pool.in_flight == [0, 0]
+    finally:
+        server.stop(None)
+
+
+async def _async_channel_pool_spreads_concurrent_rpcs():
+    arrived = asyncio.Semaphore(0)
+    unblock = asyncio.Event()
+    peers = []
+
+    async def get_inventory(request, context):
+        peers.append(context.peer())
+        arrived.release()
+        await unblock.wait()
+        return inventory.Inventory(name=request.name)
+
+    server = aio.server()
+    server.add_generic_rpc_handlers((_get_inventory_handler(get_inventory),))
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+
+    pool = _grpc_helpers.AsyncChannelPool(
+        [
+            aio.insecure_channel(
+                "localhost:{}".format(port),
+                options=_grpc_helpers.pool_channel_options([]),
+            )
+            for _ in range(POOL_SIZE)
+        ]
+    )
+    client = OsConfigZonalServiceAsyncClient(
+        transport=transports.OsConfigZonalServiceGrpcAsyncIOTransport(channel=pool)
+    )
+    try:
+        calls = [
+            asyncio.ensure_future(client.get_inventory(name="inventories/{}".format(i)))
+            for i in range(CALLS)
+        ]
+        for _ in range(CALLS):
+            await asyncio.wait_for(arrived.acquire(), 5)
+        assert pool.in_flight == [CALLS // POOL_SIZE] * POOL_SIZE
+        unblock.set()
+        responses = await asyncio.gather(*calls)
+        assert pool.get_state() == grpc.ChannelConnectivity.READY
+    finally:
+        unblock.set()
+        await client.transport.close()
+        await server.stop(None)
+
+    assert len(responses) == CALLS
+    assert pool.in_flight == [0] * POOL_SIZE
+    assert len(set(peers)) == POOL_SIZE
+
+
+def test_async_channel_pool_spreads_concurrent_rpcs():
+    # A private loop leaves the current event loop of the thread untouched.
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_async_channel_pool_spreads_concurrent_rpcs())
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize(
+    "transport_class,pool_class",
+    [
+        (transports.OsConfigZonalServiceGrpcTransport, _grpc_helpers.ChannelPool),
+        (
+            transports.OsConfigZonalServiceGrpcAsyncIOTransport,
+            _grpc_helpers.AsyncChannelPool,
+        ),
+        (ocs.OsConfigServiceGrpcTransport, _grpc_helpers.ChannelPool),
+        (ocs.OsConfigServiceGrpcAsyncIOTransport, _grpc_helpers.AsyncChannelPool),
+    ],
+)
+def test_transport_channel_pool_size(transport_class, pool_class):
+    cred = ga_credentials.AnonymousCredentials()
+    with mock.patch.object(transport_class, "create_channel") as create_channel:
+        create_channel.side_effect = lambda *args, **kwargs: mock.Mock()
+        transport = transport_class(credentials=cred, channel_pool_size=3)
+
+        assert isinstance(transport.grpc_channel, pool_class)
+        assert transport.channel_pool is transport.grpc_channel
+        assert len(transport.channel_pool.channels) == 3
+        assert create_channel.call_count == 3
+        _, kwargs = create_channel.call_args
+        assert _grpc_helpers.LOCAL_SUBCHANNEL_POOL_OPTION in kwargs["options"]
+
+        create_channel.reset_mock()
+        transport = transport_class(credentials=cred)
+        assert transport.channel_pool is None
+        assert create_channel.call_count == 1
+        _, kwargs = create_channel.call_args
+        assert kwargs["options"] == [
+            ("grpc.max_send_message_length", -1),
+            ("grpc.max_receive_message_length", -1),
+        ]
+
+    with pytest.raises(ValueError):
+        transport_class(credentials=cred, channel_pool_size=0)
+
+
+def test_channel_pool_requires_channels():
+    with pytest.raises(ValueError):
+        _grpc_helpers.ChannelPool([])
+    with pytest.raises(ValueError):
+        _grpc_helpers.AsyncChannelPool([])
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import random
+
+import pytest
+
+from google.cloud.osconfig_v1 import instance_filter
+from google.cloud.osconfig_v1.instance_filter import Instance, InstanceSet
+from google.cloud.osconfig_v1.types import inventory, os_policy_assignments
+
+Filter = os_policy_assignments.OSPolicyAssignment.InstanceFilter
+LabelSet = os_policy_assignments.OSPolicyAssignment.LabelSet
+
+OSES = {
+    "debian": ["10", "11", "11.5", "12"],
+    "rhel": ["7.9", "8.6", "8.7", "9.0"],
+    "windows": ["10.0.17763", "10.0.20348"],
+}
+LABELS = {"env": ["prod", "dev", "test"], "tier": ["web", "db"], "team": ["a", "b"]}
+
+
+def _instances(count, seed=0):
+    rng = random.Random(seed)
+    instances = []
+    for i in range(count):
+        os_short_name = rng.choice(sorted(OSES))
+        labels = {
+            key: rng.choice(values)
+            for key, values in LABELS.items()
+            if rng.random() < 0.8
+        }
+        instances.append(
+            Instance(
+                "projects/p/locations/z/instances/{}".format(i),
+                labels,
+                os_short_name,
+                rng.choice(OSES[os_short_name]),
+            )
+        )
+    return instances
+
+
+FILTERS = [
+    Filter(all_=True),
+    Filter(),
+    Filter(inclusion_labels=[LabelSet(labels={"env": "prod"})]),
+    Filter(
+        inclusion_labels=[
+            LabelSet(labels={"env": "prod", "tier": "web"}),
+            LabelSet(labels={"team": "a"}),
+        ],
+        exclusion_labels=[LabelSet(labels={"tier": "db"})],
+    ),
+    Filter(exclusion_labels=[LabelSet(labels={"env": "dev"})]),
+    Filter(
+        inventories=[
+            Filter.Inventory(os_short_name="debian", os_version="11*"),
+            Filter.Inventory(os_short_name="rhel", os_version="8.6"),
+        ]
+    ),
+    Filter(
+        inclusion_labels=[LabelSet(labels={"env": "test"})],
+        inventories=[Filter.Inventory(os_short_name="windows")],
+    ),
+    Filter(inclusion_labels=[LabelSet(labels={"env": "staging"})]),
+    Filter(inventories=[Filter.Inventory(os_short_name="sles", os_version="15*")]),
+    Filter(inclusion_labels=[LabelSet()]),
+]
+
+
+@pytest.mark.parametrize("index", range(len(FILTERS)))
+def test_select_matches_reference(index):
+    instances = _instances(500)
+    instance_set = InstanceSet(instances)
+    selected = instance_set.select(FILTERS[index])
+    expected = {
+        instance.name
+        for instance in instances
+        if instance_filter.matches(FILTERS[index], instance)
+    }
+    assert selected == expected
+    assert instance_set.count(FILTERS[index]) == len(expected)
+
+
+def test_filter_semantics():
+    instances = _instances(200)
+    instance_set = InstanceSet(instances)
+    assert len(instance_set.select(Filter(all_=True))) == 200
+    assert instance_set.select(Filter()) == set()
+    assert instance_set.select(FILTERS[7]) == set()
+    assert instance_set.select(FILTERS[9]) == {i.name for i in instances}
+    for name in instance_set.select(FILTERS[5]):
+        instance = instances[int(name.rsplit("/", 1)[1])]
+        assert (instance.os_short_name, instance.os_version) in {
+            ("debian", "11"),
+            ("debian", "11.5"),
+            ("rhel", "8.6"),
+        }
+
+
+def test_update_and_remove():
+    instances = _instances(100)
+    instance_set = InstanceSet(instances)
+    prod = Filter(inclusion_labels=[LabelSet(labels={"env": "prod"})])
+    debian12 = Filter(
+        inventories=[Filter.Inventory(os_short_name="debian", os_version="12")]
+    )
+
+    target = instances[0]._replace(labels={"env": "prod"}, os_version="12")
+    target = target._replace(os_short_name="debian")
+    instance_set.update([target])
+    assert len(instance_set) == 100
+    assert target.name in instance_set.select(prod)
+    assert target.name in instance_set.select(debian12)
+
+    assert instance_set.remove(target.name)
+    assert not instance_set.remove(target.name)
+    assert target.name not in instance_set
+    assert target.name not in instance_set.select(prod)
+    assert len(instance_set.select(Filter(all_=True))) == 99
+
+    # The freed slot is reused.
+    instance_set.update([target._replace(name="projects/p/locations/z/instances/x")])
+    assert len(instance_set._instances) == 100
+    assert "projects/p/locations/z/instances/x" in instance_set.select(debian12)
+
+    remaining = list(instance_set)
+    for instance in FILTERS[2:]:
+        assert instance_set.select(instance) == {
+            i.name for i in remaining if instance_filter.matches(instance, i)
+        }
+
+
+def test_from_inventories():
+    inventories = [
+        inventory.Inventory(
+            name="projects/p/locations/z/instances/{}/inventory".format(i),
+            os_info=inventory.Inventory.OsInfo(short_name="debian", version=version),
+        )
+        for i, version in enumerate(["11", "12"])
+    ]
+    instance_set = InstanceSet.from_inventories(
+        inventories, labels={"projects/p/locations/z/instances/1": {"env": "prod"}}
+    )
+    assert instance_set.select(
+        Filter(
+            inclusion_labels=[LabelSet(labels={"env": "prod"})],
+            inventories=[Filter.Inventory(os_short_name="debian", os_version="1*")],
+        )
+    ) == {"projects/p/locations/z/instances/1"}
+
+
+def test_invalid_filters():
+    with pytest.raises(ValueError):
+        instance_filter.compile_filter(
+            Filter(all_=True, inclusion_labels=[LabelSet(labels={"a": "b"})])
+        )
+    with pytest.raises(ValueError):
+        InstanceSet().select(Filter(inventories=[Filter.Inventory(os_version="1")]))
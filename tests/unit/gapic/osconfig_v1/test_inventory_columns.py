@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import pytest
+
+from google.cloud.osconfig_v1 import inventory_columns
+from google.cloud.osconfig_v1.types import inventory
+
+Item = inventory.Inventory.Item
+SoftwarePackage = inventory.Inventory.SoftwarePackage
+
+
+def _inventory(instance, count=2):
+    items = {
+        "apt-{}".format(i): Item(
+            id="apt-{}".format(i),
+            origin_type=Item.OriginType.INVENTORY_REPORT,
+            type_=Item.Type.INSTALLED_PACKAGE,
+            installed_package=SoftwarePackage(
+                apt_package=inventory.Inventory.VersionedPackage(
+                    package_name="pkg{}".format(i),
+                    architecture="amd64",
+                    version="1.{}".format(i),
+                )
+            ),
+        )
+        for i in range(count)
+    }
+    items["wua"] = Item(
+        id="wua",
+        type_=Item.Type.AVAILABLE_PACKAGE,
+        available_package=SoftwarePackage(
+            wua_package=inventory.Inventory.WindowsUpdatePackage(
+                title="KB1", revision_number=7
+            )
+        ),
+    )
+    items["app"] = Item(
+        id="app",
+        installed_package=SoftwarePackage(
+            windows_application=inventory.Inventory.WindowsApplication(
+                display_name="App", display_version="2.0"
+            )
+        ),
+    )
+    items["empty"] = Item(id="empty")
+    return inventory.Inventory(
+        name="projects/p/locations/l/instances/{}/inventory".format(instance),
+        items=items,
+    )
+
+
+def test_iter_rows():
+    rows = sorted(
+        inventory_columns.iter_rows([_inventory("a", count=1)]), key=lambda r: r[1]
+    )
+    assert rows == [
+        (
+            "projects/p/locations/l/instances/a",
+            "app",
+            0,
+            0,
+            "windows_application",
+            "App",
+            "2.0",
+            "",
+        ),
+        (
+            "projects/p/locations/l/instances/a",
+            "apt-0",
+            Item.OriginType.INVENTORY_REPORT,
+            Item.Type.INSTALLED_PACKAGE,
+            "apt_package",
+            "pkg0",
+            "1.0",
+            "amd64",
+        ),
+        (
+            "projects/p/locations/l/instances/a",
+            "wua",
+            0,
+            Item.Type.AVAILABLE_PACKAGE,
+            "wua_package",
+            "KB1",
+            "7",
+            "",
+        ),
+    ]
+
+
+def test_iter_rows_accepts_raw_messages():
+    message = _inventory("a")
+    assert list(inventory_columns.iter_rows([message])) == list(
+        inventory_columns.iter_rows([inventory.Inventory.pb(message)])
+    )
+
+
+def test_iter_column_chunks():
+    inventories = [_inventory(name, count=3) for name in "abc"]
+    chunks = list(inventory_columns.iter_column_chunks(inventories, chunk_size=4))
+
+    assert [len(chunk["name"]) for chunk in chunks] == [4, 4, 4, 3]
+    for chunk in chunks:
+        assert tuple(chunk) == inventory_columns.COLUMNS
+    rows = [row for chunk in chunks for row in zip(*(chunk[c] for c in chunk.keys()))]
+    assert rows == list(inventory_columns.iter_rows(inventories))
+
+    with pytest.raises(ValueError):
+        list(inventory_columns.iter_column_chunks(inventories, chunk_size=0))
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    inventories = [_inventory(name) for name in "ab"]
+    columns = inventory_columns.to_numpy(inventories, chunk_size=3)
+
+    assert set(columns) == set(inventory_columns.COLUMNS)
+    assert columns["origin_type"].dtype == numpy.int32
+    assert columns["name"].dtype == object
+    assert len(columns["instance"]) == 8
+    assert (columns["item_type"] == Item.Type.AVAILABLE_PACKAGE).sum() == 2
+
+    empty = inventory_columns.to_numpy([])
+    assert all(len(column) == 0 for column in empty.values())
+
+
+def test_to_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    inventories = [_inventory(name) for name in "abc"]
+    table = inventory_columns.to_arrow(inventories, chunk_size=5)
+
+    assert table.schema == inventory_columns.arrow_schema()
+    assert table.num_rows == 12
+    assert table.column("instance").num_chunks == 3
+    assert pyarrow.types.is_dictionary(table.schema.field("package_type").type)
+    assert table.to_pydict()["name"] == [
+        row[5] for row in inventory_columns.iter_rows(inventories)
+    ]
+
+    assert inventory_columns.to_arrow([]).num_rows == 0
+
+
+def test_missing_optional_dependencies():
+    with mock.patch.object(inventory_columns, "pyarrow", None):
+        with pytest.raises(ImportError, match="pyarrow"):
+            inventory_columns.to_arrow([])
+    with mock.patch.object(inventory_columns, "numpy", None):
+        with pytest.raises(ImportError, match="numpy"):
+            inventory_columns.to_numpy([])
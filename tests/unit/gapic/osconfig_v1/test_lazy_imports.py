@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import ast
+import importlib
+import inspect
+import json
+import subprocess
+import sys
+
+import pytest
+
+from google.cloud import osconfig, osconfig_v1
+from google.cloud.osconfig_v1 import types
+from google.cloud.osconfig_v1.services import os_config_zonal_service
+
+_LAZY_PACKAGES = (
+    "google.cloud.osconfig",
+    "google.cloud.osconfig_v1",
+    "google.cloud.osconfig_v1.types",
+    "google.cloud.osconfig_v1.services.os_config_service",
+    "google.cloud.osconfig_v1.services.os_config_service.transports",
+    "google.cloud.osconfig_v1.services.os_config_zonal_service",
+    "google.cloud.osconfig_v1.services.os_config_zonal_service.transports",
+)
+
+_HEAVY_MODULES = (
+    "grpc",
+    "requests",
+    "google.auth.transport",
+    "google.cloud.osconfig_v1.services",
+)
+
+
+def _run(code):
+    """Runs ``code`` in a fresh interpreter and returns what it prints as JSON."""
+    output = subprocess.check_output([sys.executable, "-c", code])
+    return json.loads(output)
+
+
+def _loaded_modules(statement):
+    return _run(
+        "import json, sys\n{}\nprint(json.dumps(sorted(sys.modules)))".format(statement)
+    )
+
+
+def _heavy(modules):
+    return [
+        module
+        for module in modules
+        if any(
+            module == heavy or module.startswith(heavy + ".")
+            for heavy in _HEAVY_MODULES
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import google.cloud.osconfig",
+        "import google.cloud.osconfig_v1",
+        "from google.cloud.osconfig_v1 import Inventory",
+        "from google.cloud.osconfig import PatchJob",
+        "from google.cloud.osconfig_v1.types import VulnerabilityReport",
+    ],
+)
+def test_import_does_not_load_transports(statement):
+    assert _heavy(_loaded_modules(statement)) == []
+
+
+def test_import_type_loads_only_its_module():
+    modules = _loaded_modules("from google.cloud.osconfig_v1 import Inventory")
+    assert [m for m in modules if m.startswith("google.cloud.osconfig_v1.types.")] == [
+        "google.cloud.osconfig_v1.types.inventory"
+    ]
+
+
+def test_import_client_loads_only_its_service():
+    modules = _loaded_modules(
+        "from google.cloud.osconfig_v1 import OsConfigServiceClient"
+    )
+    assert "google.cloud.osconfig_v1.services.os_config_service.client" in modules
+    assert "google.cloud.osconfig_v1.services.os_config_zonal_service" not in modules
+
+
+@pytest.mark.parametrize(
+    "package", [osconfig, osconfig_v1, types, os_config_zonal_service]
+)
+def test_lazy_exports(package):
+    for name in package.__all__:
+        value = getattr(package, name)
+        assert value is getattr(package, name)
+        # Resolved names are cached on the module.
+        assert vars(package)[name] is value
+    assert set(package.__all__) <= set(dir(package))
+
+    with pytest.raises(AttributeError, match="NotExported"):
+        package.NotExported
+
+
+@pytest.mark.parametrize("package_name", _LAZY_PACKAGES)
+def test_type_checking_imports_match_lazy_exports(package_name):
+    package = importlib.import_module(package_name)
+    tree = ast.parse(inspect.getsource(package))
+    (block,) = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", "") == "TYPE_CHECKING"
+    ]
+    imported = {}
+    for node in block.body:
+        module = "." * node.level + (node.module or "")
+        imported[module] = tuple(alias.name for alias in node.names)
+    assert imported == {
+        module: tuple(names) for module, names in package._LAZY_SUBMODULES.items()
+    }
+
+
+def test_star_import():
+    namespace = {}
+    exec("from google.cloud.osconfig import *", namespace)
+    assert (
+        namespace["OsConfigZonalServiceClient"]
+        is osconfig_v1.OsConfigZonalServiceClient
+    )
+    assert namespace["Inventory"] is types.Inventory
+
+
+def test_import_loads_a_fraction_of_the_modules():
+    """Importing the package must stay much cheaper than loading everything."""
+    code = (
+        "import json, sys\n"
+        "before = set(sys.modules)\n"
+        "import google.cloud.osconfig\n"
+        "lazy = len(set(sys.modules) - before)\n"
+        "from google.cloud.osconfig import *\n"
+        "print(json.dumps([lazy, len(set(sys.modules) - before)]))\n"
+    )
+    lazy, eager = _run(code)
+    assert lazy < eager / 10, "import loaded {} of {} modules".format(lazy, eager)
+
+
+@pytest.mark.parametrize(
+    "transport,loaded,skipped",
+    [
+        ("rest", "rest", ("grpc", "grpc_asyncio")),
+        ("grpc", "grpc", ("rest", "grpc_asyncio")),
+    ],
+)
+def test_client_loads_only_its_transport(transport, loaded, skipped):
+    package = "google.cloud.osconfig_v1.services.os_config_zonal_service.transports"
+    modules = _loaded_modules(
+        "from google.auth import credentials\n"
+        "from google.cloud.osconfig_v1 import OsConfigZonalServiceClient\n"
+        "OsConfigZonalServiceClient(\n"
+        "    credentials=credentials.AnonymousCredentials(), transport={!r}\n"
+        ")".format(transport)
+    )
+    assert "{}.{}".format(package, loaded) in modules
+    for name in skipped:
+        assert "{}.{}".format(package, name) not in modules
+
+
+def test_transport_registry():
+    from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+        OsConfigZonalServiceClient,
+        transports,
+    )
+
+    registry = transports._transport_registry
+    assert list(registry) == ["grpc", "grpc_asyncio", "rest", "rest_asyncio"]
+    assert len(registry) == 4
+    assert registry["rest"] is transports.OsConfigZonalServiceRestTransport
+    assert (
+        OsConfigZonalServiceClient.get_transport_class()
+        is transports.OsConfigZonalServiceGrpcTransport
+    )
+    with pytest.raises(KeyError):
+        registry["http2"]
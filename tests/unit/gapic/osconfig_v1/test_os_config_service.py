@@ -8359,6 +8359,18 @@ def test_os_config_service_grpc_transport_client_cert_source_for_mtls(transport_
             )
 
 
+def test_os_config_service_http_transport_pool_options():
+    transport = transports.OsConfigServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        pool_maxsize=32,
+        max_retries=2,
+    )
+    for prefix in ("https://", "http://"):
+        adapter = transport._session.adapters[prefix]
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 2
+
+
 def test_os_config_service_http_transport_client_cert_source_for_mtls():
     cred = ga_credentials.AnonymousCredentials()
     with mock.patch(
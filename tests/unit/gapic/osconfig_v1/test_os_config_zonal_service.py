@@ -13,7 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import asyncio
+import concurrent.futures
+import http.server
+import io
 import os
+import socket
+import threading
 
 # try/except added for compatibility with python < 3.8
 try:
@@ -25,6 +31,7 @@ except ImportError:  # pragma: NO COVER
 from collections.abc import Iterable
 import json
 import math
+import time
 
 from google.api_core import (
     future,
@@ -4007,6 +4014,142 @@ def test_list_inventories_pages(transport_name: str = "grpc"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_inventories_pages_prefetch(transport_name: str = "grpc"):
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials,
+        transport=transport_name,
+    )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(type(client.transport.list_inventories), "__call__") as call:
+        # Set the response to a series of pages.
+        call.side_effect = (
+            inventory.ListInventoriesResponse(
+                inventories=[
+                    inventory.Inventory(),
+                    inventory.Inventory(),
+                    inventory.Inventory(),
+                ],
+                next_page_token="abc",
+            ),
+            inventory.ListInventoriesResponse(
+                inventories=[],
+                next_page_token="def",
+            ),
+            inventory.ListInventoriesResponse(
+                inventories=[
+                    inventory.Inventory(),
+                ],
+                next_page_token="ghi",
+            ),
+            inventory.ListInventoriesResponse(
+                inventories=[
+                    inventory.Inventory(),
+                    inventory.Inventory(),
+                ],
+            ),
+            RuntimeError,
+        )
+        pager = client.list_inventories(request={}, prefetch=2)
+        pages = list(pager.pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+        assert len(pages) == 4
+        assert pager.next_page_token == ""
+        tokens = [c.args[0].page_token for c in call.call_args_list[1:]]
+        assert tokens == ["abc", "def", "ghi"]
+
+
+def test_list_inventories_pager_prefetch_bounded():
+    responses = {
+        "": inventory.ListInventoriesResponse(
+            inventories=[inventory.Inventory(name="a" * 64)],
+            next_page_token="1",
+        ),
+        "1": inventory.ListInventoriesResponse(
+            inventories=[inventory.Inventory(name="b" * 64)],
+            next_page_token="2",
+        ),
+        "2": inventory.ListInventoriesResponse(
+            inventories=[inventory.Inventory(name="c" * 64)],
+            next_page_token="3",
+        ),
+        "3": inventory.ListInventoriesResponse(
+            inventories=[inventory.Inventory(name="d" * 64)],
+        ),
+    }
+    fetched = []
+    # The number of pages the caller asked for, counted before each request
+    # so that the worker can only observe it ahead of the page being taken.
+    requested = [0]
+    ahead = []
+    fetched_2 = threading.Event()
+
+    def method(request, metadata=()):
+        fetched.append(request.page_token)
+        # The initial page and the pages fetched so far, minus the pages
+        # the caller asked for.
+        ahead.append(1 + len(fetched) - requested[0])
+        if request.page_token == "2":
+            fetched_2.set()
+        return responses[request.page_token]
+
+    pager = pagers.ListInventoriesPager(
+        method=method,
+        request=inventory.ListInventoriesRequest(),
+        response=responses[""],
+        prefetch=3,
+        prefetch_max_bytes=1,
+    )
+
+    def take(pages):
+        requested[0] += 1
+        return next(pages)
+
+    pages = iter(pager.pages)
+    take(pages)
+    take(pages)
+    # The worker fetches the next page while the caller holds this one.
+    assert fetched_2.wait(timeout=5)
+    assert [take(pages).inventories[0].name[0] for _ in range(2)] == ["c", "d"]
+    with pytest.raises(StopIteration):
+        take(pages)
+    assert fetched == ["1", "2", "3"]
+    # The byte budget admits a single buffered page at a time, so the
+    # worker never runs more than one page ahead of the caller.
+    assert max(ahead) == 1
+
+
+def test_list_inventories_pager_prefetch_error():
+    def method(request, metadata=()):
+        raise core_exceptions.ServiceUnavailable("unavailable")
+
+    pager = pagers.ListInventoriesPager(
+        method=method,
+        request=inventory.ListInventoriesRequest(),
+        response=inventory.ListInventoriesResponse(
+            inventories=[inventory.Inventory()],
+            next_page_token="abc",
+        ),
+        prefetch=2,
+    )
+    results = []
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        for result in pager:
+            results.append(result)
+    assert len(results) == 1
+
+
+def test_list_inventories_pager_prefetch_invalid():
+    with pytest.raises(ValueError):
+        pagers.ListInventoriesPager(
+            method=mock.Mock(),
+            request=inventory.ListInventoriesRequest(),
+            response=inventory.ListInventoriesResponse(),
+            prefetch=-1,
+        )
+
+
 @pytest.mark.asyncio
 async def test_list_inventories_async_pager():
     client = OsConfigZonalServiceAsyncClient(
@@ -4104,6 +4247,65 @@ async def test_list_inventories_async_pages():
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_fan_out_list_inventories():
+    client = OsConfigZonalServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+    parents = ["projects/p/locations/zone-%d/instances/-" % i for i in range(5)]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def list_inventories(request, **kwargs):
+        nonlocal in_flight, max_in_flight
+        assert request.view == inventory.InventoryView.FULL
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.parent == parents[2]:
+            raise core_exceptions.PermissionDenied("denied")
+        if not request.page_token:
+            return inventory.ListInventoriesResponse(
+                inventories=[inventory.Inventory(name=request.parent + "/a")],
+                next_page_token="abc",
+            )
+        return inventory.ListInventoriesResponse(
+            inventories=[inventory.Inventory(name=request.parent + "/b")],
+        )
+
+    # Mock the actual call within the gRPC stub, and fake the request.
+    with mock.patch.object(
+        type(client.transport.list_inventories), "__call__", new_callable=mock.AsyncMock
+    ) as call:
+        call.side_effect = list_inventories
+        results = client.fan_out(
+            "list_inventories",
+            parents + [parents[0]],
+            {"view": inventory.InventoryView.FULL},
+            max_concurrency=2,
+        )
+        responses = []
+        async for parent, response in results:  # pragma: no branch
+            assert response.name.startswith(parent)
+            responses.append(response.name)
+
+    assert len(responses) == 8
+    assert max_in_flight <= 2
+    assert list(results.errors) == [parents[2]]
+    assert isinstance(results.errors[parents[2]], core_exceptions.PermissionDenied)
+    assert results.counts == {p: 2 for p in parents if p != parents[2]}
+
+
+@pytest.mark.asyncio
+async def test_fan_out_unsupported_method():
+    client = OsConfigZonalServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials,
+    )
+    with pytest.raises(ValueError):
+        client.fan_out("get_inventory", ["projects/p/locations/l/instances/-"])
+
+
 @pytest.mark.parametrize(
     "request_type",
     [
@@ -8485,6 +8687,123 @@ def test_list_inventories_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_inventories_rest_stream_pager():
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport="rest",
+    )
+    pages = (
+        inventory.ListInventoriesResponse(
+            inventories=[
+                inventory.Inventory(name="a"),
+                inventory.Inventory(name="b"),
+            ],
+            next_page_token="abc",
+        ),
+        inventory.ListInventoriesResponse(
+            inventories=[],
+            next_page_token="def",
+        ),
+        inventory.ListInventoriesResponse(
+            inventories=[
+                inventory.Inventory(
+                    name="c",
+                    os_info=inventory.Inventory.OsInfo(hostname='"}]'),
+                ),
+            ],
+        ),
+    )
+
+    def make_response(page):
+        payload = json_format.MessageToJson(
+            inventory.ListInventoriesResponse.pb(page)
+        ).encode("UTF-8")
+        response_value = Response()
+        response_value.status_code = 200
+        response_value.raw = io.BytesIO(payload)
+        return response_value
+
+    with mock.patch.object(Session, "request") as req:
+        req.side_effect = [make_response(page) for page in pages]
+        pager = client.list_inventories(
+            request={"parent": "projects/sample1/locations/sample2/instances/-"},
+            stream=True,
+        )
+        assert isinstance(pager, pagers.ListInventoriesStreamPager)
+        results = list(pager)
+
+    assert [i.name for i in results] == ["a", "b", "c"]
+    assert results[2].os_info.hostname == '"}]'
+    assert pager.next_page_token == ""
+    assert all(call.kwargs["stream"] for call in req.call_args_list)
+    tokens = [call.kwargs["params"] for call in req.call_args_list]
+    assert ("pageToken", "abc") in tokens[1]
+    assert ("pageToken", "def") in tokens[2]
+
+
+def test_list_inventories_rest_stream_partial_page():
+    transport = transports.OsConfigZonalServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    payload = json_format.MessageToJson(
+        inventory.ListInventoriesResponse.pb(
+            inventory.ListInventoriesResponse(
+                inventories=[inventory.Inventory(name="a")] * 3,
+                next_page_token="abc",
+            )
+        )
+    ).encode("UTF-8")
+    response_value = Response()
+    response_value.status_code = 200
+    response_value.raw = io.BytesIO(payload)
+
+    with mock.patch.object(Session, "request", return_value=response_value):
+        response = transport.list_inventories_stream(
+            inventory.ListInventoriesRequest(
+                parent="projects/p/locations/l/instances/-"
+            )
+        )
+    with pytest.raises(RuntimeError):
+        response.next_page_token
+    assert next(iter(response)).name == "a"
+    response.finish()
+    assert response.done
+    assert response.next_page_token == "abc"
+
+
+def test_list_inventories_rest_stream_truncated():
+    transport = transports.OsConfigZonalServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    response_value = Response()
+    response_value.status_code = 200
+    response_value.raw = io.BytesIO(b'{"inventories": [{"name": "a"}, {"na')
+
+    with mock.patch.object(Session, "request", return_value=response_value):
+        response = transport.list_inventories_stream(
+            inventory.ListInventoriesRequest(
+                parent="projects/p/locations/l/instances/-"
+            )
+        )
+    with pytest.raises(ValueError):
+        list(response)
+
+
+def test_list_inventories_stream_requires_rest():
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport="grpc",
+    )
+    with pytest.raises(ValueError):
+        client.list_inventories(request={}, stream=True)
+    rest_client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport="rest",
+    )
+    with pytest.raises(ValueError):
+        rest_client.list_inventories(request={}, stream=True, prefetch=2)
+
+
 @pytest.mark.parametrize(
     "request_type",
     [
@@ -9469,6 +9788,83 @@ def test_os_config_zonal_service_http_transport_client_cert_source_for_mtls():
         mock_configure_mtls_channel.assert_called_once_with(client_cert_source_callback)
 
 
+def test_os_config_zonal_service_http_transport_pool_options():
+    transport = transports.OsConfigZonalServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        pool_connections=4,
+        pool_maxsize=32,
+        pool_block=True,
+        max_retries=3,
+        tcp_keepalive=30,
+    )
+    for prefix in ("https://", "http://"):
+        adapter = transport._session.adapters[prefix]
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert adapter.max_retries.total == 3
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+def test_os_config_zonal_service_http_transport_connection_reuse():
+    connections = set()
+    lock = threading.Lock()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            with lock:
+                connections.add(self.client_address)
+            body = json_format.MessageToJson(
+                inventory.Inventory.pb(
+                    inventory.Inventory(name=self.path.split("?")[0])
+                )
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+    server.daemon_threads = True
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    threads, calls = 16, 20
+    transport = transports.OsConfigZonalServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        host="localhost:{}".format(server.server_address[1]),
+        url_scheme="http",
+        pool_maxsize=threads,
+        pool_block=True,
+    )
+    client = OsConfigZonalServiceClient(transport=transport)
+    name = "projects/p/locations/l/instances/i/inventory"
+
+    def worker():
+        for _ in range(calls):
+            assert client.get_inventory(name=name).name.endswith("/inventory")
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+            for future in [executor.submit(worker) for _ in range(threads)]:
+                future.result()
+    finally:
+        transport.close()
+        server.shutdown()
+        server.server_close()
+
+    # Every thread reuses a pooled keep-alive connection instead of opening
+    # a new one per request.
+    assert 1 <= len(connections) <= threads
+
+
 def test_os_config_zonal_service_rest_lro_client():
     client = OsConfigZonalServiceClient(
         credentials=ga_credentials.AnonymousCredentials(),
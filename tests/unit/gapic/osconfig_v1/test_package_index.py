@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.protobuf import timestamp_pb2  # type: ignore
+import pytest
+
+from google.cloud.osconfig_v1 import package_index
+from google.cloud.osconfig_v1.types import inventory
+
+Item = inventory.Inventory.Item
+SoftwarePackage = inventory.Inventory.SoftwarePackage
+
+
+@pytest.mark.parametrize(
+    "older,newer",
+    [
+        ("1.0~rc1", "1.0"),
+        ("1.0~~", "1.0~"),
+        ("1.0", "1.0a"),
+        ("1.0", "1.0+b1"),
+        ("1.0-1", "1.0-2"),
+        ("1.0-9", "1.0-10"),
+        ("2.0", "1:0.1"),
+        ("3.0.2-0ubuntu1.6", "3.0.2-0ubuntu1.10"),
+        ("1.2.3", "1.2.3.0"),
+    ],
+)
+def test_dpkg_compare(older, newer):
+    assert package_index.dpkg_compare(older, newer) < 0
+    assert package_index.dpkg_compare(newer, older) > 0
+    assert package_index.dpkg_compare(newer, newer) == 0
+
+
+def test_dpkg_compare_leading_zeros():
+    assert package_index.dpkg_compare("1.01", "1.1") == 0
+    assert package_index.dpkg_compare("0:1.0", "1.0") == 0
+
+
+@pytest.mark.parametrize(
+    "older,newer",
+    [
+        ("1.0~rc1", "1.0"),
+        ("1.0", "1.0^git1"),
+        ("1.0^git1", "1.0.1"),
+        ("1.a", "1.0"),
+        ("2.0", "2.0a"),
+        ("1.1.1k-7.el8", "1.1.1k-8.el8"),
+        ("1.1.1k-9.el8", "1.1.1k-10.el8"),
+        ("5.0-1", "1:1.0-1"),
+        ("1.10", "1.010.1"),
+    ],
+)
+def test_rpm_compare(older, newer):
+    assert package_index.rpm_compare(older, newer) < 0
+    assert package_index.rpm_compare(newer, older) > 0
+    assert package_index.rpm_compare(newer, newer) == 0
+
+
+def test_rpm_compare_release_optional():
+    assert package_index.rpm_compare("1.0", "1.0-5") == 0
+    assert package_index.rpm_compare("1.0_1", "1.0.1") == 0
+
+
+@pytest.mark.parametrize(
+    "older,newer",
+    [
+        ("10.0.9200", "10.0.19041.1"),
+        ("2.1.0@3", "2.1.0@10"),
+        ("1.0", "1.0.1"),
+        ("1.0.0", "1.0.beta"),
+    ],
+)
+def test_windows_compare(older, newer):
+    assert package_index.windows_compare(older, newer) < 0
+    assert package_index.windows_compare(newer, older) > 0
+    assert package_index.windows_compare("1.0", "1.0.0") == 0
+
+
+def test_compare_versions():
+    assert package_index.compare_versions("1.0~rc1", "1.0", package_index.DPKG) < 0
+    with pytest.raises(ValueError):
+        package_index.compare_versions("1", "2", "pacman")
+
+
+def _versioned(name, version, architecture="x86_64"):
+    return inventory.Inventory.VersionedPackage(
+        package_name=name, version=version, architecture=architecture
+    )
+
+
+def _inventory(instance, packages, seconds=None, available=()):
+    items = {}
+    for package_type, name, version in packages:
+        if package_type == "windows_application":
+            details = inventory.Inventory.WindowsApplication(
+                display_name=name, display_version=version
+            )
+        else:
+            details = _versioned(name, version)
+        items["{}-{}".format(package_type, name)] = Item(
+            type_=Item.Type.INSTALLED_PACKAGE,
+            installed_package=SoftwarePackage(**{package_type: details}),
+        )
+    for name, version in available:
+        items["available-" + name] = Item(
+            type_=Item.Type.AVAILABLE_PACKAGE,
+            available_package=SoftwarePackage(apt_package=_versioned(name, version)),
+        )
+    items["kb"] = Item(
+        type_=Item.Type.INSTALLED_PACKAGE,
+        installed_package=SoftwarePackage(
+            qfe_package=inventory.Inventory.WindowsQuickFixEngineeringPackage(
+                hot_fix_id="KB1"
+            )
+        ),
+    )
+    return inventory.Inventory(
+        name="projects/p/locations/l/instances/{}/inventory".format(instance),
+        items=items,
+        update_time=None
+        if seconds is None
+        else timestamp_pb2.Timestamp(seconds=seconds),
+    )
+
+
+def _instance(name):
+    return "projects/p/locations/l/instances/" + name
+
+
+def _fleet():
+    return [
+        _inventory("deb1", [("apt_package", "openssl", "3.0.2-0ubuntu1.6")], 10),
+        _inventory("deb2", [("apt_package", "openssl", "3.0.7-1")], 10),
+        _inventory("deb3", [("apt_package", "openssl", "3.0.7~rc1-1")], 10),
+        _inventory("rhel1", [("yum_package", "openssl", "1:1.1.1k-7.el8")], 10),
+        _inventory("rhel2", [("yum_package", "openssl", "3.0.1-43.el9")], 10),
+        _inventory("win1", [("windows_application", "Chrome", "118.0.5993.89")], 10),
+    ]
+
+
+def test_index_find():
+    index = package_index.PackageVersionIndex(_fleet())
+
+    assert len(index) == 6
+    assert sorted(index.packages) == ["Chrome", "openssl"]
+    assert "KB1" not in index
+
+    assert index.instances_with("openssl", lt="3.0.7") == {
+        _instance("deb1"),
+        _instance("deb3"),
+        _instance("rhel2"),
+    }
+    assert index.instances_with("openssl", ge="3.0.7", scheme="dpkg") == {
+        _instance("deb2")
+    }
+    assert index.instances_with("openssl", eq="3.0.7-1") == {_instance("deb2")}
+    assert index.instances_with("openssl", gt="3.0.2-0ubuntu1.6", le="3.0.7-1") == {
+        _instance("deb3"),
+        _instance("deb2"),
+    }
+    assert index.instances_with("Chrome", lt="118.0.6000") == {_instance("win1")}
+    assert index.find("missing", lt="1") == []
+
+    postings = index.find("openssl", scheme=package_index.RPM)
+    assert [posting.version for posting in postings] == [
+        "3.0.1-43.el9",
+        "1:1.1.1k-7.el8",
+    ]
+    assert postings[0].package_type == "yum_package"
+
+
+def test_index_find_invalid_bounds():
+    index = package_index.PackageVersionIndex(_fleet())
+    with pytest.raises(ValueError):
+        index.find("openssl", lt="1", le="2")
+    with pytest.raises(ValueError):
+        index.find("openssl", gt="1", ge="2")
+    with pytest.raises(ValueError):
+        index.find("openssl", eq="1", lt="2")
+    with pytest.raises(ValueError):
+        index.find("openssl", scheme="pacman")
+
+
+def test_index_incremental_update():
+    index = package_index.PackageVersionIndex(_fleet())
+
+    # Stale and unchanged snapshots are ignored.
+    assert (
+        index.update(
+            [
+                _inventory("deb1", [("apt_package", "openssl", "1.0")], 5),
+                _inventory("deb2", [("apt_package", "openssl", "1.0")], 10),
+            ]
+        )
+        == 0
+    )
+    assert index.instances_with("openssl", lt="3.0.0") == set()
+
+    # A newer snapshot replaces the postings of its instance.
+    assert (
+        index.update(
+            [
+                _inventory(
+                    "deb1",
+                    [
+                        ("apt_package", "openssl", "3.0.8-1"),
+                        ("apt_package", "curl", "8.0"),
+                    ],
+                    20,
+                ),
+                _inventory("new", [("apt_package", "openssl", "3.0.0")]),
+            ]
+        )
+        == 2
+    )
+    assert index.instances_with("openssl", lt="3.0.7") == {
+        _instance("deb3"),
+        _instance("rhel2"),
+        _instance("new"),
+    }
+    assert index.instances_with("curl") == {_instance("deb1")}
+
+    # Inventories without an update_time are always reindexed.
+    assert index.update([_inventory("new", [])]) == 1
+    assert _instance("new") in index.instances
+
+    assert index.remove(_instance("deb1"))
+    assert not index.remove(_instance("deb1"))
+    assert "curl" not in index
+
+
+def test_index_include_available():
+    inventories = [_inventory("a", [], 1, available=[("openssl", "3.0.2-0ubuntu1.12")])]
+    assert len(package_index.PackageVersionIndex(inventories)) == 0
+
+    index = package_index.PackageVersionIndex(inventories, include_available=True)
+    assert index.instances_with("openssl", gt="3.0.2-0ubuntu1.6") == {_instance("a")}
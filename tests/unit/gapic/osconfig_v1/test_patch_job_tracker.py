@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import concurrent.futures
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+import pytest
+
+from google.cloud.osconfig_v1 import patch_job_tracker
+from google.cloud.osconfig_v1.services.os_config_service import OsConfigServiceClient
+from google.cloud.osconfig_v1.types import patch_jobs
+
+State = patch_jobs.PatchJob.State
+
+
+def _job(name, state=State.PATCHING, percent=0.0, **counts):
+    return patch_jobs.PatchJob(
+        name=name,
+        state=state,
+        percent_complete=percent,
+        instance_details_summary=patch_jobs.PatchJob.InstanceDetailsSummary(**counts),
+    )
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _FakeClient:
+    """Returns scripted patch job states; the last one repeats."""
+
+    def __init__(self, scripts):
+        self.scripts = {name: list(states) for name, states in scripts.items()}
+        self.calls = []
+
+    def get_patch_job(self, name, **kwargs):
+        self.calls.append(name)
+        script = self.scripts[name]
+        result = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _tracker(client, clock, **kwargs):
+    kwargs.setdefault("initial_interval", 10.0)
+    kwargs.setdefault("min_interval", 1.0)
+    kwargs.setdefault("max_interval", 40.0)
+    kwargs.setdefault("backoff", 2.0)
+    return patch_job_tracker.PatchJobTracker(client, clock=clock, **kwargs)
+
+
+def test_poll_once_events_and_backoff():
+    client = _FakeClient(
+        {
+            "a": [
+                _job("a", pending_instance_count=4),
+                _job("a", pending_instance_count=4),
+                _job("a", pending_instance_count=4),
+                _job(
+                    "a",
+                    percent=10.0,
+                    pending_instance_count=3,
+                    started_instance_count=1,
+                ),
+            ]
+        }
+    )
+    clock = _FakeClock()
+    with _tracker(client, clock) as tracker:
+        tracker.track("a")
+        tracker.track("a")
+        assert tracker.tracked == ["a"]
+
+        (event,) = tracker.poll_once()
+        assert event.previous is None
+        assert event.state_changed
+        assert event.summary_deltas == {"pending_instance_count": 4}
+        assert tracker.next_poll_in() == 10.0
+
+        # Not due yet.
+        assert tracker.poll_once() == []
+        assert client.calls == ["a"]
+
+        # Unchanged jobs back off, up to max_interval.
+        clock.now = 10.0
+        assert tracker.poll_once() == []
+        assert tracker.next_poll_in() == 20.0
+        clock.now = 30.0
+        assert tracker.poll_once() == []
+        assert tracker.next_poll_in() == 40.0
+
+        clock.now = 70.0
+        (event,) = tracker.poll_once()
+        assert not event.state_changed
+        assert event.percent_complete_delta == 10.0
+        assert event.summary_deltas == {
+            "pending_instance_count": -1,
+            "started_instance_count": 1,
+        }
+        assert not event.done
+        # A change resets the interval.
+        assert tracker.next_poll_in() == 10.0
+
+
+def test_poll_once_speeds_up_near_completion():
+    client = _FakeClient(
+        {
+            "a": [
+                _job("a", percent=10.0),
+                _job("a", percent=70.0),
+                _job("a", percent=95.0),
+                _job(
+                    "a",
+                    state=State.SUCCEEDED,
+                    percent=100.0,
+                    succeeded_instance_count=2,
+                ),
+            ]
+        }
+    )
+    clock = _FakeClock()
+    with _tracker(client, clock) as tracker:
+        tracker.track("a")
+        tracker.poll_once()
+        assert tracker.next_poll_in() == 10.0
+
+        # 60% in 10s: the remaining 30% should take 5s, so poll in 2.5s.
+        clock.now = 10.0
+        tracker.poll_once()
+        assert tracker.next_poll_in() == 2.5
+
+        clock.now = 12.5
+        tracker.poll_once()
+        assert tracker.next_poll_in() == 1.0
+
+        clock.now = 13.5
+        (event,) = tracker.poll_once()
+        assert event.done
+        assert event.state_changed
+        assert event.summary_deltas == {"succeeded_instance_count": 2}
+        assert len(tracker) == 0
+        assert tracker.next_poll_in() is None
+
+
+def test_poll_once_errors():
+    error = core_exceptions.ServiceUnavailable("unavailable")
+    client = _FakeClient({"a": [error, _job("a")]})
+    clock = _FakeClock()
+    with _tracker(client, clock) as tracker:
+        tracker.track("a")
+        (event,) = tracker.poll_once()
+        assert event.error is error
+        assert event.job is None
+        assert not event.state_changed
+        assert tracker.next_poll_in() == 20.0
+
+        clock.now = 20.0
+        (event,) = tracker.poll_once()
+        assert event.error is None
+        assert event.job == _job("a")
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        core_exceptions.NotFound("not found"),
+        core_exceptions.PermissionDenied("denied"),
+    ],
+)
+def test_poll_once_permanent_errors(error):
+    client = _FakeClient({"a": [_job("a"), error], "b": [_job("b")]})
+    clock = _FakeClock()
+    with _tracker(client, clock) as tracker:
+        tracker.track("a")
+        tracker.track("b")
+        tracker.poll_once()
+
+        clock.now = 10.0
+        (event,) = tracker.poll_once()
+        assert event.name == "a"
+        assert event.done
+        assert event.error is error
+        assert event.job == _job("a")
+        assert tracker.tracked == ["b"]
+
+
+def test_poll_once_after_close():
+    client = _FakeClient({"a": [_job("a")]})
+    tracker = _tracker(client, _FakeClock())
+    tracker.track("a")
+    tracker.close()
+    # The owned executor is shut down; nothing is submitted to it.
+    assert tracker.poll_once() == []
+    assert client.calls == []
+    assert list(tracker.events()) == []
+
+
+def test_poll_once_shared_executor():
+    client = _FakeClient({name: [_job(name)] for name in "abc"})
+    executor = mock.Mock(wraps=concurrent.futures.ThreadPoolExecutor(max_workers=2))
+    clock = _FakeClock()
+    tracker = _tracker(client, clock, executor=executor)
+    for name in "abc":
+        tracker.track(name)
+
+    assert sorted(event.name for event in tracker.poll_once()) == ["a", "b", "c"]
+    assert executor.submit.call_count == 3
+    tracker.untrack("b")
+    assert tracker.tracked == ["a", "c"]
+
+    tracker.close()
+    executor.shutdown.assert_not_called()
+    executor.shutdown(wait=True)
+
+
+def test_events():
+    client = _FakeClient(
+        {
+            "a": [_job("a"), _job("a", percent=50.0), _job("a", state=State.SUCCEEDED)],
+            "b": [_job("b", state=State.CANCELED)],
+        }
+    )
+    tracker = patch_job_tracker.PatchJobTracker(
+        client, initial_interval=0.01, min_interval=0.0, max_interval=0.05
+    )
+    tracker.track("a")
+    tracker.track("b")
+    events = [(event.name, event.done) for event in tracker.events()]
+    tracker.close()
+
+    assert sorted(events) == [
+        ("a", False),
+        ("a", False),
+        ("a", True),
+        ("b", True),
+    ]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        patch_job_tracker.PatchJobTracker(None, min_interval=10.0, initial_interval=1.0)
+    with pytest.raises(ValueError):
+        patch_job_tracker.PatchJobTracker(None, backoff=0.5)
+
+
+def test_tracker_with_client():
+    client = OsConfigServiceClient(credentials=ga_credentials.AnonymousCredentials())
+    with mock.patch.object(type(client.transport.get_patch_job), "__call__") as call:
+        call.return_value = _job("projects/p/patchJobs/j", state=State.SUCCEEDED)
+        with patch_job_tracker.PatchJobTracker(client) as tracker:
+            tracker.track("projects/p/patchJobs/j")
+            events = list(tracker.events())
+
+    assert [event.done for event in events] == [True]
+    _, args, _ = call.mock_calls[0]
+    assert args[0] == patch_jobs.GetPatchJobRequest(name="projects/p/patchJobs/j")
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import datetime
+
+from google.protobuf import duration_pb2, timestamp_pb2
+from google.type import datetime_pb2, dayofweek_pb2, timeofday_pb2
+import pytest
+
+from google.cloud.osconfig_v1 import patch_schedules
+from google.cloud.osconfig_v1.types import patch_deployments
+
+numpy = pytest.importorskip("numpy")
+pytest.importorskip("zoneinfo")
+
+RecurringSchedule = patch_deployments.RecurringSchedule
+Frequency = RecurringSchedule.Frequency
+UTC = datetime.timezone.utc
+
+
+def _deployment(name, time_zone="UTC", hours=2, minutes=30, **kwargs):
+    return patch_deployments.PatchDeployment(
+        name=name,
+        recurring_schedule=RecurringSchedule(
+            time_zone=datetime_pb2.TimeZone(id=time_zone),
+            time_of_day=timeofday_pb2.TimeOfDay(hours=hours, minutes=minutes),
+            **kwargs,
+        ),
+    )
+
+
+def _monthly(name, **kwargs):
+    return _deployment(
+        name,
+        frequency=Frequency.MONTHLY,
+        monthly=patch_deployments.MonthlySchedule(**kwargs),
+    )
+
+
+def _times(*values):
+    return numpy.array(values, dtype="datetime64[s]")
+
+
+AFTER = datetime.datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def test_daily_and_weekly():
+    deployments = [
+        _deployment("daily", frequency=Frequency.DAILY),
+        _deployment(
+            "weekly",
+            frequency=Frequency.WEEKLY,
+            weekly=patch_deployments.WeeklySchedule(day_of_week=dayofweek_pb2.TUESDAY),
+        ),
+    ]
+    result = patch_schedules.next_executions(deployments, 3, after=AFTER)
+    assert result.shape == (2, 3)
+    numpy.testing.assert_array_equal(
+        result[0],
+        _times("2026-01-01T02:30", "2026-01-02T02:30", "2026-01-03T02:30"),
+    )
+    numpy.testing.assert_array_equal(
+        result[1],
+        _times("2026-01-06T02:30", "2026-01-13T02:30", "2026-01-20T02:30"),
+    )
+
+
+def test_monthly():
+    deployments = [
+        # Months without a 31st are skipped.
+        _monthly("31st", month_day=31),
+        _monthly("last", month_day=-1),
+        # Three days after the second Tuesday.
+        _monthly(
+            "week-day",
+            week_day_of_month=patch_deployments.WeekDayOfMonth(
+                week_ordinal=2, day_of_week=dayofweek_pb2.TUESDAY, day_offset=3
+            ),
+        ),
+        # Two days before the last Monday, possibly in the previous month.
+        _monthly(
+            "last-week-day",
+            week_day_of_month=patch_deployments.WeekDayOfMonth(
+                week_ordinal=-1, day_of_week=dayofweek_pb2.MONDAY, day_offset=-2
+            ),
+        ),
+    ]
+    result = patch_schedules.next_executions(deployments, 3, after=AFTER)
+    expected = [
+        ("2026-01-31", "2026-03-31", "2026-05-31"),
+        ("2026-01-31", "2026-02-28", "2026-03-31"),
+        ("2026-01-16", "2026-02-13", "2026-03-13"),
+        ("2026-01-24", "2026-02-21", "2026-03-28"),
+    ]
+    for row, dates in zip(result, expected):
+        numpy.testing.assert_array_equal(
+            row, _times(*(date + "T02:30" for date in dates))
+        )
+
+
+def test_time_zones_and_daylight_saving():
+    deployments = [
+        _deployment("new-york", "America/New_York", frequency=Frequency.DAILY),
+        _deployment("tokyo", "Asia/Tokyo", hours=1, frequency=Frequency.DAILY),
+    ]
+    # New York switches to daylight saving time at 2:00 on 2026-03-08.
+    result = patch_schedules.next_executions(
+        deployments, 3, after=datetime.datetime(2026, 3, 7, tzinfo=UTC)
+    )
+    numpy.testing.assert_array_equal(
+        result[0],
+        # 2:30 does not exist on 2026-03-08: it runs at 3:30 EDT.
+        _times("2026-03-07T07:30", "2026-03-08T07:30", "2026-03-09T06:30"),
+    )
+    numpy.testing.assert_array_equal(
+        result[1],
+        _times("2026-03-07T16:30", "2026-03-08T16:30", "2026-03-09T16:30"),
+    )
+
+
+def test_start_end_one_time_and_paused():
+    one_time = patch_deployments.PatchDeployment(
+        name="one-time",
+        one_time_schedule=patch_deployments.OneTimeSchedule(
+            execute_time=timestamp_pb2.Timestamp(seconds=int(AFTER.timestamp()) + 60)
+        ),
+    )
+    bounded = _deployment(
+        "bounded",
+        frequency=Frequency.DAILY,
+        start_time=timestamp_pb2.Timestamp(seconds=int(AFTER.timestamp()) + 86400),
+        end_time=timestamp_pb2.Timestamp(seconds=int(AFTER.timestamp()) + 3 * 86400),
+    )
+    paused = _deployment("paused", frequency=Frequency.DAILY)
+    paused.state = patch_deployments.PatchDeployment.State.PAUSED
+    result = patch_schedules.next_executions(
+        [one_time, bounded, paused], 3, after=AFTER
+    )
+    numpy.testing.assert_array_equal(
+        result,
+        _times(
+            "2026-01-01T00:01",
+            "NaT",
+            "NaT",
+            "2026-01-02T02:30",
+            "2026-01-03T02:30",
+            "NaT",
+            "NaT",
+            "NaT",
+            "NaT",
+        ).reshape(3, 3),
+    )
+    assert not numpy.isnat(
+        patch_schedules.next_executions([paused], 1, after=AFTER, include_paused=True)
+    ).any()
+
+
+def test_expand_and_overlaps():
+    deployments = [
+        _deployment("daily", frequency=Frequency.DAILY),
+        _deployment(
+            "weekly",
+            minutes=0,
+            frequency=Frequency.WEEKLY,
+            weekly=patch_deployments.WeeklySchedule(day_of_week=dayofweek_pb2.SUNDAY),
+        ),
+        _deployment("late", hours=4, frequency=Frequency.DAILY),
+    ]
+    deployments[1].duration = duration_pb2.Duration(seconds=7200)
+    executions = patch_schedules.expand(
+        deployments, AFTER, AFTER + datetime.timedelta(days=14)
+    )
+    assert len(executions) == 14 + 2 + 14
+    assert (numpy.diff(executions.start) >= numpy.timedelta64(0, "s")).all()
+    assert executions.conflicts() == [("daily", "weekly")]
+
+    sunday = datetime.datetime(2026, 1, 4, 3, tzinfo=UTC)
+    assert executions.deployments_overlapping(
+        sunday, sunday + datetime.timedelta(minutes=1)
+    ) == ["daily", "weekly"]
+    assert executions.deployments_overlapping(
+        sunday, sunday + datetime.timedelta(hours=1, minutes=31)
+    ) == ["daily", "late", "weekly"]
+    assert (
+        executions.deployments_overlapping(
+            datetime.datetime(2026, 1, 5, 5, 30, tzinfo=UTC),
+            datetime.datetime(2026, 1, 6, 2, 30, tzinfo=UTC),
+        )
+        == []
+    )
+
+    with pytest.raises(ValueError):
+        patch_schedules.expand(deployments, datetime.datetime(2026, 1, 1), AFTER)
+
+
+def test_many_deployments():
+    time_zones = ("UTC", "Europe/Paris", "Asia/Kolkata", "America/Los_Angeles")
+    deployments = [
+        _deployment(
+            "d{}".format(i),
+            time_zones[i % len(time_zones)],
+            hours=i % 24,
+            minutes=i % 60,
+            frequency=Frequency.WEEKLY,
+            weekly=patch_deployments.WeeklySchedule(day_of_week=1 + i % 7),
+        )
+        for i in range(500)
+    ]
+    result = patch_schedules.next_executions(deployments, 60, after=AFTER)
+    assert not numpy.isnat(result).any()
+    assert (numpy.diff(result, axis=1) > numpy.timedelta64(6, "D")).all()
+    executions = patch_schedules.expand(
+        deployments, AFTER, AFTER + datetime.timedelta(days=70)
+    )
+    assert len(executions) == 500 * 10
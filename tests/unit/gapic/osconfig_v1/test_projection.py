@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import json
+
+from google.auth import credentials as ga_credentials
+from google.protobuf import json_format
+import pytest
+from requests import Response
+
+from google.cloud.osconfig_v1.services import projection, rest_codecs
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceAsyncClient,
+    OsConfigZonalServiceClient,
+    transports,
+)
+from google.cloud.osconfig_v1.services.projection import (
+    REPORT_COMPLIANCE,
+    FieldProjection,
+)
+from google.cloud.osconfig_v1.types import os_policy_assignment_reports
+
+ListResponse = os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse
+Report = os_policy_assignment_reports.OSPolicyAssignmentReport
+PolicyCompliance = Report.OSPolicyCompliance
+ResourceCompliance = PolicyCompliance.OSPolicyResourceCompliance
+
+PARENT = "projects/p/locations/z1/instances/-/osPolicyAssignments/-"
+
+
+def _response(reports=3, output=b"x" * 4096):
+    return ListResponse(
+        os_policy_assignment_reports=[
+            Report(
+                name="{}/reports/{}".format(PARENT, i),
+                instance="vm-{}".format(i),
+                os_policy_compliances=[
+                    PolicyCompliance(
+                        os_policy_id="policy",
+                        compliance_state="NON_COMPLIANT",
+                        os_policy_resource_compliances=[
+                            ResourceCompliance(
+                                os_policy_resource_id="script",
+                                compliance_state="NON_COMPLIANT",
+                                compliance_state_reason="exit code 101",
+                                config_steps=[
+                                    ResourceCompliance.OSPolicyResourceConfigStep(
+                                        type_="VALIDATION",
+                                        error_message="failed",
+                                    )
+                                ],
+                                exec_resource_output=ResourceCompliance.ExecResourceOutput(
+                                    enforcement_output=output
+                                ),
+                            )
+                        ],
+                    )
+                ],
+            )
+            for i in range(reports)
+        ],
+        next_page_token="token",
+    )
+
+
+def _assert_projected(response):
+    assert response.next_page_token == "token"
+    assert [report.instance for report in response.os_policy_assignment_reports] == [
+        "vm-0",
+        "vm-1",
+        "vm-2",
+    ]
+    for report in response.os_policy_assignment_reports:
+        (policy,) = report.os_policy_compliances
+        assert policy.compliance_state == PolicyCompliance.ComplianceState.NON_COMPLIANT
+        (resource,) = policy.os_policy_resource_compliances
+        assert resource.os_policy_resource_id == "script"
+        assert resource.compliance_state_reason == "exit code 101"
+        assert "exec_resource_output" not in resource
+        assert not resource.config_steps
+
+
+def test_prune_and_deserialize():
+    payload = ListResponse.serialize(_response())
+    pruned = REPORT_COMPLIANCE.prune(payload)
+    assert len(pruned) < len(payload) // 10
+    _assert_projected(ListResponse.deserialize(pruned))
+    _assert_projected(REPORT_COMPLIANCE.deserialize(payload))
+
+    # Nothing to drop: the payload is unchanged.
+    empty = ListResponse.serialize(ListResponse(next_page_token="token"))
+    assert REPORT_COMPLIANCE.prune(empty) == empty
+    assert FieldProjection(ListResponse, []).prune(payload) == payload
+
+
+def test_drop_enclosing_field():
+    dropped = FieldProjection(
+        ListResponse,
+        [
+            "os_policy_assignment_reports.os_policy_compliances",
+            "os_policy_assignment_reports.os_policy_compliances.os_policy_id",
+        ],
+    )
+    response = dropped.deserialize(ListResponse.serialize(_response()))
+    assert len(response.os_policy_assignment_reports) == 3
+    assert not response.os_policy_assignment_reports[0].os_policy_compliances
+    assert dropped.exclude[0] == "os_policy_assignment_reports.os_policy_compliances"
+
+
+def test_prune_json_and_codec():
+    content = json_format.MessageToJson(ListResponse.pb(_response())).encode("utf-8")
+    value = json.loads(content)
+    REPORT_COMPLIANCE.prune_json(value)
+    assert "execResourceOutput" not in json.dumps(value)
+
+    codec = REPORT_COMPLIANCE.codec()
+    message = ListResponse.pb(ListResponse())
+    codec.decode(content, message)
+    _assert_projected(ListResponse.wrap(message))
+    request = os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest(
+        parent=PARENT
+    )
+    pb_request = os_policy_assignment_reports.ListOSPolicyAssignmentReportsRequest.pb(
+        request
+    )
+    assert codec.to_dict(pb_request) == {"parent": PARENT}
+
+    # The pruned value is merged by the wrapped codec.
+    fast = rest_codecs.FastJsonCodec()
+    codec = REPORT_COMPLIANCE.codec(fast)
+    message = ListResponse.pb(ListResponse())
+    with mock.patch.object(fast, "decode_value", wraps=fast.decode_value) as decode:
+        codec.decode(content, message)
+    assert decode.call_count == 1
+    assert "execResourceOutput" not in json.dumps(decode.call_args[0][0])
+    _assert_projected(ListResponse.wrap(message))
+    with pytest.raises(json_format.ParseError):
+        codec.decode(b"{not json", ListResponse.pb(ListResponse()))
+
+
+def test_invalid_paths():
+    with pytest.raises(ValueError):
+        FieldProjection(ListResponse, ["reports"])
+    with pytest.raises(ValueError):
+        FieldProjection(ListResponse, ["next_page_token.size"])
+    with pytest.raises(ValueError):
+        FieldProjection(ListResponse, ["os_policy_assignment_reports.missing"])
+    assert "ListOSPolicyAssignmentReportsResponse" in repr(REPORT_COMPLIANCE)
+
+
+def test_client_rest():
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport="rest",
+    )
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = json_format.MessageToJson(
+            ListResponse.pb(_response())
+        ).encode("UTF-8")
+        req.return_value = response_value
+        pager = client.list_os_policy_assignment_reports(
+            parent=PARENT, projection=projection.REPORT_COMPLIANCE
+        )
+        _assert_projected(pager._response)
+
+
+def test_client_grpc():
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    transport = client.transport
+    stub = transport.list_os_policy_assignment_reports_projected(REPORT_COMPLIANCE)
+    assert stub is not transport.list_os_policy_assignment_reports
+    assert stub is transport.list_os_policy_assignment_reports_projected(
+        REPORT_COMPLIANCE
+    )
+    with mock.patch.object(type(stub), "__call__") as call:
+        call.return_value = REPORT_COMPLIANCE.deserialize(
+            ListResponse.serialize(_response())
+        )
+        pager = client.list_os_policy_assignment_reports(
+            parent=PARENT, projection=REPORT_COMPLIANCE
+        )
+        _assert_projected(pager._response)
+    assert call.call_args[0][0].parent == PARENT
+
+    with pytest.raises(ValueError):
+        client.list_os_policy_assignment_reports(
+            parent=PARENT,
+            projection=FieldProjection(Report, ["os_policy_compliances"]),
+        )
+
+
+@pytest.mark.asyncio
+async def test_unsupported_transport():
+    # The base transport has no projected stub.
+    transport = transports.OsConfigZonalServiceTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with pytest.raises(ValueError):
+        OsConfigZonalServiceClient(
+            transport=transport
+        ).list_os_policy_assignment_reports(parent=PARENT, projection=REPORT_COMPLIANCE)
+    with pytest.raises(ValueError):
+        await OsConfigZonalServiceAsyncClient(
+            transport=transport
+        ).list_os_policy_assignment_reports(parent=PARENT, projection=REPORT_COMPLIANCE)
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import os
+import time
+
+from google.auth import credentials as ga_credentials
+from google.protobuf.message import Message
+import pytest
+
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceClient,
+    pagers,
+)
+from google.cloud.osconfig_v1.services.response_cache import ResponseCache
+from google.cloud.osconfig_v1.types import (
+    inventory,
+    os_policy_assignment_reports,
+    vulnerability,
+)
+
+PARENT = "projects/p/locations/z1/instances/-"
+
+# The benchmarks are slow, and only report their results.
+_benchmark = pytest.mark.skipif(
+    not os.environ.get("OSCONFIG_BENCHMARKS"),
+    reason="Set OSCONFIG_BENCHMARKS=1 to run the benchmarks.",
+)
+
+
+def _inventories(count):
+    return [
+        inventory.Inventory(
+            name="{}/instances/vm-{}/inventory".format(PARENT, i),
+            os_info=inventory.Inventory.OsInfo(
+                hostname="vm-{}".format(i), kernel_version="6.1.0-{}".format(i)
+            ),
+        )
+        for i in range(count)
+    ]
+
+
+def _vulnerability_reports(count):
+    Vulnerability = vulnerability.VulnerabilityReport.Vulnerability
+    return [
+        vulnerability.VulnerabilityReport(
+            name="{}/instances/vm-{}/vulnerabilityReport".format(PARENT, i),
+            vulnerabilities=[
+                Vulnerability(
+                    details=Vulnerability.Details(
+                        cve="CVE-2024-{}".format(j),
+                        cvss_v3=vulnerability.CVSSv3(base_score=7.5),
+                    )
+                )
+                for j in range(5)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def _client():
+    return OsConfigZonalServiceClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def test_list_raw():
+    client = _client()
+    pages = (
+        inventory.ListInventoriesResponse(
+            inventories=_inventories(2), next_page_token="abc"
+        ),
+        inventory.ListInventoriesResponse(inventories=_inventories(1)),
+    )
+    with mock.patch.object(type(client.transport.list_inventories), "__call__") as call:
+        call.side_effect = pages
+        items = list(client.list_inventories(parent=PARENT, raw=True))
+    assert [item.os_info.hostname for item in items] == ["vm-0", "vm-1", "vm-0"]
+    assert all(isinstance(item, Message) for item in items)
+    # The items are the messages of the responses, not copies.
+    assert items[0] is inventory.ListInventoriesResponse.pb(pages[0]).inventories[0]
+
+
+def test_pager_raw():
+    response = vulnerability.ListVulnerabilityReportsResponse(
+        vulnerability_reports=_vulnerability_reports(3)
+    )
+    method = mock.Mock()
+    request = vulnerability.ListVulnerabilityReportsRequest(parent=PARENT)
+    wrapped = list(pagers.ListVulnerabilityReportsPager(method, request, response))
+    raw = list(
+        pagers.ListVulnerabilityReportsPager(method, request, response, raw=True)
+    )
+    assert [vulnerability.VulnerabilityReport.pb(item) for item in wrapped] == raw
+    assert not method.called
+
+
+def _get_report():
+    return os_policy_assignment_reports.OSPolicyAssignmentReport(
+        name="r", instance="vm-0"
+    )
+
+
+def test_get_raw():
+    client = _client()
+    with mock.patch.object(type(client.transport.get_inventory), "__call__") as call:
+        call.return_value = _inventories(1)[0]
+        response = client.get_inventory(name=PARENT + "/vm-0/inventory", raw=True)
+    assert isinstance(response, Message)
+    assert response.os_info.hostname == "vm-0"
+
+    # Cached responses are returned raw as well.
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        response_cache=ResponseCache(ttl=60),
+    )
+    with mock.patch.object(
+        type(client.transport.get_os_policy_assignment_report), "__call__"
+    ) as call:
+        call.return_value = _get_report()
+        first = client.get_os_policy_assignment_report(name="r", raw=True)
+        second = client.get_os_policy_assignment_report(name="r", raw=True)
+        wrapped = client.get_os_policy_assignment_report(name="r")
+    assert call.call_count == 1
+    assert isinstance(second, Message)
+    assert first == second
+    assert not isinstance(wrapped, Message)
+
+
+def test_raw_iteration_does_not_wrap():
+    response = vulnerability.ListVulnerabilityReportsResponse(
+        vulnerability_reports=_vulnerability_reports(3)
+    )
+    request = vulnerability.ListVulnerabilityReportsRequest(parent=PARENT)
+    Report = vulnerability.VulnerabilityReport
+    with mock.patch.object(Report, "wrap", wraps=Report.wrap) as wrap:
+        for item in pagers.ListVulnerabilityReportsPager(
+            mock.Mock(), request, response, raw=True
+        ):
+            for vuln in item.vulnerabilities:
+                vuln.details.cvss_v3.base_score
+        assert not wrap.called
+
+        # proto-plus wraps each item as it is read.
+        list(pagers.ListVulnerabilityReportsPager(mock.Mock(), request, response))
+        assert wrap.call_count == 3
+
+
+def _read_inventory(item):  # pragma: NO COVER
+    item.os_info.hostname
+
+
+def _read_vulnerability_report(item):  # pragma: NO COVER
+    for vuln in item.vulnerabilities:
+        vuln.details.cvss_v3.base_score
+
+
+def _iteration_seconds(
+    pager_type, request, pages, read, raw, rounds=5
+):  # pragma: NO COVER
+    """Returns the best CPU time of reading every item of ``pages``."""
+    best = float("inf")
+    for _ in range(rounds):
+        method = mock.Mock(side_effect=pages[1:])
+        start = time.process_time()
+        for item in pager_type(method, request, pages[0], raw=raw):
+            read(item)
+        best = min(best, time.process_time() - start)
+    return best
+
+
+@_benchmark
+@pytest.mark.parametrize(
+    "label,pager_type,request_type,response_type,field,items,read",
+    [
+        (
+            "inventory",
+            pagers.ListInventoriesPager,
+            inventory.ListInventoriesRequest,
+            inventory.ListInventoriesResponse,
+            "inventories",
+            _inventories,
+            _read_inventory,
+        ),
+        (
+            "vulnerability_report",
+            pagers.ListVulnerabilityReportsPager,
+            vulnerability.ListVulnerabilityReportsRequest,
+            vulnerability.ListVulnerabilityReportsResponse,
+            "vulnerability_reports",
+            _vulnerability_reports,
+            _read_vulnerability_report,
+        ),
+    ],
+)
+def test_raw_iteration_benchmark(
+    record_testsuite_property,
+    label,
+    pager_type,
+    request_type,
+    response_type,
+    field,
+    items,
+    read,
+):  # pragma: NO COVER
+    """Records the CPU time of iterating over 10 pages of 100 items.
+
+    The results are properties of the test suite in the JUnit XML report.
+    """
+    pages = [
+        response_type(**{field: items(100), "next_page_token": "page-{}".format(i)})
+        for i in range(1, 10)
+    ]
+    pages.append(response_type(**{field: items(100)}))
+    request = request_type(parent=PARENT)
+    for raw in (False, True):
+        seconds = _iteration_seconds(pager_type, request, pages, read, raw)
+        record_testsuite_property(
+            "{}_{}_cpu_seconds".format(label, "raw" if raw else "wrapped"),
+            round(seconds, 4),
+        )
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import asyncio
+import datetime
+
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.protobuf import timestamp_pb2
+import pytest
+
+from google.cloud.osconfig_v1.report_query import QueryStats, ReportQuery
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceAsyncClient,
+    OsConfigZonalServiceClient,
+)
+from google.cloud.osconfig_v1.types import os_policy_assignment_reports
+
+Report = os_policy_assignment_reports.OSPolicyAssignmentReport
+PolicyCompliance = Report.OSPolicyCompliance
+
+Z1 = "projects/p/locations/z1"
+Z2 = "projects/p/locations/z2"
+
+
+def _report(location, instance, assignment, run_id="run", states=(), updated=0):
+    return Report(
+        name="{}/instances/{}/osPolicyAssignments/{}/report".format(
+            location, instance, assignment
+        ),
+        instance=instance,
+        os_policy_assignment="{}/osPolicyAssignments/{}@r1".format(
+            location, assignment
+        ),
+        last_run_id=run_id,
+        os_policy_compliances=[
+            PolicyCompliance(os_policy_id=policy_id, compliance_state=state)
+            for policy_id, state in states
+        ],
+        update_time=timestamp_pb2.Timestamp(seconds=updated),
+    )
+
+
+REPORTS = [
+    _report(location, instance, assignment, run_id, states, updated)
+    for location in (Z1, Z2)
+    for instance in ("vm-1", "vm-2", "vm-3")
+    for assignment, run_id, states, updated in (
+        ("web", "run-1", [("nginx", "COMPLIANT")], 100),
+        ("db", "run-2", [("pg", "NON_COMPLIANT"), ("ntp", "COMPLIANT")], 200),
+    )
+]
+
+
+def _list(request, **kwargs):
+    """Serves the reports of a parent, ignoring the filter."""
+    location, rest = request.parent.split("/instances/")
+    instance, rest = rest.split("/osPolicyAssignments/")
+    assignment = rest[: -len("/reports")]
+    return os_policy_assignment_reports.ListOSPolicyAssignmentReportsResponse(
+        os_policy_assignment_reports=[
+            report
+            for report in REPORTS
+            if report.name.startswith(location + "/")
+            and instance in ("-", report.instance)
+            and assignment in ("-", report.name.split("/")[7])
+        ]
+    )
+
+
+def test_compile_parents_and_filter():
+    compiled = (
+        ReportQuery([Z1, Z2])
+        .instance("vm-1", "projects/p/zones/z1/instances/vm-2")
+        .assignment("web", "db", "ntp")
+        .last_run_id('run "1"')
+        .compile()
+    )
+    # Instances have fewer values: they go into the parents. A named
+    # instance is only listed in its own location.
+    assert compiled.parents == (
+        Z1 + "/instances/vm-1/osPolicyAssignments/-/reports",
+        Z1 + "/instances/vm-2/osPolicyAssignments/-/reports",
+        Z2 + "/instances/vm-1/osPolicyAssignments/-/reports",
+    )
+    assert compiled.filter == 'last_run_id = "run \\"1\\""'
+    assert compiled.local == ("assignment",)
+
+    compiled = ReportQuery(Z1).instance("vm-1", "vm-2").assignment("web").compile()
+    assert compiled.parents == (Z1 + "/instances/-/osPolicyAssignments/web/reports",)
+    assert compiled.filter == '(instance = "vm-1" OR instance = "vm-2")'
+    assert compiled.local == ()
+
+
+def test_compile_instance_names():
+    named = Z1 + "/instances/vm-1"
+    compiled = ReportQuery([Z1, Z2]).instance(named).compile()
+    assert compiled.parents == (Z1 + "/instances/vm-1/osPolicyAssignments/-/reports",)
+    assert compiled.local == ()
+
+    # Filters name instances by ID; their location is checked locally.
+    compiled = ReportQuery([Z1, Z2], max_parents=0).instance(named, "vm-2").compile()
+    assert compiled.filter == '(instance = "vm-1" OR instance = "vm-2")'
+    assert compiled.local == ("instance",)
+    names = [report.name for report in REPORTS if compiled.matches(Report.pb(report))]
+    assert names == [
+        Z1 + "/instances/vm-1/osPolicyAssignments/web/report",
+        Z1 + "/instances/vm-1/osPolicyAssignments/db/report",
+        Z1 + "/instances/vm-2/osPolicyAssignments/web/report",
+        Z1 + "/instances/vm-2/osPolicyAssignments/db/report",
+        Z2 + "/instances/vm-2/osPolicyAssignments/web/report",
+        Z2 + "/instances/vm-2/osPolicyAssignments/db/report",
+    ]
+
+    # A location not queried, e.g. by project number, is matched by zone.
+    compiled = ReportQuery([Z1, Z2]).instance("projects/123/zones/z2/instances/vm-3")
+    compiled = compiled.compile()
+    assert compiled.parents == (Z2 + "/instances/vm-3/osPolicyAssignments/-/reports",)
+    assert compiled.local == ("instance",)
+    reports, _, _ = _execute(
+        ReportQuery([Z1, Z2]).instance(named).assignment("web", "db", "ntp")
+    )
+    assert {report.name.split("/")[3] for report in reports} == {"z1"}
+
+
+def test_compile_without_pushdown():
+    query = ReportQuery(Z1, filterable=()).instance("vm-1").last_run_id("r")
+    compiled = query.compile()
+    assert compiled.parents == (Z1 + "/instances/vm-1/osPolicyAssignments/-/reports",)
+    assert compiled.filter == ""
+    assert compiled.local == ("last_run_id",)
+
+    compiled = ReportQuery(Z1, pushdown=False).instance("vm-1").compile()
+    assert compiled.parents == (Z1 + "/instances/-/osPolicyAssignments/-/reports",)
+    assert compiled.local == ("instance",)
+
+    compiled = ReportQuery(Z1, max_parents=1).instance("vm-1", "vm-2").compile()
+    assert compiled.parents == (Z1 + "/instances/-/osPolicyAssignments/-/reports",)
+    assert compiled.filter.startswith("(instance")
+
+
+def test_local_predicates():
+    query = (
+        ReportQuery([Z1, Z2], pushdown=False)
+        .instance("vm-1", "vm-3")
+        .assignment("db")
+        .last_run_id("run-2")
+        .compliance_state("NON_COMPLIANT", os_policy_id="pg")
+        .updated_after(datetime.datetime.fromtimestamp(150, datetime.timezone.utc))
+    )
+    matches = query.compile().matches
+    names = [report.name for report in REPORTS if matches(Report.pb(report))]
+    assert names == [
+        "{}/instances/{}/osPolicyAssignments/db/report".format(location, instance)
+        for location in (Z1, Z2)
+        for instance in ("vm-1", "vm-3")
+    ]
+    # No report has a non-compliant nginx policy.
+    matches = query.compliance_state("NON_COMPLIANT", os_policy_id="nginx").compile()
+    assert not any(matches.matches(Report.pb(report)) for report in REPORTS)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ReportQuery([])
+    with pytest.raises(ValueError):
+        ReportQuery("projects/p")
+    with pytest.raises(ValueError):
+        ReportQuery(Z1, filterable=["compliance_state"])
+    with pytest.raises(ValueError):
+        ReportQuery(Z1).instance()
+    with pytest.raises(ValueError):
+        ReportQuery(Z1).updated_after(datetime.datetime(2026, 1, 1))
+    with pytest.raises(KeyError):
+        ReportQuery(Z1).compliance_state("GREEN")
+
+
+def _execute(query):
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with mock.patch.object(
+        type(client.transport.list_os_policy_assignment_reports), "__call__"
+    ) as call:
+        call.side_effect = _list
+        results = query.execute(client)
+        reports = list(results)
+    filters = {args[0].filter for args, _ in call.call_args_list}
+    return reports, results.stats, filters
+
+
+def test_execute_and_stats():
+    query = ReportQuery([Z1, Z2]).assignment("db").compliance_state("NON_COMPLIANT")
+    reports, stats, filters = _execute(query)
+    assert len(reports) == 6
+    assert filters == {""}
+    assert stats.parents == 2
+    assert stats.reports_received == stats.reports_returned == 6
+    assert stats.bytes_discarded == 0
+
+    baseline_query = ReportQuery([Z1, Z2], pushdown=False).assignment("db")
+    baseline_reports, baseline, _ = _execute(
+        baseline_query.compliance_state("NON_COMPLIANT")
+    )
+    assert baseline_reports == reports
+    assert baseline.reports_received == 12
+    assert baseline.bytes_discarded > 0
+    assert 0.4 < stats.savings(baseline) < 0.6
+    assert QueryStats().savings(QueryStats()) == 0.0
+
+
+async def _execute_async(query):
+    client = OsConfigZonalServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with mock.patch.object(
+        type(client.transport.list_os_policy_assignment_reports), "__call__"
+    ) as call:
+        call.side_effect = lambda request, **kwargs: (
+            grpc_helpers_async.FakeUnaryUnaryCall(_list(request))
+        )
+        results = query.execute_async(client, max_concurrency=2)
+        reports = [report async for report in results]
+    return reports, results
+
+
+def test_execute_async():
+    query = ReportQuery([Z1, Z2]).instance("vm-2").last_run_id("run-1")
+    # A private loop leaves the current event loop of the thread untouched.
+    loop = asyncio.new_event_loop()
+    try:
+        reports, results = loop.run_until_complete(_execute_async(query))
+    finally:
+        loop.close()
+    # The fake service ignores the filter: it returns both assignments.
+    assert sorted(report.name.split("/")[7] for report in reports) == [
+        "db",
+        "db",
+        "web",
+        "web",
+    ]
+    assert results.stats.parents == 2
+    assert results.errors == {}
+    with pytest.raises(TypeError):
+        iter(results)
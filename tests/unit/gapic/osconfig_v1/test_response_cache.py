@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+import asyncio
+
+from google.api_core import grpc_helpers_async
+from google.auth import credentials as ga_credentials
+from google.longrunning import operations_pb2
+from google.protobuf import timestamp_pb2
+import pytest
+
+from google.cloud.osconfig_v1.services.os_config_service import OsConfigServiceClient
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceAsyncClient,
+    OsConfigZonalServiceClient,
+)
+from google.cloud.osconfig_v1.services.response_cache import ResponseCache
+from google.cloud.osconfig_v1.types import (
+    os_policy_assignment_reports,
+    os_policy_assignments,
+    patch_deployments,
+)
+
+NAME = "projects/p/locations/l/osPolicyAssignments/a"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _assignment(etag, name=NAME, description=""):
+    return os_policy_assignments.OSPolicyAssignment(
+        name=name, etag=etag, description=description
+    )
+
+
+def _report(seconds, name="r"):
+    return os_policy_assignment_reports.OSPolicyAssignmentReport(
+        name=name, update_time=timestamp_pb2.Timestamp(seconds=seconds)
+    )
+
+
+def test_get_put_ttl():
+    clock = _Clock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    assert cache.get("get_os_policy_assignment", NAME) is None
+    response = _assignment("e1")
+    assert cache.put("get_os_policy_assignment", NAME, response) is response
+
+    cached = cache.get("get_os_policy_assignment", NAME)
+    assert cached == response
+    # Each lookup returns a copy.
+    cached.description = "modified"
+    assert cache.get("get_os_policy_assignment", NAME).description == ""
+    assert cache.get("get_os_policy_assignment_report", NAME) is None
+
+    clock.now = 10
+    assert cache.get("get_os_policy_assignment", NAME) is None
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 3
+    assert len(cache) == 1
+
+
+def test_revalidation():
+    clock = _Clock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    cache.put("get_os_policy_assignment", NAME, _assignment("e1"))
+    clock.now = 15
+    assert cache.get("get_os_policy_assignment", NAME) is None
+
+    # The same etag extends the entry.
+    cache.put("get_os_policy_assignment", NAME, _assignment("e1"))
+    assert cache.stats.revalidations == 1
+    clock.now = 20
+    assert cache.get("get_os_policy_assignment", NAME).etag == "e1"
+
+    # Another etag replaces it.
+    clock.now = 30
+    cache.put("get_os_policy_assignment", NAME, _assignment("e2"))
+    assert cache.get("get_os_policy_assignment", NAME).etag == "e2"
+    assert cache.stats.revalidations == 1
+
+
+def test_older_update_time_does_not_replace_newer():
+    cache = ResponseCache(ttl=0)
+    cache.put("get_os_policy_assignment_report", "r", _report(20))
+    assert cache.put("get_os_policy_assignment_report", "r", _report(10)) == _report(20)
+    assert cache.put("get_os_policy_assignment_report", "r", _report(30)) == _report(30)
+
+
+def test_revisions_do_not_expire():
+    clock = _Clock()
+    cache = ResponseCache(ttl=10, clock=clock)
+    revision = NAME + "@rev1"
+    cache.put("get_os_policy_assignment", revision, _assignment("e1", name=revision))
+    clock.now = 1e9
+    assert cache.get("get_os_policy_assignment", revision).name == revision
+
+
+def test_lru_eviction_by_bytes():
+    one = _assignment("e", name=NAME + "1", description="x" * 100)
+    size = len(os_policy_assignments.OSPolicyAssignment.serialize(one))
+    cache = ResponseCache(max_bytes=size * 2)
+    for i in range(1, 4):
+        if i == 3:
+            # Touch the first entry, so that the second one is evicted.
+            cache.get("get_os_policy_assignment", NAME + "1")
+        cache.put(
+            "get_os_policy_assignment",
+            NAME + str(i),
+            _assignment("e", name=NAME + str(i), description="x" * 100),
+        )
+    assert cache.get("get_os_policy_assignment", NAME + "1") is not None
+    assert cache.get("get_os_policy_assignment", NAME + "2") is None
+    assert cache.get("get_os_policy_assignment", NAME + "3") is not None
+    assert cache.size_bytes == size * 2
+    assert cache.stats.evictions == 1
+
+    # Responses larger than the cache are not cached.
+    cache = ResponseCache(max_bytes=size - 1)
+    cache.put("get_os_policy_assignment", NAME + "1", one)
+    assert len(cache) == 0
+
+
+def test_reconciling_responses_are_not_cached():
+    cache = ResponseCache()
+    cache.put("get_os_policy_assignment", NAME, _assignment("e1"))
+    reconciling = _assignment("e2")
+    reconciling.reconciling = True
+    assert cache.put("get_os_policy_assignment", NAME, reconciling) is reconciling
+    assert cache.get("get_os_policy_assignment", NAME) is None
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+    cache.put("get_os_policy_assignment", NAME, _assignment("e3"))
+    assert cache.get("get_os_policy_assignment", NAME).etag == "e3"
+
+
+def test_invalidate():
+    cache = ResponseCache()
+    cache.put("get_os_policy_assignment", NAME, _assignment("e1"))
+    cache.put("get_os_policy_assignment_report", NAME, _report(1, name=NAME))
+    cache.put("get_os_policy_assignment", NAME + "2", _assignment("e1", NAME + "2"))
+    cache.invalidate(NAME)
+    cache.invalidate("unknown")
+    assert cache.get("get_os_policy_assignment", NAME) is None
+    assert cache.get("get_os_policy_assignment_report", NAME) is None
+    assert cache.get("get_os_policy_assignment", NAME + "2").etag == "e1"
+    assert cache.stats.invalidations == 2
+
+    # Evicted and replaced entries are no longer invalidated.
+    cache.put("get_os_policy_assignment", NAME, _assignment("e2"))
+    cache.put("get_os_policy_assignment", NAME, _assignment("e3"))
+    cache.clear()
+    cache.invalidate(NAME)
+    cache.invalidate(NAME + "2")
+    assert cache.stats.invalidations == 2
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ResponseCache(ttl=-1)
+    with pytest.raises(ValueError):
+        ResponseCache(max_bytes=-1)
+
+
+def test_zonal_client():
+    cache = ResponseCache()
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), response_cache=cache
+    )
+    with mock.patch.object(
+        type(client.transport.get_os_policy_assignment), "__call__"
+    ) as call:
+        call.return_value = _assignment("e1")
+        assert client.get_os_policy_assignment(name=NAME).etag == "e1"
+        assert client.get_os_policy_assignment(name=NAME).etag == "e1"
+        assert call.call_count == 1
+
+        with mock.patch.object(
+            type(client.transport.update_os_policy_assignment), "__call__"
+        ) as update:
+            update.return_value = operations_pb2.Operation(name="operations/op")
+            client.update_os_policy_assignment(
+                os_policy_assignment=_assignment("", description="new"),
+                update_mask=None,
+            )
+        assert len(cache) == 0
+        # The change is rolled out after the operation is returned.
+        call.return_value = _assignment("e2")
+        call.return_value.reconciling = True
+        assert client.get_os_policy_assignment(name=NAME).reconciling
+        assert len(cache) == 0
+        call.return_value = _assignment("e3")
+        assert client.get_os_policy_assignment(name=NAME).etag == "e3"
+        assert client.get_os_policy_assignment(name=NAME).etag == "e3"
+        assert call.call_count == 3
+
+        with mock.patch.object(
+            type(client.transport.delete_os_policy_assignment), "__call__"
+        ) as delete:
+            delete.return_value = operations_pb2.Operation(name="operations/op")
+            client.delete_os_policy_assignment(name=NAME)
+        assert len(cache) == 0
+
+
+def test_zonal_client_without_cache():
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with mock.patch.object(
+        type(client.transport.get_os_policy_assignment_report), "__call__"
+    ) as call:
+        call.return_value = _report(1)
+        client.get_os_policy_assignment_report(name="r")
+        client.get_os_policy_assignment_report(name="r")
+        assert call.call_count == 2
+
+
+def test_os_config_service_client():
+    cache = ResponseCache()
+    client = OsConfigServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(), response_cache=cache
+    )
+    name = "projects/p/patchDeployments/d"
+    # The stubs share a type: patch one method at a time.
+    transport = client.transport
+    with mock.patch.object(type(transport.get_patch_deployment), "__call__") as get:
+        get.return_value = patch_deployments.PatchDeployment(
+            name=name, state=patch_deployments.PatchDeployment.State.ACTIVE
+        )
+        client.get_patch_deployment(name=name)
+    with mock.patch.object(type(transport.pause_patch_deployment), "__call__") as pause:
+        pause.return_value = patch_deployments.PatchDeployment(
+            name=name, state=patch_deployments.PatchDeployment.State.PAUSED
+        )
+        client.pause_patch_deployment(name=name)
+    with mock.patch.object(type(transport.get_patch_deployment), "__call__") as get:
+        # The paused deployment replaced the cached one.
+        assert (
+            client.get_patch_deployment(name=name).state
+            == patch_deployments.PatchDeployment.State.PAUSED
+        )
+        assert get.call_count == 0
+    with mock.patch.object(
+        type(transport.delete_patch_deployment), "__call__"
+    ) as delete:
+        delete.return_value = None
+        client.delete_patch_deployment(name=name)
+    assert len(cache) == 0
+
+
+async def _async_client(cache):
+    client = OsConfigZonalServiceAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), response_cache=cache
+    )
+    with mock.patch.object(
+        type(client.transport.get_os_policy_assignment), "__call__"
+    ) as call:
+        call.return_value = grpc_helpers_async.FakeUnaryUnaryCall(_assignment("e1"))
+        assert (await client.get_os_policy_assignment(name=NAME)).etag == "e1"
+        assert (await client.get_os_policy_assignment(name=NAME)).etag == "e1"
+        assert call.call_count == 1
+
+
+def test_async_client():
+    cache = ResponseCache()
+    # A private loop leaves the current event loop of the thread untouched.
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_async_client(cache))
+    finally:
+        loop.close()
+    assert cache.stats.hits == 1
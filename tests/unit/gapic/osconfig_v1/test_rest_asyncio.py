@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import json
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.longrunning import operations_pb2
+from google.protobuf import json_format
+import pytest
+
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceAsyncClient,
+    transports,
+)
+from google.cloud.osconfig_v1.types import inventory, os_policy_assignments
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+CALLS = 8
+INSTANCE = "projects/p/locations/l/instances/{}/inventory"
+OPERATION = "projects/p/locations/l/osPolicyAssignments/a/operations/op"
+
+
+class _FakeServer:
+    """Serves a few OsConfigZonalService REST methods on localhost."""
+
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.peers = set()
+
+    async def handle(self, request):
+        self.requests.append((request.method, request.path, dict(request.query)))
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Let concurrent requests overlap.
+            await asyncio.sleep(0.05)
+            return await self._respond(request)
+        finally:
+            self.in_flight -= 1
+
+    async def _respond(self, request):
+        path = request.path
+        if path == "/v1/" + INSTANCE.format("missing"):
+            return web.json_response(
+                {"error": {"code": 404, "message": "no such inventory"}}, status=404
+            )
+        if path.endswith("/inventory"):
+            name = path[len("/v1/") :]
+            return web.Response(
+                text=inventory.Inventory.to_json(inventory.Inventory(name=name)),
+                content_type="application/json",
+            )
+        if request.method == "POST" and path.endswith("/osPolicyAssignments"):
+            body = json.loads(await request.read())
+            assert body["description"] == "created"
+            operation = operations_pb2.Operation(name=OPERATION)
+            return web.Response(
+                text=json_format.MessageToJson(operation),
+                content_type="application/json",
+            )
+        if path == "/v1/" + OPERATION:
+            operation = operations_pb2.Operation(name=OPERATION, done=True)
+            operation.response.Pack(
+                os_policy_assignments.OSPolicyAssignment.pb(
+                    os_policy_assignments.OSPolicyAssignment(
+                        name="projects/p/locations/l/osPolicyAssignments/a",
+                        description="created",
+                    )
+                )
+            )
+            return web.Response(
+                text=json_format.MessageToJson(operation),
+                content_type="application/json",
+            )
+        return web.json_response({"error": {"message": "unexpected"}}, status=500)
+
+
+class _RecordingInterceptor(transports.AsyncOsConfigZonalServiceRestInterceptor):
+    def __init__(self):
+        self.calls = []
+
+    async def pre_get_inventory(self, request, metadata):
+        self.calls.append(("pre", request.name))
+        return request, tuple(metadata) + (("x-test", "1"),)
+
+    async def post_get_inventory(self, response):
+        self.calls.append(("post", response.name))
+        return response
+
+
+async def _run(test):
+    server = _FakeServer()
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", server.handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    interceptor = _RecordingInterceptor()
+    transport = transports.AsyncOsConfigZonalServiceRestTransport(
+        host="127.0.0.1:{}".format(port),
+        url_scheme="http",
+        credentials=ga_credentials.AnonymousCredentials(),
+        interceptor=interceptor,
+        pool_maxsize=4,
+    )
+    client = OsConfigZonalServiceAsyncClient(transport=transport)
+    try:
+        await test(client, server, interceptor)
+    finally:
+        await transport.close()
+        await runner.cleanup()
+
+
+def _run_in_new_loop(test):
+    # A private loop leaves the current event loop of the thread untouched.
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(_run(test))
+    finally:
+        loop.close()
+
+
+def test_concurrent_calls_share_pooled_connections():
+    async def test(client, server, interceptor):
+        names = [INSTANCE.format(i) for i in range(CALLS)]
+        responses = await asyncio.gather(
+            *(client.get_inventory(name=name) for name in names)
+        )
+        assert [r.name for r in responses] == names
+        # The calls ran concurrently, over at most pool_maxsize connections.
+        assert server.max_in_flight == 4
+        assert len(server.peers) == 4
+        assert sorted(interceptor.calls) == sorted(
+            [("pre", name) for name in names] + [("post", name) for name in names]
+        )
+        assert server.requests[0][2]["$alt"] == "json;enum-encoding=int"
+
+    _run_in_new_loop(test)
+
+
+def test_error_response():
+    async def test(client, server, interceptor):
+        with pytest.raises(core_exceptions.NotFound) as exc_info:
+            await client.get_inventory(name=INSTANCE.format("missing"))
+        assert "no such inventory" in exc_info.value.message
+        assert exc_info.value.response.status_code == 404
+
+    _run_in_new_loop(test)
+
+
+def test_long_running_operation():
+    async def test(client, server, interceptor):
+        operation = await client.create_os_policy_assignment(
+            parent="projects/p/locations/l",
+            os_policy_assignment=os_policy_assignments.OSPolicyAssignment(
+                description="created"
+            ),
+            os_policy_assignment_id="a",
+        )
+        assert operation.operation.name == OPERATION
+        result = await operation.result()
+        assert result.description == "created"
+        assert ("GET", "/v1/" + OPERATION) in [r[:2] for r in server.requests]
+
+    _run_in_new_loop(test)
+
+
+def test_transport_registry():
+    transport_class = OsConfigZonalServiceAsyncClient.get_transport_class(
+        "rest_asyncio"
+    )
+    assert transport_class is transports.AsyncOsConfigZonalServiceRestTransport
+    transport = transport_class(credentials=ga_credentials.AnonymousCredentials())
+    assert transport.kind == "rest_asyncio"
+    assert transport._host == "https://osconfig.googleapis.com"
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.auth import credentials as ga_credentials
+from google.protobuf import duration_pb2  # type: ignore
+from google.protobuf import json_format
+from google.protobuf import timestamp_pb2  # type: ignore
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.cloud.osconfig_v1.services import rest_codecs
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceClient,
+    transports,
+)
+from google.cloud.osconfig_v1.types import (
+    inventory,
+    os_policy,
+    os_policy_assignment_reports,
+    os_policy_assignments,
+    osconfig_common,
+    patch_jobs,
+    vulnerability,
+)
+
+
+def _inventory():
+    return inventory.Inventory(
+        name="projects/p/locations/l/instances/i/inventory",
+        os_info=inventory.Inventory.OsInfo(
+            hostname="host", short_name="debian", version="11"
+        ),
+        items={
+            "a": inventory.Inventory.Item(
+                id="a",
+                origin_type=inventory.Inventory.Item.OriginType.INVENTORY_REPORT,
+                type_=inventory.Inventory.Item.Type.INSTALLED_PACKAGE,
+                create_time=timestamp_pb2.Timestamp(seconds=10, nanos=5),
+                installed_package=inventory.Inventory.SoftwarePackage(
+                    apt_package=inventory.Inventory.VersionedPackage(
+                        package_name="openssl",
+                        architecture="amd64",
+                        version="3.0.2",
+                    )
+                ),
+            ),
+            "b": inventory.Inventory.Item(
+                id="b",
+                available_package=inventory.Inventory.SoftwarePackage(
+                    wua_package=inventory.Inventory.WindowsUpdatePackage(
+                        title="KB1",
+                        kb_article_ids=["1", "2"],
+                        categories=[
+                            inventory.Inventory.WindowsUpdatePackage.WindowsUpdateCategory(
+                                id="c", name="Security"
+                            )
+                        ],
+                        revision_number=7,
+                    )
+                ),
+            ),
+        },
+        update_time=timestamp_pb2.Timestamp(seconds=20),
+    )
+
+
+def _report():
+    exec_output = os_policy_assignment_reports.OSPolicyAssignmentReport.OSPolicyCompliance.OSPolicyResourceCompliance.ExecResourceOutput(
+        enforcement_output=b"\x00\x01binary\xff"
+    )
+    return os_policy_assignment_reports.OSPolicyAssignmentReport(
+        name="report",
+        os_policy_compliances=[
+            os_policy_assignment_reports.OSPolicyAssignmentReport.OSPolicyCompliance(
+                os_policy_id="policy",
+                compliance_state=os_policy_assignment_reports.OSPolicyAssignmentReport.OSPolicyCompliance.ComplianceState.COMPLIANT,
+                os_policy_resource_compliances=[
+                    os_policy_assignment_reports.OSPolicyAssignmentReport.OSPolicyCompliance.OSPolicyResourceCompliance(
+                        os_policy_resource_id="resource",
+                        exec_resource_output=exec_output,
+                    )
+                ],
+            )
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        _inventory(),
+        _report(),
+        patch_jobs.PatchJob(
+            name="job",
+            percent_complete=12.5,
+            state=patch_jobs.PatchJob.State.PATCHING,
+            duration=duration_pb2.Duration(seconds=3600),
+            instance_details_summary=patch_jobs.PatchJob.InstanceDetailsSummary(
+                pending_instance_count=2**40, failed_instance_count=3
+            ),
+        ),
+        os_policy_assignments.OSPolicyAssignment(
+            name="assignment",
+            instance_filter=os_policy_assignments.OSPolicyAssignment.InstanceFilter(
+                inclusion_labels=[
+                    os_policy_assignments.OSPolicyAssignment.LabelSet(
+                        labels={"env": "prod"}
+                    )
+                ],
+            ),
+            rollout=os_policy_assignments.OSPolicyAssignment.Rollout(
+                disruption_budget=osconfig_common.FixedOrPercent(percent=10),
+                min_wait_duration=duration_pb2.Duration(seconds=60),
+            ),
+            os_policies=[
+                os_policy.OSPolicy(id="policy", allow_no_resource_group_match=True)
+            ],
+        ),
+    ],
+)
+def test_fast_codec_matches_json_format(message):
+    pb = type(message).pb(message)
+    for kwargs in (
+        {"use_integers_for_enums": True},
+        {"preserving_proto_field_name": True},
+    ):
+        payload = json_format.MessageToJson(pb, **kwargs).encode("utf-8")
+
+        expected = type(pb)()
+        rest_codecs.JsonCodec().decode(payload, expected)
+        actual = type(pb)()
+        rest_codecs.FastJsonCodec().decode(payload, actual)
+
+        assert actual == expected == pb
+
+
+def test_fast_codec_fallbacks():
+    payload = json.dumps(
+        {
+            "name": "job",
+            "state": "PATCHING",
+            "percentComplete": "NaN",
+            "displayName": None,
+            "unknownField": {"nested": [1, 2]},
+            "instanceDetailsSummary": {"pendingInstanceCount": "12"},
+            "createTime": "1970-01-01T00:00:10Z",
+        }
+    ).encode("utf-8")
+    expected = patch_jobs.PatchJob.pb(patch_jobs.PatchJob())
+    rest_codecs.JsonCodec().decode(payload, expected)
+    actual = patch_jobs.PatchJob.pb(patch_jobs.PatchJob())
+    rest_codecs.FastJsonCodec(loads=json.loads).decode(payload, actual)
+
+    assert actual.SerializeToString() == expected.SerializeToString()
+    assert actual.state == patch_jobs.PatchJob.State.PATCHING
+    assert actual.instance_details_summary.pending_instance_count == 12
+
+
+def test_fast_codec_invalid_payload():
+    message = patch_jobs.PatchJob.pb(patch_jobs.PatchJob())
+    with pytest.raises(json_format.ParseError):
+        rest_codecs.FastJsonCodec().decode(b"{not json", message)
+    with pytest.raises(json_format.ParseError):
+        rest_codecs.FastJsonCodec().decode(b'{"percentComplete": "high"}', message)
+
+
+@pytest.mark.parametrize(
+    "message_type,content",
+    [
+        # Not representable in a float field.
+        (vulnerability.CVSSv3, b'{"baseScore": 1e300}'),
+        (vulnerability.CVSSv3, b'{"baseScore": -3.5e38}'),
+        # Rounds to infinity in a double field.
+        (patch_jobs.PatchJob, b'{"percentComplete": 1e400}'),
+        # Two members of the same oneof.
+        (
+            inventory.Inventory.SoftwarePackage,
+            b'{"aptPackage": {"packageName": "bash"},'
+            b' "yum_package": {"packageName": "bash"}}',
+        ),
+    ],
+)
+def test_fast_codec_rejects_like_json_format(message_type, content):
+    for codec in (rest_codecs.JsonCodec(), rest_codecs.FastJsonCodec()):
+        with pytest.raises(json_format.ParseError):
+            codec.decode(content, message_type.pb(message_type()))
+
+
+def test_codec_to_dict_matches_round_trip():
+    request = inventory.ListInventoriesRequest.pb(
+        inventory.ListInventoriesRequest(
+            page_size=10, view=inventory.InventoryView.FULL, filter="a=b"
+        )
+    )
+    expected = json.loads(
+        json_format.MessageToJson(
+            request,
+            including_default_value_fields=False,
+            use_integers_for_enums=True,
+        )
+    )
+    for codec in (rest_codecs.JsonCodec(), rest_codecs.FastJsonCodec()):
+        assert codec.to_dict(request) == expected
+
+
+def test_rest_transport_uses_codec():
+    codec = rest_codecs.FastJsonCodec()
+    transport = transports.OsConfigZonalServiceRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        codec=codec,
+    )
+    client = OsConfigZonalServiceClient(transport=transport)
+    expected = _inventory()
+
+    with mock.patch.object(Session, "request") as req, mock.patch.object(
+        codec, "decode", wraps=codec.decode
+    ) as decode:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = json_format.MessageToJson(
+            inventory.Inventory.pb(expected)
+        ).encode("UTF-8")
+        req.return_value = response_value
+        response = client.get_inventory(
+            name="projects/p/locations/l/instances/i/inventory"
+        )
+
+    decode.assert_called_once()
+    assert response == expected
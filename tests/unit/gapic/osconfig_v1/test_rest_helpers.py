@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+import pytest
+
+from google.cloud.osconfig_v1.services import _rest_helpers
+
+DOCUMENT = {
+    "nextPageToken": 'tok"}]',
+    "inventories": [
+        {"name": "a", "items": {"k": {"v": [1, 2, {"s": ']}{\\"'}]}}},
+        {"name": "b", "ok": True, "n": None},
+        {},
+    ],
+    "unreachable": ["z"],
+    "size": 12,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 20])
+def test_json_list_splitter_chunk_boundaries(chunk_size):
+    payload = json.dumps(DOCUMENT, indent=2).encode("utf-8")
+    splitter = _rest_helpers.JsonListSplitter(["inventories"])
+    items = []
+    for start in range(0, len(payload), chunk_size):
+        items.extend(splitter.feed(payload[start : start + chunk_size]))
+    fields = splitter.finish()
+
+    assert [json.loads(item) for item in items] == DOCUMENT["inventories"]
+    assert fields == {k: v for k, v in DOCUMENT.items() if k != "inventories"}
+
+
+def test_json_list_splitter_yields_items_incrementally():
+    splitter = _rest_helpers.JsonListSplitter(["inventories"])
+    assert splitter.feed(b'{"inventories": [{"name": "a"},') == [b'{"name": "a"}']
+    assert splitter.feed(b' {"name"') == []
+    assert splitter.feed(b': "b"}]}') == [b'{"name": "b"}']
+    assert splitter.finish() == {}
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b'{"inventories": [{"name": "a"}', b'["inventories"]', b'{"a" 1}'],
+)
+def test_json_list_splitter_malformed(payload):
+    splitter = _rest_helpers.JsonListSplitter(["inventories"])
+    with pytest.raises(ValueError):
+        splitter.feed(payload)
+        splitter.finish()
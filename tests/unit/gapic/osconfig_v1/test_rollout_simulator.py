@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from google.protobuf import duration_pb2, timestamp_pb2
+import pytest
+
+from google.cloud.osconfig_v1 import rollout_simulator
+from google.cloud.osconfig_v1.types import (
+    os_policy_assignment_reports,
+    os_policy_assignments,
+    osconfig_common,
+)
+
+
+def _assignment(fixed=None, percent=None, min_wait=0):
+    return os_policy_assignments.OSPolicyAssignment(
+        rollout=os_policy_assignments.OSPolicyAssignment.Rollout(
+            disruption_budget=osconfig_common.FixedOrPercent(
+                fixed=fixed, percent=percent
+            ),
+            min_wait_duration=duration_pb2.Duration(seconds=min_wait),
+        )
+    )
+
+
+def _instances(count, zones=("z1",)):
+    return [
+        "projects/p/locations/{}/instances/i{}".format(zones[i % len(zones)], i)
+        for i in range(count)
+    ]
+
+
+def test_zone_budget():
+    fixed = osconfig_common.FixedOrPercent(fixed=3)
+    percent = osconfig_common.FixedOrPercent(percent=10)
+    assert rollout_simulator.zone_budget(fixed, 100) == 3
+    assert rollout_simulator.zone_budget(percent, 100) == 10
+    assert rollout_simulator.zone_budget(percent, 101) == 11
+    # The rollout always progresses.
+    assert rollout_simulator.zone_budget(percent, 5) == 1
+    assert rollout_simulator.zone_budget(osconfig_common.FixedOrPercent(), 5) == 1
+
+
+def test_zone_of():
+    assert rollout_simulator.zone_of(_instances(1)[0]) == "z1"
+    with pytest.raises(ValueError):
+        rollout_simulator.zone_of("instances/i")
+
+
+def test_constant_apply_times():
+    # 10 VMs of 60s, 3 at a time and 30s apart: 4 waves of 90s.
+    estimate = rollout_simulator.simulate_rollout(
+        _assignment(fixed=3, min_wait=30),
+        _instances(10),
+        default_apply_times=[60],
+        runs=5,
+    )
+    assert estimate.completion_times == [360.0] * 5
+    assert estimate.zone_budgets == {"z1": 3}
+
+    # Zones roll out in parallel, each with its own budget.
+    estimate = rollout_simulator.simulate_rollout(
+        _assignment(percent=50),
+        _instances(10, zones=("z1", "z2")),
+        default_apply_times=[60],
+        runs=1,
+    )
+    assert estimate.mean == 120.0
+    assert estimate.zone_budgets == {"z1": 3, "z2": 3}
+
+
+def test_per_instance_apply_times():
+    instances = _instances(4)
+    # The slow VM starts in the first wave whatever the order, since the
+    # budget covers all VMs.
+    estimate = rollout_simulator.simulate_rollout(
+        _assignment(fixed=4),
+        instances,
+        {instances[0]: [600]},
+        default_apply_times=[10],
+        runs=3,
+    )
+    assert estimate.completion_times == [600.0] * 3
+
+    # The default samples are those of all instances.
+    estimate = rollout_simulator.simulate_rollout(
+        _assignment(fixed=4), instances, {instances[0]: [600]}, runs=1
+    )
+    assert estimate.completion_times == [600.0]
+    with pytest.raises(ValueError):
+        rollout_simulator.simulate_rollout(
+            _assignment(fixed=1),
+            instances,
+            {instances[0]: [600]},
+            default_apply_times=[],
+        )
+
+
+def test_distribution_and_seed():
+    kwargs = dict(default_apply_times=[10, 20, 30, 40], runs=200, seed=7)
+    first = rollout_simulator.simulate_rollout(
+        _assignment(fixed=5), _instances(50), **kwargs
+    )
+    second = rollout_simulator.simulate_rollout(
+        _assignment(fixed=5), _instances(50), **kwargs
+    )
+    assert first == second
+    assert first.completion_times == sorted(first.completion_times)
+    assert 10 * 10 <= first.percentile(0) <= first.percentile(50)
+    assert first.percentile(50) <= first.percentile(100) <= 10 * 40
+    assert first.percentile(100) == first.completion_times[-1]
+    with pytest.raises(ValueError):
+        first.percentile(101)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        rollout_simulator.simulate_rollout(
+            _assignment(fixed=1), [], default_apply_times=[1]
+        )
+    with pytest.raises(ValueError):
+        rollout_simulator.simulate_rollout(
+            _assignment(fixed=1), _instances(1), default_apply_times=[1], runs=0
+        )
+
+
+def test_apply_times_from_reports():
+    name = "projects/my-project/locations/z1/osPolicyAssignments/a"
+    revisions = [
+        os_policy_assignments.OSPolicyAssignment(
+            name=name,
+            revision_id=revision_id,
+            revision_create_time=timestamp_pb2.Timestamp(seconds=created),
+        )
+        for revision_id, created in (("r1", 1000), ("r2", 2000))
+    ]
+    instance = _instances(1)[0]
+
+    def report(revision_id, updated):
+        return os_policy_assignment_reports.OSPolicyAssignmentReport(
+            instance=instance,
+            os_policy_assignment="projects/123/locations/z1/osPolicyAssignments/a@"
+            + revision_id,
+            update_time=timestamp_pb2.Timestamp(seconds=updated, nanos=500000000),
+        )
+
+    reports = [
+        report("r1", 1060),
+        report("r2", 2030),
+        # Unknown revisions and reports predating the revision are skipped.
+        report("r3", 3000),
+        report("r2", 1500),
+    ]
+    samples = rollout_simulator.apply_times_from_reports(reports, revisions)
+    assert samples == {instance: [60.5, 30.5]}
+
+
+def test_scales_to_many_instances():
+    instances = _instances(100000, zones=("z1", "z2", "z3", "z4"))
+    assignment = _assignment(percent=5, min_wait=60)
+    estimate = rollout_simulator.simulate_rollout(
+        assignment, instances, default_apply_times=[30], runs=2, seed=1
+    )
+    # 25000 VMs per zone, 1250 at a time: exactly 20 waves of 90s.
+    assert estimate.completion_times == [20 * 90, 20 * 90]
+    assert estimate.zone_budgets == dict.fromkeys(("z1", "z2", "z3", "z4"), 1250)
+
+    estimate = rollout_simulator.simulate_rollout(
+        assignment,
+        instances,
+        default_apply_times=[30, 45, 60, 120, 300],
+        seed=1,
+    )
+    assert len(estimate.completion_times) == rollout_simulator.DEFAULT_RUNS
+    assert estimate.percentile(0) >= 20 * 90
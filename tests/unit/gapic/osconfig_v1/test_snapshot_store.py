@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import datetime
+import os
+
+from google.protobuf import timestamp_pb2
+import pytest
+
+from google.cloud.osconfig_v1.snapshot_store import SnapshotStore, WriteResult
+from google.cloud.osconfig_v1.types import inventory
+
+Inventory = inventory.Inventory
+Item = Inventory.Item
+
+ZONE = "projects/p/locations/us-central1-a"
+DAY_1 = datetime.datetime(2026, 10, 1, tzinfo=datetime.timezone.utc)
+DAY_2 = datetime.datetime(2026, 10, 2, tzinfo=datetime.timezone.utc)
+
+
+def _apt(name, version):
+    return Inventory.SoftwarePackage(
+        apt_package=Inventory.VersionedPackage(
+            package_name=name, architecture="amd64", version=version
+        )
+    )
+
+
+def _inventory(instance, packages, available=(), hostname=None):
+    items = {}
+    for name, version in packages:
+        key = "installedPackage-" + name
+        items[key] = Item(
+            id=key,
+            origin_type=Item.OriginType.INVENTORY_REPORT,
+            type_=Item.Type.INSTALLED_PACKAGE,
+            create_time=timestamp_pb2.Timestamp(seconds=len(instance)),
+            installed_package=_apt(name, version),
+        )
+    for name, version in available:
+        key = "availablePackage-" + name
+        items[key] = Item(
+            id=key,
+            type_=Item.Type.AVAILABLE_PACKAGE,
+            available_package=_apt(name, version),
+        )
+    items["unknown"] = Item(id="unknown")
+    return Inventory(
+        name="{}/instances/{}/inventory".format(ZONE, instance),
+        os_info=Inventory.OsInfo(hostname=hostname or instance),
+        items=items,
+        update_time=timestamp_pb2.Timestamp(seconds=1000),
+    )
+
+
+BASE = [("bash", "5.2-1"), ("openssl", "3.0.11-1"), ("curl", "7.88.1-10")]
+
+FLEET_1 = [
+    _inventory("vm-{}".format(i), BASE, available=[("openssl", "3.0.13-1")])
+    for i in range(20)
+]
+FLEET_2 = [
+    _inventory("vm-{}".format(i), BASE[:1] + [("openssl", "3.0.13-1")] + BASE[2:])
+    for i in range(10)
+] + FLEET_1[10:]
+
+
+def test_write_dedupes_packages(tmp_path):
+    with SnapshotStore(str(tmp_path)) as store:
+        first = store.write(FLEET_1, DAY_1)
+        assert first == WriteResult("20261001T000000Z", 20, 20 * 5, 4)
+        second = store.write(FLEET_2, DAY_2)
+        # The upgraded openssl is the package available on day 1.
+        assert second == WriteResult("20261002T000000Z", 20, 10 * 4 + 10 * 5, 0)
+        assert store.package_count == 4
+        assert store.snapshots() == [first.snapshot_id, second.snapshot_id]
+    # Each package is stored once, whatever the number of instances.
+    size = os.path.getsize(os.path.join(str(tmp_path), "packages.bin"))
+    packages = BASE + [("openssl", "3.0.13-1")]
+    assert size == sum(
+        len(Inventory.SoftwarePackage.serialize(_apt(*p))) for p in packages
+    )
+
+
+def test_round_trip(tmp_path):
+    with SnapshotStore(str(tmp_path)) as store:
+        store.write(FLEET_1, DAY_1)
+        store.write((Inventory.pb(i) for i in FLEET_2), DAY_2)
+        snapshot = store.open("20261002T000000Z")
+        assert len(snapshot) == 20
+        assert snapshot.time == DAY_2
+        assert list(snapshot) == FLEET_2
+        assert snapshot.get(ZONE + "/instances/vm-15") == FLEET_1[15]
+
+        packages = list(snapshot.packages(ZONE + "/instances/vm-3"))
+        assert {p.apt_package.package_name for p in packages} == {
+            "bash",
+            "openssl",
+            "curl",
+        }
+        ids = snapshot.item_ids(ZONE + "/instances/vm-3")
+        assert len(ids) == 4
+        assert 0xFFFFFFFF in ids
+        del ids
+
+
+def test_point_in_time(tmp_path):
+    with SnapshotStore(str(tmp_path)) as store:
+        store.write(FLEET_1, DAY_1)
+        store.write(FLEET_2, DAY_2)
+        assert store.at(DAY_1 - datetime.timedelta(seconds=1)) is None
+        noon = DAY_1 + datetime.timedelta(hours=12)
+        assert store.at(noon).id == "20261001T000000Z"
+        assert store.at(DAY_2).id == "20261002T000000Z"
+        tokyo = datetime.timezone(datetime.timedelta(hours=9))
+        assert store.at(DAY_2.astimezone(tokyo)).id == "20261002T000000Z"
+
+
+def test_reopen_and_recover(tmp_path):
+    root = str(tmp_path)
+    with SnapshotStore(root) as store:
+        store.write(FLEET_1, DAY_1)
+    # An interrupted write leaves a package without an index entry.
+    with open(os.path.join(root, "packages.bin"), "ab") as f:
+        f.write(b"partial")
+    with open(os.path.join(root, "packages.sha"), "ab") as f:
+        f.write(b"\0" * 32)
+    os.mkdir(os.path.join(root, "snapshots", ".tmp-partial"))
+
+    with SnapshotStore(root) as store:
+        assert store.package_count == 4
+        assert store.snapshots() == ["20261001T000000Z"]
+        assert store.write(FLEET_2, DAY_2).new_packages == 0
+        assert list(store.open("20261002T000000Z")) == FLEET_2
+        assert list(store.open("20261001T000000Z")) == FLEET_1
+
+
+def test_recover_truncated_data(tmp_path):
+    root = str(tmp_path)
+    with SnapshotStore(root) as store:
+        store.write(FLEET_1, DAY_1)
+    # The index and digests reached the disk, the data of the last
+    # packages did not.
+    data = os.path.join(root, "packages.bin")
+    size = os.path.getsize(data)
+    # Packages are stored in item key order: the available openssl, then
+    # bash, curl and the installed openssl.
+    last = len(Inventory.SoftwarePackage.serialize(_apt("openssl", "3.0.11-1")))
+    os.truncate(data, size - last - 1)
+
+    with SnapshotStore(root) as store:
+        assert store.package_count == 2
+        # The data file is never grown past what was written.
+        assert os.path.getsize(data) < size - last
+        assert os.path.getsize(os.path.join(root, "packages.idx")) == 2 * 12
+        assert os.path.getsize(os.path.join(root, "packages.sha")) == 2 * 32
+        assert [store.package(i) for i in range(2)] == [
+            Inventory.SoftwarePackage.pb(_apt(*p))
+            for p in [("openssl", "3.0.13-1"), ("bash", "5.2-1")]
+        ]
+        # The lost packages are stored again, not deduplicated onto garbage.
+        assert store.write(FLEET_2, DAY_2).new_packages == 2
+        assert list(store.open("20261002T000000Z")) == FLEET_2
+
+
+def test_failed_write_leaves_no_directory(tmp_path):
+    def inventories():
+        yield from FLEET_1[:5]
+        raise RuntimeError("listing failed")
+
+    root = str(tmp_path)
+    with SnapshotStore(root) as store:
+        with pytest.raises(RuntimeError):
+            store.write(inventories(), DAY_1)
+        assert os.listdir(os.path.join(root, "snapshots")) == []
+        assert store.snapshots() == []
+
+        store.write(FLEET_1, DAY_1)
+        assert list(store.open("20261001T000000Z")) == FLEET_1
+
+
+def test_invalid_arguments(tmp_path):
+    with SnapshotStore(str(tmp_path)) as store:
+        with pytest.raises(ValueError):
+            store.write(FLEET_1, datetime.datetime(2026, 10, 1))
+        store.write(FLEET_1, DAY_1)
+        with pytest.raises(ValueError):
+            store.write(FLEET_1, DAY_1)
+        with pytest.raises(KeyError):
+            store.open("20261002T000000Z")
+        with pytest.raises(KeyError):
+            store.package(store.package_count)
+        snapshot = store.at(DAY_1)
+        with pytest.raises(KeyError):
+            snapshot.get(ZONE + "/instances/missing")
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import math
+
+import pytest
+
+from google.cloud.osconfig_v1 import vulnerability_scores
+from google.cloud.osconfig_v1.types import vulnerability
+
+numpy = pytest.importorskip("numpy")
+
+CVSSv3 = vulnerability.CVSSv3
+Vulnerability = vulnerability.VulnerabilityReport.Vulnerability
+
+_METRICS = {
+    "AV": ("attack_vector", CVSSv3.AttackVector, "ATTACK_VECTOR_", "NALP"),
+    "AC": ("attack_complexity", CVSSv3.AttackComplexity, "ATTACK_COMPLEXITY_", "LH"),
+    "PR": (
+        "privileges_required",
+        CVSSv3.PrivilegesRequired,
+        "PRIVILEGES_REQUIRED_",
+        "NLH",
+    ),
+    "UI": ("user_interaction", CVSSv3.UserInteraction, "USER_INTERACTION_", "NR"),
+    "S": ("scope", CVSSv3.Scope, "SCOPE_", "UC"),
+    "C": ("confidentiality_impact", CVSSv3.Impact, "IMPACT_", "HLN"),
+    "I": ("integrity_impact", CVSSv3.Impact, "IMPACT_", "HLN"),
+    "A": ("availability_impact", CVSSv3.Impact, "IMPACT_", "HLN"),
+}
+_NAMES = {
+    "N": ("NETWORK", "NONE"),
+    "A": ("ADJACENT",),
+    "L": ("LOCAL", "LOW"),
+    "P": ("PHYSICAL",),
+    "H": ("HIGH",),
+    "R": ("REQUIRED",),
+    "U": ("UNCHANGED",),
+    "C": ("CHANGED",),
+}
+
+
+def _cvss(vector, base_score=0.0):
+    """Builds a CVSSv3 message from a vector such as ``AV:N/AC:L/...``."""
+    fields = {"base_score": base_score}
+    for part in vector.split("/"):
+        metric, value = part.split(":")
+        field, enum, prefix, _ = _METRICS[metric]
+        for name in _NAMES[value]:
+            if hasattr(enum, prefix + name):
+                fields[field] = getattr(enum, prefix + name)
+                break
+    return CVSSv3(**fields)
+
+
+def _report(instance, zone, vulnerabilities):
+    return vulnerability.VulnerabilityReport(
+        name="projects/p/locations/{}/instances/{}/vulnerabilityReport".format(
+            zone, instance
+        ),
+        vulnerabilities=[
+            Vulnerability(
+                details=Vulnerability.Details(
+                    cve=cve, severity=severity, cvss_v2_score=5.0, cvss_v3=cvss_v3
+                )
+            )
+            for cve, severity, cvss_v3 in vulnerabilities
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "vector,base,impact,exploitability",
+    [
+        ("AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N", 7.5, 3.6, 3.9),
+        ("AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H", 9.8, 5.9, 3.9),
+        ("AV:N/AC:L/PR:N/UI:N/S:C/C:H/I:H/A:H", 10.0, 6.0, 3.9),
+        ("AV:N/AC:L/PR:N/UI:R/S:C/C:L/I:L/A:N", 6.1, 2.7, 2.8),
+        ("AV:L/AC:L/PR:L/UI:N/S:U/C:H/I:H/A:H", 7.8, 5.9, 1.8),
+        ("AV:N/AC:L/PR:L/UI:N/S:C/C:L/I:N/A:N", 5.0, 1.4, 3.1),
+        ("AV:P/AC:H/PR:H/UI:R/S:U/C:N/I:N/A:N", 0.0, 0.0, 0.1),
+    ],
+)
+def test_cvss3_scores(vector, base, impact, exploitability):
+    arrays = vulnerability_scores.encode(
+        [_report("i", "us-central1-a", [("CVE-1", "", _cvss(vector))])]
+    )
+    scores = vulnerability_scores.cvss3_scores(arrays)
+
+    assert scores.base.tolist() == [base]
+    assert scores.impact.tolist() == [impact]
+    assert scores.exploitability.tolist() == [exploitability]
+
+
+def test_cvss3_scores_unspecified_metrics():
+    arrays = vulnerability_scores.encode(
+        [
+            _report(
+                "i",
+                "us-central1-a",
+                [
+                    ("CVE-1", "", _cvss("AV:N/AC:L/PR:N/UI:N/C:H/I:H/A:H", 9.0)),
+                    ("CVE-2", "", None),
+                ],
+            )
+        ]
+    )
+    assert numpy.isnan(vulnerability_scores.cvss3_scores(arrays).base).all()
+    effective = vulnerability_scores.effective_scores(arrays)
+    assert effective[0] == 9.0
+    assert numpy.isnan(effective[1])
+
+
+def test_encode():
+    arrays = vulnerability_scores.encode(
+        [
+            _report("a", "us-central1-a", [("CVE-1", "High", None)]),
+            vulnerability.VulnerabilityReport.pb(
+                _report("b", "europe-west1-b", [("CVE-2", "", None)])
+            ),
+        ]
+    )
+    assert len(arrays) == 2
+    assert arrays.zone.tolist() == ["us-central1-a", "europe-west1-b"]
+    assert arrays.instance.tolist() == [
+        "projects/p/locations/us-central1-a/instances/a",
+        "projects/p/locations/europe-west1-b/instances/b",
+    ]
+    assert arrays.severity.tolist() == ["HIGH", ""]
+    assert arrays.cvss_v2_score.tolist() == [5.0, 5.0]
+    assert arrays.attack_vector.dtype == numpy.int8
+
+    assert len(vulnerability_scores.encode([])) == 0
+
+
+def test_severity_ratings():
+    assert vulnerability_scores.severity_ratings(
+        [0.0, 0.1, 3.9, 4.0, 7.0, 8.9, 9.0, 10.0, float("nan")]
+    ).tolist() == [
+        "NONE",
+        "LOW",
+        "LOW",
+        "MEDIUM",
+        "HIGH",
+        "HIGH",
+        "CRITICAL",
+        "CRITICAL",
+        "UNKNOWN",
+    ]
+
+
+def test_rollup():
+    critical = _cvss("AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:H/A:H")
+    high = _cvss("AV:N/AC:L/PR:N/UI:N/S:U/C:H/I:N/A:N")
+    arrays = vulnerability_scores.encode(
+        [
+            _report(
+                "a",
+                "zone-1",
+                [("CVE-1", "", critical), ("CVE-2", "low", high), ("CVE-3", "", None)],
+            ),
+            _report("b", "zone-1", [("CVE-1", "", critical)]),
+            _report("c", "zone-2", [("CVE-2", "", high)]),
+        ]
+    )
+
+    by_zone = vulnerability_scores.rollup(arrays, "zone")
+    assert list(by_zone) == ["zone-1", "zone-2"]
+    assert by_zone["zone-1"].count == 4
+    assert by_zone["zone-1"].instances == 2
+    assert by_zone["zone-1"].max_score == 9.8
+    assert by_zone["zone-1"].mean_score == pytest.approx((9.8 + 7.5 + 9.8) / 3)
+    assert by_zone["zone-2"] == vulnerability_scores.Rollup(1, 1, 7.5, 7.5)
+
+    by_cve = vulnerability_scores.rollup(arrays, "cve")
+    assert by_cve["CVE-1"] == vulnerability_scores.Rollup(2, 2, 9.8, 9.8)
+    assert by_cve["CVE-3"].count == 1
+    assert math.isnan(by_cve["CVE-3"].max_score)
+    assert math.isnan(by_cve["CVE-3"].mean_score)
+
+    by_severity = vulnerability_scores.rollup(arrays, "severity")
+    assert {key: value.count for key, value in by_severity.items()} == {
+        "CRITICAL": 2,
+        "HIGH": 1,
+        "LOW": 1,
+        "UNKNOWN": 1,
+    }
+
+    assert (
+        vulnerability_scores.rollup(arrays, "instance")[
+            "projects/p/locations/zone-1/instances/a"
+        ].count
+        == 3
+    )
+
+    with pytest.raises(ValueError):
+        vulnerability_scores.rollup(arrays, "project")
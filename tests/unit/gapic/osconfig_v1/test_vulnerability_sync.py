@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# try/except added for compatibility with python < 3.8
+try:
+    from unittest import mock
+except ImportError:  # pragma: NO COVER
+    import mock
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.protobuf import timestamp_pb2  # type: ignore
+import pytest
+
+from google.cloud.osconfig_v1 import vulnerability_sync
+from google.cloud.osconfig_v1.services.os_config_zonal_service import (
+    OsConfigZonalServiceClient,
+)
+from google.cloud.osconfig_v1.types import vulnerability
+
+PARENT = "projects/p/locations/l/instances/-"
+
+
+def _name(instance):
+    return "projects/p/locations/l/instances/{}/vulnerabilityReport".format(instance)
+
+
+def _report(instance, seconds):
+    return vulnerability.VulnerabilityReport(
+        name=_name(instance),
+        update_time=timestamp_pb2.Timestamp(seconds=seconds),
+    )
+
+
+class _FakeService:
+    """Serves vulnerability reports, optionally honoring update_time filters."""
+
+    def __init__(self, reports, supports_filter=True):
+        self.reports = {report.name: report for report in reports}
+        self.supports_filter = supports_filter
+        self.requests = []
+
+    def list_vulnerability_reports(self, request, **kwargs):
+        self.requests.append(request)
+        if "update_time" not in request.filter:
+            return list(self.reports.values())
+        if not self.supports_filter:
+            raise core_exceptions.InvalidArgument("invalid filter")
+        since = timestamp_pb2.Timestamp()
+        since.FromJsonString(request.filter.split('"')[-2])
+        return [
+            report
+            for report in self.reports.values()
+            if vulnerability.VulnerabilityReport.pb(report).update_time.ToNanoseconds()
+            >= since.ToNanoseconds()
+        ]
+
+
+def _changes(syncer, **kwargs):
+    return [
+        (change.kind, change.name.split("/")[5])
+        for change in syncer.sync(PARENT, **kwargs)
+    ]
+
+
+def test_sync_incremental():
+    service = _FakeService([_report("a", 10), _report("b", 20)])
+    syncer = vulnerability_sync.VulnerabilityReportSync(service)
+
+    assert syncer.watermark(PARENT) is None
+    assert _changes(syncer) == [("added", "a"), ("added", "b")]
+    assert syncer.watermark(PARENT) == timestamp_pb2.Timestamp(seconds=20)
+    assert service.requests[-1].filter == ""
+
+    assert _changes(syncer) == []
+    assert service.requests[-1].filter == 'update_time >= "1970-01-01T00:00:20Z"'
+
+    service.reports[_name("a")] = _report("a", 30)
+    service.reports[_name("c")] = _report("c", 25)
+    assert _changes(syncer) == [("changed", "a"), ("added", "c")]
+    assert syncer.watermark(PARENT) == timestamp_pb2.Timestamp(seconds=30)
+
+    # Removals are only detected by a complete listing.
+    del service.reports[_name("b")]
+    assert _changes(syncer) == []
+    assert _changes(syncer, full=True) == [("removed", "b")]
+    assert service.requests[-1].filter == ""
+    assert sorted(syncer.known_reports(PARENT)) == [_name("a"), _name("c")]
+    assert syncer.server_filter_supported
+
+
+def test_sync_full_sync_every():
+    service = _FakeService([_report("a", 10)])
+    syncer = vulnerability_sync.VulnerabilityReportSync(
+        service, filter='name:"a"', full_sync_every=3
+    )
+    for _ in range(7):
+        list(syncer.sync(PARENT))
+
+    filters = [request.filter for request in service.requests]
+    incremental = '(name:"a") AND update_time >= "1970-01-01T00:00:10Z"'
+    assert filters == [
+        'name:"a"',
+        incremental,
+        incremental,
+        'name:"a"',
+        incremental,
+        incremental,
+        'name:"a"',
+    ]
+
+    with pytest.raises(ValueError):
+        vulnerability_sync.VulnerabilityReportSync(service, full_sync_every=0)
+
+
+def test_sync_client_side_fallback():
+    service = _FakeService([_report("a", 10), _report("b", 20)], supports_filter=False)
+    syncer = vulnerability_sync.VulnerabilityReportSync(service)
+
+    assert _changes(syncer) == [("added", "a"), ("added", "b")]
+    service.reports[_name("b")] = _report("b", 40)
+    del service.reports[_name("a")]
+
+    assert _changes(syncer) == [("changed", "b"), ("removed", "a")]
+    assert not syncer.server_filter_supported
+    # The rejected filter is not sent again.
+    assert [request.filter for request in service.requests] == [
+        "",
+        'update_time >= "1970-01-01T00:00:20Z"',
+        "",
+    ]
+    assert _changes(syncer) == []
+    assert service.requests[-1].filter == ""
+
+
+def test_sync_reset():
+    service = _FakeService([_report("a", 10)])
+    syncer = vulnerability_sync.VulnerabilityReportSync(service)
+    list(syncer.sync(PARENT))
+
+    syncer.reset(PARENT)
+    assert syncer.watermark(PARENT) is None
+    assert _changes(syncer) == [("added", "a")]
+    syncer.reset()
+    assert syncer.known_reports(PARENT) == []
+
+
+def test_sync_with_client():
+    client = OsConfigZonalServiceClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with mock.patch.object(
+        type(client.transport.list_vulnerability_reports), "__call__"
+    ) as call:
+        call.return_value = vulnerability.ListVulnerabilityReportsResponse(
+            vulnerability_reports=[_report("a", 10)],
+        )
+        syncer = vulnerability_sync.VulnerabilityReportSync(client, page_size=5)
+        changes = list(syncer.sync(PARENT))
+
+    assert [change.kind for change in changes] == ["added"]
+    assert changes[0].report == _report("a", 10)
+    _, args, _ = call.mock_calls[0]
+    assert args[0] == vulnerability.ListVulnerabilityReportsRequest(
+        parent=PARENT, page_size=5
+    )